@@ -36,6 +36,7 @@ def subplots(
     style: Optional[Dict[str, Any]] = None,
     apply_style_mm: bool = True,
     panel_labels: Optional[bool] = None,
+    snapshot_arrays: bool = False,
     **kwargs,
 ) -> Tuple[RecordingFigure, Union[RecordingAxes, NDArray]]:
     """Create a figure with recording-enabled axes.
@@ -63,6 +64,10 @@ def subplots(
         If True (default), apply loaded style to axes.
     panel_labels : bool or None
         If True, add panel labels (A, B, C, ...).
+    snapshot_arrays : bool
+        If False (default), recorded arrays are read-only views of your
+        data, serialized only on save. Set True to copy them at plot time
+        if you modify the arrays after plotting.
     **kwargs
         Additional arguments passed to plt.subplots().
 
@@ -89,6 +94,7 @@ def subplots(
         style=style,
         apply_style_mm=apply_style_mm,
         panel_labels=panel_labels,
+        snapshot_arrays=snapshot_arrays,
         **kwargs,
     )
 
@@ -103,6 +109,7 @@ def save(
     validate: bool = True,
     validate_mse_threshold: float = 100.0,
     validate_error_level: str = "error",
+    validate_mode: str = "full",
     verbose: bool = True,
     dpi: Optional[int] = None,
     image_format: Optional[str] = None,
@@ -122,7 +129,8 @@ def save(
     include_data : bool
         If True (default), save large arrays to separate files.
     data_format : str
-        Format for data files: 'csv', 'npz', or 'inline'.
+        Format for data files: 'csv', 'npz', 'parquet', 'arrow', or 'inline'.
+        'parquet'/'arrow' write one columnar file per figure (needs pyarrow).
     csv_format : str
         CSV structure: 'separate' (default) or 'single' (scitex-compatible).
     validate : bool
@@ -131,6 +139,10 @@ def save(
         Maximum acceptable MSE for validation (default: 100).
     validate_error_level : str
         How to handle failures: 'error', 'warning', or 'debug'.
+    validate_mode : str
+        'full' (default, reload recipe from disk), 'fast' (replay the
+        in-memory record at reduced DPI) or 'async' ('fast' in a background
+        worker; returns a Future of the ValidationResult).
     verbose : bool
         If True (default), print save status.
     dpi : int, optional
@@ -160,6 +172,7 @@ def save(
         validate=validate,
         validate_mse_threshold=validate_mse_threshold,
         validate_error_level=validate_error_level,
+        validate_mode=validate_mode,
         verbose=verbose,
         dpi=dpi,
         image_format=image_format,
@@ -227,9 +240,14 @@ def info(path: Union[str, Path]) -> Dict[str, Any]:
     return get_recipe_info(path)
 
 
-def load_record(path: Union[str, Path]) -> FigureRecord:
-    """Load a recipe as a FigureRecord object (advanced use)."""
-    return load_recipe(path)
+def load_record(path: Union[str, Path], *, lazy: bool = False) -> FigureRecord:
+    """Load a recipe as a FigureRecord object (advanced use).
+
+    With ``lazy=True`` data files are not read until an arg's
+    ``_loaded_array`` handle is accessed; ``data`` then still holds the
+    file reference.
+    """
+    return load_recipe(path, lazy=lazy)
 
 
 def extract_data(path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
@@ -339,6 +357,7 @@ def gui(
     hot_reload: bool = False,
     working_dir=None,
     desktop: bool = False,
+    workers: int = 0,
 ):
     """Launch interactive GUI editor for figure styling.
 
@@ -362,6 +381,9 @@ def gui(
     desktop : bool, optional
         Launch as native desktop window using pywebview (default: False).
         Requires: pip install figrecipe[desktop]
+    workers : int, optional
+        Run editor sessions in this many worker processes (default: 0,
+        in the server process).
 
     Returns
     -------
@@ -379,6 +401,7 @@ def gui(
         hot_reload=hot_reload,
         working_dir=working_dir,
         desktop=desktop,
+        workers=workers,
     )
 
 
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Save function helpers for the public API."""
 
+from functools import partial
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -9,6 +10,7 @@ from typing import Optional, Tuple
 from ._save_helpers import (
     _capture_axes_bboxes,
     _is_bundle_path,
+    _render_rgba,
     _save_as_bundle,
 )
 from ._save_helpers import (
@@ -156,6 +158,7 @@ def save_figure(
     validate: bool = True,
     validate_mse_threshold: float = 100.0,
     validate_error_level: str = "error",
+    validate_mode: str = "full",
     verbose: bool = True,
     dpi: Optional[int] = None,
     image_format: Optional[str] = None,
@@ -182,7 +185,8 @@ def save_figure(
     include_data : bool
         If True (default), save large arrays to separate files.
     data_format : str
-        Format for data files: 'csv' (default), 'npz', or 'inline'.
+        Format for data files: 'csv' (default), 'npz', 'parquet', 'arrow',
+        or 'inline'.
     csv_format : str
         CSV file structure: 'separate' (default) or 'single'.
         - 'separate': One CSV file per variable
@@ -194,6 +198,14 @@ def save_figure(
         Maximum acceptable MSE for validation (default: 100).
     validate_error_level : str
         How to handle validation failures: 'error', 'warning', or 'debug'.
+    validate_mode : str
+        'full' (default): reload the saved recipe from disk and compare
+        re-rendered images. 'fast': replay the in-memory record and compare
+        pixel buffers (the replay against the PNG's own save render, or
+        both at reduced DPI for other saves). 'async': like 'fast', but run
+        in a background worker; the returned result is a
+        ``concurrent.futures.Future`` of the ValidationResult (failures
+        surface when calling ``.result()``).
     verbose : bool
         If True (default), print save status.
     dpi : int, optional
@@ -214,6 +226,7 @@ def save_figure(
     -------
     tuple
         If save_recipe=True: (image_path, yaml_path, ValidationResult or None)
+        (a Future of the ValidationResult for validate_mode='async')
         If save_recipe=False: (image_path, None, None)
     """
     from .._wrappers import RecordingFigure
@@ -340,6 +353,15 @@ def save_figure(
 
     pad_inches = 0.0  # updated below if use_constrained
 
+    # PNG crops are computed on the in-memory render (no PNG round trip)
+    has_crop_margins = crop_margin_mm is not None or (
+        mm_layout is not None and "crop_margin_left_mm" in mm_layout
+    )
+    crop_png_in_memory = (
+        not use_constrained and image_path.suffix.lower() == ".png" and has_crop_margins
+    )
+    rgba = None
+
     try:
         if use_constrained:
             # For constrained_layout, use bbox_inches='tight' to crop at save time
@@ -391,6 +413,11 @@ def save_figure(
                 )
                 # Mark for cropping since we couldn't use bbox_inches="tight"
                 use_constrained = False
+        elif crop_png_in_memory:
+            # Render once to RGBA; cropped and written as PNG below
+            rgba = _render_rgba(
+                fig.fig, dpi, transparent=transparent, facecolor=facecolor
+            )
         else:
             # Standard save without bbox_inches to preserve mm layout
             fig.fig.savefig(
@@ -410,7 +437,28 @@ def save_figure(
     is_svg = image_path.suffix.lower() == ".svg"
 
     crop_offset = None
-    if is_croppable and not use_constrained:
+    if rgba is not None:
+        import matplotlib
+
+        from .._utils._crop import save_cropped_png
+
+        if crop_margin_mm is not None:
+            margins = {"margin_mm": crop_margin_mm}
+        else:
+            margins = {
+                "margin_left_mm": crop_margin_left_mm,
+                "margin_right_mm": crop_margin_right_mm,
+                "margin_top_mm": crop_margin_top_mm,
+                "margin_bottom_mm": crop_margin_bottom_mm,
+            }
+        software = (
+            f"Matplotlib version{matplotlib.__version__}, https://matplotlib.org/"
+        )
+        crop_offset = save_cropped_png(
+            rgba, image_path, dpi, metadata={"Software": software}, **margins
+        )
+
+    elif is_croppable and not use_constrained:
         if crop_margin_mm is not None:
             # Explicit uniform crop margin
             from .._utils._crop import crop
@@ -463,6 +511,7 @@ def save_figure(
     # Save hitmap if requested (for GUI editor element selection)
     # Pass bbox_inches="tight" when the image was saved that way (constrained_layout)
     # so the hitmap crop matches the saved image exactly (critical for pie/imshow).
+    # Otherwise it is one raw draw in the hitmap colours (no PNG round trip).
     if save_hitmap:
         _hitmap_bbox = "tight" if use_constrained else None
         _hitmap_pad = pad_inches if use_constrained else 0.0
@@ -482,6 +531,20 @@ def save_figure(
             print(f"Saved (with errors): {image_path}")
         raise ValueError("\n  ".join(_diagram_errors))
 
+    # In-memory validation replays the record, which saving would alter
+    replay_record = None
+    validate_dpi = None
+    original_pixels = None
+    if validate and validate_mode != "full":
+        from .._validator import snapshot_record
+
+        replay_record = snapshot_record(fig.record)
+        # Compare against the uncropped save render when the replay can be
+        # rendered the same way (no facecolor override)
+        if rgba is not None and restore_patches is None:
+            validate_dpi = dpi
+            original_pixels = rgba[..., :3]
+
     # Save the recipe
     saved_yaml = fig.save_recipe(
         yaml_path,
@@ -494,28 +557,76 @@ def save_figure(
     if validate:
         from .._validator import validate_on_save
 
-        result = validate_on_save(fig, saved_yaml, mse_threshold=validate_mse_threshold)
+        check = partial(_apply_validation_level, error_level=validate_error_level)
+        if validate_mode == "async":
+            future = validate_on_save(
+                fig,
+                saved_yaml,
+                mse_threshold=validate_mse_threshold,
+                dpi=validate_dpi,
+                mode=validate_mode,
+                record=replay_record,
+                original=original_pixels,
+            )
+            future = _chain_future(future, check)
+            if verbose:
+                print(
+                    f"Saved: {image_path} + {yaml_path} "
+                    "(Reproducible Validation: PENDING)"
+                )
+            return image_path, yaml_path, future
+
+        result = validate_on_save(
+            fig,
+            saved_yaml,
+            mse_threshold=validate_mse_threshold,
+            dpi=validate_dpi,
+            mode=validate_mode,
+            record=replay_record,
+            original=original_pixels,
+        )
         status = "PASSED" if result.valid else "FAILED"
         if verbose:
             print(
                 f"Saved: {image_path} + {yaml_path} (Reproducible Validation: {status})"
             )
-        if not result.valid:
-            msg = f"Reproducibility validation failed (MSE={result.mse:.1f}): {result.message}"
-            if validate_error_level == "error":
-                raise ValueError(msg)
-            elif validate_error_level == "warning":
-                import warnings
-
-                warnings.warn(msg, UserWarning)
-            # "debug" level: silent, just return the result
-        return image_path, yaml_path, result
+        return image_path, yaml_path, check(result)
 
     if verbose:
         print(f"Saved: {image_path} + {yaml_path}")
     return image_path, yaml_path, None
 
 
+def _apply_validation_level(result, error_level: str = "error"):
+    """Raise or warn for a failed validation according to *error_level*."""
+    if not result.valid:
+        msg = f"Reproducibility validation failed (MSE={result.mse:.1f}): {result.message}"
+        if error_level == "error":
+            raise ValueError(msg)
+        elif error_level == "warning":
+            import warnings
+
+            warnings.warn(msg, UserWarning)
+        # "debug" level: silent, just return the result
+    return result
+
+
+def _chain_future(future, func):
+    """Return a Future resolving to ``func(future.result())``."""
+    from concurrent.futures import Future
+
+    chained = Future()
+
+    def _done(f):
+        try:
+            chained.set_result(func(f.result()))
+        except Exception as e:
+            chained.set_exception(e)
+
+    future.add_done_callback(_done)
+    return chained
+
+
 __all__ = [
     "IMAGE_EXTENSIONS",
     "YAML_EXTENSIONS",
@@ -115,6 +115,28 @@ def _crop_to_axes_size(
     }
 
 
+def _render_rgba(mpl_fig, dpi: int, **savefig_kwargs):
+    """Render a figure once to an in-memory (H, W, 4) uint8 RGBA array.
+
+    Uses ``savefig(format="raw")`` so facecolor/transparent handling is
+    identical to a PNG ``savefig``, without encoding a file.
+    """
+    import io
+
+    import numpy as np
+
+    buf = io.BytesIO()
+    # Render at the figure DPI so the canvas reports the raster's own size
+    original_dpi = mpl_fig.dpi
+    mpl_fig.dpi = dpi
+    try:
+        mpl_fig.savefig(buf, format="raw", dpi=dpi, **savefig_kwargs)
+        width, height = mpl_fig.canvas.get_width_height(physical=True)
+    finally:
+        mpl_fig.dpi = original_dpi
+    return np.frombuffer(buf.getvalue(), dtype=np.uint8).reshape(height, width, 4)
+
+
 def _capture_axes_bboxes(fig, crop_offset: Optional[dict] = None) -> None:
     """Capture bounding boxes of all axes for alignment/snap functionality.
 
@@ -263,6 +285,34 @@ def _save_as_bundle(
             return bundle_dir, bundle_dir / BUNDLE_RECIPE_NAME
 
 
+def _render_hitmap_rgb(fig, dpi: int):
+    """Render the hitmap colours of a figure in one raw draw.
+
+    Same pixels as :func:`generate_hitmap` without ``bbox_inches``, but
+    read straight from the Agg buffer instead of a PNG encode/decode.
+    """
+    import numpy as np
+    from PIL import Image
+
+    from .._editor._hitmap_main import (
+        apply_hitmap_colors,
+        get_hitmap_dpi,
+        restore_hitmap_colors,
+    )
+
+    mpl_fig = fig.fig if hasattr(fig, "fig") else fig
+    axes_list, original_props, _ = apply_hitmap_colors(fig)
+    try:
+        rgba = _render_rgba(
+            mpl_fig,
+            get_hitmap_dpi(mpl_fig, dpi),
+            facecolor=mpl_fig.get_facecolor(),
+        )
+    finally:
+        restore_hitmap_colors(fig, axes_list, original_props)
+    return Image.fromarray(np.ascontiguousarray(rgba[..., :3]), "RGB")
+
+
 def save_hitmap(
     fig,
     image_path: Path,
@@ -294,6 +344,8 @@ def save_hitmap(
             from .._diagram._diagram._hitmap import save_diagram_hitmap
 
             save_diagram_hitmap(diagram, hitmap_path, dpi=min(dpi, 150))
+        elif bbox_inches is None:
+            _render_hitmap_rgb(fig, min(dpi, 150)).save(hitmap_path)
         else:
             from .._editor._hitmap import generate_hitmap
 
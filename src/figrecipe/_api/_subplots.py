@@ -237,6 +237,7 @@ def create_subplots(
     style: Optional[Dict[str, Any]] = None,
     apply_style_mm: bool = True,
     panel_labels: Optional[bool] = None,
+    snapshot_arrays: bool = False,
     **kwargs,
 ) -> Tuple[RecordingFigure, Union[RecordingAxes, NDArray]]:
     """Core subplots implementation."""
@@ -318,7 +319,9 @@ def create_subplots(
         kwargs["constrained_layout"] = style_constrained
 
     # Create the recording subplots
-    fig, axes = create_recording_subplots(nrows, ncols, **kwargs)
+    fig, axes = create_recording_subplots(
+        nrows, ncols, snapshot_arrays=snapshot_arrays, **kwargs
+    )
 
     # Record constrained_layout setting for reproduction
     fig.record.constrained_layout = kwargs.get("constrained_layout", False)
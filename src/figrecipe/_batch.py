@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Parallel batch rendering of recipe directories.
+
+Recipes (``*.yaml`` files starting with a ``figrecipe:`` or
+``type: diagram`` header) and bundles (directories holding
+``recipe.yaml``, ZIPs containing one) are discovered under a directory
+and rendered by a process pool. Each worker imports matplotlib, loads
+the active style and warms the font cache once, then renders many
+figures through :func:`figrecipe._render_cache.render_recipe`.
+"""
+
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from ._utils._bundle import RECIPE_FILENAME, RECIPE_FILENAME_ALT
+
+# Header lines that identify a YAML file as a recipe
+_RECIPE_HEADER = re.compile(r"^(figrecipe:|type:\s*['\"]?diagram)", re.MULTILINE)
+
+# Bytes read from a YAML file to look for the recipe header
+_HEADER_BYTES = 4096
+
+
+@dataclass
+class BatchJob:
+    """One recipe to render in a batch.
+
+    Attributes
+    ----------
+    source : str
+        Recipe source (YAML file, bundle directory or ZIP).
+    output : str
+        Output image path.
+    fmt : str
+        Output format ('png', 'pdf', 'svg').
+    dpi : int
+        DPI for raster output.
+    use_cache : bool
+        Whether to use the render cache.
+    """
+
+    source: str
+    output: str
+    fmt: str = "png"
+    dpi: int = 300
+    use_cache: bool = True
+
+
+def _is_recipe_file(path: Path) -> bool:
+    """Check whether a YAML file is a figrecipe recipe (not a style, etc.)."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            head = f.read(_HEADER_BYTES)
+    except OSError:
+        return False
+    return _RECIPE_HEADER.search(head) is not None
+
+
+def _is_bundle_dir(path: Path) -> bool:
+    """Check whether a directory is a recipe bundle."""
+    return (path / RECIPE_FILENAME).exists() or (path / RECIPE_FILENAME_ALT).exists()
+
+
+def _is_bundle_zip(path: Path) -> bool:
+    """Check whether a ZIP archive contains a recipe."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            names = zf.namelist()
+    except (OSError, zipfile.BadZipFile):
+        return False
+    return any(
+        Path(n).name in (RECIPE_FILENAME, RECIPE_FILENAME_ALT)
+        or n.endswith("spec.json")
+        for n in names
+    )
+
+
+def discover_recipes(
+    root: Union[str, Path],
+    recursive: bool = True,
+    include_reproduced: bool = False,
+) -> List[Path]:
+    """Find recipes and bundles under a directory.
+
+    Parameters
+    ----------
+    root : str or Path
+        Directory to search. A bundle directory yields itself.
+    recursive : bool
+        If True (default), search subdirectories (bundles and ``*_data``
+        directories are not descended into).
+    include_reproduced : bool
+        If False (default), skip ``*.reproduced.yaml`` recipes written by
+        earlier ``figrecipe reproduce`` runs.
+
+    Returns
+    -------
+    list of Path
+        Sorted recipe sources, each accepted by ``resolve_recipe_path``.
+    """
+    root = Path(root)
+    if _is_bundle_dir(root):
+        return [root]
+
+    found: List[Path] = []
+
+    def _visit(directory: Path) -> None:
+        for entry in sorted(directory.iterdir()):
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                if _is_bundle_dir(entry):
+                    found.append(entry)
+                elif recursive and not entry.name.endswith("_data"):
+                    _visit(entry)
+                continue
+
+            suffix = entry.suffix.lower()
+            if suffix in (".yaml", ".yml"):
+                if not include_reproduced and ".reproduced" in entry.suffixes:
+                    continue
+                if _is_recipe_file(entry):
+                    found.append(entry)
+            elif suffix == ".zip" and _is_bundle_zip(entry):
+                found.append(entry)
+
+    _visit(root)
+    return found
+
+
+def output_path_for(
+    source: Union[str, Path],
+    fmt: str,
+    root: Optional[Union[str, Path]] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+    tag: str = ".reproduced",
+) -> Path:
+    """Choose the output path for a recipe in a batch.
+
+    Without *output_dir* the image goes next to the source as
+    ``<name>{tag}.<fmt>`` (as single-file ``reproduce`` does). With
+    *output_dir* the layout below *root* is mirrored there as
+    ``<name>.<fmt>``.
+    """
+    source = Path(source)
+    if output_dir is None:
+        return source.with_suffix(f"{tag}.{fmt}")
+
+    rel = source.relative_to(root) if root is not None else Path(source.name)
+    if rel == Path("."):
+        rel = Path(source.name)
+    return (Path(output_dir) / rel).with_suffix(f".{fmt}")
+
+
+def warm_up_worker() -> None:
+    """Prepare a worker process: Agg backend, active style and fonts."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    from .styles._style_loader import get_style
+
+    get_style()
+
+    # Render a tiny labelled figure once so font lookup and text layout
+    # caches are populated before the first real job
+    fig, ax = plt.subplots(figsize=(1, 1))
+    ax.set_title("warm-up")
+    ax.plot([0, 1], [0, 1])
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def run_job(job: BatchJob) -> Dict[str, Any]:
+    """Render one job, never raising; returns a status dict."""
+    from ._render_cache import render_recipe
+
+    start = time.perf_counter()
+    result = {"source": job.source, "output": job.output, "pid": os.getpid()}
+    try:
+        output = Path(job.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        written, cached = render_recipe(
+            job.source,
+            output,
+            job.fmt,
+            job.dpi,
+            use_cache=job.use_cache,
+            prune=False,
+        )
+        result["output"] = str(written)
+        result["status"] = "cached" if cached else "ok"
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def run_batch(
+    jobs: List[BatchJob],
+    n_jobs: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Render jobs in a process pool, yielding status dicts as they finish.
+
+    Parameters
+    ----------
+    jobs : list of BatchJob
+        Jobs to render.
+    n_jobs : int, optional
+        Worker processes (default: ``os.cpu_count()``). With 1, jobs run
+        in the calling process.
+
+    Yields
+    ------
+    dict
+        ``source``, ``output``, ``status`` ('ok', 'cached' or 'error'),
+        ``seconds``, ``pid`` and, on failure, ``error``.
+    """
+    n_jobs = n_jobs or os.cpu_count() or 1
+    n_jobs = max(1, min(n_jobs, len(jobs)))
+
+    if n_jobs == 1:
+        for job in jobs:
+            yield run_job(job)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=warm_up_worker
+        ) as pool:
+            futures = {pool.submit(run_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # Worker died (e.g. killed or out of memory)
+                    job = futures[future]
+                    yield {
+                        "source": job.source,
+                        "output": job.output,
+                        "status": "error",
+                        "error": f"{type(e).__name__}: {e}",
+                        "seconds": 0.0,
+                    }
+
+    # Enforce the cache size limit once, after all workers are done
+    if any(job.use_cache for job in jobs):
+        from ._render_cache import RenderCache, cache_enabled
+
+        if cache_enabled():
+            RenderCache().prune()
+
+
+__all__ = [
+    "BatchJob",
+    "discover_recipes",
+    "output_path_for",
+    "run_batch",
+    "run_job",
+    "warm_up_worker",
+]
+
+# EOF
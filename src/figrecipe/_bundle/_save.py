@@ -10,6 +10,7 @@ import zipfile
 from pathlib import Path
 from typing import Optional, Union
 
+from .._serializer._utils import _convert_numpy_types
 from ._extract import (
     extract_data_from_record,
     extract_spec_from_record,
@@ -95,12 +96,12 @@ def save_bundle(
 
         # Save spec (after adding data_hash)
         with open(tmpdir / SPEC_FILENAME, "w") as f:
-            json.dump(spec, f, indent=2, default=str)
+            json.dump(_convert_numpy_types(spec), f, indent=2, default=str)
 
         # Extract and save style
         style = extract_style_from_record(fig.record)
         with open(tmpdir / STYLE_FILENAME, "w") as f:
-            json.dump(style, f, indent=2, default=str)
+            json.dump(_convert_numpy_types(style), f, indent=2, default=str)
 
         # Export images
         image_formats = image_formats or ["png"]
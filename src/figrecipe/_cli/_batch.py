@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Shared --batch implementation for reproduce/convert."""
+
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import click
+
+# Options shared by commands that support --batch
+batch_option = click.option(
+    "--batch",
+    "batch_dir",
+    type=click.Path(exists=True, file_okay=False),
+    help="Render every recipe/bundle under this directory.",
+)
+jobs_option = click.option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=None,
+    help="Worker processes for --batch (default: number of CPUs).",
+)
+
+
+def run_batch_command(
+    batch_dir: str,
+    output_dir: Optional[str],
+    fmt: str,
+    dpi: int,
+    jobs: Optional[int],
+    use_cache: bool,
+) -> None:
+    """Render a directory of recipes, streaming one JSON line per file.
+
+    Each line has ``source``, ``output``, ``status`` ('ok', 'cached' or
+    'error'), ``seconds`` and, on failure, ``error``. A final line with
+    ``"event": "done"`` summarizes counts and wall time. Exits with
+    status 1 if any file failed. Without *output_dir* each image is
+    written next to its source as ``<name>.reproduced.<fmt>``, so sources
+    and images saved with them are never overwritten.
+    """
+    from .._batch import BatchJob, discover_recipes, output_path_for, run_batch
+
+    root = Path(batch_dir)
+    sources = discover_recipes(root)
+    jobs_list = [
+        BatchJob(
+            source=str(source),
+            output=str(output_path_for(source, fmt, root, output_dir)),
+            fmt=fmt,
+            dpi=dpi,
+            use_cache=use_cache,
+        )
+        for source in sources
+    ]
+
+    start = time.perf_counter()
+    counts = {"ok": 0, "cached": 0, "error": 0}
+    for result in run_batch(jobs_list, jobs):
+        counts[result["status"]] += 1
+        click.echo(json.dumps({"event": "file", **result}))
+
+    summary = {
+        "event": "done",
+        "total": len(jobs_list),
+        **counts,
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+    click.echo(json.dumps(summary))
+    if counts["error"]:
+        raise SystemExit(1)
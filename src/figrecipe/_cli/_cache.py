@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""cache command - Inspect and prune the render cache."""
+
+import json
+import time
+from typing import Optional
+
+import click
+
+CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
+
+
+def _format_size(n_bytes: int) -> str:
+    """Format a byte count for display."""
+    size = float(n_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@click.group(invoke_without_command=True, context_settings=CONTEXT_SETTINGS)
+@click.pass_context
+def cache(ctx: click.Context) -> None:
+    """Inspect and prune the render cache.
+
+    `reproduce` and `convert` reuse cached renders when the recipe, its
+    data files, the style, matplotlib, DPI and format are unchanged.
+    Location: $FIGRECIPE_CACHE_DIR (default ~/.cache/figrecipe/renders).
+    Size limit: $FIGRECIPE_CACHE_MAX_MB (default 1024).
+    """
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+
+
+@cache.command("info")
+@click.option("--json", "as_json", is_flag=True, help="Emit JSON.")
+def cache_info(as_json: bool) -> None:
+    """Show cache location, size and limit.
+
+    \b
+    Example:
+      $ figrecipe cache info
+    """
+    from .._render_cache import RenderCache
+
+    stats = RenderCache().stats()
+    if as_json:
+        click.echo(json.dumps(stats, indent=2))
+        return
+
+    click.echo(f"Location: {stats['path']}")
+    click.echo(f"Entries:  {stats['entries']}")
+    click.echo(
+        f"Size:     {_format_size(stats['size'])} "
+        f"(limit {_format_size(stats['max_bytes'])})"
+    )
+
+
+@cache.command("list")
+@click.option("--json", "as_json", is_flag=True, help="Emit JSON.")
+def cache_list(as_json: bool) -> None:
+    """List cached renders, most recently used first.
+
+    \b
+    Example:
+      $ figrecipe cache list
+    """
+    from .._render_cache import RenderCache
+
+    entries = list(reversed(RenderCache().entries()))
+    if as_json:
+        click.echo(json.dumps([e.to_dict() for e in entries], indent=2, default=str))
+        return
+
+    if not entries:
+        click.echo("Cache is empty.")
+        return
+
+    for entry in entries:
+        used = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.last_used))
+        source = entry.meta.get("source", "?")
+        fmt = entry.meta.get("format", "?")
+        click.echo(
+            f"{entry.key[:12]}  {used}  {_format_size(entry.size):>9}  "
+            f"{fmt:<4} {source}"
+        )
+
+
+@cache.command("prune")
+@click.option(
+    "--max-size",
+    "max_size_mb",
+    type=float,
+    default=None,
+    help="Size limit in MB (default: $FIGRECIPE_CACHE_MAX_MB or 1024).",
+)
+def cache_prune(max_size_mb: Optional[float]) -> None:
+    """Evict least recently used renders until under the size limit.
+
+    \b
+    Example:
+      $ figrecipe cache prune
+      $ figrecipe cache prune --max-size 200
+    """
+    from .._render_cache import RenderCache
+
+    max_bytes = None if max_size_mb is None else int(max_size_mb * 1024 * 1024)
+    removed, freed = RenderCache().prune(max_bytes)
+    click.echo(f"Removed {removed} entries ({_format_size(freed)})")
+
+
+@cache.command("clear")
+@click.option(
+    "-y",
+    "--yes",
+    is_flag=True,
+    help="Suppress interactive confirmation (assume yes).",
+)
+def cache_clear(yes: bool) -> None:
+    """Remove all cached renders.
+
+    \b
+    Example:
+      $ figrecipe cache clear -y
+    """
+    from .._render_cache import RenderCache
+
+    render_cache = RenderCache()
+    if not yes:
+        click.confirm(f"Remove all cached renders in {render_cache.root}?", abort=True)
+    removed, freed = render_cache.clear()
+    click.echo(f"Removed {removed} entries ({_format_size(freed)})")
@@ -7,9 +7,11 @@ from typing import Optional
 
 import click
 
+from ._batch import batch_option, jobs_option, run_batch_command
+
 
 @click.command()
-@click.argument("source", type=click.Path(exists=True))
+@click.argument("source", type=click.Path(exists=True), required=False)
 @click.option(
     "-f",
     "--format",
@@ -22,7 +24,10 @@ import click
     "-o",
     "--output",
     type=click.Path(),
-    help="Output path.",
+    help=(
+        "Output path (directory with --batch; default: "
+        "<name>.reproduced.<fmt> next to each source)."
+    ),
 )
 @click.option(
     "--dpi",
@@ -41,24 +46,59 @@ import click
     is_flag=True,
     help="Suppress interactive confirmation (assume yes).",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always re-render recipes (bypass the render cache) and also write "
+    "the recipe and hitmap sidecars.",
+)
+@batch_option
+@jobs_option
 def convert(
-    source: str,
+    source: Optional[str],
     fmt: str,
     output: Optional[str],
     dpi: int,
     dry_run: bool,
     yes: bool,
+    no_cache: bool,
+    batch_dir: Optional[str],
+    jobs: Optional[int],
 ) -> None:
     """Convert between figure formats.
 
-    SOURCE is a .yaml recipe or image file.
+    SOURCE is a .yaml recipe or image file. With --batch DIR, every
+    recipe and bundle under DIR is converted in parallel and one JSON
+    line is printed per file.
 
     \b
     Example:
       $ figrecipe convert figure.yaml -f png
       $ figrecipe convert figure.yaml -f pdf -o paper/figs/main.pdf --dpi 600
       $ figrecipe convert figure.png -f svg --dry-run
+      $ figrecipe convert --batch figures/ -f pdf -o exported/ --jobs 16
     """
+    if source is None and batch_dir is None:
+        raise click.MissingParameter(
+            param_hint="'SOURCE'",
+            param_type="argument",
+            message="Pass a recipe or use --batch DIR.",
+        )
+    if source is not None and batch_dir is not None:
+        raise click.UsageError("SOURCE and --batch DIR are mutually exclusive.")
+
+    if batch_dir is not None:
+        if fmt == "yaml":
+            raise click.UsageError("--batch converts recipes to png, pdf or svg.")
+        if dry_run:
+            from .._batch import discover_recipes
+
+            for recipe in discover_recipes(batch_dir):
+                click.echo(f"DRY RUN — would convert {recipe} (dpi={dpi})")
+            return
+        run_batch_command(batch_dir, output, fmt, dpi, jobs, not no_cache)
+        return
+
     source_path = Path(source)
 
     # Determine output path
@@ -75,37 +115,32 @@ def convert(
 
     # Handle different source types
     if source_path.suffix in [".yaml", ".yml"]:
-        _convert_from_recipe(source_path, output_path, fmt, dpi)
+        _convert_from_recipe(source_path, output_path, fmt, dpi, not no_cache)
     elif source_path.suffix in [".png", ".pdf", ".svg"]:
         _convert_image(source_path, output_path, fmt, dpi)
     else:
         raise click.ClickException(f"Unsupported source format: {source_path.suffix}")
 
 
-def _convert_from_recipe(source: Path, output: Path, fmt: str, dpi: int) -> None:
+def _convert_from_recipe(
+    source: Path, output: Path, fmt: str, dpi: int, use_cache: bool = True
+) -> None:
     """Convert from YAML recipe to image format."""
-    import matplotlib.pyplot as plt
-
-    from .. import reproduce
-
     try:
-        fig, _ = reproduce(source)
-
         if fmt == "yaml":
             # Already have YAML, just copy
             import shutil
 
             shutil.copy(source, output)
+            cached = False
         else:
-            fig.savefig(output, dpi=dpi, format=fmt)
+            from .._render_cache import render_recipe
 
-        # Close the figure (handle both regular and Recording figures)
-        try:
-            plt.close(fig)
-        except TypeError:
-            plt.close("all")
+            output, cached = render_recipe(
+                source, output, fmt, dpi, use_cache=use_cache
+            )
 
-        click.echo(f"Converted: {output}")
+        click.echo(f"Converted: {output}{' (cached)' if cached else ''}")
 
     except Exception as e:
         raise click.ClickException(f"Conversion failed: {e}") from e
@@ -60,6 +60,12 @@ def _kill_port(port: int) -> bool:
     is_flag=True,
     help="Launch as native desktop window (requires pywebview).",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=0,
+    help="Run editor sessions in N worker processes (default: 0).",
+)
 @click.option(
     "--force",
     is_flag=True,
@@ -71,6 +77,7 @@ def gui(
     host: str,
     no_browser: bool,
     desktop: bool,
+    workers: int,
     force: bool,
 ) -> None:
     """Launch interactive GUI editor.
@@ -84,6 +91,7 @@ def gui(
       $ figrecipe gui figure.yaml --port 8080
       $ figrecipe gui --desktop
       $ figrecipe gui figure.yaml --force --no-browser
+      $ figrecipe gui --workers 4
     """
     from .. import gui as fr_gui
 
@@ -118,6 +126,7 @@ def gui(
             open_browser=not no_browser,
             desktop=desktop,
             working_dir=working_dir,
+            workers=workers,
         )
     except Exception as e:
         raise click.ClickException(f"Editor failed: {e}") from e
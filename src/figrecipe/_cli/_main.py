@@ -7,6 +7,7 @@ from rich.console import Console
 
 from .. import __version__
 from ._apis import list_python_apis
+from ._cache import cache
 from ._completion import completion
 from ._compose import compose
 from ._convert import convert
@@ -38,7 +39,7 @@ COMMAND_CATEGORIES = [
     ("Diagram", ["diagram"]),
     ("Style & Appearance", ["style", "fonts"]),
     ("Integration", ["mcp", "list-python-apis"]),
-    ("Utility", ["completion", "version"]),
+    ("Utility", ["cache", "completion", "version"]),
 ]
 
 
@@ -149,6 +150,7 @@ def _show_recursive_help(ctx: click.Context) -> None:
 
 # Register commands
 
+main.add_command(cache)
 main.add_command(completion)
 main.add_command(compose)
 main.add_command(convert)
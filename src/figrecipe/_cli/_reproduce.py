@@ -7,14 +7,16 @@ from typing import Optional
 
 import click
 
+from ._batch import batch_option, jobs_option, run_batch_command
+
 
 @click.command()
-@click.argument("source", type=click.Path(exists=True))
+@click.argument("source", type=click.Path(exists=True), required=False)
 @click.option(
     "-o",
     "--output",
     type=click.Path(),
-    help="Output path for the reproduced figure.",
+    help="Output path for the reproduced figure (directory with --batch).",
 )
 @click.option(
     "-f",
@@ -35,47 +37,89 @@ import click
     is_flag=True,
     help="Display the figure interactively.",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always re-render (bypass the render cache) and also write the "
+    "recipe and hitmap sidecars.",
+)
+@batch_option
+@jobs_option
 def reproduce(
-    source: str,
+    source: Optional[str],
     output: Optional[str],
     fmt: str,
     dpi: int,
     show: bool,
+    no_cache: bool,
+    batch_dir: Optional[str],
+    jobs: Optional[int],
 ) -> None:
     """Reproduce a figure from a YAML recipe.
 
     SOURCE is the path to a .yaml recipe file or bundle directory.
+    With --batch DIR, every recipe and bundle under DIR is rendered in
+    parallel and one JSON line is printed per file.
 
     \b
     Example:
       $ figrecipe reproduce figure.yaml
       $ figrecipe reproduce figure.yaml -o out.pdf -f pdf --dpi 600
       $ figrecipe reproduce figure.yaml --show
+      $ figrecipe reproduce figure.yaml --no-cache
+      $ figrecipe reproduce --batch figures/ --jobs 8 --dpi 600
+      $ figrecipe reproduce --batch figures/ -o exported/ -f pdf
+
+    Unchanged recipes are served from the render cache
+    (see 'figrecipe cache'); only the image is written. With --no-cache
+    the recipe and hitmap sidecars are written as well.
     """
+    if source is None and batch_dir is None:
+        raise click.MissingParameter(
+            param_hint="'SOURCE'",
+            param_type="argument",
+            message="Pass a recipe or use --batch DIR.",
+        )
+    if source is not None and batch_dir is not None:
+        raise click.UsageError("SOURCE and --batch DIR are mutually exclusive.")
+
+    if batch_dir is not None:
+        if show:
+            raise click.UsageError("--show cannot be combined with --batch.")
+        run_batch_command(batch_dir, output, fmt, dpi, jobs, not no_cache)
+        return
+
     import matplotlib.pyplot as plt
 
     from .. import reproduce as fr_reproduce
 
     source_path = Path(source)
 
-    # Reproduce the figure
-    try:
-        fig, axes = fr_reproduce(source_path)
-    except Exception as e:
-        raise click.ClickException(f"Failed to reproduce: {e}") from e
-
     # Determine output path
     if output:
         output_path = Path(output)
     else:
         output_path = source_path.with_suffix(f".reproduced.{fmt}")
 
-    # Save or show
-    if show:
-        plt.show()
-    else:
-        fig.savefig(output_path, dpi=dpi, format=fmt)
-        click.echo(f"Saved: {output_path}")
+    if not show:
+        from .._render_cache import render_recipe
+
+        try:
+            output_path, cached = render_recipe(
+                source_path, output_path, fmt, dpi, use_cache=not no_cache
+            )
+        except Exception as e:
+            raise click.ClickException(f"Failed to reproduce: {e}") from e
+        click.echo(f"Saved: {output_path}{' (cached)' if cached else ''}")
+        return
+
+    # Reproduce the figure
+    try:
+        fig, axes = fr_reproduce(source_path)
+    except Exception as e:
+        raise click.ClickException(f"Failed to reproduce: {e}") from e
+
+    plt.show()
 
     # Close the figure (handle both regular and Recording figures)
     try:
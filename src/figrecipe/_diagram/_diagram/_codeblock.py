@@ -168,22 +168,17 @@ def _measure_char_width_mm(ax, fontsize, fontfamily="monospace") -> float:
     """Measure actual monospace character width in data (mm) coordinates.
 
     Uses two-point measurement to eliminate bbox padding bias:
-    width = (bbox(60 chars) - bbox(20 chars)) / 40.
+    width = (bbox(60 chars) - bbox(20 chars)) / 40. Widths come from the
+    cached text layout, so the figure is not drawn.
     """
-    fig = ax.get_figure()
-    fig.canvas.draw()
-    renderer = fig.canvas.get_renderer()
-    inv = ax.transData.inverted()
+    from ._text_metrics import points_to_data, text_offsets
 
     widths = []
     for n in (20, 60):
-        t = ax.text(0, 0, "M" * n, fontsize=fontsize, fontfamily=fontfamily, alpha=0)
-        bbox = t.get_window_extent(renderer)
-        p0, p1 = inv.transform((bbox.x0, 0)), inv.transform((bbox.x1, 0))
-        widths.append(p1[0] - p0[0])
-        t.remove()
+        left, _, right, _ = text_offsets("M" * n, fontsize, fontfamily=fontfamily)
+        widths.append(right - left)
 
-    return (widths[1] - widths[0]) / 40
+    return (widths[1] - widths[0]) / 40 * points_to_data(ax)
 
 
 def render_codeblock_text(
@@ -70,6 +70,9 @@ class Diagram:
         self._icons: Dict[str, IconSpec] = {}
         self._positions: Dict[str, PositionSpec] = {}
         self._render_info: Dict[str, Dict[str, Any]] = {}
+        self._draw_state = None  # artists per element, for incremental draws
+        self._layout_cache = None  # layers of the last auto_layout
+        self._flex_explicit: Dict[str, Tuple[float, float]] = {}  # user sizes
 
     def add_box(
         self,
@@ -182,6 +185,7 @@ class Diagram:
         }
         if self._gap_mm is not None and x_mm is None and y_mm is None:
             self._positions[id] = PositionSpec(0, 0, width_mm or 0, height_mm or 0)
+            self._flex_explicit[id] = (width_mm or 0, height_mm or 0)
             self._flow_items.append(id)
             return self
         if None not in (x_mm, y_mm, width_mm, height_mm):
@@ -268,8 +272,13 @@ class Diagram:
         avoid_overlap: bool = True,
         justify: str = "space-between",
         align_items: str = "center",
+        incremental: bool = False,
     ) -> "Diagram":
-        """Automatically position boxes. See _layout for details."""
+        """Automatically position boxes. See _layout for details.
+
+        incremental=True keeps boxes from the previous flow layout in place
+        and only slots newly added boxes into their layer.
+        """
         from ._layout import auto_layout
 
         auto_layout(
@@ -281,6 +290,7 @@ class Diagram:
             avoid_overlap=avoid_overlap,
             justify=justify,
             align_items=align_items,
+            incremental=incremental,
         )
         return self
 
@@ -338,8 +348,13 @@ class Diagram:
         ax: Optional[Axes] = None,
         auto_fix: bool = False,
         auto_curve: bool = True,
+        incremental: bool = False,
     ) -> Tuple["Figure", Axes]:
-        """Render. auto_fix=True resolves violations; auto_curve=False skips R7."""
+        """Render. auto_fix=True resolves violations; auto_curve=False skips R7.
+
+        incremental=True re-renders onto the same ``ax`` by replacing only
+        the elements that changed since the previous render (editors).
+        """
         import matplotlib.pyplot as plt
 
         from . import _render as _sr
@@ -360,7 +375,7 @@ class Diagram:
         else:
             fig = ax.figure
 
-        _sr.draw_all_elements(self, ax)
+        _sr.draw_all_elements(self, ax, incremental=incremental)
 
         if auto_fix:
             from ._autofix import fix_post_render
@@ -368,7 +383,8 @@ class Diagram:
             for _ in range(3):
                 if fix_post_render(self, fig, ax) == 0:
                     break
-                _sr.draw_all_elements(self, ax)
+                # Only the arrows whose labels moved are redrawn
+                _sr.draw_all_elements(self, ax, incremental=True)
 
         if owns_fig:
             fig._figrecipe_diagram_failed = False
@@ -383,6 +399,8 @@ class Diagram:
 
         # Auto-crop SVG on any savefig call (stx.io.save, direct, etc.)
         # Pixel-analysis approach: renders temp PNG → find_content_area → adjust viewBox
+        if hasattr(fig, "_figrecipe_original_savefig"):
+            return fig, ax  # already wrapped by an earlier render
         _original_savefig = fig.savefig
         fig._figrecipe_original_savefig = _original_savefig  # exposed for crop_svg
 
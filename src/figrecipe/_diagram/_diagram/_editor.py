@@ -182,20 +182,19 @@ class DiagramEditor:
             plt.close(self._fig)
 
     def _redraw(self) -> None:
-        """Redraw the diagram with updated positions."""
-        self._ax.clear()
-        self.info.render(ax=self._ax)
+        """Redraw the diagram with updated positions.
+
+        Only the elements that changed (the moved box and its arrows) are
+        re-rendered; the rest of the axes is kept.
+        """
+        self.info.render(ax=self._ax, incremental=True)
         status = " [MODIFIED]" if self._modified else ""
-        self._ax.text(
-            0.5,
-            -0.05,
-            f"Drag boxes to move | Press 'S' to save | Press 'Q' to quit{status}",
-            transform=self._ax.transAxes,
-            ha="center",
-            va="top",
-            fontsize=9,
-            color="orange" if self._modified else "gray",
+        self._instruction_text.set_text(
+            f"Drag boxes to move | Press 'S' to save | Press 'Q' to quit{status}"
         )
+        self._instruction_text.set_color("orange" if self._modified else "gray")
+        if self._instruction_text.axes is None:  # full redraw cleared the axes
+            self._ax.add_artist(self._instruction_text)
         self._fig.canvas.draw()
 
     def _save(self) -> None:
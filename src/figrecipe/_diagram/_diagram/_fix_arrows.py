@@ -172,40 +172,84 @@ def fix_bidirectional_arrows(diagram: "Diagram", curve: float = 0.4) -> int:
 # ── R7: Arrow occlusion auto-curve ─────────────────────────────────
 
 
-def _arrow_visibility_prerender(diagram: "Diagram", arrow) -> float:
+def _arrow_visibility_prerender(diagram: "Diagram", arrow, boxes=None) -> float:
     """Compute visibility ratio for an arrow against intermediate boxes.
 
     Returns float in [0, 1]: 1.0 = fully visible, 0.0 = fully occluded.
     For curved arrows, approximates the arc as two segments via the
-    midpoint offset (curve * dist perpendicular to the chord).
+    midpoint offset (curve * dist perpendicular to the chord). ``boxes``
+    is a box GridIndex to reuse across arrows; built when omitted.
     """
-    from ._geom import box_rect, seg_rect_clip_len
+    return float(_curve_visibilities(diagram, [arrow], [arrow.curve], boxes)[0, 0])
 
-    src = diagram._positions.get(arrow.source)
-    tgt = diagram._positions.get(arrow.target)
-    if not src or not tgt:
-        return 1.0
-    dx, dy = tgt.x_mm - src.x_mm, tgt.y_mm - src.y_mm
-    dist = math.hypot(dx, dy)
-    if dist < 1e-6:
-        return 1.0
-    # Build path: straight (2 pts) or curved (3 pts via midpoint offset)
-    if arrow.curve and abs(arrow.curve) > 1e-6:
-        nx, ny = -dy / dist, dx / dist  # perpendicular unit vector
-        mx = (src.x_mm + tgt.x_mm) / 2 + nx * arrow.curve * dist
-        my = (src.y_mm + tgt.y_mm) / 2 + ny * arrow.curve * dist
-        segments = [(src.x_mm, src.y_mm, mx, my), (mx, my, tgt.x_mm, tgt.y_mm)]
-    else:
-        segments = [(src.x_mm, src.y_mm, tgt.x_mm, tgt.y_mm)]
-    total_len = sum(math.hypot(s[2] - s[0], s[3] - s[1]) for s in segments)
-    occluded = 0.0
-    for bid, pos in diagram._positions.items():
-        if bid in (arrow.source, arrow.target) or bid not in diagram._boxes:
+
+def _curve_visibilities(diagram: "Diagram", arrows, curves, boxes=None):
+    """Visibility ratio of each arrow for each candidate curve value.
+
+    Candidate (arrow, box) pairs come from the box index; the paths of all
+    arrows and curves are clipped against them in one vectorized call.
+    Returns an ``(n_arrows, n_curves)`` array.
+    """
+    import numpy as np
+
+    from ._geom import seg_rects_clip_len
+    from ._spatial import box_index
+
+    curves = np.asarray(curves, dtype=float)
+    vis = np.ones((len(arrows), len(curves)))
+    ends = []
+    for i, arrow in enumerate(arrows):
+        src = diagram._positions.get(arrow.source)
+        tgt = diagram._positions.get(arrow.target)
+        if not (src and tgt):
             continue
-        bl, bb, br, bt = box_rect(pos)
-        for x0, y0, x1, y1 in segments:
-            occluded += seg_rect_clip_len(x0, y0, x1, y1, bl, bb, br, bt)
-    return 1.0 - min(occluded / total_len, 1.0)
+        if math.hypot(tgt.x_mm - src.x_mm, tgt.y_mm - src.y_mm) >= 1e-6:
+            ends.append((i, src.x_mm, src.y_mm, tgt.x_mm, tgt.y_mm))
+    if not ends:
+        return vis
+    rows, sx, sy, tx, ty = (np.array(v)[:, None] for v in zip(*ends))
+
+    # Path per curve: two segments via the midpoint offset perpendicular to
+    # the chord (a straight path is two collinear halves, same clip length)
+    dx, dy = tx - sx, ty - sy
+    dist = np.hypot(dx, dy)
+    offset = np.where(np.abs(curves) > 1e-6, curves, 0.0) * dist
+    mx = (sx + tx) / 2 - dy / dist * offset
+    my = (sy + ty) / 2 + dx / dist * offset
+    # (arrows, curves, 2 segments)
+    x0 = np.stack(np.broadcast_arrays(sx, mx), axis=-1)
+    y0 = np.stack(np.broadcast_arrays(sy, my), axis=-1)
+    x1 = np.stack(np.broadcast_arrays(mx, tx), axis=-1)
+    y1 = np.stack(np.broadcast_arrays(my, ty), axis=-1)
+    total_len = np.hypot(x1 - x0, y1 - y0).sum(axis=-1)
+
+    if boxes is None:
+        ids = [b for b in diagram._positions if b in diagram._boxes]
+        boxes = box_index(diagram, ids)
+    pair_arrow, pair_rect = [], []
+    for k, i in enumerate(rows[:, 0]):
+        arrow = arrows[i]
+        span = (
+            min(x0[k].min(), x1[k].min()),
+            min(y0[k].min(), y1[k].min()),
+            max(x0[k].max(), x1[k].max()),
+            max(y0[k].max(), y1[k].max()),
+        )
+        for bid in boxes.query(span):
+            if bid not in (arrow.source, arrow.target):
+                pair_arrow.append(k)
+                pair_rect.append(boxes.rect(bid))
+    if not pair_arrow:
+        return vis
+    pa = np.array(pair_arrow)
+    r = np.array(pair_rect)[:, None, None, :]
+    clip = seg_rects_clip_len(
+        x0[pa], y0[pa], x1[pa], y1[pa], r[..., 0], r[..., 1], r[..., 2], r[..., 3]
+    )
+    occluded = np.zeros_like(total_len)
+    np.add.at(occluded, pa, clip.sum(axis=-1))
+    vis[rows[:, 0]] = 1.0 - np.minimum(occluded / total_len, 1.0)
+    return vis
 
 
 def fix_arrow_occlusion(diagram: "Diagram", min_visible: float = 0.9) -> int:
@@ -214,17 +258,21 @@ def fix_arrow_occlusion(diagram: "Diagram", min_visible: float = 0.9) -> int:
     Tries curve values in both directions, picking the one with best
     visibility. Skips arrows where the user already set a curve.
     """
+    from ._spatial import box_index
+
+    ids = [b for b in diagram._positions if b in diagram._boxes]
+    boxes = box_index(diagram, ids)
+    candidates = [0.3, -0.3, 0.5, -0.5, 0.7, -0.7, 1.0, -1.0]
+    # Visibility only depends on the boxes, so all straight arrows and
+    # their candidate curves are evaluated in one batch
+    straight = [a for a in diagram._arrows if a.curve == 0.0]
+    table = _curve_visibilities(diagram, straight, [0.0, *candidates], boxes)
     fixed = 0
-    for arrow in diagram._arrows:
-        if arrow.curve != 0.0:
-            continue
-        vis = _arrow_visibility_prerender(diagram, arrow)
+    for arrow, (vis, *candidate_vis) in zip(straight, table.tolist()):
         if vis >= min_visible:
             continue
         best_curve, best_vis = 0.0, vis
-        for c in [0.3, -0.3, 0.5, -0.5, 0.7, -0.7, 1.0, -1.0]:
-            arrow.curve = c
-            v = _arrow_visibility_prerender(diagram, arrow)
+        for c, v in zip(candidates, candidate_vis):
             if v > best_vis:
                 best_curve, best_vis = c, v
             if v >= min_visible:
@@ -270,32 +318,34 @@ def fix_post_render(diagram, fig, ax, min_margin=2.0) -> int:
     Offsets affected labels perpendicular to the arrow direction.
     Returns number of arrow labels adjusted.
     """
-    from ._geom import bbox_gap, box_rect, seg_rect_clip_len
+    from matplotlib.transforms import Bbox
 
-    fig.canvas.draw()
-    renderer = fig.canvas.get_renderer()
-    inv = ax.transData.inverted()
+    from ._geom import bbox_gap, seg_rect_clip_len
+    from ._spatial import GridIndex, bbox_rect, box_index
+    from ._text_metrics import text_extents
 
-    # Collect all text bboxes
+    # Collect all text bboxes (cached layout, no redraw)
     text_entries = []
-    for t in ax.texts:
+    for t, bb in text_extents(ax):
         txt = t.get_text().strip()
         if not txt or t.get_label() == "__codeblock_internal__":
             continue
-        bb = t.get_window_extent(renderer).transformed(inv)
         text_entries.append((txt, bb))
 
     arrow_labels = {a.label for a in diagram._arrows if a.label}
+    label_bbs = {}
+    for txt, bb in text_entries:
+        label_bbs.setdefault(txt, bb)
+    text_index = GridIndex.from_rects(
+        {k: bbox_rect(bb) for k, (_, bb) in enumerate(text_entries)}
+    )
+    edges = box_index(diagram)
 
     fixed = 0
     for arrow in diagram._arrows:
         if not arrow.label:
             continue
-        label_bb = None
-        for txt, bb in text_entries:
-            if txt == arrow.label:
-                label_bb = bb
-                break
+        label_bb = label_bbs.get(arrow.label)
         if label_bb is None:
             continue
 
@@ -320,7 +370,8 @@ def fix_post_render(diagram, fig, ax, min_margin=2.0) -> int:
 
         # R5/R6: Check collision with non-arrow-label text
         if not needs_fix:
-            for txt, bb in text_entries:
+            for k in text_index.query(bbox_rect(label_bb), pad=min_margin):
+                txt, bb = text_entries[k]
                 if txt == arrow.label or txt in arrow_labels:
                     continue
                 if bbox_gap(label_bb, bb) < min_margin:
@@ -329,12 +380,8 @@ def fix_post_render(diagram, fig, ax, min_margin=2.0) -> int:
 
         # R5/R6: Check proximity to box/container edges
         if not needs_fix:
-            from matplotlib.transforms import Bbox
-
-            for eid in list(diagram._boxes) + list(diagram._containers):
-                if eid not in diagram._positions:
-                    continue
-                el, eb, er, et = box_rect(diagram._positions[eid])
+            for eid in edges.query(bbox_rect(label_bb), pad=min_margin):
+                el, eb, er, et = edges.rect(eid)
                 cx = (label_bb.x0 + label_bb.x1) / 2
                 cy = (label_bb.y0 + label_bb.y1) / 2
                 if el <= cx <= er and eb <= cy <= et:
@@ -5,10 +5,10 @@
 Fixes container enclosure (R1), box overlaps (R2), and canvas bounds (R9).
 """
 
-from itertools import combinations
 from typing import TYPE_CHECKING, Dict, List
 
-from ._geom import box_rect, rects_overlap
+from ._geom import box_rect
+from ._spatial import box_index
 
 try:
     from scitex.logging import getLogger
@@ -66,19 +66,17 @@ def _collect_container_violations(diagram: "Diagram") -> List[Dict]:
 def _collect_overlap_violations(diagram: "Diagram") -> List[Dict]:
     """Collect all R2 box-overlap violations."""
     results = []
-    box_ids = [bid for bid in diagram._boxes if bid in diagram._positions]
-    for id_a, id_b in combinations(box_ids, 2):
-        r_a = box_rect(diagram._positions[id_a])
-        r_b = box_rect(diagram._positions[id_b])
-        if rects_overlap(r_a, r_b):
-            results.append(
-                {
-                    "id_a": id_a,
-                    "id_b": id_b,
-                    "overlap_x": min(r_a[2], r_b[2]) - max(r_a[0], r_b[0]),
-                    "overlap_y": min(r_a[3], r_b[3]) - max(r_a[1], r_b[1]),
-                }
-            )
+    index = box_index(diagram, diagram._boxes)
+    for id_a, id_b in index.overlapping_pairs():
+        r_a, r_b = index.rect(id_a), index.rect(id_b)
+        results.append(
+            {
+                "id_a": id_a,
+                "id_b": id_b,
+                "overlap_x": min(r_a[2], r_b[2]) - max(r_a[0], r_b[0]),
+                "overlap_y": min(r_a[3], r_b[3]) - max(r_a[1], r_b[1]),
+            }
+        )
     return results
 
 
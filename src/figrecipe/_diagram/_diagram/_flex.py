@@ -99,10 +99,10 @@ def _compute_container_size(info: "Diagram", cid: str, connected: set) -> None:
 
     # Recursively compute child containers first (bottom-up)
     for child in children:
-        if child in info._containers:
-            pos = info._positions.get(child)
-            if pos is None or pos.height_mm == 0:
-                _compute_container_size(info, child, connected)
+        if child in info._containers and (
+            child in info._flex_explicit or child not in info._positions
+        ):
+            _compute_container_size(info, child, connected)
 
     child_sizes = [
         (info._positions[c].width_mm, info._positions[c].height_mm)
@@ -122,12 +122,13 @@ def _compute_container_size(info: "Diagram", cid: str, connected: set) -> None:
         w = max(s[0] for s in child_sizes) + 2 * c_pad
         h = sum(s[1] for s in child_sizes) + total_gaps + title_h + 2 * c_pad
 
-    # Respect explicit width/height overrides (non-zero placeholder)
-    pos = info._positions.get(cid)
-    if pos and pos.width_mm > 0:
-        w = pos.width_mm
-    if pos and pos.height_mm > 0:
-        h = pos.height_mm
+    # Respect explicit width/height overrides given to add_container; sizes
+    # computed by an earlier resolve are recomputed (children may change)
+    explicit_w, explicit_h = info._flex_explicit.get(cid, (0, 0))
+    if explicit_w > 0:
+        w = explicit_w
+    if explicit_h > 0:
+        h = explicit_h
 
     info._positions[cid] = PositionSpec(0, 0, w, h)
 
@@ -4,6 +4,8 @@
 
 import math
 
+import numpy as np
+
 
 def box_rect(pos):
     """Return (left, bottom, right, top) from a PositionSpec."""
@@ -59,4 +61,35 @@ def seg_rect_clip_len(x0, y0, x1, y1, left, bottom, right, top):
     return (t1 - t0) * seg_len if t0 <= t1 else 0.0
 
 
+def seg_rects_clip_len(x0, y0, x1, y1, left, bottom, right, top):
+    """Vectorized ``seg_rect_clip_len`` (Liang-Barsky) over numpy arrays.
+
+    Segment and rectangle arguments broadcast against each other, so
+    ``(n, 1)`` segment arrays with ``(m,)`` rectangle arrays give an
+    ``(n, m)`` matrix of clipped lengths, and equal-length 1-D arrays give
+    one length per (segment, rectangle) pair.
+    """
+    x0, y0, x1, y1 = (np.asarray(a, dtype=float) for a in (x0, y0, x1, y1))
+    dx, dy = x1 - x0, y1 - y0
+    seg_len = np.hypot(dx, dy)
+    t0 = np.zeros(np.broadcast_shapes(x0.shape, np.shape(left)))
+    t1 = np.ones_like(t0)
+    outside = np.broadcast_to(seg_len < 1e-9, t0.shape).copy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for p, q in (
+            (-dx, x0 - left),
+            (dx, right - x0),
+            (-dy, y0 - bottom),
+            (dy, top - y0),
+        ):
+            p = np.broadcast_to(p, t0.shape)
+            parallel = np.abs(p) < 1e-12
+            outside |= parallel & (q < 0)
+            t = q / p
+            t0 = np.where(~parallel & (p < 0), np.maximum(t0, t), t0)
+            t1 = np.where(~parallel & (p > 0), np.minimum(t1, t), t1)
+    inside = ~outside & (t0 <= t1)
+    return np.where(inside, (t1 - t0) * seg_len, 0.0)
+
+
 # EOF
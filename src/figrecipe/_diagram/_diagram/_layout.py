@@ -6,6 +6,8 @@ Provides automatic positioning of boxes based on graph structure.
 Uses networkx for layout computation with graceful fallback.
 """
 
+from collections import deque
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
@@ -15,6 +17,17 @@ if TYPE_CHECKING:
 DEFAULT_WIDTH_MM = 40.0
 DEFAULT_HEIGHT_MM = 25.0
 
+_FLOW_LAYOUTS = ("lr", "rl", "tb", "bt")
+
+
+@dataclass
+class _LayoutCache:
+    """Layer assignment of the last flow layout, for incremental updates."""
+
+    settings: Tuple
+    layers: Dict[str, int]
+    main: Dict[int, float]  # main-axis coordinate of each layer
+
 
 def auto_layout(
     info: "Diagram",
@@ -25,8 +38,15 @@ def auto_layout(
     avoid_overlap: bool = True,
     justify: str = "space-between",
     align_items: str = "center",
+    incremental: bool = False,
 ) -> None:
-    """Automatically position boxes. See Diagram.auto_layout for full docs."""
+    """Automatically position boxes. See Diagram.auto_layout for full docs.
+
+    With ``incremental=True`` a flow layout keeps the boxes placed by the
+    previous call where they are and only slots new boxes into their
+    layer. A full layout runs instead when the settings or canvas bounds
+    differ, when an existing box changes layer or when a layer is full.
+    """
     from ._core import PositionSpec
 
     # Default box size
@@ -123,47 +143,75 @@ def auto_layout(
     if info.title:
         dy_max -= title_space_mm
 
-    # Compute positions based on layout type
-    if layout_key in ("lr", "rl", "tb", "bt"):
-        positions = _flow_layout(
-            box_ids,
-            edges,
-            layout_key,
-            dx_min,
-            dx_max,
-            dy_min,
-            dy_max,
-            gap_mm,
-            justify,
-            align_items,
-            containers=containers,
-            layers=_layers,
-            layer_groups=_layer_groups,
+    # Box extents along the cross axis (existing size, else the default)
+    cross_sizes = {}
+    for bid in box_ids:
+        pos = info._positions.get(bid)
+        size = (pos.height_mm if is_horizontal else pos.width_mm) if pos else 0.0
+        cross_sizes[bid] = size or (h if is_horizontal else w)
+
+    settings = (
+        layout_key,
+        dx_min,
+        dx_max,
+        dy_min,
+        dy_max,
+        gap_mm,
+        justify,
+        align_items,
+        box_size_mm,
+    )
+    positions = None
+    if incremental and layout_key in _FLOW_LAYOUTS:
+        positions = _extend_layout(
+            info, info._layout_cache, settings, _layers, edges, cross_sizes, gap_mm
         )
-    elif layout_key == "spring":
-        from ._layout_graph import _spring_layout
+    extended = positions is not None
 
-        positions = _spring_layout(box_ids, edges, dx_min, dx_max, dy_min, dy_max)
-    elif layout_key == "circular":
-        from ._layout_graph import _circular_layout
+    # Compute positions based on layout type
+    if not extended:
+        if layout_key in _FLOW_LAYOUTS:
+            positions = _flow_layout(
+                box_ids,
+                edges,
+                layout_key,
+                dx_min,
+                dx_max,
+                dy_min,
+                dy_max,
+                gap_mm,
+                justify,
+                align_items,
+                containers=containers,
+                layers=_layers,
+                layer_groups=_layer_groups,
+                cross_sizes=cross_sizes,
+            )
+        elif layout_key == "spring":
+            from ._layout_graph import _spring_layout
 
-        positions = _circular_layout(box_ids, dx_min, dx_max, dy_min, dy_max)
-    else:
-        positions = _flow_layout(
-            box_ids,
-            edges,
-            "lr",
-            dx_min,
-            dx_max,
-            dy_min,
-            dy_max,
-            gap_mm,
-            justify,
-            align_items,
-            containers=containers,
-            layers=_layers,
-            layer_groups=_layer_groups,
-        )
+            positions = _spring_layout(box_ids, edges, dx_min, dx_max, dy_min, dy_max)
+        elif layout_key == "circular":
+            from ._layout_graph import _circular_layout
+
+            positions = _circular_layout(box_ids, dx_min, dx_max, dy_min, dy_max)
+        else:
+            positions = _flow_layout(
+                box_ids,
+                edges,
+                "lr",
+                dx_min,
+                dx_max,
+                dy_min,
+                dy_max,
+                gap_mm,
+                justify,
+                align_items,
+                containers=containers,
+                layers=_layers,
+                layer_groups=_layer_groups,
+                cross_sizes=cross_sizes,
+            )
 
     # Apply positions
     for box_id, (x, y) in positions.items():
@@ -178,6 +226,16 @@ def auto_layout(
                 x_mm=x, y_mm=y, width_mm=w, height_mm=h
             )
 
+    if layout_key in _FLOW_LAYOUTS:
+        # Main-axis coordinate of each layer, for boxes added later
+        main = dict(info._layout_cache.main) if extended else {}
+        axis = 0 if is_horizontal else 1
+        for bid, xy in positions.items():
+            main.setdefault(_layers[bid], xy[axis])
+        info._layout_cache = _LayoutCache(settings, dict(_layers), main)
+    else:
+        info._layout_cache = None
+
     # Apply collision avoidance if requested
     if avoid_overlap:
         from ._overlap import resolve_overlaps
@@ -185,6 +243,85 @@ def auto_layout(
         resolve_overlaps(info, gap_mm, x_min, x_max, y_min, y_max)
 
 
+def _extend_layout(
+    info: "Diagram",
+    cache: Optional[_LayoutCache],
+    settings: Tuple,
+    layers: Dict[str, int],
+    edges: List[Tuple[str, str]],
+    cross_sizes: Dict[str, float],
+    gap: float,
+) -> Optional[Dict[str, Tuple[float, float]]]:
+    """Place boxes added since the cached layout without moving the others.
+
+    Each new box goes into its layer at the free cross-axis slot nearest
+    to the mean of its already placed neighbours. Returns None when a
+    full layout is needed instead.
+    """
+    if cache is None or cache.settings != settings:
+        return None
+    for bid, layer in layers.items():
+        if cache.layers.get(bid, layer) != layer or layer not in cache.main:
+            return None
+
+    layout_key, dx_min, dx_max, dy_min, dy_max = settings[:5]
+    horizontal = layout_key in ("lr", "rl")
+    axis = 1 if horizontal else 0
+    lo, hi = (dy_min, dy_max) if horizontal else (dx_min, dx_max)
+
+    placed: Dict[str, Tuple[float, float]] = {}
+    members: Dict[int, List[str]] = {}
+    for bid, layer in layers.items():
+        if bid in cache.layers and bid in info._positions:
+            pos = info._positions[bid]
+            placed[bid] = (pos.x_mm, pos.y_mm)
+            members.setdefault(layer, []).append(bid)
+    neighbours: Dict[str, List[str]] = {}
+    for src, tgt in edges:
+        neighbours.setdefault(src, []).append(tgt)
+        neighbours.setdefault(tgt, []).append(src)
+
+    positions = {}
+    for bid, layer in layers.items():
+        if bid in placed:
+            continue
+        near = [placed[n][axis] for n in neighbours.get(bid, ()) if n in placed]
+        target = sum(near) / len(near) if near else (lo + hi) / 2
+        taken = [(placed[m][axis], cross_sizes[m]) for m in members.get(layer, ())]
+        c = _free_slot(target, cross_sizes[bid], taken, gap, lo, hi)
+        if c is None:
+            return None
+        m = cache.main[layer]
+        positions[bid] = placed[bid] = (m, c) if horizontal else (c, m)
+        members.setdefault(layer, []).append(bid)
+    return positions
+
+
+def _free_slot(
+    target: float,
+    size: float,
+    taken: List[Tuple[float, float]],
+    gap: float,
+    lo: float,
+    hi: float,
+) -> Optional[float]:
+    """Centre in [lo, hi] nearest to ``target`` clear of ``taken`` boxes.
+
+    ``taken`` holds (centre, size) pairs along the same axis; a slot
+    keeps ``gap`` from each of them. Returns None if none fits.
+    """
+
+    def free(c):
+        return all(abs(c - tc) >= (size + ts) / 2 + gap - 1e-9 for tc, ts in taken)
+
+    candidates = [min(max(target, lo), hi)]
+    for tc, ts in taken:
+        reach = (size + ts) / 2 + gap
+        candidates += [tc - reach, tc + reach]
+    fits = [c for c in candidates if lo - 1e-9 <= c <= hi + 1e-9 and free(c)]
+    return min(fits, key=lambda c: abs(c - target), default=None)
+
+
 def _flow_layout(
     box_ids: List[str],
     edges: List[Tuple[str, str]],
@@ -199,26 +336,41 @@ def _flow_layout(
     containers: Optional[Dict] = None,
     layers: Optional[Dict[str, int]] = None,
     layer_groups: Optional[Dict[int, List[str]]] = None,
+    cross_sizes: Optional[Dict[str, float]] = None,
 ) -> Dict[str, Tuple[float, float]]:
     """Compute flow-based layout using topological ordering with CSS-like options.
 
+    Layers are ordered and placed along the cross axis by the layered
+    (Sugiyama) engine, then scaled to fill the cross-axis bounds.
+
     Parameters
     ----------
     justify : str
         Main axis: start, center, end, space-between, space-around
     align_items : str
-        Cross axis: start, center, end
+        Cross axis when all boxes line up: start, center, end
     layers : dict, optional
         Pre-computed layer assignment from _compute_layers.
     layer_groups : dict, optional
-        Pre-computed layer grouping from _compute_layers.
+        Pre-computed layer grouping from _compute_layers. Reordered in place.
+    cross_sizes : dict, optional
+        Box extent along the cross axis in mm (height for lr/rl, width
+        for tb/bt). Defaults to DEFAULT_HEIGHT_MM / DEFAULT_WIDTH_MM.
     """
+    from .._shared._sugiyama import layered_layout
+
     # Use pre-computed layers or compute from scratch
     if layers is None or layer_groups is None:
         layers, layer_groups = _compute_layers(box_ids, edges, containers)
 
-    # Reorder members within layers to minimize edge crossings
-    _reorder_by_barycenter(layer_groups, layers, edges)
+    # Order members within layers and assign cross-axis coordinates
+    horizontal = direction in ("lr", "rl")
+    if cross_sizes is None:
+        default = DEFAULT_HEIGHT_MM if horizontal else DEFAULT_WIDTH_MM
+        cross_sizes = dict.fromkeys(layers, default)
+    placed = layered_layout(layers, edges, sizes=cross_sizes, gap=gap)
+    layer_groups.update(placed.order)
+    span = max(placed.cross.values(), default=0.0)
 
     n_layers = max(layers.values()) + 1 if layers else 1
 
@@ -255,8 +407,13 @@ def _flow_layout(
             return axis_max
         return (axis_min + axis_max) / 2  # center (default)
 
-    # Cross-axis distribution: space-between spreads items evenly
-    cross_justify = "space-between"
+    # Cross-axis position: engine coordinates scaled to fill the bounds
+    # (first in layer order at the top for lr/rl, at the left for tb/bt)
+    def cross(bid: str, axis_min: float, axis_max: float, flip: bool) -> float:
+        if span <= 0:
+            return align(axis_min, axis_max, align_items)
+        t = placed.cross[bid] / span
+        return axis_min + (1 - t if flip else t) * (axis_max - axis_min)
 
     positions = {}
 
@@ -265,15 +422,8 @@ def _flow_layout(
         main_positions = distribute(n_layers, x_min, x_max, justify)
         for layer_idx, members in layer_groups.items():
             x = main_positions[layer_idx] if layer_idx < len(main_positions) else x_max
-            n = len(members)
-            cross_positions = distribute(n, y_min, y_max, cross_justify)
-            for i, bid in enumerate(members):
-                y = (
-                    cross_positions[n - 1 - i]
-                    if n > 1
-                    else align(y_min, y_max, align_items)
-                )
-                positions[bid] = (x, y)
+            for bid in members:
+                positions[bid] = (x, cross(bid, y_min, y_max, flip=True))
 
     elif direction == "rl":
         # Right to left
@@ -284,15 +434,8 @@ def _flow_layout(
                 if layer_idx < n_layers
                 else x_min
             )
-            n = len(members)
-            cross_positions = distribute(n, y_min, y_max, cross_justify)
-            for i, bid in enumerate(members):
-                y = (
-                    cross_positions[n - 1 - i]
-                    if n > 1
-                    else align(y_min, y_max, align_items)
-                )
-                positions[bid] = (x, y)
+            for bid in members:
+                positions[bid] = (x, cross(bid, y_min, y_max, flip=True))
 
     elif direction == "tb":
         # Top to bottom: main=Y (reversed), cross=X
@@ -303,22 +446,16 @@ def _flow_layout(
                 if layer_idx < n_layers
                 else y_min
             )
-            n = len(members)
-            cross_positions = distribute(n, x_min, x_max, cross_justify)
-            for i, bid in enumerate(members):
-                x = cross_positions[i] if n > 1 else align(x_min, x_max, align_items)
-                positions[bid] = (x, y)
+            for bid in members:
+                positions[bid] = (cross(bid, x_min, x_max, flip=False), y)
 
     elif direction == "bt":
         # Bottom to top: main=Y, cross=X
         main_positions = distribute(n_layers, y_min, y_max, justify)
         for layer_idx, members in layer_groups.items():
             y = main_positions[layer_idx] if layer_idx < len(main_positions) else y_max
-            n = len(members)
-            cross_positions = distribute(n, x_min, x_max, cross_justify)
-            for i, bid in enumerate(members):
-                x = cross_positions[i] if n > 1 else align(x_min, x_max, align_items)
-                positions[bid] = (x, y)
+            for bid in members:
+                positions[bid] = (cross(bid, x_min, x_max, flip=False), y)
 
     return positions
 
@@ -370,18 +507,17 @@ def _compute_layers(
             predecessors[tgt].append(src)
 
     in_degree = {bid: len(predecessors[bid]) for bid in box_ids}
-    queue = [bid for bid in box_ids if in_degree[bid] == 0]
+    queue = deque(bid for bid in box_ids if in_degree[bid] == 0)
     sorted_ids: List[str] = []
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         sorted_ids.append(node)
         for succ in successors[node]:
             in_degree[succ] -= 1
             if in_degree[succ] == 0:
                 queue.append(succ)
-    for bid in box_ids:
-        if bid not in sorted_ids:
-            sorted_ids.append(bid)
+    seen = set(sorted_ids)
+    sorted_ids += [bid for bid in box_ids if bid not in seen]
 
     layers = _assign_layers(sorted_ids, predecessors, containers=containers)
     layer_groups: Dict[int, List[str]] = {}
@@ -390,63 +526,4 @@ def _compute_layers(
     return layers, layer_groups
 
 
-def _reorder_by_barycenter(
-    layer_groups: Dict[int, List[str]],
-    layers: Dict[str, int],
-    edges: List[Tuple[str, str]],
-) -> None:
-    """Reorder members within layers to minimize edge crossings (in-place).
-
-    Uses the barycenter heuristic with forward + backward sweeps.
-    """
-    preds: Dict[str, List[str]] = {}
-    succs: Dict[str, List[str]] = {}
-    for src, tgt in edges:
-        preds.setdefault(tgt, []).append(src)
-        succs.setdefault(src, []).append(tgt)
-
-    member_idx: Dict[str, int] = {}
-    for members in layer_groups.values():
-        for i, bid in enumerate(members):
-            member_idx[bid] = i
-
-    sorted_keys = sorted(layer_groups.keys())
-
-    # Forward sweep: reorder by predecessor positions
-    for layer_idx in sorted_keys:
-        if layer_idx == sorted_keys[0]:
-            continue
-        members = layer_groups[layer_idx]
-        n = len(members)
-        bary: Dict[str, float] = {}
-        for bid in members:
-            pi = [
-                member_idx[p]
-                for p in preds.get(bid, [])
-                if layers.get(p, -1) < layer_idx and p in member_idx
-            ]
-            bary[bid] = sum(pi) / len(pi) if pi else n / 2
-        layer_groups[layer_idx] = sorted(members, key=lambda b: bary[b])
-        for i, bid in enumerate(layer_groups[layer_idx]):
-            member_idx[bid] = i
-
-    # Backward sweep: reorder by successor positions
-    for layer_idx in reversed(sorted_keys):
-        if layer_idx == sorted_keys[-1]:
-            continue
-        members = layer_groups[layer_idx]
-        n = len(members)
-        bary = {}
-        for bid in members:
-            si = [
-                member_idx[s]
-                for s in succs.get(bid, [])
-                if layers.get(s, -1) > layer_idx and s in member_idx
-            ]
-            bary[bid] = sum(si) / len(si) if si else n / 2
-        layer_groups[layer_idx] = sorted(members, key=lambda b: bary[b])
-        for i, bid in enumerate(layer_groups[layer_idx]):
-            member_idx[bid] = i
-
-
 __all__ = ["auto_layout"]
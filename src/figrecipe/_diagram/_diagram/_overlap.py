@@ -19,86 +19,123 @@ def resolve_overlaps(
 ) -> None:
     """Resolve overlapping boxes by pushing them apart.
 
-    Uses iterative collision detection and resolution.
+    Uses iterative collision detection and resolution. Candidate pairs come
+    from a spatial grid of the boxes grown by their clearance, so each pass
+    only compares neighbouring boxes; pairs are still visited in the same
+    order as a full pairwise scan.
     """
+    from ._spatial import GridIndex
 
     box_ids = list(info._positions.keys())
     if len(box_ids) < 2:
         return
 
+    def clearance(bid):
+        box = info._boxes.get(bid)
+        return gap / 2 + (box.margin_mm if box else 0.0)
+
+    def padded(bid):
+        pos = info._positions[bid]
+        half_w = pos.width_mm / 2 + clearance(bid)
+        half_h = pos.height_mm / 2 + clearance(bid)
+        return (
+            pos.x_mm - half_w,
+            pos.y_mm - half_h,
+            pos.x_mm + half_w,
+            pos.y_mm + half_h,
+        )
+
+    index = GridIndex.from_rects({bid: padded(bid) for bid in box_ids})
+    bounds = (x_min, x_max, y_min, y_max)
+
     for _ in range(max_iterations):
         moved = False
 
         for i, id1 in enumerate(box_ids):
-            pos1 = info._positions[id1]
-            box1 = info._boxes.get(id1)
-            margin1 = box1.margin_mm if box1 else 0.0
-
-            for id2 in box_ids[i + 1 :]:
-                pos2 = info._positions[id2]
-                box2 = info._boxes.get(id2)
-                margin2 = box2.margin_mm if box2 else 0.0
-
-                # Calculate overlap with gap and margins
-                total_gap = gap + margin1 + margin2
-                half_w1 = pos1.width_mm / 2 + total_gap / 2
-                half_h1 = pos1.height_mm / 2 + total_gap / 2
-                half_w2 = pos2.width_mm / 2 + total_gap / 2
-                half_h2 = pos2.height_mm / 2 + total_gap / 2
-
-                dx = pos2.x_mm - pos1.x_mm
-                dy = pos2.y_mm - pos1.y_mm
-
-                overlap_x = half_w1 + half_w2 - abs(dx)
-                overlap_y = half_h1 + half_h2 - abs(dy)
-
-                # Check if overlapping
-                if overlap_x > 0 and overlap_y > 0:
-                    moved = True
-
-                    # Push apart along axis with smaller overlap
-                    if overlap_x < overlap_y:
-                        # Push horizontally
-                        push = overlap_x / 2 + 0.1
-                        if dx >= 0:
-                            pos1.x_mm -= push
-                            pos2.x_mm += push
-                        else:
-                            pos1.x_mm += push
-                            pos2.x_mm -= push
-                    else:
-                        # Push vertically
-                        push = overlap_y / 2 + 0.1
-                        if dy >= 0:
-                            pos1.y_mm -= push
-                            pos2.y_mm += push
-                        else:
-                            pos1.y_mm += push
-                            pos2.y_mm -= push
-
-                    # Clamp to bounds
-                    pos1.x_mm = max(
-                        x_min + pos1.width_mm / 2,
-                        min(x_max - pos1.width_mm / 2, pos1.x_mm),
-                    )
-                    pos1.y_mm = max(
-                        y_min + pos1.height_mm / 2,
-                        min(y_max - pos1.height_mm / 2, pos1.y_mm),
-                    )
-                    pos2.x_mm = max(
-                        x_min + pos2.width_mm / 2,
-                        min(x_max - pos2.width_mm / 2, pos2.x_mm),
-                    )
-                    pos2.y_mm = max(
-                        y_min + pos2.height_mm / 2,
-                        min(y_max - pos2.height_mm / 2, pos2.y_mm),
-                    )
-
-                    info._positions[id1] = pos1
-                    info._positions[id2] = pos2
+            j = i
+            while True:
+                # Small pad keeps exactly-touching pairs as candidates
+                near = index.query(padded(id1), pad=1e-6)
+                later = [k for k in near if index.order(k) > j]
+                pushed = False
+                for id2 in later:
+                    j = index.order(id2)
+                    if _push_apart(info, id1, id2, gap, bounds):
+                        moved = pushed = True
+                        index.update(id1, padded(id1))
+                        index.update(id2, padded(id2))
+                        break
+                if not pushed:
+                    break
 
         if not moved:
             break
 
 
+def _push_apart(info: "Diagram", id1: str, id2: str, gap: float, bounds) -> bool:
+    """Push two boxes apart if they overlap (with gap and margins).
+
+    Returns True if the boxes were moved.
+    """
+    x_min, x_max, y_min, y_max = bounds
+    pos1 = info._positions[id1]
+    box1 = info._boxes.get(id1)
+    margin1 = box1.margin_mm if box1 else 0.0
+    pos2 = info._positions[id2]
+    box2 = info._boxes.get(id2)
+    margin2 = box2.margin_mm if box2 else 0.0
+
+    # Calculate overlap with gap and margins
+    total_gap = gap + margin1 + margin2
+    half_w1 = pos1.width_mm / 2 + total_gap / 2
+    half_h1 = pos1.height_mm / 2 + total_gap / 2
+    half_w2 = pos2.width_mm / 2 + total_gap / 2
+    half_h2 = pos2.height_mm / 2 + total_gap / 2
+
+    dx = pos2.x_mm - pos1.x_mm
+    dy = pos2.y_mm - pos1.y_mm
+
+    overlap_x = half_w1 + half_w2 - abs(dx)
+    overlap_y = half_h1 + half_h2 - abs(dy)
+
+    # Check if overlapping
+    if not (overlap_x > 0 and overlap_y > 0):
+        return False
+
+    # Push apart along axis with smaller overlap
+    if overlap_x < overlap_y:
+        # Push horizontally
+        push = overlap_x / 2 + 0.1
+        if dx >= 0:
+            pos1.x_mm -= push
+            pos2.x_mm += push
+        else:
+            pos1.x_mm += push
+            pos2.x_mm -= push
+    else:
+        # Push vertically
+        push = overlap_y / 2 + 0.1
+        if dy >= 0:
+            pos1.y_mm -= push
+            pos2.y_mm += push
+        else:
+            pos1.y_mm += push
+            pos2.y_mm -= push
+
+    # Clamp to bounds
+    for pos in (pos1, pos2):
+        pos.x_mm = max(
+            x_min + pos.width_mm / 2,
+            min(x_max - pos.width_mm / 2, pos.x_mm),
+        )
+        pos.y_mm = max(
+            y_min + pos.height_mm / 2,
+            min(y_max - pos.height_mm / 2, pos.y_mm),
+        )
+
+    info._positions[id1] = pos1
+    info._positions[id2] = pos2
+    return True
+
+
 __all__ = ["resolve_overlaps"]
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 """Rendering functions for diagram diagrams."""
 
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from matplotlib.axes import Axes
 from matplotlib.patches import (
@@ -258,6 +258,38 @@ def render_container(diagram: "Diagram", ax: Axes, cid: str, container: Dict) ->
     diagram._render_info[cid] = {"pos": pos}
 
 
+def box_text_items(box: "BoxSpec") -> List[Tuple[str, float, str, Any, str]]:
+    """Return the text lines of a rich text box.
+
+    Each item is (text, fontsize, fontweight, color, fontfamily); color is
+    None where the emphasis text color applies.
+    """
+    is_code = box.shape == "codeblock"
+    pfx = {"circle": "\u00b7 ", "dash": "\u2013 ", "arrow": "\u2192 "}.get(
+        box.bullet, ""
+    )
+    body_family = "monospace" if is_code else "sans-serif"
+    items = [(box.title, 11, "bold", None, "sans-serif")]
+    if box.subtitle:
+        items.append((box.subtitle, 9, "normal", None, body_family))
+    for line in box.content:
+        if isinstance(line, dict):
+            items.append(
+                (
+                    pfx + line.get("text", ""),
+                    line.get("fontsize", 8),
+                    line.get("fontweight", "normal"),
+                    line.get("color"),
+                    body_family,
+                )
+            )
+        else:
+            items.append(
+                (pfx + str(line), 8 if not is_code else 7, "normal", None, body_family)
+            )
+    return items
+
+
 def render_box(diagram: "Diagram", ax: Axes, bid: str, box: "BoxSpec") -> None:
     """Render a rich text box."""
     pos = diagram._positions[bid]
@@ -314,31 +346,9 @@ def render_box(diagram: "Diagram", ax: Axes, bid: str, box: "BoxSpec") -> None:
         diagram._render_info[bid] = {"pos": pos}
         return
 
-    # Build text items: list of (text, fontsize, fontweight, color)
+    # Text items: list of (text, fontsize, fontweight, color, fontfamily)
     is_code = box.shape == "codeblock"
-    items = [(box.title, 11, "bold", title_color)]
-    if box.subtitle:
-        items.append((box.subtitle, 9, "normal", colors["text"]))
-    for line in box.content:
-        if isinstance(line, dict):
-            pfx = {"circle": "\u00b7 ", "dash": "\u2013 ", "arrow": "\u2192 "}.get(
-                box.bullet, ""
-            )
-            items.append(
-                (
-                    pfx + line.get("text", ""),
-                    line.get("fontsize", 8),
-                    line.get("fontweight", "normal"),
-                    line.get("color", colors["text"]),
-                )
-            )
-        else:
-            pfx = {"circle": "\u00b7 ", "dash": "\u2013 ", "arrow": "\u2192 "}.get(
-                box.bullet, ""
-            )
-            items.append(
-                (pfx + str(line), 8 if not is_code else 7, "normal", colors["text"])
-            )
+    items = box_text_items(box)
 
     # Text area = PositionSpec minus padding on all sides
     inner_h = pos.height_mm - 2 * box.padding_mm
@@ -356,7 +366,9 @@ def render_box(diagram: "Diagram", ax: Axes, bid: str, box: "BoxSpec") -> None:
     )
     ha = "left" if is_code else "center"
     x_text = (pos.x_mm - pos.width_mm / 2 + box.padding_mm) if is_code else pos.x_mm
-    for i, (text, fsize, fweight, fcolor) in enumerate(items):
+    for i, (text, fsize, fweight, fcolor, family) in enumerate(items):
+        if fcolor is None:
+            fcolor = title_color if i == 0 else colors["text"]
         ax.text(
             x_text,
             top_y - i * gap,
@@ -366,7 +378,7 @@ def render_box(diagram: "Diagram", ax: Axes, bid: str, box: "BoxSpec") -> None:
             fontsize=fsize,
             fontweight=fweight,
             color=fcolor,
-            fontfamily="monospace" if is_code and i > 0 else "sans-serif",
+            fontfamily=family,
             fontstyle="normal",
             zorder=7,
             bbox=_txt_bg,
@@ -468,30 +480,92 @@ def render_arrow(diagram: "Diagram", ax: Axes, arrow: "ArrowSpec") -> None:
         )
 
 
-def draw_all_elements(diagram, ax):
-    """Draw all diagram elements onto axes (used by Diagram.render)."""
-    ax.clear()
-    ax.set_xlim(diagram.xlim)
-    ax.set_ylim(diagram.ylim)
-    ax.set_aspect("equal")
-    ax.axis("off")
+class _DrawState:
+    """Artists drawn for each diagram element and what they were drawn from.
+
+    Lets ``draw_all_elements(..., incremental=True)`` replace only the
+    elements whose geometry or spec changed since the last draw.
+    """
+
+    def __init__(self, ax: Axes, frame: Tuple):
+        self.ax = ax
+        self.frame = frame
+        # ax.clear() swaps in a new child list; a different list means
+        # the axes was cleared behind our back
+        self.children = ax._children
+        self.artists: Dict[Tuple, List] = {}
+        self.signatures: Dict[Tuple, Any] = {}
+
+
+def _frame(diagram, ax) -> Tuple:
+    """Everything besides the elements that drawn artists depend on."""
+    fig = ax.figure
+    return (
+        tuple(diagram.xlim),
+        tuple(diagram.ylim),
+        tuple(fig.get_size_inches()),
+        fig.dpi,
+        tuple(ax.get_position(original=True).bounds),
+    )
+
+
+def _drawn_elements(diagram, ax) -> List[Tuple[Tuple, Any, Any]]:
+    """Return ``(key, signature, draw)`` for every element, in draw order.
+
+    The signature holds everything the element's artists are computed
+    from: its position and spec (and for arrows, both endpoints).
+    """
+    positions = diagram._positions
+
+    def geom(eid):
+        p = positions[eid]
+        return (p.x_mm, p.y_mm, p.width_mm, p.height_mm)
+
+    elements = []
     for cid in sorted(
-        (c for c in diagram._containers if c in diagram._positions),
-        key=lambda c: -(
-            diagram._positions[c].width_mm * diagram._positions[c].height_mm
-        ),
+        (c for c in diagram._containers if c in positions),
+        key=lambda c: -(positions[c].width_mm * positions[c].height_mm),
     ):
-        render_container(diagram, ax, cid, diagram._containers[cid])
+        c = diagram._containers[cid]
+        elements.append(
+            (
+                ("container", cid),
+                (geom(cid), repr(c)),
+                lambda cid=cid, c=c: render_container(diagram, ax, cid, c),
+            )
+        )
     for bid, box in diagram._boxes.items():
-        if bid in diagram._positions:
-            render_box(diagram, ax, bid, box)
-    for arrow in diagram._arrows:
-        render_arrow(diagram, ax, arrow)
+        if bid in positions:
+            elements.append(
+                (
+                    ("box", bid),
+                    (geom(bid), repr(box)),
+                    lambda bid=bid, box=box: render_box(diagram, ax, bid, box),
+                )
+            )
+    for i, arrow in enumerate(diagram._arrows):
+        ends = tuple(
+            geom(eid) if eid in positions else None
+            for eid in (arrow.source, arrow.target)
+        )
+        elements.append(
+            (
+                ("arrow", i),
+                (ends, repr(arrow)),
+                lambda arrow=arrow: render_arrow(diagram, ax, arrow),
+            )
+        )
     for iid, icon in diagram._icons.items():
-        if iid in diagram._positions:
-            render_icon(diagram, ax, iid, icon)
+        if iid in positions:
+            elements.append(
+                (
+                    ("icon", iid),
+                    (geom(iid), repr(icon)),
+                    lambda iid=iid, icon=icon: render_icon(diagram, ax, iid, icon),
+                )
+            )
     if diagram.title:
-        ps = list(diagram._positions.values())
+        ps = list(positions.values())
         cx = (
             (
                 min(p.x_mm - p.width_mm / 2 for p in ps)
@@ -501,12 +575,96 @@ def draw_all_elements(diagram, ax):
             if ps
             else (diagram.xlim[0] + diagram.xlim[1]) / 2
         )
-        ax.text(
-            cx,
-            diagram.ylim[1] - 5.0,
-            diagram.title,
-            ha="center",
-            va="top",
-            fontsize=12,
-            fontweight="bold",
+        elements.append(
+            (
+                ("title",),
+                (diagram.title, cx),
+                lambda cx=cx: ax.text(
+                    cx,
+                    diagram.ylim[1] - 5.0,
+                    diagram.title,
+                    ha="center",
+                    va="top",
+                    fontsize=12,
+                    fontweight="bold",
+                ),
+            )
         )
+    return elements
+
+
+def _draw_captured(ax, draw) -> List:
+    """Call ``draw()`` and return the artists it added to ``ax``."""
+    n = len(ax._children)
+    draw()
+    return ax._children[n:]
+
+
+def draw_all_elements(diagram, ax, incremental: bool = False) -> int:
+    """Draw all diagram elements onto axes (used by Diagram.render).
+
+    Parameters
+    ----------
+    diagram : Diagram
+        Diagram to draw.
+    ax : Axes
+        Target axes.
+    incremental : bool
+        Keep the artists of elements unchanged since the previous draw on
+        the same axes and replace only the others. Falls back to a full
+        redraw when the axes, its limits or the figure size changed.
+
+    Returns
+    -------
+    int
+        Number of elements (re)drawn.
+    """
+    frame = _frame(diagram, ax)
+    state = diagram._draw_state
+    elements = _drawn_elements(diagram, ax)
+
+    if (
+        incremental
+        and state is not None
+        and state.ax is ax
+        and state.frame == frame
+        and state.children is ax._children
+    ):
+        stale = {
+            key
+            for key, signature, _ in elements
+            if state.signatures.get(key) != signature
+        }
+        # Containers overlap by design; their stacking follows draw order
+        if any(key[0] == "container" for key in stale):
+            stale.update(key for key in state.artists if key[0] == "container")
+        current = {key for key, _, _ in elements}
+        for key in [k for k in state.artists if k in stale or k not in current]:
+            for artist in state.artists.pop(key):
+                artist.remove()
+            state.signatures.pop(key, None)
+            if key[0] in ("container", "box", "icon") and key not in current:
+                diagram._render_info.pop(key[1], None)
+        for key, signature, draw in elements:
+            if key in stale:
+                state.artists[key] = _draw_captured(ax, draw)
+                state.signatures[key] = signature
+        # Keep artists in element order: validation and the hitmap match
+        # arrows to their patches by position
+        drawn = [a for key, _, _ in elements for a in state.artists.get(key, ())]
+        ids = {id(a) for a in drawn}
+        ax._children[:] = drawn + [a for a in ax._children if id(a) not in ids]
+        ax.stale = True
+        return len(stale)
+
+    ax.clear()
+    ax.set_xlim(diagram.xlim)
+    ax.set_ylim(diagram.ylim)
+    ax.set_aspect("equal")
+    ax.axis("off")
+    state = _DrawState(ax, frame)
+    for key, signature, draw in elements:
+        state.artists[key] = _draw_captured(ax, draw)
+        state.signatures[key] = signature
+    diagram._draw_state = state
+    return len(elements)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Uniform-grid spatial index for diagram geometry.
+
+Overlap resolution, validation and the auto-fixers compare every box
+(or text bbox) against every other one. GridIndex buckets
+(left, bottom, right, top) rectangles into square cells so those
+checks only look at nearby rectangles. Results are returned in
+insertion order, so callers that raise on the first violation report
+the same element pair as the all-pairs loops they replace.
+"""
+
+import math
+from statistics import median
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from ._geom import box_rect
+
+Rect = Tuple[float, float, float, float]
+
+# Rectangles covering more cells than this are kept in a list that every
+# query scans instead (huge containers, degenerate positions).
+_MAX_CELLS_PER_RECT = 4096
+
+
+class GridIndex:
+    """Spatial index of axis-aligned rectangles on a uniform grid.
+
+    Parameters
+    ----------
+    cell_mm : float
+        Edge length of a grid cell in mm.
+    """
+
+    def __init__(self, cell_mm: float = 20.0):
+        self.cell_mm = float(cell_mm) if cell_mm > 0 else 20.0
+        self._rects: Dict[Hashable, Rect] = {}
+        self._order: Dict[Hashable, int] = {}
+        self._cells: Dict[Tuple[int, int], List[Hashable]] = {}
+        self._large: List[Hashable] = []
+        self._seq = 0
+
+    @classmethod
+    def from_rects(
+        cls, rects: Dict[Hashable, Rect], cell_mm: Optional[float] = None
+    ) -> "GridIndex":
+        """Build an index from ``{key: rect}``.
+
+        The default cell size is the median rectangle extent, which keeps
+        the number of cells per rectangle and of rectangles per cell small.
+        """
+        if cell_mm is None:
+            extents = [
+                max(r[2] - r[0], r[3] - r[1])
+                for r in rects.values()
+                if all(map(math.isfinite, r))
+            ]
+            cell_mm = max(median(extents), 1.0) if extents else 20.0
+        index = cls(cell_mm)
+        for key, rect in rects.items():
+            index.insert(key, rect)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, key) -> bool:
+        return key in self._rects
+
+    def rect(self, key) -> Rect:
+        """Return the stored rectangle of ``key``."""
+        return self._rects[key]
+
+    def order(self, key) -> int:
+        """Return the insertion rank of ``key`` (kept across updates)."""
+        return self._order[key]
+
+    def _cell_range(self, rect: Rect):
+        if not all(map(math.isfinite, rect)):
+            return None
+        c = self.cell_mm
+        ix0, ix1 = math.floor(rect[0] / c), math.floor(rect[2] / c)
+        iy0, iy1 = math.floor(rect[1] / c), math.floor(rect[3] / c)
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > _MAX_CELLS_PER_RECT:
+            return None
+        return ix0, iy0, ix1, iy1
+
+    def insert(self, key, rect: Rect) -> None:
+        """Add ``key`` with rectangle ``rect`` (replaces an existing entry)."""
+        if key in self._rects:
+            self.remove(key, keep_order=True)
+        else:
+            self._order[key] = self._seq
+            self._seq += 1
+        rect = tuple(rect)
+        self._rects[key] = rect
+        cells = self._cell_range(rect)
+        if cells is None:
+            self._large.append(key)
+            return
+        ix0, iy0, ix1, iy1 = cells
+        for ix in range(ix0, ix1 + 1):
+            for iy in range(iy0, iy1 + 1):
+                self._cells.setdefault((ix, iy), []).append(key)
+
+    def update(self, key, rect: Rect) -> None:
+        """Move ``key`` to a new rectangle, keeping its insertion rank."""
+        self.insert(key, rect)
+
+    def remove(self, key, keep_order: bool = False) -> None:
+        """Remove ``key`` from the index."""
+        rect = self._rects.pop(key)
+        if not keep_order:
+            del self._order[key]
+        cells = self._cell_range(rect)
+        if cells is None:
+            self._large.remove(key)
+            return
+        ix0, iy0, ix1, iy1 = cells
+        for ix in range(ix0, ix1 + 1):
+            for iy in range(iy0, iy1 + 1):
+                bucket = self._cells[(ix, iy)]
+                bucket.remove(key)
+                if not bucket:
+                    del self._cells[(ix, iy)]
+
+    def _candidates(self, rect: Rect) -> Iterable:
+        cells = self._cell_range(rect)
+        if cells is None:
+            return list(self._rects)
+        ix0, iy0, ix1, iy1 = cells
+        # Scanning every entry is cheaper than visiting more cells
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > len(self._rects):
+            return list(self._rects)
+        found = set(self._large)
+        for ix in range(ix0, ix1 + 1):
+            for iy in range(iy0, iy1 + 1):
+                found.update(self._cells.get((ix, iy), ()))
+        return found
+
+    def query(self, rect: Rect, pad: float = 0.0) -> List:
+        """Return keys whose rectangles touch ``rect`` grown by ``pad``.
+
+        Touching counts (closed rectangles), so the result is a superset of
+        strict overlaps; callers apply their exact test to it. Keys are in
+        insertion order.
+        """
+        l, b, r, t = rect[0] - pad, rect[1] - pad, rect[2] + pad, rect[3] + pad
+        hits = []
+        for key in self._candidates((l, b, r, t)):
+            kl, kb, kr, kt = self._rects[key]
+            if kl <= r and l <= kr and kb <= t and b <= kt:
+                hits.append(key)
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def query_point(self, x: float, y: float) -> List:
+        """Return keys whose rectangles contain the point, in insertion order."""
+        return self.query((x, y, x, y))
+
+    def overlapping_pairs(self) -> List[Tuple]:
+        """Return all strictly overlapping key pairs.
+
+        Pairs are ``(a, b)`` with ``a`` inserted before ``b`` and sorted
+        like ``itertools.combinations`` over the insertion order.
+        """
+        rank = self._order
+        rects = self._rects
+        seen = set()
+        pairs = []
+
+        def check(a, b):
+            if rank[a] > rank[b]:
+                a, b = b, a
+            if (a, b) in seen:
+                return
+            seen.add((a, b))
+            ra, rb = rects[a], rects[b]
+            if ra[0] < rb[2] and rb[0] < ra[2] and ra[1] < rb[3] and rb[1] < ra[3]:
+                pairs.append((a, b))
+
+        for bucket in self._cells.values():
+            for i, a in enumerate(bucket):
+                for b in bucket[i + 1 :]:
+                    check(a, b)
+        for a in self._large:
+            for b in self._rects:
+                if b != a:
+                    check(a, b)
+        pairs.sort(key=lambda p: (rank[p[0]], rank[p[1]]))
+        return pairs
+
+
+def pad_rect(rect: Rect, pad: float) -> Rect:
+    """Grow a (left, bottom, right, top) rectangle by ``pad`` on each side."""
+    return (rect[0] - pad, rect[1] - pad, rect[2] + pad, rect[3] + pad)
+
+
+def bbox_rect(bb) -> Rect:
+    """Return a normalized (left, bottom, right, top) from a Bbox."""
+    return (bb.xmin, bb.ymin, bb.xmax, bb.ymax)
+
+
+def box_index(
+    diagram, ids: Optional[Iterable] = None, pad: float = 0.0
+) -> GridIndex:
+    """Index the rectangles of diagram elements.
+
+    Parameters
+    ----------
+    diagram : Diagram
+        Diagram whose ``_positions`` are indexed.
+    ids : iterable, optional
+        Element IDs in the order results should follow. Defaults to the
+        boxes followed by the containers.
+    pad : float
+        Grow every rectangle by this many mm.
+    """
+    if ids is None:
+        ids = list(diagram._boxes) + list(diagram._containers)
+    rects = {}
+    for eid in ids:
+        if eid in diagram._positions and eid not in rects:
+            rects[eid] = pad_rect(box_rect(diagram._positions[eid]), pad)
+    return GridIndex.from_rects(rects)
+
+
+__all__ = ["GridIndex", "bbox_rect", "box_index", "pad_rect"]
+
+# EOF
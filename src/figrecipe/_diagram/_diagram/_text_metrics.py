@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Text extents without drawing the figure.
+
+Auto-fix and validation need the bounding boxes of the diagram's text.
+Reading ``Text.get_window_extent`` after ``fig.canvas.draw()`` renders
+the whole figure each time. Here matplotlib's own text layout is run on
+a detached Text, and the result is cached by string, font properties,
+resolved font file, rotation, alignment and dpi. A text on the axes is
+then placed by transforming its anchor only.
+"""
+
+import threading
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+from matplotlib.transforms import Bbox, IdentityTransform
+
+_PT_TO_MM = 25.4 / 72
+
+# Agg text layout is not thread-safe; editor sessions render from threads
+_layout_lock = threading.Lock()
+_layout_state = {}
+
+
+def _layout_text(dpi: float, font: str):
+    """Return a detached Text and renderer used for measuring at ``dpi``.
+
+    One renderer per font file, as matplotlib caches text metrics per
+    renderer and font properties.
+    """
+    if (dpi, font) not in _layout_state:
+        from matplotlib.backends.backend_agg import RendererAgg
+        from matplotlib.figure import Figure
+        from matplotlib.text import Text
+
+        text = Text(0, 0, "", transform=IdentityTransform())
+        text.set_figure(Figure(dpi=dpi))
+        _layout_state[dpi, font] = (text, RendererAgg(1, 1, dpi))
+    return _layout_state[dpi, font]
+
+
+@lru_cache(maxsize=1)
+def _default_text():
+    """A Text with default properties (for defaults such as line spacing)."""
+    from matplotlib.text import Text
+
+    return Text(0, 0, "")
+
+
+def _font_file(prop) -> str:
+    """Font file ``prop`` resolves to under the current rcParams.
+
+    FontProperties hash by their fields only; a family such as
+    "sans-serif" maps to another font when ``font.sans-serif`` changes.
+    """
+    from matplotlib.font_manager import findfont
+
+    return findfont(prop)
+
+
+@lru_cache(maxsize=8192)
+def _layout_offsets(
+    string: str,
+    prop,
+    font: str,
+    rotation: float,
+    ha: str,
+    va: str,
+    linespacing,
+    rotation_mode: str,
+    usetex: bool,
+    dpi: float,
+) -> Tuple[float, float, float, float]:
+    """Extent around the anchor in pixels at ``dpi``.
+
+    ``font`` is the file ``prop`` resolves to (see ``_font_file``).
+    """
+    with _layout_lock:
+        text, renderer = _layout_text(dpi, font)
+        text.update(
+            {
+                "text": string,
+                "fontproperties": prop,
+                "rotation": rotation,
+                "horizontalalignment": ha,
+                "verticalalignment": va,
+                "linespacing": linespacing,
+                "rotation_mode": rotation_mode,
+                "usetex": usetex,
+            }
+        )
+        bb = text.get_window_extent(renderer)
+    return (bb.x0, bb.y0, bb.x1, bb.y1)
+
+
+def text_offsets(
+    string: str,
+    fontsize: float = 10,
+    fontweight="normal",
+    fontfamily="sans-serif",
+    fontstyle: str = "normal",
+    rotation: float = 0.0,
+    ha: str = "left",
+    va: str = "baseline",
+) -> Tuple[float, float, float, float]:
+    """
+    Extent of a string around its anchor point, in points.
+
+    Parameters
+    ----------
+    string : str
+        Text to measure (may contain newlines).
+    fontsize, fontweight, fontfamily, fontstyle
+        Font properties as accepted by ``ax.text``.
+    rotation : float
+        Rotation in degrees.
+    ha, va : str
+        Alignment relative to the anchor.
+
+    Returns
+    -------
+    tuple
+        (left, bottom, right, top) relative to the anchor, in points.
+    """
+    from matplotlib import rcParams
+    from matplotlib.font_manager import FontProperties
+
+    prop = FontProperties(
+        family=fontfamily, size=fontsize, weight=fontweight, style=fontstyle
+    )
+    return _layout_offsets(
+        string,
+        prop,
+        _font_file(prop),
+        float(rotation),
+        ha,
+        va,
+        _default_text().get_linespacing(),
+        "default",
+        bool(rcParams["text.usetex"]),
+        72.0,
+    )
+
+
+def text_size_mm(string: str, fontsize: float = 10, **font) -> Tuple[float, float]:
+    """Width and height of a string in mm (see ``text_offsets``)."""
+    left, bottom, right, top = text_offsets(string, fontsize, **font)
+    return (right - left) * _PT_TO_MM, (top - bottom) * _PT_TO_MM
+
+
+def text_window_extent(t) -> Bbox:
+    """
+    Display-space bbox of a Text, equal to ``t.get_window_extent()``.
+
+    Uses the cached layout of the text's string, font and the figure dpi;
+    only the anchor is transformed. Wrapped text depends on the figure
+    size and is measured directly.
+    """
+    if not t.get_visible():
+        return Bbox.unit()
+    if t.get_wrap():
+        return t.get_window_extent(t.figure.canvas.get_renderer())
+    prop = t.get_fontproperties().copy()
+    left, bottom, right, top = _layout_offsets(
+        t.get_text(),
+        prop,
+        _font_file(prop),
+        float(t.get_rotation()),
+        t.get_horizontalalignment(),
+        t.get_verticalalignment(),
+        t.get_linespacing(),
+        t.get_rotation_mode() or "default",
+        bool(t.get_usetex()),
+        float(t.figure.dpi),
+    )
+    x, y = t.get_transform().transform(t.get_unitless_position())
+    return Bbox.from_extents(x + left, y + bottom, x + right, y + top)
+
+
+def sync_axes_layout(ax) -> None:
+    """Apply the figure layout and aspect that a draw would apply.
+
+    ``transData`` is final only after the layout engine and the axes
+    aspect have been applied; draws do this implicitly.
+    """
+    fig = ax.get_figure()
+    engine = fig.get_layout_engine() if hasattr(fig, "get_layout_engine") else None
+    if engine is not None:
+        engine.execute(fig)
+    ax.apply_aspect()
+
+
+def text_extents(ax, texts: Optional[Iterable] = None) -> List[Tuple[object, Bbox]]:
+    """
+    Data-space bboxes of the axes' texts without drawing.
+
+    Parameters
+    ----------
+    ax : Axes
+        Axes holding the texts.
+    texts : iterable of Text, optional
+        Texts to measure; defaults to ``ax.texts``.
+
+    Returns
+    -------
+    list of (Text, Bbox)
+        Each text with its bbox in data coordinates.
+    """
+    sync_axes_layout(ax)
+    inv = ax.transData.inverted()
+    return [
+        (t, text_window_extent(t).transformed(inv))
+        for t in (ax.texts if texts is None else texts)
+    ]
+
+
+def points_to_data(ax) -> float:
+    """Data units (x direction) per typographic point on ``ax``."""
+    sync_axes_layout(ax)
+    x0, _ = ax.transData.transform((0, 0))
+    x1, _ = ax.transData.transform((1, 0))
+    return ax.get_figure().dpi / 72 / abs(x1 - x0)
+
+
+def clear_cache() -> None:
+    """Drop cached text layouts (e.g. after changing fonts or rcParams)."""
+    _layout_offsets.cache_clear()
+
+
+__all__ = [
+    "clear_cache",
+    "points_to_data",
+    "sync_axes_layout",
+    "text_extents",
+    "text_offsets",
+    "text_size_mm",
+    "text_window_extent",
+]
+
+# EOF
@@ -25,7 +25,8 @@ except ImportError:
 
     logger = logging.getLogger(__name__)
 
-from ._geom import bbox_gap, box_rect, rects_overlap, seg_rect_clip_len
+from ._geom import bbox_gap, box_rect, seg_rects_clip_len
+from ._spatial import GridIndex, bbox_rect, box_index
 
 # Centralised thresholds
 MIN_MARGIN_MM = 2.0  # R5, R6
@@ -96,20 +97,18 @@ def validate_no_overlap(diagram: "Diagram") -> None:
 
     Containers are excluded — only boxes are checked.
     """
-    from itertools import combinations
-
-    box_ids = [bid for bid in diagram._boxes if bid in diagram._positions]
-    for id_a, id_b in combinations(box_ids, 2):
-        r_a = box_rect(diagram._positions[id_a])
-        r_b = box_rect(diagram._positions[id_b])
-        if rects_overlap(r_a, r_b):
-            raise ValueError(
-                f"Boxes '{id_a}' and '{id_b}' overlap: "
-                f"'{id_a}' rect=({r_a[0]:.1f},{r_a[1]:.1f})-"
-                f"({r_a[2]:.1f},{r_a[3]:.1f}), "
-                f"'{id_b}' rect=({r_b[0]:.1f},{r_b[1]:.1f})-"
-                f"({r_b[2]:.1f},{r_b[3]:.1f})"
-            )
+    index = box_index(diagram, diagram._boxes)
+    pairs = index.overlapping_pairs()
+    if pairs:
+        id_a, id_b = pairs[0]
+        r_a, r_b = index.rect(id_a), index.rect(id_b)
+        raise ValueError(
+            f"Boxes '{id_a}' and '{id_b}' overlap: "
+            f"'{id_a}' rect=({r_a[0]:.1f},{r_a[1]:.1f})-"
+            f"({r_a[2]:.1f},{r_a[3]:.1f}), "
+            f"'{id_b}' rect=({r_b[0]:.1f},{r_b[1]:.1f})-"
+            f"({r_b[2]:.1f},{r_b[3]:.1f})"
+        )
 
 
 def validate_text_margins(fig, ax, diagram, min_margin_mm=MIN_MARGIN_MM) -> None:
@@ -117,12 +116,12 @@ def validate_text_margins(fig, ax, diagram, min_margin_mm=MIN_MARGIN_MM) -> None
 
     Raises ValueError if text-to-text or text-to-edge gap < min_margin_mm.
     Arrows are excluded (accepted by design).
-    Must be called after render.
+    Must be called after render; text extents come from the cached text
+    layout, so the figure is not redrawn.
     """
-    from itertools import combinations
+    from matplotlib.transforms import Bbox
 
-    fig.canvas.draw()
-    renderer = fig.canvas.get_renderer()
+    from ._text_metrics import text_extents
 
     texts = [
         t
@@ -132,27 +131,33 @@ def validate_text_margins(fig, ax, diagram, min_margin_mm=MIN_MARGIN_MM) -> None
     if not texts:
         return
 
-    # Build box rects for ownership lookup
-    box_rects = {}
-    for eid in list(diagram._boxes) + list(diagram._containers):
-        if eid in diagram._positions:
-            box_rects[eid] = box_rect(diagram._positions[eid])
+    # Box/container rects for ownership lookup and edge checks
+    edges = box_index(diagram)
 
     def _owner(bb):
-        """Return the box/container ID whose rect contains bb center."""
+        """Return the box ID whose rect contains bb center."""
         cx, cy = (bb.x0 + bb.x1) / 2, (bb.y0 + bb.y1) / 2
-        for eid, (el, eb, er, et) in box_rects.items():
+        for eid in edges.query_point(cx, cy):
+            el, eb, er, et = edges.rect(eid)
             if el <= cx <= er and eb <= cy <= et and eid in diagram._boxes:
                 return eid
         return None
 
-    entries = []
-    for t in texts:
-        bb = t.get_window_extent(renderer).transformed(ax.transData.inverted())
-        entries.append((t.get_text(), bb, _owner(bb)))
-
-    # 1. Text-to-text margin check (skip pairs in same box)
-    for (txt_a, bb_a, own_a), (txt_b, bb_b, own_b) in combinations(entries, 2):
+    entries = [(t.get_text(), bb, _owner(bb)) for t, bb in text_extents(ax, texts)]
+
+    # 1. Text-to-text margin check (skip pairs in same box).
+    # gap < min_margin exactly when the bboxes grown by min_margin/2 overlap;
+    # a tiny extra pad keeps rounding from dropping borderline pairs.
+    half = min_margin_mm / 2 + 1e-6
+    text_index = GridIndex.from_rects(
+        {
+            i: (bb.xmin - half, bb.ymin - half, bb.xmax + half, bb.ymax + half)
+            for i, (_, bb, _) in enumerate(entries)
+        }
+    )
+    for i, j in text_index.overlapping_pairs():
+        txt_a, bb_a, own_a = entries[i]
+        txt_b, bb_b, own_b = entries[j]
         if own_a is not None and own_a == own_b:
             continue
         gap = bbox_gap(bb_a, bb_b)
@@ -163,21 +168,15 @@ def validate_text_margins(fig, ax, diagram, min_margin_mm=MIN_MARGIN_MM) -> None
             )
 
     # 2. Text-to-box/container-edge margin check
-    edges = []
-    for eid in list(diagram._boxes) + list(diagram._containers):
-        if eid in diagram._positions:
-            edges.append((eid, box_rect(diagram._positions[eid])))
-
     for txt, bb, _own in entries:
-        for eid, (el, eb, er, et) in edges:
+        for eid in edges.query(bbox_rect(bb), pad=min_margin_mm):
+            el, eb, er, et = edges.rect(eid)
             # Skip if text center is inside this box (it belongs there)
             cx = (bb.x0 + bb.x1) / 2
             cy = (bb.y0 + bb.y1) / 2
             if el <= cx <= er and eb <= cy <= et:
                 continue
             # Check gap to this edge rect
-            from matplotlib.transforms import Bbox
-
             edge_bb = Bbox([[el, eb], [er, et]])
             gap = bbox_gap(bb, edge_bb)
             if gap < min_margin_mm:
@@ -226,10 +225,11 @@ def validate_container_title_clearance(
 def validate_text_fits_boxes(diagram: "Diagram") -> None:
     """Warn if a box has more text lines than fit within its padded area.
 
-    Estimates text height from font sizes (1pt ≈ 0.35mm) and checks
-    against the box inner height (height - 2*padding).
+    Line heights are measured with matplotlib's text layout (cached, no
+    render) and checked against the box inner height (height - 2*padding).
     """
-    _PT_TO_MM = 0.35  # approximate pt → mm conversion
+    from ._render import box_text_items
+    from ._text_metrics import text_size_mm
 
     for bid, box in diagram._boxes.items():
         if bid not in diagram._positions:
@@ -237,15 +237,14 @@ def validate_text_fits_boxes(diagram: "Diagram") -> None:
         pos = diagram._positions[bid]
         inner_h = pos.height_mm - 2 * box.padding_mm
 
-        # Estimate total text height
-        text_h = 11 * _PT_TO_MM  # title always present
-        if box.subtitle:
-            text_h += 9 * _PT_TO_MM
-        text_h += len(box.content) * 8 * _PT_TO_MM
+        text_h = sum(
+            text_size_mm(text, fsize, fontweight=fweight, fontfamily=family)[1]
+            for text, fsize, fweight, _color, family in box_text_items(box)
+        )
 
         if text_h > inner_h:
             logger.warning(
-                f"Box '{bid}' text (~{text_h:.1f}mm) exceeds "
+                f"Box '{bid}' text ({text_h:.1f}mm) exceeds "
                 f"inner height ({inner_h:.1f}mm). "
                 f"Increase box height or reduce content."
             )
@@ -258,12 +257,13 @@ def validate_text_arrow_no_overlap(fig, ax, diagram=None, min_visible=MIN_VISIBL
     total arc length, and subtracts the length occluded by text bboxes
     AND intermediate box rectangles (excluding source/target boxes).
     """
-    import math
-
     from matplotlib.patches import FancyArrowPatch
 
+    from ._text_metrics import text_extents
+
+    # The one draw per validation: it sets the arrows' dpi correction,
+    # which their display paths depend on. Texts use the cached layout.
     fig.canvas.draw()
-    renderer = fig.canvas.get_renderer()
     inv = ax.transData.inverted()
 
     texts = [t for t in ax.texts if t.get_text().strip()]
@@ -275,17 +275,13 @@ def validate_text_arrow_no_overlap(fig, ax, diagram=None, min_visible=MIN_VISIBL
     if diagram is not None:
         arrow_specs = list(diagram._arrows)
 
-    text_bbs = []
-    for t in texts:
-        bb = t.get_window_extent(renderer).transformed(inv)
-        text_bbs.append((t.get_text(), bb))
+    text_bbs = [(t.get_text(), bb) for t, bb in text_extents(ax, texts)]
+    text_index = GridIndex.from_rects(
+        {k: bbox_rect(bb) for k, (_, bb) in enumerate(text_bbs)}
+    )
 
-    # Build box rects in data coords for intermediate-box occlusion
-    box_rects = {}
-    if diagram is not None:
-        for bid in diagram._boxes:
-            if bid in diagram._positions:
-                box_rects[bid] = box_rect(diagram._positions[bid])
+    # Box rects in data coords for intermediate-box occlusion
+    boxes = box_index(diagram, diagram._boxes) if diagram is not None else None
 
     for i, arrow in enumerate(arrows):
         aspec = arrow_specs[i] if i < len(arrow_specs) else None
@@ -308,34 +304,9 @@ def validate_text_arrow_no_overlap(fig, ax, diagram=None, min_visible=MIN_VISIBL
         pts = inv.transform(pts_disp)
         if len(pts) < 2:
             continue
-        # Measure total length and occluded length per segment
-        total_len = 0.0
-        occluded_len = 0.0
-        occluders = set()
-        for j in range(len(pts) - 1):
-            x0, y0 = pts[j]
-            x1, y1 = pts[j + 1]
-            seg_len = math.hypot(x1 - x0, y1 - y0)
-            total_len += seg_len
-            mx, my = (x0 + x1) / 2, (y0 + y1) / 2
-            occluded = False
-            # Check text bboxes
-            for txt, bb in text_bbs:
-                if bb.x0 <= mx <= bb.x1 and bb.y0 <= my <= bb.y1:
-                    occluded_len += seg_len
-                    occluders.add(f"text:'{txt}'")
-                    occluded = True
-                    break
-            if occluded:
-                continue
-            # Check intermediate box rectangles (line-rect clipping)
-            for bid, (bl, bb_, br, bt) in box_rects.items():
-                if bid == src_id or bid == tgt_id:
-                    continue
-                clip = seg_rect_clip_len(x0, y0, x1, y1, bl, bb_, br, bt)
-                if clip > 0:
-                    occluded_len += clip
-                    occluders.add(f"box:'{bid}'")
+        total_len, occluded_len, occluders = _polyline_occlusion(
+            pts, text_bbs, text_index, boxes, exclude=(src_id, tgt_id)
+        )
         if total_len < 1e-6:
             continue
         visible_ratio = 1.0 - occluded_len / total_len
@@ -347,6 +318,58 @@ def validate_text_arrow_no_overlap(fig, ax, diagram=None, min_visible=MIN_VISIBL
             )
 
 
+def _polyline_occlusion(pts, text_bbs, text_index, boxes=None, exclude=()):
+    """Total and occluded length of a polyline, with its occluders.
+
+    A segment whose midpoint lies in a text bbox counts as occluded by the
+    first such text; the remaining segments are clipped against the box
+    rects (except ``exclude``). All segments are tested at once against
+    the texts and boxes near the polyline.
+    """
+    import numpy as np
+
+    x0, y0, x1, y1 = pts[:-1, 0], pts[:-1, 1], pts[1:, 0], pts[1:, 1]
+    seg_len = np.hypot(x1 - x0, y1 - y0)
+    span = (pts[:, 0].min(), pts[:, 1].min(), pts[:, 0].max(), pts[:, 1].max())
+    occluded_len = 0.0
+    occluders = set()
+
+    # Text bboxes (midpoint test)
+    free = np.ones(len(seg_len), dtype=bool)
+    near_texts = text_index.query(span)
+    if near_texts:
+        tb = np.array([text_bbs[j][1].extents for j in near_texts])
+        mx, my = ((x0 + x1) / 2)[:, None], ((y0 + y1) / 2)[:, None]
+        inside = (tb[:, 0] <= mx) & (mx <= tb[:, 2])
+        inside &= (tb[:, 1] <= my) & (my <= tb[:, 3])
+        hit = inside.any(axis=1)
+        occluded_len += float(seg_len[hit].sum())
+        for k in np.unique(inside.argmax(axis=1)[hit]):
+            occluders.add(f"text:'{text_bbs[near_texts[k]][0]}'")
+        free = ~hit
+
+    # Intermediate box rectangles (line-rect clipping)
+    if boxes is not None and free.any():
+        near_boxes = [b for b in boxes.query(span) if b not in exclude]
+        if near_boxes:
+            r = np.array([boxes.rect(b) for b in near_boxes])
+            clip = seg_rects_clip_len(
+                x0[free, None],
+                y0[free, None],
+                x1[free, None],
+                y1[free, None],
+                r[:, 0],
+                r[:, 1],
+                r[:, 2],
+                r[:, 3],
+            )
+            occluded_len += float(clip.sum())
+            for j in np.flatnonzero((clip > 0).any(axis=0)):
+                occluders.add(f"box:'{near_boxes[j]}'")
+
+    return float(seg_len.sum()), occluded_len, occluders
+
+
 def validate_arrow_label_side(diagram: "Diagram") -> None:
     """R8: Curved-arrow label must be on same side as arc bulge.
 
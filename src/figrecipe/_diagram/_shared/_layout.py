@@ -9,6 +9,8 @@ import warnings
 from collections import defaultdict
 from typing import TYPE_CHECKING, Dict, List, Tuple
 
+from ._sugiyama import layered_layout
+
 if TYPE_CHECKING:
     from ._schema import DiagramSpec
 
@@ -133,6 +135,14 @@ def _layered_layout(
         # No nodes
         return {}
 
+    # Order layers and assign cross-axis coordinates (Sugiyama)
+    placed = layered_layout(
+        {nid: idx for idx, layer in enumerate(layers) for nid in layer},
+        [(e.source, e.target) for e in spec.edges],
+    )
+    layers = [placed.order.get(idx, []) for idx in range(len(layers))]
+    span = max(placed.cross.values(), default=0.0)
+
     # Compute positions with proper spacing
     n_layers = len(layers)
     positions = {}
@@ -141,92 +151,42 @@ def _layered_layout(
     width = 1.0 - left - right
     height = 1.0 - top - bottom
 
-    # Calculate spacing between layers and within layers
     # Leave extra space for node dimensions
     node_padding = 0.08  # Padding around each node
 
     for layer_idx, layer in enumerate(layers):
-        n_nodes = len(layer)
-        if n_nodes == 0:
-            continue
+        if n_layers > 1:
+            t_layer = layer_idx / (n_layers - 1)
+        for node_id in layer:
+            t_cross = placed.cross[node_id] / span if span > 0 else None
 
-        # Position within layer
-        for node_idx, node_id in enumerate(layer):
-            if direction == "LR":
+            if direction in ("LR", "RL"):
                 # Horizontal: layers go left-to-right, nodes stack vertically
                 if n_layers > 1:
-                    x = (
-                        left
-                        + node_padding
-                        + (layer_idx / (n_layers - 1)) * (width - 2 * node_padding)
-                    )
+                    offset = t_layer * (width - 2 * node_padding)
+                    if direction == "LR":
+                        x = left + node_padding + offset
+                    else:
+                        x = 1.0 - left - node_padding - offset
                 else:
                     x = 0.5
-                if n_nodes > 1:
-                    y = (
-                        bottom
-                        + node_padding
-                        + (node_idx / (n_nodes - 1)) * (height - 2 * node_padding)
-                    )
+                if t_cross is not None:
+                    y = bottom + node_padding + t_cross * (height - 2 * node_padding)
                 else:
                     y = 0.5
 
-            elif direction == "RL":
-                # Right-to-left
-                if n_layers > 1:
-                    x = (
-                        1.0
-                        - left
-                        - node_padding
-                        - (layer_idx / (n_layers - 1)) * (width - 2 * node_padding)
-                    )
-                else:
-                    x = 0.5
-                if n_nodes > 1:
-                    y = (
-                        bottom
-                        + node_padding
-                        + (node_idx / (n_nodes - 1)) * (height - 2 * node_padding)
-                    )
-                else:
-                    y = 0.5
-
-            elif direction == "TB":
-                # Top-to-bottom: layers go top-to-bottom, nodes spread horizontally
-                if n_nodes > 1:
-                    x = (
-                        left
-                        + node_padding
-                        + (node_idx / (n_nodes - 1)) * (width - 2 * node_padding)
-                    )
-                else:
-                    x = 0.5
-                if n_layers > 1:
-                    y = (
-                        1.0
-                        - top
-                        - node_padding
-                        - (layer_idx / (n_layers - 1)) * (height - 2 * node_padding)
-                    )
-                else:
-                    y = 0.5
-
-            else:  # BT
-                # Bottom-to-top
-                if n_nodes > 1:
-                    x = (
-                        left
-                        + node_padding
-                        + (node_idx / (n_nodes - 1)) * (width - 2 * node_padding)
-                    )
+            else:
+                # Vertical: layers go top-to-bottom (TB) or bottom-to-top (BT)
+                if t_cross is not None:
+                    x = left + node_padding + t_cross * (width - 2 * node_padding)
                 else:
                     x = 0.5
                 if n_layers > 1:
-                    y = (
-                        bottom
-                        + node_padding
-                        + (layer_idx / (n_layers - 1)) * (height - 2 * node_padding)
-                    )
+                    offset = t_layer * (height - 2 * node_padding)
+                    if direction == "TB":
+                        y = 1.0 - top - node_padding - offset
+                    else:
+                        y = bottom + node_padding + offset
                 else:
                     y = 0.5
 
@@ -357,59 +317,28 @@ def optimize_edge_crossings(
 ) -> Dict[str, Tuple[float, float]]:
     """Reorder nodes within layers to minimize edge crossings.
 
-    This is a simple barycenter heuristic implementation.
+    Nodes sharing an x coordinate form a layer. Layers are reordered by
+    the layered engine and each layer reuses its existing y positions.
     """
-    # Group nodes by x-coordinate (layer)
-    layers = defaultdict(list)
-    for node_id, (x, y) in positions.items():
-        # Round x to group into layers
-        layer_key = round(x, 2)
-        layers[layer_key].append((node_id, y))
+    if not positions:
+        return positions
 
-    # Build adjacency
-    adj = defaultdict(set)
-    for edge in spec.edges:
-        adj[edge.source].add(edge.target)
-        adj[edge.target].add(edge.source)
+    # Group nodes into layers by x (sorted, with a small tolerance)
+    layer_of: Dict[str, int] = {}
+    layer_x: List[float] = []
+    for node_id, (x, y) in sorted(positions.items(), key=lambda kv: kv[1]):
+        if not layer_x or abs(x - layer_x[-1]) > 1e-6:
+            layer_x.append(x)
+        layer_of[node_id] = len(layer_x) - 1
 
-    # Sort layers by x
-    sorted_layers = sorted(layers.keys())
+    placed = layered_layout(layer_of, [(e.source, e.target) for e in spec.edges])
 
-    # Barycenter heuristic
     new_positions = {}
-    for layer_x in sorted_layers:
-        layer_nodes = layers[layer_x]
-
-        # Compute barycenter for each node
-        barycenters = []
-        for node_id, old_y in layer_nodes:
-            neighbors = adj[node_id]
-            if neighbors:
-                neighbor_ys = [positions[n][1] for n in neighbors if n in positions]
-                if neighbor_ys:
-                    barycenter = sum(neighbor_ys) / len(neighbor_ys)
-                else:
-                    barycenter = old_y
-            else:
-                barycenter = old_y
-            barycenters.append((node_id, barycenter))
-
-        # Sort by barycenter
-        barycenters.sort(key=lambda x: x[1])
-
-        # Assign new y positions evenly spaced
-        n = len(barycenters)
-        y_positions = [positions[node_id][1] for node_id, _ in layer_nodes]
-        y_min, y_max = min(y_positions), max(y_positions)
-
-        for idx, (node_id, _) in enumerate(barycenters):
-            if n > 1:
-                new_y = y_min + idx * (y_max - y_min) / (n - 1)
-            else:
-                new_y = (y_min + y_max) / 2
-            new_positions[node_id] = (layer_x, new_y)
-
-    return new_positions if new_positions else positions
+    for idx, members in placed.order.items():
+        ys = sorted(positions[node_id][1] for node_id in members)
+        for node_id, y in zip(members, ys):
+            new_positions[node_id] = (positions[node_id][0], y)
+    return new_positions
 
 
 __all__ = [
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Latest-wins render queue for editor updates.
+
+Slider drags post an update for every move, and each update used to do
+a full render of its own. A RenderCoalescer runs at most one render per
+editor at a time: updates that arrive while a render is running are
+queued, and the next render applies all of them, in arrival order and
+under the editor lock, then serves them with the newest state. Renders
+for superseded states are never started.
+
+Clients mark updates sent during interaction as drafts. Drafts render at
+DRAFT_DPI; once no draft has arrived for SETTLE_DELAY_S, a full-DPI
+settle render runs in the background and replaces the stored preview,
+which clients pick up through ``image/preview`` revalidation.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Preview resolution while the user is dragging
+DRAFT_DPI = 72
+
+# Quiet period after the last draft before the full-DPI render
+SETTLE_DELAY_S = 0.3
+
+
+def get_coalescer(editor) -> "RenderCoalescer":
+    """Return the editor's render queue, creating it on first use."""
+    with editor._lock:
+        if editor._render_queue is None:
+            editor._render_queue = RenderCoalescer(editor._lock)
+        return editor._render_queue
+
+
+class RenderCoalescer:
+    """Serialize and coalesce renders of one editor.
+
+    Parameters
+    ----------
+    lock : reentrant lock
+        Lock held while the figure is rendered (the editor's lock, which
+        other handlers hold while they use the figure).
+    settle_delay : float
+        Seconds without drafts before the settle render.
+    """
+
+    def __init__(self, lock, settle_delay: float = SETTLE_DELAY_S):
+        self.lock = lock
+        self.settle_delay = settle_delay
+        self.renders = 0
+        self.coalesced = 0
+        self._cond = threading.Condition()
+        self._submitted = 0
+        # (seq, apply) not yet run, and apply errors by seq
+        self._pending: List[Tuple[int, Callable[[], None]]] = []
+        self._errors: Dict[int, BaseException] = {}
+        self._busy = False
+        self._pending_full = 0
+        # draft -> (last submission included, result)
+        self._done = {False: (0, None), True: (0, None)}
+        self._timer: Optional[threading.Timer] = None
+
+    def submit(
+        self,
+        apply: Optional[Callable[[], None]],
+        render: Callable[[bool], Any],
+        draft: bool = False,
+    ) -> Any:
+        """
+        Apply a change and return a render that includes it.
+
+        Parameters
+        ----------
+        apply : callable or None
+            Mutates the editor state. Runs under ``lock``, in arrival
+            order, right before the render that serves this request; an
+            exception it raises is re-raised here.
+        render : callable
+            ``render(draft)`` draws the figure and returns the frame.
+        draft : bool
+            Whether a draft-quality frame is acceptable. A full render
+            serves drafts too; drafts are upgraded to full renders when a
+            full request is waiting.
+
+        Returns
+        -------
+        Any
+            The frame from the render that served this request.
+        """
+        with self._cond:
+            self._submitted += 1
+            seq = self._submitted
+            if apply is not None:
+                self._pending.append((seq, apply))
+            if not draft:
+                self._pending_full += 1
+            try:
+                while True:
+                    found, result = self._result_for(seq, draft)
+                    if found:
+                        self.coalesced += 1
+                        self._raise_error(seq)
+                        return result
+                    if not self._busy:
+                        break
+                    self._cond.wait()
+                self._busy = True
+                target = self._submitted
+                pending, self._pending = self._pending, []
+                as_draft = draft and not self._pending_full
+            finally:
+                if not draft:
+                    self._pending_full -= 1
+
+        try:
+            with self.lock:
+                self._apply(pending)
+                result = render(as_draft)
+        except BaseException:
+            with self._cond:
+                self._errors.pop(seq, None)
+                self._busy = False
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            self._busy = False
+            self.renders += 1
+            self._done[as_draft] = (target, result)
+            self._cond.notify_all()
+        if as_draft:
+            self._schedule_settle(render)
+        with self._cond:
+            self._raise_error(seq)
+        return result
+
+    def _apply(self, pending) -> None:
+        """Run queued applies (caller holds ``lock``); keep their errors."""
+        for seq, apply in pending:
+            try:
+                apply()
+            except Exception as e:
+                with self._cond:
+                    self._errors[seq] = e
+
+    def _raise_error(self, seq: int) -> None:
+        error = self._errors.pop(seq, None)
+        if error is not None:
+            raise error
+
+    def _result_for(self, seq: int, draft: bool):
+        full_seq, full_result = self._done[False]
+        if full_seq >= seq:
+            return True, full_result
+        draft_seq, draft_result = self._done[True]
+        if draft and draft_seq >= seq:
+            return True, draft_result
+        return False, None
+
+    def _schedule_settle(self, render) -> None:
+        """(Re)start the timer for the full-DPI render after drafts."""
+        with self._cond:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.settle_delay, self._settle, (render,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _settle(self, render) -> None:
+        with self._cond:
+            self._timer = None
+            if self._done[False][0] >= self._submitted:
+                return
+        try:
+            self.submit(None, render, draft=False)
+        except Exception:
+            logger.exception("[FigRecipe] Settle render failed")
+
+    def cancel(self) -> None:
+        """Cancel a pending settle render."""
+        with self._cond:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
+__all__ = ["DRAFT_DPI", "SETTLE_DELAY_S", "RenderCoalescer", "get_coalescer"]
+
+# EOF
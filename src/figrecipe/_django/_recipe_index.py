@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Persistent index of recipe files in a working directory.
+
+The file panel needs to know which YAML files are recipes and whether
+they have a companion image. Reading every YAML file on each listing is
+slow for large project directories, so the index keeps per-file
+metadata keyed by relative path and only re-reads files whose mtime or
+size changed since the last scan:
+
+    {"mtime_ns", "size", "is_recipe", "image", "figure_id", "n_axes"}
+
+The index is saved as JSON under ``$FIGRECIPE_INDEX_DIR`` (default:
+``$XDG_CACHE_HOME/figrecipe/index`` or ``~/.cache/figrecipe/index``),
+one file per working directory, so a restarted server starts warm.
+
+The walk is bounded like the files backend tree: hidden directories,
+environments and build outputs are skipped, recursion stops at
+``_MAX_DEPTH`` levels, and the home directory or a filesystem root only
+has its top level indexed.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .._utils._cache_dir import user_cache_dir
+
+logger = logging.getLogger(__name__)
+
+_INDEX_VERSION = 1
+
+# Bytes read to decide whether a YAML file is a recipe
+_HEADER_BYTES = 2048
+
+_RECIPE_SUFFIXES = (".yaml", ".yml")
+_SKIP_DIRS = {
+    "__pycache__",
+    "node_modules",
+    "site-packages",
+    "venv",
+    "build",
+    "dist",
+}
+
+# Directory levels walked below the root (build_tree's default max_depth)
+_MAX_DEPTH = 10
+
+# Characters that continue an indented YAML block
+_BLOCK_CHARS = ("", " ", "\t", "#", "\n", "\r")
+
+_FIGURE_ID = re.compile(r"^id:\s*['\"]?([^\s'\"#]+)", re.MULTILINE)
+_AXES_BLOCK = re.compile(r"^axes:[^\n]*\n((?:[ \t#][^\n]*\n|\n)*)", re.MULTILINE)
+_AXES_KEY = re.compile(r"^  ax_\d+_\d+:", re.MULTILINE)
+
+_indexes: Dict[str, "RecipeIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+def default_index_dir() -> Path:
+    """Return the directory holding saved recipe indexes."""
+    return user_cache_dir("index", "FIGRECIPE_INDEX_DIR")
+
+
+def get_recipe_index(working_dir: Union[str, Path]) -> "RecipeIndex":
+    """Return the shared index for a working directory."""
+    root = str(Path(working_dir).resolve())
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = RecipeIndex(root)
+        return index
+
+
+class RecipeIndex:
+    """Incrementally updated metadata of the recipe files under a directory.
+
+    Parameters
+    ----------
+    root : str or Path
+        Working directory to index.
+    index_path : Path, optional
+        JSON file to persist the index to (default: derived from *root*
+        inside default_index_dir()). Saving is skipped if not writable.
+    """
+
+    def __init__(self, root: Union[str, Path], index_path: Optional[Path] = None):
+        self.root = Path(root).resolve()
+        if index_path is None:
+            digest = hashlib.sha256(str(self.root).encode()).hexdigest()[:16]
+            index_path = default_index_dir() / f"{digest}.json"
+        self.index_path = index_path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.last_changed = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def scan(self) -> Dict[str, Dict[str, Any]]:
+        """Bring the index up to date and return its entries.
+
+        Files are only read when new or modified; deleted files are
+        dropped. The index is saved if anything changed.
+        """
+        with self._lock:
+            seen = set()
+            changed = 0
+            for dirpath, names in self._walk():
+                for name in names:
+                    if not name.endswith(_RECIPE_SUFFIXES):
+                        continue
+                    if name.endswith(".overrides.yaml"):
+                        continue
+                    full = os.path.join(dirpath, name)
+                    rel = Path(os.path.relpath(full, self.root)).as_posix()
+                    seen.add(rel)
+                    changed += self._update(rel, full, names)
+
+            for rel in set(self.entries) - seen:
+                del self.entries[rel]
+                changed += 1
+
+            self.last_changed = changed
+            if changed:
+                self._save()
+            return self.entries
+
+    def get(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        """Return the entry of a relative path, or None if not indexed."""
+        return self.entries.get(Path(rel_path).as_posix())
+
+    def _walk(self):
+        """Yield (directory, file names) for non-hidden directories.
+
+        Skips _SKIP_DIRS, stops _MAX_DEPTH levels below the root and does
+        not descend from the home directory or a filesystem root.
+        """
+        shallow = {str(Path.home().resolve()), self.root.anchor}
+        base_depth = len(self.root.parts)
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            path = Path(dirpath)
+            if len(path.parts) - base_depth >= _MAX_DEPTH - 1 or str(path) in shallow:
+                dirnames[:] = []
+            else:
+                dirnames[:] = [
+                    d for d in dirnames if not d.startswith(".") and d not in _SKIP_DIRS
+                ]
+            yield dirpath, set(f for f in filenames if not f.startswith("."))
+
+    def _update(self, rel: str, full: str, siblings) -> int:
+        """Refresh one file's entry; return 1 if it changed."""
+        try:
+            st = os.stat(full)
+        except OSError:
+            return 0
+
+        image_name = Path(full).with_suffix(".png").name
+        image = Path(rel).with_suffix(".png").as_posix()
+        image = image if image_name in siblings else None
+
+        entry = self.entries.get(rel)
+        if (
+            entry is not None
+            and entry["mtime_ns"] == st.st_mtime_ns
+            and entry["size"] == st.st_size
+        ):
+            if entry["image"] == image:
+                return 0
+            entry["image"] = image
+            return 1
+
+        self.entries[rel] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "image": image,
+            **_read_recipe_info(full),
+        }
+        return 1
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") == _INDEX_VERSION and data.get("root") == str(
+            self.root
+        ):
+            self.entries = data.get("entries", {})
+
+    def _save(self) -> None:
+        data = {
+            "version": _INDEX_VERSION,
+            "root": str(self.root),
+            "entries": self.entries,
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            logger.debug("[FigRecipe] Could not save recipe index: %s", e)
+
+
+def _read_recipe_info(path: str) -> Dict[str, Any]:
+    """Read the recipe flag, figure id and number of axes of a YAML file."""
+    info = {"is_recipe": False, "figure_id": None, "n_axes": 0}
+    try:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            text = _read_through_axes(f)
+    except OSError:
+        return info
+
+    if text is None:
+        return info
+    match = _FIGURE_ID.search(text)
+    block = _AXES_BLOCK.search(text)
+    info.update(
+        is_recipe=True,
+        figure_id=match.group(1) if match else None,
+        n_axes=len(_AXES_KEY.findall(block.group(1))) if block else 0,
+    )
+    return info
+
+
+def _read_through_axes(f) -> Optional[str]:
+    """Read a recipe up to the end of its top-level axes block.
+
+    Returns None without reading further if the first _HEADER_BYTES
+    do not look like a recipe. Nothing after the axes block is read.
+    """
+    header = f.read(_HEADER_BYTES)
+    if "figure:" not in header or "axes:" not in header:
+        return None
+    lines = []
+    in_axes = False
+    for line in itertools.chain((header + f.readline()).splitlines(True), f):
+        if in_axes and line[:1] not in _BLOCK_CHARS:
+            break
+        lines.append(line)
+        in_axes = in_axes or line.startswith("axes:")
+    return "".join(lines)
+
+
+__all__ = ["RecipeIndex", "default_index_dir", "get_recipe_index"]
+
+# EOF
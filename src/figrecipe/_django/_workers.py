@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Editor worker pool -- sessions in separate processes.
+
+By default editors live in the server process (see services.py), so all
+sessions share one GIL and a slow render blocks every other request.
+With ``FIGRECIPE_EDITOR_WORKERS=N`` (or ``figrecipe gui --workers N``),
+each session is pinned to one of N worker processes, which holds its
+EditorState and runs the API handlers for it. The server forwards the
+request over a pipe and returns the worker's response.
+
+Sessions are evicted in LRU order once more than
+``FIGRECIPE_EDITOR_MAX_SESSIONS`` (default: 4 per worker) are open. An
+evicted editor persists its overrides to ``.overrides.json`` and is
+restored from it when the recipe is opened again.
+
+A worker that does not answer within ``FIGRECIPE_EDITOR_TIMEOUT`` seconds
+(default: 300; 0 waits forever) is killed and restarted, and its sessions
+are dropped. ``cache/stats`` sums the editor caches of all started workers
+and lists each worker's stats under ``workers``.
+
+Workers are started with the "spawn" method and call ``django.setup()``,
+so the server must be configured through ``DJANGO_SETTINGS_MODULE``.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.http import HttpRequest, HttpResponse, JsonResponse, QueryDict
+
+logger = logging.getLogger(__name__)
+
+_POOL: Optional["EditorWorkerPool"] = None
+_POOL_LOCK = threading.Lock()
+
+
+class WorkerError(RuntimeError):
+    """A worker process died or stopped responding."""
+
+
+def get_worker_pool() -> Optional["EditorWorkerPool"]:
+    """Return the process-wide worker pool, or None if disabled."""
+    global _POOL
+    n_workers = int(os.environ.get("FIGRECIPE_EDITOR_WORKERS") or 0)
+    if n_workers <= 0:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            max_sessions = int(
+                os.environ.get("FIGRECIPE_EDITOR_MAX_SESSIONS") or 4 * n_workers
+            )
+            timeout = float(os.environ.get("FIGRECIPE_EDITOR_TIMEOUT") or 300)
+            _POOL = EditorWorkerPool(n_workers, max_sessions, timeout or None)
+            atexit.register(_POOL.shutdown)
+    return _POOL
+
+
+class _Worker:
+    """One worker process and the pipe to it."""
+
+    def __init__(self, ctx, timeout: Optional[float] = None):
+        self._ctx = ctx
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._start()
+
+    def _start(self) -> None:
+        self.conn, child = self._ctx.Pipe()
+        self.process = self._ctx.Process(
+            target=_worker_main, args=(child,), daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def _restart(self) -> None:
+        self.process.kill()
+        self.conn.close()
+        self._start()
+
+    def call(self, *message) -> Tuple[str, Any]:
+        """Send a command and wait for the reply (one command at a time).
+
+        Raises WorkerError, after restarting the worker, if it died or did
+        not reply within ``timeout`` seconds.
+        """
+        with self._lock:
+            try:
+                self.conn.send(message)
+                if not self.conn.poll(self.timeout):
+                    logger.error(
+                        "[FigRecipe] Editor worker timed out after %ss on %s",
+                        self.timeout,
+                        message[0],
+                    )
+                    self._restart()
+                    raise WorkerError(
+                        "Editor worker timed out and was restarted; reload the figure"
+                    )
+                return self.conn.recv()
+            except (EOFError, OSError) as e:
+                logger.error("[FigRecipe] Editor worker died: %s", e)
+                self._restart()
+                raise WorkerError("Editor worker restarted; reload the figure") from e
+
+    def stop(self) -> None:
+        with self._lock:
+            try:
+                self.conn.send(("stop",))
+                self.conn.recv()
+            except (EOFError, OSError):
+                pass
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                self.process.kill()
+
+
+class EditorWorkerPool:
+    """Bounded pool of editor worker processes with session affinity.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of worker processes (started on first use).
+    max_sessions : int
+        Maximum number of open sessions across all workers.
+    timeout : float, optional
+        Seconds to wait for a worker reply before restarting the worker.
+        None waits forever.
+    """
+
+    def __init__(
+        self, n_workers: int, max_sessions: int, timeout: Optional[float] = None
+    ):
+        import multiprocessing
+
+        self.n_workers = n_workers
+        self.max_sessions = max(1, max_sessions)
+        self.timeout = timeout
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers: List[Optional[_Worker]] = [None] * n_workers
+        # session_key -> worker index, least recently used first
+        self._sessions: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _worker(self, index: int) -> _Worker:
+        with self._lock:
+            if self._workers[index] is None:
+                self._workers[index] = _Worker(self._ctx, self.timeout)
+            return self._workers[index]
+
+    def _assign(self, session_key: str) -> Tuple[int, List[Tuple[str, int]]]:
+        """Pin a session to a worker; return it and the sessions to evict."""
+        with self._lock:
+            if session_key in self._sessions:
+                self._sessions.move_to_end(session_key)
+                return self._sessions[session_key], []
+
+            evicted = []
+            while len(self._sessions) >= self.max_sessions:
+                evicted.append(self._sessions.popitem(last=False))
+
+            load = [0] * self.n_workers
+            for index in self._sessions.values():
+                load[index] += 1
+            index = load.index(min(load))
+            self._sessions[session_key] = index
+            return index, evicted
+
+    def _forget_worker(self, index: int) -> None:
+        """Drop sessions of a restarted worker."""
+        with self._lock:
+            for key in [k for k, i in self._sessions.items() if i == index]:
+                del self._sessions[key]
+
+    def dispatch(
+        self, session_key: str, endpoint: str, request: HttpRequest
+    ) -> HttpResponse:
+        """Run an API endpoint for a session in its worker."""
+        index, evicted = self._assign(session_key)
+        for old_key, old_index in evicted:
+            try:
+                self._worker(old_index).call("evict", old_key)
+            except WorkerError:
+                self._forget_worker(old_index)
+
+        try:
+            status, payload = self._worker(index).call(
+                "dispatch", endpoint, _serialize_request(request)
+            )
+        except WorkerError as e:
+            self._forget_worker(index)
+            return JsonResponse({"error": str(e)}, status=503)
+
+        if status != "ok":
+            return JsonResponse({"error": payload}, status=500)
+        return _build_response(payload)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return the editor cache stats summed over the started workers."""
+        with self._lock:
+            started = [(i, w) for i, w in enumerate(self._workers) if w is not None]
+        per_worker = []
+        for index, worker in started:
+            try:
+                status, stats = worker.call("cache_stats")
+            except WorkerError:
+                self._forget_worker(index)
+                continue
+            if status == "ok":
+                per_worker.append({"worker": index, **stats})
+        return _merge_cache_stats(per_worker)
+
+    def sessions(self) -> Dict[str, int]:
+        """Return open sessions and their worker index, LRU first."""
+        with self._lock:
+            return dict(self._sessions)
+
+    def shutdown(self) -> None:
+        """Stop all workers; they persist their sessions first."""
+        with self._lock:
+            workers = [w for w in self._workers if w is not None]
+            self._workers = [None] * self.n_workers
+            self._sessions.clear()
+        for worker in workers:
+            worker.stop()
+
+
+def _merge_cache_stats(per_worker: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum per-worker get_cache_stats() results (each has a ``worker`` index)."""
+    totals = {
+        key: sum(stats[key] for stats in per_worker)
+        for key in ("entries", "bytes", "max_bytes", "hits", "misses", "evictions")
+    }
+    lookups = totals["hits"] + totals["misses"]
+    editors = [
+        {**editor, "worker": stats["worker"]}
+        for stats in per_worker
+        for editor in stats["editors"]
+    ]
+    editors.sort(key=lambda e: e["last_access"])
+    return {
+        **totals,
+        "hit_rate": totals["hits"] / lookups if lookups else 0.0,
+        "editors": editors,
+        "workers": [
+            {k: v for k, v in stats.items() if k != "editors"} for stats in per_worker
+        ],
+    }
+
+
+# ── Request/response transport ──────────────────────────────────────
+
+
+def _serialize_request(request: HttpRequest) -> Dict[str, Any]:
+    meta = {k: v for k, v in request.META.items() if isinstance(v, str)}
+    return {
+        "method": request.method,
+        "path": request.path,
+        "meta": meta,
+        "body": request.body,
+    }
+
+
+def _build_request(data: Dict[str, Any]) -> HttpRequest:
+    request = HttpRequest()
+    request.method = data["method"]
+    request.path = request.path_info = data["path"]
+    request.META = dict(data["meta"])
+    request.GET = QueryDict(request.META.get("QUERY_STRING", ""))
+    request._body = data["body"]
+    return request
+
+
+def _serialize_response(response: HttpResponse) -> Dict[str, Any]:
+    if response.streaming:
+        content = b"".join(response.streaming_content)
+    else:
+        content = response.content
+    return {
+        "status": response.status_code,
+        "content": content,
+        "headers": dict(response.items()),
+    }
+
+
+def _build_response(data: Dict[str, Any]) -> HttpResponse:
+    response = HttpResponse(data["content"], status=data["status"])
+    for key, value in data["headers"].items():
+        response[key] = value
+    return response
+
+
+# ── Worker process ──────────────────────────────────────────────────
+
+
+def _worker_main(conn) -> None:
+    """Serve commands from the server until told to stop."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "figrecipe._django.settings")
+    import django
+
+    django.setup()
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    from . import services, views
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        op = message[0]
+        try:
+            if op == "dispatch":
+                _, endpoint, data = message
+                request = _build_request(data)
+                editor = views._get_editor(request)
+                response = views.dispatch_endpoint(request, editor, endpoint)
+                reply = ("ok", _serialize_response(response))
+            elif op == "cache_stats":
+                reply = ("ok", services.get_cache_stats())
+            elif op == "evict":
+                services.evict_editor(message[1])
+                reply = ("ok", None)
+            elif op == "stop":
+                services.evict_all_editors()
+                conn.send(("ok", None))
+                break
+            else:
+                reply = ("error", f"Unknown worker command: {op}")
+        except Exception as e:
+            logger.exception("[FigRecipe] Worker command %s failed", op)
+            reply = ("error", str(e))
+        conn.send(reply)
+
+
+__all__ = ["EditorWorkerPool", "WorkerError", "get_worker_pool"]
+
+# EOF
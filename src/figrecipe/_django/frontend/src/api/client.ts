@@ -39,6 +39,39 @@ function buildUrl(endpoint: string): string {
   return url;
 }
 
+/** Resolve a server-relative URL from a response (e.g. ``image_url``). */
+export function resolveUrl(path: string): string {
+  return `${_base}/${path}`;
+}
+
+/** Image src for a render response.
+ *
+ * Prefers inline base64 when the server sent it, otherwise the served
+ * ``image_url`` (requests made with ``image=url``), which the browser
+ * caches and revalidates by ETag.
+ */
+export function imageSrc(data: { image?: string; image_url?: string }): string {
+  if (data.image) return `data:image/png;base64,${data.image}`;
+  return data.image_url ? resolveUrl(data.image_url) : "";
+}
+
+/** Base64 PNG for an image src (data URI or served URL). */
+export async function imageBase64(src: string): Promise<string> {
+  if (src.startsWith("data:")) return src.slice(src.indexOf(",") + 1);
+  const res = await fetch(src);
+  if (!res.ok) throw new Error(`Image fetch failed: ${res.status}`);
+  const blob = await res.blob();
+  return new Promise((resolve, reject) => {
+    const reader = new FileReader();
+    reader.onload = () => {
+      const url = reader.result as string;
+      resolve(url.slice(url.indexOf(",") + 1));
+    };
+    reader.onerror = () => reject(reader.error);
+    reader.readAsDataURL(blob);
+  });
+}
+
 async function request<T>(endpoint: string, options?: RequestInit): Promise<T> {
   const url = buildUrl(endpoint);
   const res = await fetch(url, {
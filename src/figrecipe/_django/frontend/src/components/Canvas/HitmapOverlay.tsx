@@ -31,6 +31,8 @@ export function HitmapOverlay({ onElementClick }: Props) {
     if (!hitmapImage || !canvasRef.current) return;
 
     const img = new Image();
+    // Served hitmap URLs must stay readable through getImageData
+    img.crossOrigin = "anonymous";
     img.onload = () => {
       const canvas = canvasRef.current;
       if (!canvas) return;
@@ -41,7 +43,7 @@ export function HitmapOverlay({ onElementClick }: Props) {
       ctx.drawImage(img, 0, 0);
       ctxRef.current = ctx;
     };
-    img.src = `data:image/png;base64,${hitmapImage}`;
+    img.src = hitmapImage;
   }, [hitmapImage]);
 
   const handleClick = useCallback(
@@ -198,7 +198,7 @@ export function PlacedFigure({
       >
         <img
           className="canvas-image"
-          src={`data:image/png;base64,${figure.previewImage}`}
+          src={figure.previewImage}
           alt={figure.path}
           draggable={false}
           width={figure.imgSize.width}
@@ -9,6 +9,7 @@ import { DataTable as StxDataTable } from "@scitex/ui/src/scitex_ui/static/scite
 import type { Dataset } from "@scitex/ui/src/scitex_ui/static/scitex_ui/react/app/data-table";
 import { api } from "../../api/client";
 import { useEditorStore } from "../../store/useEditorStore";
+import { LoadMoreRows } from "./LoadMoreRows";
 
 export function DataTable() {
   const { datatableTabs, activeTabId, showToast, loadDatatable } =
@@ -121,6 +122,7 @@ export function DataTable() {
           {dataset && (
             <StxDataTable data={dataset} showRowNumbers sortable resizable />
           )}
+          <LoadMoreRows tab={activeTab} />
         </>
       )}
     </div>
@@ -0,0 +1,25 @@
+/** "Load more" footer for datatables fetched page by page. */
+
+import type { TabData } from "../../types/editor";
+import { useEditorStore } from "../../store/useEditorStore";
+
+export function LoadMoreRows({ tab }: { tab: TabData | null }) {
+  const loadMoreDatatableRows = useEditorStore((s) => s.loadMoreDatatableRows);
+  if (!tab || tab.rows.length >= (tab.nRows ?? 0)) return null;
+  return (
+    <div className="datatable-panel__more">
+      <span>
+        {tab.rows.length.toLocaleString()} of {tab.nRows?.toLocaleString()}{" "}
+        rows
+      </span>
+      <button
+        className="pane-header-btn"
+        onClick={() => loadMoreDatatableRows()}
+        title="Load more rows"
+        type="button"
+      >
+        Load more
+      </button>
+    </div>
+  );
+}
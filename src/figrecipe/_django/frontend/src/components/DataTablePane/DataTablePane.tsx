@@ -6,6 +6,7 @@ import { DataTable } from "@scitex/ui/src/scitex_ui/static/scitex_ui/react/app/d
 import { api } from "../../api/client";
 import { useEditorStore } from "../../store/useEditorStore";
 import { getPanelColor } from "../../utils/panelColors";
+import { LoadMoreRows } from "../DataTable/LoadMoreRows";
 
 interface DataTablePaneProps {
   onHeaderDoubleClick?: () => void;
@@ -226,6 +227,7 @@ export function DataTablePane({ onHeaderDoubleClick }: DataTablePaneProps) {
           }
           style={{ flex: 1 }}
         />
+        <LoadMoreRows tab={activeTab} />
       </div>
     </>
   );
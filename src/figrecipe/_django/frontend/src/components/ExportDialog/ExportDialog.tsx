@@ -42,7 +42,7 @@ export function ExportDialog({ onClose }: Props) {
     try {
       let blob: Blob;
       if (placedFigures.length > 0) {
-        const payload = buildExportPayload(
+        const payload = await buildExportPayload(
           placedFigures,
           workingDir,
           darkMode,
@@ -77,7 +77,7 @@ export function FigureViewer() {
     >
       {previewImage && (
         <img
-          src={`data:image/png;base64,${previewImage}`}
+          src={previewImage}
           alt="Figure preview"
           draggable={false}
           style={{
@@ -11,6 +11,7 @@ import { LabelsSection } from "./LabelsSection";
 import { LegendSection } from "./LegendSection";
 import { PropRow } from "./PropRow";
 import { PropSection } from "./PropSection";
+import { StyleSliders } from "./StyleSliders";
 
 type TabId = "current" | "preset" | "layout" | "view";
 
@@ -394,6 +395,10 @@ function ViewTab() {
         </div>
       </PropSection>
 
+      <PropSection title="Style">
+        <StyleSliders />
+      </PropSection>
+
       <PropSection title="Zoom">
         <div className="details-btn-grid">
           <button
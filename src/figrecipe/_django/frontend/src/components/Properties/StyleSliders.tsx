@@ -0,0 +1,108 @@
+/** Style sliders — font sizes and line width as manual style overrides.
+ *
+ * While dragging, updates are sent as drafts (rendered at low DPI and
+ * coalesced by the backend); releasing the slider sends a full update.
+ */
+
+import { useEffect, useRef, useState } from "react";
+import { useEditorStore } from "../../store/useEditorStore";
+
+const SLIDERS = [
+  {
+    key: "fonts_axis_label_pt",
+    label: "Axis label (pt)",
+    min: 4,
+    max: 16,
+    step: 0.5,
+    init: 7,
+  },
+  {
+    key: "fonts_tick_label_pt",
+    label: "Tick label (pt)",
+    min: 4,
+    max: 16,
+    step: 0.5,
+    init: 6,
+  },
+  {
+    key: "lines_trace_mm",
+    label: "Line width (mm)",
+    min: 0.05,
+    max: 1,
+    step: 0.05,
+    init: 0.2,
+  },
+];
+
+function StyleSlider({
+  name,
+  label,
+  min,
+  max,
+  step,
+  value,
+}: {
+  name: string;
+  label: string;
+  min: number;
+  max: number;
+  step: number;
+  value: number;
+}) {
+  const updateOverrides = useEditorStore((s) => s.updateOverrides);
+  const [current, setCurrent] = useState(value);
+  const dragged = useRef(false);
+  useEffect(() => setCurrent(value), [value]);
+
+  // Full-DPI update once the slider is released
+  const commit = () => {
+    if (!dragged.current) return;
+    dragged.current = false;
+    updateOverrides({ [name]: current });
+  };
+
+  return (
+    <div className="property-row">
+      <div className="property-group">
+        <span className="property-label">
+          {label}: {current}
+        </span>
+        <input
+          className="property-range"
+          type="range"
+          min={min}
+          max={max}
+          step={step}
+          value={current}
+          onChange={(e) => {
+            const v = Number(e.target.value);
+            setCurrent(v);
+            dragged.current = true;
+            updateOverrides({ [name]: v }, true);
+          }}
+          onPointerUp={commit}
+          onKeyUp={commit}
+        />
+      </div>
+    </div>
+  );
+}
+
+export function StyleSliders() {
+  const overrides = useEditorStore((s) => s.overrides);
+  return (
+    <>
+      {SLIDERS.map((s) => (
+        <StyleSlider
+          key={s.key}
+          name={s.key}
+          label={s.label}
+          min={s.min}
+          max={s.max}
+          step={s.step}
+          value={Number(overrides[s.key] ?? s.init)}
+        />
+      ))}
+    </>
+  );
+}
@@ -1,6 +1,6 @@
 /** Figure composition actions — add/remove/select/move/align placed figures. */
 
-import { api } from "../api/client";
+import { api, imageSrc } from "../api/client";
 import { getPanelBboxes } from "../hooks/useSnap";
 import { pushUndoState } from "../hooks/useUndoRedo";
 import type {
@@ -66,7 +66,7 @@ export function createFigureActions(set: Set, get: Get) {
           path,
           x: 0,
           y: nextY,
-          previewImage: data.image,
+          previewImage: imageSrc(data),
           bboxes: data.bboxes,
           imgSize: data.img_size,
           panelLetter: String.fromCharCode(65 + placedFigures.length),
@@ -1,6 +1,6 @@
 /** Save / Restore / Style / Theme actions — extracted from editor store. */
 
-import { api } from "../api/client";
+import { api, imageBase64, imageSrc } from "../api/client";
 import type {
   PlacedFigure,
   PreviewResponse,
@@ -25,19 +25,29 @@ type Set = (
       >),
 ) => void;
 
+/** Sequence number of the latest update request (older responses are dropped). */
+let updateSeq = 0;
+
+/** Compose figure entries; previews shown by URL are fetched as base64. */
+function composeFigures(placedFigures: PlacedFigure[]) {
+  return Promise.all(
+    placedFigures.map(async (f) => ({
+      path: f.path,
+      x: f.x,
+      y: f.y,
+      width: f.imgSize.width,
+      height: f.imgSize.height,
+      image: await imageBase64(f.previewImage),
+      panel_letter: f.panelLetter,
+      panel_letter_pos: f.panelLetterPos,
+    })),
+  );
+}
+
 /** Build the figures payload for compose, including preview images. */
-function buildComposePayload(get: Get) {
+async function buildComposePayload(get: Get) {
   const { placedFigures, workingDir, darkMode } = get();
-  const figures = placedFigures.map((f) => ({
-    path: f.path,
-    x: f.x,
-    y: f.y,
-    width: f.imgSize.width,
-    height: f.imgSize.height,
-    image: f.previewImage,
-    panel_letter: f.panelLetter,
-    panel_letter_pos: f.panelLetterPos,
-  }));
+  const figures = await composeFigures(placedFigures);
   return { figures, working_dir: workingDir, dark_mode: darkMode };
 }
 
@@ -57,7 +67,7 @@ export function createPersistActions(set: Set, get: Get) {
               f.id === selId
                 ? {
                     ...f,
-                    previewImage: data.image,
+                    previewImage: imageSrc(data),
                     bboxes: data.bboxes,
                     imgSize: data.img_size,
                   }
@@ -77,10 +87,17 @@ export function createPersistActions(set: Set, get: Get) {
       }
     },
 
-    updateOverrides: async (overrides: StyleOverrides) => {
-      set({ loading: true });
+    /** Apply style overrides; drafts (slider drags) render at low DPI. */
+    updateOverrides: async (overrides: StyleOverrides, draft = false) => {
+      const seq = ++updateSeq;
+      if (!draft) set({ loading: true });
       try {
-        const data = await api.post<PreviewResponse>("update", { overrides });
+        const data = await api.post<PreviewResponse>("update", {
+          overrides,
+          image: "url",
+          draft,
+        });
+        if (seq !== updateSeq) return;
         const selId = get().selectedFigureId;
         if (selId) {
           set((s) => ({
@@ -88,7 +105,7 @@ export function createPersistActions(set: Set, get: Get) {
               f.id === selId
                 ? {
                     ...f,
-                    previewImage: data.image,
+                    previewImage: imageSrc(data),
                     bboxes: data.bboxes,
                     imgSize: data.img_size,
                   }
@@ -101,7 +118,7 @@ export function createPersistActions(set: Set, get: Get) {
         console.error("[Editor] Failed to update:", e);
         get().showToast(`Error: ${e}`, "error");
       } finally {
-        set({ loading: false });
+        if (!draft) set({ loading: false });
       }
     },
 
@@ -119,7 +136,7 @@ export function createPersistActions(set: Set, get: Get) {
       }
       set({ loading: true });
       try {
-        const payload = buildComposePayload(get);
+        const payload = await buildComposePayload(get);
         const result = await api.post<{ success: boolean; path: string }>(
           "api/compose",
           { ...payload, filename: "composed" },
@@ -146,7 +163,7 @@ export function createPersistActions(set: Set, get: Get) {
                   f.id === selId
                     ? {
                         ...f,
-                        previewImage: data.image,
+                        previewImage: imageSrc(data),
                         bboxes: data.bboxes,
                         imgSize: data.img_size,
                       }
@@ -170,23 +187,14 @@ export function createPersistActions(set: Set, get: Get) {
 }
 
 /** Build compose export payload (for ExportDialog). */
-export function buildExportPayload(
+export async function buildExportPayload(
   placedFigures: PlacedFigure[],
   workingDir: string | null,
   darkMode: boolean,
   filename: string,
 ) {
   return {
-    figures: placedFigures.map((f) => ({
-      path: f.path,
-      x: f.x,
-      y: f.y,
-      width: f.imgSize.width,
-      height: f.imgSize.height,
-      image: f.previewImage,
-      panel_letter: f.panelLetter,
-      panel_letter_pos: f.panelLetterPos,
-    })),
+    figures: await composeFigures(placedFigures),
     working_dir: workingDir,
     dark_mode: darkMode,
     filename,
@@ -1,6 +1,6 @@
 /** Sync actions — element↔data linking, calls/labels, stat brackets. */
 
-import { api } from "../api/client";
+import { api, imageSrc } from "../api/client";
 import type {
   AxesLabels,
   BBox,
@@ -98,7 +98,7 @@ export function createSyncActions(set: Set, get: Get) {
               f.id === selectedFigureId
                 ? {
                     ...f,
-                    previewImage: data.image,
+                    previewImage: imageSrc(data),
                     bboxes: data.bboxes,
                     imgSize: data.img_size,
                   }
@@ -137,7 +137,7 @@ export function createSyncActions(set: Set, get: Get) {
               f.id === selectedFigureId
                 ? {
                     ...f,
-                    previewImage: data.image,
+                    previewImage: imageSrc(data),
                     bboxes: data.bboxes,
                     imgSize: data.img_size,
                   }
@@ -1,14 +1,14 @@
 /** Central Zustand store — single source of truth for the editor. */
 
 import { create } from "zustand";
-import { api } from "../api/client";
+import { api, imageSrc } from "../api/client";
 import type { SnapGuide } from "../hooks/useSnap";
 import { pushUndoState } from "../hooks/useUndoRedo";
 import type {
   AxesLabels,
   BBox,
   CallRecord,
-  ColumnDef,
+  DatatablePage,
   ElementDataLink,
   FileTreeItem,
   FilesResponse,
@@ -99,6 +99,7 @@ interface EditorState {
   loadFiles: () => Promise<void>;
   loadThemes: () => Promise<void>;
   loadDatatable: () => Promise<void>;
+  loadMoreDatatableRows: () => Promise<void>;
   loadPanelPositions: () => Promise<void>;
 
   addFigure: (path: string) => Promise<void>;
@@ -133,7 +134,10 @@ interface EditorState {
   selectElement: (id: string | null, bbox?: BBox, figureId?: string) => void;
   switchFile: (path: string) => Promise<void>;
   switchTheme: (theme: string) => Promise<void>;
-  updateOverrides: (overrides: StyleOverrides) => Promise<void>;
+  updateOverrides: (
+    overrides: StyleOverrides,
+    draft?: boolean,
+  ) => Promise<void>;
   save: () => Promise<void>;
   restore: () => Promise<void>;
 
@@ -160,6 +164,24 @@ interface EditorState {
 }
 
 /* eslint-disable @typescript-eslint/no-explicit-any */
+/** Rows fetched per datatable/columns request. */
+const DATATABLE_PAGE_ROWS = 1000;
+
+function fetchDatatablePage(offset: number): Promise<DatatablePage> {
+  return api.get<DatatablePage>(
+    `datatable/columns?offset=${offset}&limit=${DATATABLE_PAGE_ROWS}`,
+  );
+}
+
+/** Turn a column-major page into table rows. */
+function pageRows(page: DatatablePage): (string | number)[][] {
+  const rows: (string | number)[][] = [];
+  for (let i = 0; i < page.stop - page.start; i++) {
+    rows.push(page.columns.map((c) => page.data[c.name]?.[i] ?? ""));
+  }
+  return rows;
+}
+
 export const useEditorStore = create<EditorState>((set, get) => ({
   // ── Initial state ───────────────────────────────────────
   placedFigures: [],
@@ -278,7 +300,9 @@ export const useEditorStore = create<EditorState>((set, get) => ({
     set({ loading: true });
     try {
       const dark = get().darkMode;
-      const data = await api.get<PreviewResponse>(`preview?dark_mode=${dark}`);
+      const data = await api.get<PreviewResponse>(
+        `preview?dark_mode=${dark}&image=url`,
+      );
       if (data.dark_mode !== undefined) set({ darkMode: data.dark_mode });
       const { placedFigures, selectedFigureId, currentFile } = get();
       if (placedFigures.length === 0) {
@@ -291,7 +315,7 @@ export const useEditorStore = create<EditorState>((set, get) => ({
           path: recipePath,
           x: 0,
           y: 0,
-          previewImage: data.image,
+          previewImage: imageSrc(data),
           bboxes: data.bboxes,
           imgSize: data.img_size,
           panelLetter: "A",
@@ -303,7 +327,7 @@ export const useEditorStore = create<EditorState>((set, get) => ({
             f.id === selectedFigureId
               ? {
                   ...f,
-                  previewImage: data.image,
+                  previewImage: imageSrc(data),
                   bboxes: data.bboxes,
                   imgSize: data.img_size,
                 }
@@ -321,8 +345,8 @@ export const useEditorStore = create<EditorState>((set, get) => ({
 
   loadHitmap: async () => {
     try {
-      const data = await api.get<HitmapResponse>("hitmap");
-      set({ hitmapImage: data.image, colorMap: data.color_map });
+      const data = await api.get<HitmapResponse>("hitmap?image=url");
+      set({ hitmapImage: imageSrc(data), colorMap: data.color_map });
     } catch (e) {
       console.error("[Editor] Failed to load hitmap:", e);
     }
@@ -352,43 +376,49 @@ export const useEditorStore = create<EditorState>((set, get) => ({
 
   loadDatatable: async () => {
     try {
-      const data = await api.get<{
-        columns: ColumnDef[];
-        rows: (string | number)[][];
-        element_data_map?: Record<
-          string,
-          { columns: string[]; row_indices: number[] }
-        >;
-      }>("datatable/data");
+      const page = await fetchDatatablePage(0);
       const tab: TabData = {
         id: "main",
         label: "Data",
-        columns: data.columns ?? [],
-        rows: data.rows ?? [],
+        columns: page.columns,
+        rows: pageRows(page),
+        nRows: page.n_rows,
       };
-      // Build element-data mapping if provided by backend
-      const elementDataMap: Record<
-        string,
-        { columns: string[]; rowIndices: number[] }
-      > = {};
-      if (data.element_data_map) {
-        for (const [key, val] of Object.entries(data.element_data_map)) {
-          elementDataMap[key] = {
-            columns: val.columns,
-            rowIndices: val.row_indices,
-          };
-        }
-      }
       set({
         datatableTabs: { main: tab },
         activeTabId: "main",
-        elementDataMap,
+        elementDataMap: {},
       });
     } catch (e) {
       console.warn("[Editor] No datatable data available:", e);
     }
   },
 
+  loadMoreDatatableRows: async () => {
+    const tab = get().datatableTabs.main;
+    if (!tab || tab.rows.length >= (tab.nRows ?? 0)) return;
+    try {
+      const page = await fetchDatatablePage(tab.rows.length);
+      set((s) => {
+        const current = s.datatableTabs.main;
+        // Skip pages for a table reloaded meanwhile
+        if (!current || current.rows.length !== page.start) return {};
+        return {
+          datatableTabs: {
+            ...s.datatableTabs,
+            main: {
+              ...current,
+              rows: [...current.rows, ...pageRows(page)],
+              nRows: page.n_rows,
+            },
+          },
+        };
+      });
+    } catch (e) {
+      console.warn("[Editor] Failed to load datatable rows:", e);
+    }
+  },
+
   loadPanelPositions: async () => {
     try {
       const data = await api.get<Record<string, any>>("get_axes_positions");
@@ -442,8 +472,9 @@ export const useEditorStore = create<EditorState>((set, get) => ({
     try {
       const data = await api.post<PreviewResponse>("update", {
         dark_mode: dark,
+        image: "url",
       });
-      if (data?.image) {
+      if (data?.image || data?.image_url) {
         const { selectedFigureId } = get();
         if (selectedFigureId) {
           set((s) => ({
@@ -451,7 +482,7 @@ export const useEditorStore = create<EditorState>((set, get) => ({
               f.id === selectedFigureId
                 ? {
                     ...f,
-                    previewImage: data.image,
+                    previewImage: imageSrc(data),
                     bboxes: data.bboxes,
                     imgSize: data.img_size,
                   }
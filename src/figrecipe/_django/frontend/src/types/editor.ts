@@ -21,6 +21,7 @@ export interface PlacedFigure {
   path: string;
   x: number;
   y: number;
+  /** Image src: a served image URL or a base64 data URI (see imageSrc). */
   previewImage: string;
   bboxes: Record<string, BBox>;
   imgSize: ImgSize;
@@ -43,6 +44,17 @@ export interface TabData {
   label: string;
   columns: ColumnDef[];
   rows: (string | number)[][];
+  /** Total rows on the server; rows holds the pages loaded so far. */
+  nRows?: number;
+}
+
+/** One page of datatable/columns (column-major values). */
+export interface DatatablePage {
+  columns: ColumnDef[];
+  n_rows: number;
+  start: number;
+  stop: number;
+  data: Record<string, (string | number | null)[]>;
 }
 
 export interface ColumnDef {
@@ -62,14 +74,18 @@ export interface CallRecord {
 }
 
 export interface PreviewResponse {
-  image: string;
+  image?: string;
+  image_url?: string;
+  image_etag?: string;
   bboxes: Record<string, BBox>;
   img_size: ImgSize;
   dark_mode?: boolean;
 }
 
 export interface HitmapResponse {
-  image: string;
+  image?: string;
+  image_url?: string;
+  image_etag?: string;
   color_map: Record<string, unknown>;
 }
 
@@ -33,8 +33,17 @@ from .axis import (
     handle_update_legend_position,
 )
 from .compose import handle_compose_save
-from .core import handle_hitmap, handle_ping, handle_preview, handle_update
+from .core import (
+    handle_cache_stats,
+    handle_hitmap,
+    handle_hitmap_ids,
+    handle_image,
+    handle_ping,
+    handle_preview,
+    handle_update,
+)
 from .datatable import (
+    handle_datatable_columns,
     handle_datatable_data,
     handle_datatable_import,
     handle_datatable_plot,
@@ -111,6 +120,8 @@ HANDLERS = {
     "ping":                         handle_ping,
     "update":                       handle_update,
     "hitmap":                       handle_hitmap,
+    "hitmap/ids":                   handle_hitmap_ids,
+    "cache/stats":                  handle_cache_stats,
 
     # Style
     "style":                        handle_style,
@@ -144,6 +155,7 @@ HANDLERS = {
 
     # Datatable
     "datatable/data":               handle_datatable_data,
+    "datatable/columns":            handle_datatable_columns,
     "datatable/plot":               handle_datatable_plot,
     "datatable/import":             handle_datatable_import,
 
@@ -189,5 +201,6 @@ __all__ = [
     "handle_single_call",
     "handle_download_fig",
     "handle_gallery_thumbnail",
+    "handle_image",
     "handle_compose_export",
 ]
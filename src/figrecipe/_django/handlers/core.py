@@ -1,41 +1,135 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Core handlers: preview, ping, update, hitmap."""
-
+"""Core handlers: preview, ping, update, hitmap, hitmap/ids, image, cache/stats.
+
+Rendered PNGs are kept per editor as raw bytes keyed by a content hash.
+JSON responses reference them by URL (``image/<kind>/<etag>``) so clients
+can fetch the bytes directly, with ETag/304 revalidation. Clients that
+send ``image=url`` (query string or JSON body) get metadata only;
+otherwise the PNG is also embedded as base64 for backward compatibility.
+The bundled editor frontend requests URLs for preview, update and hitmap.
+
+Preview and update renders go through the editor's RenderCoalescer, so
+bursts of updates share renders; updates with ``"draft": true`` render
+at low DPI and are followed by a full-DPI settle render.
+"""
+
+import base64
+import hashlib
 import json
+from urllib.parse import quote
 
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
 
+# Images served by handle_image
+IMAGE_KINDS = ("preview", "hitmap")
 
-def _regen_hitmap(editor, img_size):
-    """Regenerate hitmap after any render that changes figure content."""
-    from figrecipe._editor._hitmap import generate_hitmap, hitmap_to_base64
 
-    editor._main_img_size = img_size
-    hitmap_img, color_map = generate_hitmap(editor.fig, dpi=150, target_size=img_size)
-    editor._color_map = color_map
-    editor._hitmap_base64 = hitmap_to_base64(hitmap_img)
+def _store_image(editor, kind, png_bytes):
+    """Keep the latest PNG of *kind* on the editor and return its ETag."""
+    etag = hashlib.sha256(png_bytes).hexdigest()[:16]
+    editor._images[kind] = (etag, png_bytes)
+    return etag
+
+
+def _wants_url(request, data=None):
+    """Check whether the client asked for image URLs instead of base64."""
+    if request.GET.get("image") == "url":
+        return True
+    return bool(data) and data.get("image") == "url"
+
+
+def _image_fields(request, editor, kind, data=None, image=None):
+    """Return the JSON fields referencing an image of *kind*.
+
+    *image* is an ``(etag, png_bytes)`` pair; defaults to the stored one.
+    """
+    etag, png_bytes = image or editor._images[kind]
+    url = f"image/{kind}/{etag}"
+    recipe = request.GET.get("recipe") or (data or {}).get("recipe_path")
+    if recipe:
+        url += f"?recipe={quote(str(recipe))}"
+    fields = {"image_url": url, "image_etag": etag}
+    if not _wants_url(request, data):
+        fields["image"] = base64.b64encode(png_bytes).decode("utf-8")
+    return fields
+
+
+def _ensure_hitmap(editor):
+    """Generate the hitmap if it is missing or stale.
+
+    Only axes changed since the previous hitmap are redrawn.
+    """
+    if editor._hitmap_generated and "hitmap" in editor._images:
+        return
+    from figrecipe._editor._hitmap import get_hitmap_cache, hitmap_to_png
+
+    hitmap_img, editor._color_map = get_hitmap_cache(editor.fig).generate(
+        dpi=150, target_size=getattr(editor, "_main_img_size", None)
+    )
+    _store_image(editor, "hitmap", hitmap_to_png(hitmap_img))
     editor._hitmap_generated = True
 
 
-def handle_preview(request, editor):
-    from figrecipe._editor._helpers import render_with_overrides
+def _regen_hitmap(editor, img_size):
+    """Mark the hitmap stale after any render that changes figure content.
+
+    The hitmap is rebuilt lazily, when the client next requests it, at
+    the size of the latest full render. Draft renders pass ``None`` for
+    *img_size* and keep that size.
+    """
+    if img_size is not None:
+        editor._main_img_size = img_size
+    editor._hitmap_generated = False
+
+
+def _draw_preview(editor, draft=False):
+    """Render and store the preview; return the frame for responses."""
+    from figrecipe._editor._helpers import render_png_with_overrides
+
+    from .._coalesce import DRAFT_DPI
+
+    png_bytes, bboxes, size = render_png_with_overrides(
+        editor.fig,
+        editor.get_effective_style(),
+        editor.dark_mode,
+        dpi=DRAFT_DPI if draft else 150,
+    )
+    etag = _store_image(editor, "preview", png_bytes)
+    _regen_hitmap(editor, None if draft else size)
+    return {"image": (etag, png_bytes), "bboxes": bboxes, "size": size, "draft": draft}
+
+
+def _render_preview(request, editor, data=None, apply=None, draft=False):
+    """Render the preview (coalesced) and return the JSON fields.
+
+    *apply* mutates the editor before rendering, under the editor lock;
+    see RenderCoalescer.submit.
+    """
+    from .._coalesce import get_coalescer
+
+    frame = get_coalescer(editor).submit(
+        apply, lambda as_draft: _draw_preview(editor, as_draft), draft=draft
+    )
+    size = frame["size"]
+    return {
+        **_image_fields(request, editor, "preview", data, frame["image"]),
+        "bboxes": frame["bboxes"],
+        "img_size": {"width": size[0], "height": size[1]},
+        "draft": frame["draft"],
+    }
+
 
+def handle_preview(request, editor):
     # Frontend can pass dark_mode to override backend default
     dark = request.GET.get("dark_mode")
-    if dark is not None:
-        editor.dark_mode = dark == "true"
 
-    img, bboxes, size = render_with_overrides(
-        editor.fig, editor.get_effective_style(), editor.dark_mode
-    )
+    def apply():
+        if dark is not None:
+            editor.dark_mode = dark == "true"
+
     return JsonResponse(
-        {
-            "image": img,
-            "bboxes": bboxes,
-            "img_size": {"width": size[0], "height": size[1]},
-            "dark_mode": editor.dark_mode,
-        }
+        {**_render_preview(request, editor, apply=apply), "dark_mode": editor.dark_mode}
     )
 
 
@@ -43,36 +137,72 @@ def handle_ping(request, editor):
     return JsonResponse({"status": "ok"})
 
 
-def handle_update(request, editor):
-    from figrecipe._editor._helpers import render_with_overrides
+def handle_cache_stats(request, editor):
+    """GET /cache/stats -- editor cache size, budget and hit rate."""
+    from ..services import get_cache_stats
+
+    return JsonResponse(get_cache_stats())
+
 
+def handle_update(request, editor):
     data = json.loads(request.body) if request.body else {}
-    editor.overrides.update_manual_overrides(data.get("overrides", {}))
 
-    new_dark = data.get("dark_mode")
-    if new_dark is not None and new_dark != editor.dark_mode:
-        editor.dark_mode = new_dark
+    def apply():
+        editor.overrides.update_manual_overrides(data.get("overrides", {}))
+        new_dark = data.get("dark_mode")
+        if new_dark is not None and new_dark != editor.dark_mode:
+            editor.dark_mode = new_dark
 
-    img, bboxes, size = render_with_overrides(
-        editor.fig, editor.get_effective_style(), editor.dark_mode
-    )
     return JsonResponse(
-        {
-            "image": img,
-            "bboxes": bboxes,
-            "img_size": {"width": size[0], "height": size[1]},
-        }
+        _render_preview(
+            request, editor, data, apply=apply, draft=bool(data.get("draft"))
+        )
     )
 
 
 def handle_hitmap(request, editor):
-    if not editor._hitmap_generated:
-        from figrecipe._editor._hitmap import generate_hitmap, hitmap_to_base64
+    _ensure_hitmap(editor)
+    return JsonResponse(
+        {**_image_fields(request, editor, "hitmap"), "color_map": editor._color_map}
+    )
 
-        hitmap_img, editor._color_map = generate_hitmap(editor.fig)
-        editor._hitmap_base64 = hitmap_to_base64(hitmap_img)
-        editor._hitmap_generated = True
 
-    return JsonResponse(
-        {"image": editor._hitmap_base64, "color_map": editor._color_map}
+def handle_hitmap_ids(request, editor):
+    """GET /hitmap/ids -- run-length encoded element ID map and color map."""
+    from figrecipe._editor._hitmap import encode_id_map_rle, generate_id_map
+
+    id_map, color_map = generate_id_map(
+        editor.fig, dpi=150, target_size=getattr(editor, "_main_img_size", None)
     )
+    return JsonResponse({**encode_id_map_rle(id_map), "color_map": color_map})
+
+
+def handle_image(request, editor, kind, version=""):
+    """GET /image/<kind>[/<etag>] -- serve a stored PNG as raw bytes.
+
+    Versioned URLs are immutable and return 404 once a newer image of that
+    kind replaced them. The unversioned URL always serves the latest image
+    and must be revalidated.
+    """
+    if kind not in IMAGE_KINDS:
+        return JsonResponse({"error": f"Unknown image: {kind}"}, status=404)
+    if kind == "hitmap":
+        _ensure_hitmap(editor)
+    if kind not in editor._images:
+        return JsonResponse({"error": f"No {kind} rendered yet"}, status=404)
+
+    etag, png_bytes = editor._images[kind]
+    if version and version != etag:
+        return JsonResponse(
+            {"error": f"Stale {kind} version", "image_etag": etag}, status=404
+        )
+
+    quoted = f'"{etag}"'
+    cache_control = "private, max-age=31536000, immutable" if version else "no-cache"
+    if quoted in request.headers.get("If-None-Match", ""):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(png_bytes, content_type="image/png")
+    response["ETag"] = quoted
+    response["Cache-Control"] = cache_control
+    return response
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Datatable handlers: data, plot, import."""
+"""Datatable handlers: data, columns, plot, import."""
 
 import json
 import logging
@@ -9,6 +9,10 @@ from django.http import JsonResponse
 
 logger = logging.getLogger(__name__)
 
+# Row window limits for datatable/columns
+_DEFAULT_LIMIT = 1000
+_MAX_LIMIT = 100_000
+
 
 def handle_datatable_data(request, editor):
     from figrecipe._editor._helpers import to_json_serializable
@@ -26,8 +30,13 @@ def handle_datatable_data(request, editor):
             args = getattr(call, "args", [])
             func = getattr(call, "function", "")
 
-            x_data = kwargs.get("x") or (args[0] if len(args) > 0 else None)
-            y_data = kwargs.get("y") or (args[1] if len(args) > 1 else None)
+            # Recorded kwargs may be arrays, so never test them for truth
+            x_data = kwargs.get("x")
+            if x_data is None and len(args) > 0:
+                x_data = args[0]
+            y_data = kwargs.get("y")
+            if y_data is None and len(args) > 1:
+                y_data = args[1]
 
             if x_data is not None and y_data is not None:
                 call_id = (
@@ -49,6 +58,56 @@ def handle_datatable_data(request, editor):
     return JsonResponse({"columns": columns, "data": data_rows, "source": "record"})
 
 
+def handle_datatable_columns(request, editor):
+    """GET /datatable/columns -- windowed, columnar view of the recorded data.
+
+    Query parameters: ``offset`` and ``limit`` select rows (limit is
+    capped at 100000), ``columns`` (comma separated) selects columns and
+    ``max_points`` downsamples the window by stride for previews. Column
+    metadata is always returned for all columns. Columns are cached on the
+    editor until the recorded data changes.
+    """
+    from figrecipe._editor._datatable_columns import column_window
+
+    record = getattr(editor.fig, "record", None)
+    if not record:
+        return JsonResponse({"columns": [], "n_rows": 0, "data": {}, "source": "empty"})
+
+    try:
+        offset = int(request.GET.get("offset", 0))
+        limit = min(int(request.GET.get("limit", _DEFAULT_LIMIT)), _MAX_LIMIT)
+        max_points = int(request.GET.get("max_points", 0)) or None
+    except ValueError:
+        return JsonResponse({"error": "Invalid offset/limit/max_points"}, status=400)
+
+    columns = _editor_columns(editor, record)
+    selected = columns
+    names = request.GET.get("columns")
+    if names:
+        wanted = set(names.split(","))
+        selected = [c for c in columns if c.name in wanted]
+
+    window = column_window(selected, offset, limit, max_points)
+    return JsonResponse(
+        {
+            "columns": [c.info() for c in columns],
+            **window,
+            "source": "record",
+        }
+    )
+
+
+def _editor_columns(editor, record):
+    """Return the datatable columns of the record, cached per editor."""
+    from figrecipe._editor._datatable_columns import record_columns, record_key
+
+    key = record_key(record)
+    cached = editor._datatable_columns
+    if cached is None or cached[0] != key:
+        cached = editor._datatable_columns = (key, record_columns(record))
+    return cached[1]
+
+
 def handle_datatable_plot(request, editor):
     """Plot from datatable column selections."""
     from figrecipe._editor._helpers import render_with_overrides
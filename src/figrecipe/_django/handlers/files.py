@@ -11,12 +11,20 @@ from django.http import FileResponse, JsonResponse
 logger = logging.getLogger(__name__)
 
 
+def _current_recipe(editor):
+    """Return the resolved recipe path of the editor, or None."""
+    if editor and getattr(editor, "recipe_path", None):
+        return editor.recipe_path.resolve()
+    return None
+
+
 def _enrich_tree(tree, working_dir, editor, files_backend):
     """Add figrecipe-specific metadata to a generic file tree.
 
     Filters to recipe files only (must contain figure: and axes:),
     and adds has_image and is_current flags.
     """
+    current = _current_recipe(editor)
     enriched = []
     for item in tree:
         if item["type"] == "directory":
@@ -40,16 +48,78 @@ def _enrich_tree(tree, working_dir, editor, files_backend):
                 {
                     **item,
                     "has_image": files_backend.exists(png_path),
-                    "is_current": bool(
-                        editor
-                        and getattr(editor, "recipe_path", None)
-                        and full_path.resolve() == editor.recipe_path.resolve()
-                    ),
+                    "is_current": bool(current and full_path.resolve() == current),
                 }
             )
     return enriched
 
 
+def _index_tree(index, editor):
+    """Build the recipe file tree from a scanned RecipeIndex.
+
+    Gives the items of _enrich_tree (plus figure_id and n_axes) without
+    walking the working directory again. Directories come first, then
+    files, each sorted by name.
+    """
+    current = _current_recipe(editor)
+    root = {}
+    for rel_path, entry in index.entries.items():
+        if not entry["is_recipe"]:
+            continue
+        parts = rel_path.split("/")
+        children = root
+        for depth, part in enumerate(parts[:-1]):
+            node = children.setdefault(
+                part,
+                {
+                    "name": part,
+                    "path": "/".join(parts[: depth + 1]),
+                    "type": "directory",
+                    "children": {},
+                },
+            )
+            children = node["children"]
+        children[parts[-1]] = {
+            "name": parts[-1],
+            "path": rel_path,
+            "type": "file",
+            "has_image": entry["image"] is not None,
+            "figure_id": entry["figure_id"],
+            "n_axes": entry["n_axes"],
+            "is_current": bool(
+                current
+                and current.name == parts[-1]
+                and (index.root / rel_path).resolve() == current
+            ),
+        }
+
+    def to_list(nodes):
+        items = sorted(
+            nodes.values(), key=lambda x: (x["type"] != "directory", x["name"].lower())
+        )
+        return [
+            {**x, "children": to_list(x["children"])} if x["type"] == "directory" else x
+            for x in items
+        ]
+
+    return to_list(root)
+
+
+def _get_recipe_index(working_dir):
+    """Return the up-to-date recipe index of a local working dir, or None."""
+    if not Path(working_dir).is_dir():
+        return None
+    from .._recipe_index import get_recipe_index
+
+    index = get_recipe_index(working_dir)
+    try:
+        index.scan()
+    except OSError as exc:
+        logger.warning("[api_files] Recipe index scan failed: %s", exc)
+        return None
+    return index
+
+
 def _find_default_working_dir():
     """Find the working directory — respects FIGRECIPE_WORKING_DIR env var."""
     import os
@@ -148,8 +218,13 @@ def handle_api_files(request, editor):
 
     working_dir, files_backend = _get_working_dir_and_backend(request, editor)
     try:
-        tree = _build_tree(files_backend, extensions=[".yaml", ".yml"])
-        tree = _enrich_tree(tree, working_dir, editor, files_backend)
+        # The index walk of a local working dir also yields the tree
+        index = _get_recipe_index(working_dir)
+        if index is not None:
+            tree = _index_tree(index, editor)
+        else:
+            tree = _build_tree(files_backend, extensions=[".yaml", ".yml"])
+            tree = _enrich_tree(tree, working_dir, editor, files_backend)
     except PermissionError:
         return JsonResponse({"tree": [], "files": [], "working_dir": str(working_dir)})
 
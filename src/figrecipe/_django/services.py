@@ -5,20 +5,73 @@
 Editors are cached in-process because route handlers mutate
 the matplotlib figure directly (labels, legend, axes positions).
 Uses a lightweight EditorState dataclass.
+
+The cache is bounded by the estimated memory of its editors
+(``FIGRECIPE_EDITOR_CACHE_MB``, default 512) as well as by a TTL.
+Least recently used editors are evicted first; eviction closes the
+figure and saves overrides so the session can be restored. Editors in
+use by a request (holding ``EditorState._lock``) are skipped by budget
+and TTL eviction.
 """
 
 import logging
-import tempfile
+import os
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# In-process cache: session_key -> (editor, last_access_time)
-_editor_cache: Dict[str, Tuple[Any, float]] = {}
+# In-process cache: session_key -> (editor, last_access_time, estimated_bytes),
+# least recently used first
+_editor_cache: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+_cache_lock = threading.RLock()
+_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
 _CACHE_TTL_SECONDS = 3600  # 1 hour
+_CACHE_MAX_BYTES = int(
+    float(os.environ.get("FIGRECIPE_EDITOR_CACHE_MB") or 512) * 1024 * 1024
+)
+
+# Rough per-artist cost (Python objects, transforms, properties)
+_ARTIST_OVERHEAD_BYTES = 2048
+
+
+class _EditorLock:
+    """Reentrant lock that records the thread holding it.
+
+    Eviction uses ``held_by_current_thread`` to skip editors held by the
+    evicting thread itself, which a plain RLock does not expose publicly.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._owner: Optional[int] = None
+        self._count = 0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if not self._lock.acquire(blocking, timeout):
+            return False
+        self._owner = threading.get_ident()
+        self._count += 1
+        return True
+
+    def release(self) -> None:
+        self._count -= 1
+        if self._count == 0:
+            self._owner = None
+        self._lock.release()
+
+    def held_by_current_thread(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc) -> None:
+        self.release()
 
 
 @dataclass
@@ -34,6 +87,17 @@ class EditorState:
     _style_name: str = "SCITEX"
     _hitmap_generated: bool = False
 
+    # Latest rendered PNGs served by handle_image: kind -> (etag, bytes)
+    _images: Dict[str, Tuple[str, bytes]] = field(default_factory=dict)
+
+    # Datatable columns of the record: (record_key, columns)
+    _datatable_columns: Any = None
+
+    # Held while a handler uses the figure; update renders are coalesced
+    # by the RenderCoalescer in _render_queue (see _coalesce.py)
+    _lock: Any = field(default_factory=_EditorLock)
+    _render_queue: Any = None
+
     # StyleOverrides for layered style management
     _overrides: Any = None
 
@@ -85,21 +149,193 @@ def get_or_create_editor(
     style: Optional[str] = None,
 ) -> EditorState:
     """Get cached editor or create a new one."""
-    _cleanup_expired()
-
-    if session_key in _editor_cache:
-        editor, _ = _editor_cache[session_key]
-        _editor_cache[session_key] = (editor, time.time())
-        return editor
+    with _cache_lock:
+        _cleanup_expired()
+        entry = _editor_cache.get(session_key)
+        _cache_stats["hits" if entry else "misses"] += 1
+        if entry is not None:
+            return _touch_editor(session_key, entry[0])
 
+    # Created outside the lock so other sessions are not blocked meanwhile
     editor = _create_editor(recipe_path, style)
-    _editor_cache[session_key] = (editor, time.time())
+
+    with _cache_lock:
+        entry = _editor_cache.get(session_key)
+        if entry is None:
+            return _touch_editor(session_key, editor)
+        # A concurrent request for the same session created one first
+        winner = _touch_editor(session_key, entry[0])
+    _close_editor(editor)
+    return winner
+
+
+def _touch_editor(session_key: str, editor: EditorState) -> EditorState:
+    """Mark an editor most recently used and enforce the budget (holds lock)."""
+    # Sizes are re-estimated on access, i.e. as left by the last request
+    _editor_cache[session_key] = (editor, time.time(), estimate_editor_bytes(editor))
+    _editor_cache.move_to_end(session_key)
+    _enforce_budget(keep=session_key)
     return editor
 
 
 def remove_editor(session_key: str) -> None:
     """Remove an editor from cache."""
-    _editor_cache.pop(session_key, None)
+    with _cache_lock:
+        _editor_cache.pop(session_key, None)
+
+
+def evict_editor(session_key: str, persist: bool = True) -> None:
+    """Remove an editor from cache and release its figure.
+
+    Parameters
+    ----------
+    session_key : str
+        Cache key of the editor.
+    persist : bool, optional
+        Save the editor's overrides to ``.overrides.json`` first, so the
+        session is restored when the recipe is opened again (default: True).
+    """
+    with _cache_lock:
+        entry = _editor_cache.pop(session_key, None)
+        if entry is None:
+            return
+        _cache_stats["evictions"] += 1
+    editor = entry[0]
+    # Wait for a handler or render still using the figure
+    with editor._lock:
+        if persist:
+            _persist_overrides(editor)
+        _close_editor(editor)
+    logger.info("[FigRecipe] Evicted editor %s", session_key)
+
+
+def evict_all_editors(persist: bool = True) -> None:
+    """Evict every cached editor (see evict_editor)."""
+    with _cache_lock:
+        session_keys = list(_editor_cache)
+    for session_key in session_keys:
+        evict_editor(session_key, persist=persist)
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Return size, budget and hit rate of the editor cache.
+
+    Returns
+    -------
+    dict
+        ``entries``, ``bytes``, ``max_bytes``, ``hits``, ``misses``,
+        ``hit_rate``, ``evictions`` and per-editor ``editors`` sizes
+        (least recently used first).
+    """
+    with _cache_lock:
+        lookups = _cache_stats["hits"] + _cache_stats["misses"]
+        editors = [
+            {"session_key": key, "bytes": size, "last_access": ts}
+            for key, (_, ts, size) in _editor_cache.items()
+        ]
+        return {
+            "entries": len(editors),
+            "bytes": sum(e["bytes"] for e in editors),
+            "max_bytes": _CACHE_MAX_BYTES,
+            **_cache_stats,
+            "hit_rate": _cache_stats["hits"] / lookups if lookups else 0.0,
+            "editors": editors,
+        }
+
+
+def estimate_editor_bytes(editor: EditorState) -> int:
+    """Estimate the memory held by an editor.
+
+    Counts stored PNGs, the element color map, array data of the figure's
+    artists plus a fixed per-artist overhead, and the Agg buffers kept by
+    the canvas and the preview/hitmap renderers.
+    """
+    size = sum(len(png) for _, png in editor._images.values())
+    size += 256 * len(editor._color_map or {})
+
+    mpl_fig = getattr(editor.fig, "_fig", editor.fig)
+    if mpl_fig is None or not hasattr(mpl_fig, "findobj"):
+        return size
+
+    for artist in mpl_fig.findobj():
+        size += _ARTIST_OVERHEAD_BYTES + _artist_array_bytes(artist)
+
+    hitmap_cache = getattr(mpl_fig, "_figrecipe_hitmap_cache", None)
+    renderers = (
+        getattr(mpl_fig.canvas, "renderer", None),
+        getattr(getattr(mpl_fig, "_figrecipe_preview", None), "_renderer", None),
+        getattr(getattr(hitmap_cache, "_renderer", None), "_renderer", None),
+    )
+    for renderer in renderers:
+        if renderer is not None and hasattr(renderer, "width"):
+            size += 4 * int(renderer.width) * int(renderer.height)
+    return size
+
+
+def _artist_array_bytes(artist) -> int:
+    """Bytes of the numpy data an artist holds (lines, collections, images)."""
+    size = 0
+    for name in ("_xy", "_offsets", "_A", "_coordinates"):
+        size += int(getattr(getattr(artist, name, None), "nbytes", 0) or 0)
+    for path in getattr(artist, "_paths", None) or ():
+        size += int(getattr(getattr(path, "vertices", None), "nbytes", 0) or 0)
+    return size
+
+
+def _enforce_budget(keep: Optional[str] = None) -> None:
+    """Evict least recently used editors until the cache fits its budget."""
+    with _cache_lock:
+        total = sum(size for _, _, size in _editor_cache.values())
+        for session_key in list(_editor_cache):
+            if total <= _CACHE_MAX_BYTES:
+                break
+            if session_key == keep:
+                continue
+            size = _editor_cache[session_key][2]
+            if _evict_if_idle(session_key):
+                total -= size
+
+
+def _evict_if_idle(session_key: str) -> bool:
+    """Evict an editor unless a request is using it; return whether it was."""
+    lock = _editor_cache[session_key][0]._lock
+    # Also skip editors held by this thread, e.g. by a handler opening
+    # another recipe
+    if lock.held_by_current_thread() or not lock.acquire(blocking=False):
+        return False
+    try:
+        evict_editor(session_key)
+    finally:
+        lock.release()
+    return True
+
+
+def _persist_overrides(editor: EditorState) -> None:
+    """Save manual and call overrides next to the recipe, if any."""
+    overrides = editor._overrides
+    if editor.recipe_path is None or overrides is None:
+        return
+    if not (overrides.has_manual_overrides() or overrides.has_call_overrides()):
+        return
+    from figrecipe._editor._overrides import get_overrides_path, save_overrides
+
+    try:
+        save_overrides(overrides, get_overrides_path(Path(editor.recipe_path)))
+    except OSError as e:
+        logger.warning("[FigRecipe] Could not save overrides: %s", e)
+
+
+def _close_editor(editor: EditorState) -> None:
+    """Close the editor's matplotlib figure and drop rendered images."""
+    import matplotlib.pyplot as plt
+
+    if editor._render_queue is not None:
+        editor._render_queue.cancel()
+    mpl_fig = getattr(editor.fig, "_fig", editor.fig)
+    if mpl_fig is not None:
+        plt.close(mpl_fig)
+    editor._images.clear()
+    editor._datatable_columns = None
 
 
 def _create_editor(
@@ -108,33 +344,22 @@ def _create_editor(
 ) -> EditorState:
     """Create an EditorState from recipe path."""
     from figrecipe._editor import _resolve_source, _resolve_style
-    from figrecipe._editor._hitmap import generate_hitmap, hitmap_to_base64
 
     fig, resolved_path = _resolve_source(recipe_path)
     style_dict = _resolve_style(style)
 
-    mpl_fig = fig._fig if hasattr(fig, "_fig") else fig
-    saved_facecolors = []
-    for ax in mpl_fig.get_axes():
-        saved_facecolors.append((ax, ax.get_facecolor()))
-        ax.set_facecolor("none")
-    static_png_path = Path(tempfile.mktemp(suffix="_figrecipe_static.png"))
-    mpl_fig.savefig(static_png_path, format="png", dpi=150, transparent=True)
-    for ax, fc in saved_facecolors:
-        ax.set_facecolor(fc)
-
-    hitmap_img, color_map = generate_hitmap(fig)
-    hitmap_base64 = hitmap_to_base64(hitmap_img)
-
+    # Preview and hitmap are rendered on first request
     editor = EditorState(
         fig=fig,
         recipe_path=resolved_path,
         style=style_dict,
         working_dir=Path(recipe_path).parent if recipe_path else Path.cwd(),
-        _color_map=color_map,
-        _hitmap_generated=True,
     )
-    editor._hitmap_base64 = hitmap_base64
+    # Restore overrides persisted by an earlier (evicted) session
+    if resolved_path is not None:
+        from figrecipe._editor._overrides import get_overrides_path, load_overrides
+
+        editor._overrides = load_overrides(get_overrides_path(Path(resolved_path)))
     logger.info("[FigRecipe] Created editor for %s", recipe_path)
     return editor
 
@@ -143,7 +368,7 @@ def _cleanup_expired() -> None:
     """Remove expired editors from cache."""
     now = time.time()
     expired = [
-        k for k, (_, ts) in _editor_cache.items() if now - ts > _CACHE_TTL_SECONDS
+        k for k, (_, ts, _) in _editor_cache.items() if now - ts > _CACHE_TTL_SECONDS
     ]
     for k in expired:
-        _editor_cache.pop(k, None)
+        _evict_if_idle(k)
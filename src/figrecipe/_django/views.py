@@ -69,6 +69,7 @@ def _get_editor(request):
 # ── Endpoints that work without an editor ──────────────────────────
 _NO_EDITOR_ENDPOINTS = {
     "ping",
+    "cache/stats",
     "list_themes",
     "api/tree",
     "api/files",
@@ -114,9 +115,41 @@ def editor_page(request):
 
 @csrf_exempt
 def api_dispatch(request, endpoint):
-    """Dispatch API calls to handler functions."""
-    editor = _get_editor(request)
+    """Dispatch API calls to handler functions.
 
+    With an editor worker pool (FIGRECIPE_EDITOR_WORKERS), requests for a
+    recipe run in the worker process that holds its editor.
+    """
+    from ._workers import get_worker_pool
+
+    pool = get_worker_pool()
+    if pool is not None and endpoint == "cache/stats":
+        return JsonResponse(pool.cache_stats())
+    recipe_path = _get_recipe_path(request)
+    if pool is not None and recipe_path and not endpoint.startswith("api/chat/"):
+        return pool.dispatch(f"figrecipe_{recipe_path}", endpoint, request)
+
+    return dispatch_endpoint(request, _get_editor(request), endpoint)
+
+
+# Endpoints that serialize their own renders and state changes
+# (RenderCoalescer runs them under the editor lock)
+_COALESCED_ENDPOINTS = {"preview", "update"}
+
+
+def dispatch_endpoint(request, editor, endpoint):
+    """Run the handler for *endpoint* with the given editor.
+
+    Handlers hold the editor's lock while they use its figure, so they do
+    not interleave with each other or with background settle renders.
+    """
+    if editor is None or endpoint in _COALESCED_ENDPOINTS:
+        return _dispatch_endpoint(request, editor, endpoint)
+    with editor._lock:
+        return _dispatch_endpoint(request, editor, endpoint)
+
+
+def _dispatch_endpoint(request, editor, endpoint):
     # Some endpoints require an editor
     _no_editor = endpoint in _NO_EDITOR_ENDPOINTS or endpoint.startswith(
         (
@@ -163,6 +196,18 @@ def api_dispatch(request, endpoint):
             logger.exception("[FigRecipe] API error on /call/%s", call_id)
             return JsonResponse({"error": str(e)}, status=500)
 
+    if endpoint.startswith("image/"):
+        if editor is None:
+            return JsonResponse({"error": "No recipe loaded"}, status=400)
+        from .handlers import handle_image
+
+        kind, _, version = endpoint[len("image/") :].partition("/")
+        try:
+            return handle_image(request, editor, kind, version.strip("/"))
+        except Exception as e:
+            logger.exception("[FigRecipe] API error on /image/%s", kind)
+            return JsonResponse({"error": str(e)}, status=500)
+
     if endpoint.startswith("download/"):
         if editor is None:
             return JsonResponse({"error": "No recipe loaded"}, status=400)
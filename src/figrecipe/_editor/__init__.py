@@ -115,6 +115,7 @@ def gui(
     hot_reload: bool = False,
     working_dir: Optional[Union[str, Path]] = None,
     desktop: bool = False,
+    workers: int = 0,
 ) -> None:
     """Launch interactive GUI editor using Django + React.
 
@@ -136,6 +137,9 @@ def gui(
         Working directory for file browser.
     desktop : bool
         Launch as native desktop window (default: False).
+    workers : int
+        Run editor sessions in this many worker processes (default: 0,
+        in the server process).
     """
     import os
 
@@ -149,6 +153,8 @@ def gui(
         wd = str(Path.cwd())
 
     os.environ["FIGRECIPE_WORKING_DIR"] = wd
+    if workers:
+        os.environ["FIGRECIPE_EDITOR_WORKERS"] = str(workers)
 
     # Extra env for recipe source
     extra_env = {}
@@ -7,8 +7,9 @@ This module contains the main extract_bboxes function that coordinates
 all element-specific bbox extractors.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from matplotlib.backend_bases import RendererBase
 from matplotlib.figure import Figure
 from matplotlib.transforms import Bbox
 
@@ -34,6 +35,7 @@ def extract_bboxes(
     img_width: int,
     img_height: int,
     include_points: bool = True,
+    renderer: Optional[RendererBase] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """
     Extract bounding boxes for all figure elements.
@@ -48,6 +50,9 @@ def extract_bboxes(
         Height of the output image in pixels.
     include_points : bool, optional
         Whether to include point arrays for lines/scatter (default: True).
+    renderer : RendererBase, optional
+        Renderer that has just drawn the figure at its current DPI. When
+        given, the figure is not drawn again.
 
     Returns
     -------
@@ -56,23 +61,8 @@ def extract_bboxes(
     """
     bboxes = {}
 
-    # Get renderer for bbox calculations
-    # Handle matplotlib's Done exception from _get_renderer (can occur with corrupted canvas state)
-    try:
-        fig.canvas.draw()
-    except Exception as e:
-        # Matplotlib's Done exception or other draw issues - reset canvas and retry
-        if "Done" in str(type(e).__name__) or "Done" in str(e):
-            from matplotlib.backends.backend_agg import FigureCanvasAgg
-
-            fig.set_canvas(FigureCanvasAgg(fig))
-            try:
-                fig.canvas.draw()
-            except Exception:
-                pass  # Continue with potentially stale renderer
-        else:
-            raise
-    renderer = fig.canvas.get_renderer()
+    if renderer is None:
+        renderer = _draw_for_renderer(fig)
 
     # Get figure bounds for coordinate transformation
     fig_width_inches = fig.get_figwidth()
@@ -150,6 +140,27 @@ def extract_bboxes(
     return bboxes
 
 
+def _draw_for_renderer(fig: Figure) -> RendererBase:
+    """Draw the figure on its canvas and return the canvas renderer."""
+    # Get renderer for bbox calculations
+    # Handle matplotlib's Done exception from _get_renderer (can occur with corrupted canvas state)
+    try:
+        fig.canvas.draw()
+    except Exception as e:
+        # Matplotlib's Done exception or other draw issues - reset canvas and retry
+        if "Done" in str(type(e).__name__) or "Done" in str(e):
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+            fig.set_canvas(FigureCanvasAgg(fig))
+            try:
+                fig.canvas.draw()
+            except Exception:
+                pass  # Continue with potentially stale renderer
+        else:
+            raise
+    return fig.canvas.get_renderer()
+
+
 def _extract_axes_bboxes(
     ax,
     ax_idx,
@@ -93,7 +93,9 @@ def _apply_diagram_override(ax_record, call_id, param, value):
     if call is None:
         return
 
-    diagram_data = call.kwargs.get("diagram_data") or call.kwargs.get("schematic_data")
+    diagram_data = call.kwargs.get("diagram_data")
+    if diagram_data is None:
+        diagram_data = call.kwargs.get("schematic_data")
     if diagram_data is None:
         return
 
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Columnar, windowed access to the data recorded in a figure.
+
+The editor's datatable shows one column per recorded data argument
+(``<call_id>_<arg>``). Columns reference the record's numpy arrays
+directly; only the requested window of rows is converted for JSON, so
+large traces never become full Python lists.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Array kinds that form datatable columns
+_ARG_KINDS = "iufbUSOM"
+_KWARG_KINDS = "iufb"
+
+
+@dataclass
+class DataColumn:
+    """One recorded data array shown as a datatable column."""
+
+    name: str
+    values: np.ndarray
+    call_id: str
+    ax_key: str
+    arg: str
+
+    @property
+    def dtype(self) -> str:
+        """Column type for clients: float, int, bool, datetime or string."""
+        kind = self.values.dtype.kind
+        if kind == "f":
+            return "float"
+        if kind in "iu":
+            return "int"
+        if kind == "b":
+            return "bool"
+        if kind == "M":
+            return "datetime"
+        return "string"
+
+    def info(self) -> Dict[str, Any]:
+        """Return JSON-ready column metadata."""
+        return {
+            "name": self.name,
+            "dtype": self.dtype,
+            "length": int(len(self.values)),
+            "call_id": self.call_id,
+            "ax_key": self.ax_key,
+            "arg": self.arg,
+        }
+
+
+def record_columns(record) -> List[DataColumn]:
+    """
+    Collect the 1-D data arrays of all recorded calls as columns.
+
+    Parameters
+    ----------
+    record : FigureRecord
+        Record of the figure.
+
+    Returns
+    -------
+    list of DataColumn
+        Columns in call order. Lists of arrays (boxplot, violinplot) give
+        one column per array; other multi-dimensional data is skipped.
+    """
+    from .._reproducer._reconstruct import reconstruct_value
+
+    columns: List[DataColumn] = []
+    names = set()
+
+    def add(call, ax_key, arg, values, kinds):
+        if isinstance(values, (list, tuple)) and values:
+            if all(isinstance(v, np.ndarray) for v in values):
+                for i, v in enumerate(values):
+                    add(call, ax_key, f"{arg}{i}", v, kinds)
+                return
+        try:
+            arr = np.asarray(values)
+        except (TypeError, ValueError):
+            return
+        if arr.ndim != 1 or arr.size < 2 or arr.dtype.kind not in kinds:
+            return
+        name = base = f"{call.id}_{arg}"
+        n = 1
+        while name in names:
+            n += 1
+            name = f"{base}_{n}"
+        names.add(name)
+        columns.append(DataColumn(name, arr, call.id, ax_key, arg))
+
+    for ax_key, ax_record in record.axes.items():
+        for call in getattr(ax_record, "calls", []):
+            for i, arg_data in enumerate(call.args):
+                if not isinstance(arg_data, dict):
+                    continue
+                arg = arg_data.get("name") or f"arg{i}"
+                value = reconstruct_value(arg_data)
+                if arg_data.get("_is_array_list") and isinstance(value, np.ndarray):
+                    value = _split_array_list(value, arg_data.get("_array_lengths"))
+                add(call, ax_key, arg, value, _ARG_KINDS)
+            for key, value in call.kwargs.items():
+                if isinstance(value, (list, tuple, np.ndarray)):
+                    add(call, ax_key, key, value, _KWARG_KINDS)
+    return columns
+
+
+def record_key(record) -> tuple:
+    """
+    Identity key of the data recorded in a figure.
+
+    The key changes when calls are added or removed or when an argument
+    or keyword value is replaced, so it can key a cache of
+    record_columns(). It costs O(calls), independent of the data size.
+
+    Parameters
+    ----------
+    record : FigureRecord
+        Record of the figure.
+
+    Returns
+    -------
+    tuple
+        Hashable key.
+    """
+
+    def value_key(value):
+        if isinstance(value, dict):
+            value = value.get("data")
+        return id(value), getattr(value, "shape", None)
+
+    return (id(record),) + tuple(
+        (
+            ax_key,
+            id(call),
+            tuple(value_key(arg) for arg in call.args),
+            tuple((k, value_key(v)) for k, v in call.kwargs.items()),
+        )
+        for ax_key, ax_record in record.axes.items()
+        for call in getattr(ax_record, "calls", [])
+    )
+
+
+def _split_array_list(stacked: np.ndarray, lengths: Optional[Sequence[int]]):
+    """Undo the column stacking of recorded lists of arrays."""
+    if stacked.ndim != 2:
+        return stacked
+    arrays = [stacked[:, i] for i in range(stacked.shape[1])]
+    if lengths and len(lengths) == len(arrays):
+        arrays = [a[:n] for a, n in zip(arrays, lengths)]
+    return arrays
+
+
+def column_window(
+    columns: List[DataColumn],
+    offset: int = 0,
+    limit: int = 1000,
+    max_points: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Return a window of rows from the columns, ready for JSON.
+
+    Parameters
+    ----------
+    columns : list of DataColumn
+        Columns to read.
+    offset : int
+        First row of the window.
+    limit : int
+        Maximum number of rows in the window.
+    max_points : int, optional
+        Downsample the window by a constant stride so that at most this
+        many rows are returned (for previews).
+
+    Returns
+    -------
+    dict
+        ``n_rows`` (longest column), ``start``, ``stop`` and ``step`` of
+        the returned rows, and ``data`` mapping column names to value
+        lists. Columns shorter than the window give shorter lists;
+        NaN/inf floats become None.
+    """
+    n_rows = max((len(c.values) for c in columns), default=0)
+    start = min(max(int(offset), 0), n_rows)
+    stop = min(start + max(int(limit), 0), n_rows)
+    step = 1
+    if max_points and stop - start > max_points:
+        step = -(-(stop - start) // int(max_points))
+    rows = np.arange(start, stop, step)
+
+    return {
+        "n_rows": n_rows,
+        "start": start,
+        "stop": stop,
+        "step": step,
+        "data": {c.name: _json_values(c.values, rows) for c in columns},
+    }
+
+
+def _json_values(values: np.ndarray, rows: np.ndarray) -> list:
+    """Convert the selected rows of a column to JSON-safe Python values."""
+    window = values[rows[rows < len(values)]]
+    kind = window.dtype.kind
+    if kind == "f":
+        out = window.astype(object)
+        out[~np.isfinite(window)] = None
+        return out.tolist()
+    if kind in "iub":
+        return window.tolist()
+    if kind == "M":
+        return np.datetime_as_string(window).tolist()
+    return [None if v is None else str(v) for v in window.tolist()]
+
+
+__all__ = ["DataColumn", "record_columns", "record_key", "column_window"]
+
+# EOF
@@ -129,15 +129,74 @@ def _reset_to_light_mode(fig) -> None:
                 t.set_color(txt)
 
 
+def _preview_keys(
+    fig, overrides: Optional[Dict[str, Any]], record: Any, dark_mode: bool
+):
+    """Fingerprint overrides for the incremental preview renderer.
+
+    Call overrides only affect the axes holding the call, so they are keyed
+    per axes; everything else is keyed globally.
+    """
+    from ._preview import fingerprint
+
+    overrides = overrides or {}
+    call_overrides = overrides.get("call_overrides") or {}
+    global_overrides = {k: v for k, v in overrides.items() if k != "call_overrides"}
+
+    axes_list = fig.get_axes()
+    call_to_ax = {}
+    if record is not None and hasattr(record, "axes"):
+        # Same axes mapping as apply_call_overrides (sorted ax_key order)
+        for idx, ax_key in enumerate(sorted(record.axes.keys())):
+            if idx < len(axes_list):
+                for call in record.axes[ax_key].calls:
+                    call_to_ax[call.id] = id(axes_list[idx])
+
+    per_axes: Dict[int, Dict[str, Any]] = {}
+    unassigned = {}
+    for call_id, params in call_overrides.items():
+        ax_id = call_to_ax.get(call_id)
+        if ax_id is None:
+            unassigned[call_id] = params
+        else:
+            per_axes.setdefault(ax_id, {})[call_id] = params
+
+    state_key = fingerprint(
+        {"overrides": global_overrides, "calls": unassigned, "dark_mode": dark_mode}
+    )
+    axes_keys = {ax_id: fingerprint(calls) for ax_id, calls in per_axes.items()}
+    return state_key, axes_keys
+
+
 def render_with_overrides(
     fig, overrides: Optional[Dict[str, Any]], dark_mode: bool = False
 ):
     """
     Re-render figure with overrides applied directly.
 
-    Applies style overrides directly to the existing figure for reliable rendering.
+    Same as render_png_with_overrides, with the PNG base64-encoded for
+    embedding in JSON responses.
     """
     import base64
+
+    png_bytes, bboxes, img_size = render_png_with_overrides(fig, overrides, dark_mode)
+    return base64.b64encode(png_bytes).decode("utf-8"), bboxes, img_size
+
+
+def render_png_with_overrides(
+    fig,
+    overrides: Optional[Dict[str, Any]],
+    dark_mode: bool = False,
+    dpi: int = 150,
+):
+    """
+    Re-render figure with overrides applied directly, returning raw PNG bytes.
+
+    Applies style overrides directly to the existing figure for reliable rendering.
+    The preview is drawn by the figure's incremental PreviewRenderer, so only
+    axes changed since the previous render are redrawn. Bboxes are read from
+    that same draw. A lower *dpi* gives cheaper draft previews.
+    """
     import io
     import warnings
 
@@ -145,13 +204,14 @@ def render_with_overrides(
     from PIL import Image
 
     from ._bbox import extract_bboxes
+    from ._preview import get_preview_renderer
 
     # Use the underlying matplotlib Figure for canvas/render to avoid
     # RecordingFigure.__getattr__ issues with matplotlib internals (dpi etc.)
     mpl_fig = fig._fig if hasattr(fig, "_fig") else fig
+    preview = get_preview_renderer(mpl_fig)
 
     fig_width, fig_height = fig.get_size_inches()
-    dpi = 150
     pixel_width = fig_width * dpi
     pixel_height = fig_height * dpi
 
@@ -163,7 +223,8 @@ def render_with_overrides(
         )
 
     # Switch to Agg backend to avoid Tkinter thread issues
-    mpl_fig.set_canvas(FigureCanvasAgg(mpl_fig))
+    if not isinstance(mpl_fig.canvas, FigureCanvasAgg):
+        mpl_fig.set_canvas(FigureCanvasAgg(mpl_fig))
 
     # Disable constrained_layout if present (can cause rendering issues)
     layout_engine = fig.get_layout_engine()
@@ -172,35 +233,39 @@ def render_with_overrides(
         if "Constrained" in layout_name:
             fig.set_layout_engine("none")
 
-    # Set global font family via rcParams to catch any text matplotlib creates
-    if overrides:
-        import matplotlib as mpl
+    is_diagram = getattr(fig, "_figrecipe_diagram", None) is not None
+    record = fig.record if hasattr(fig, "record") else None
+
+    # Overrides and colour mode are re-applied on every render; their effect
+    # is keyed by fingerprints, so the mutations are not tracked as edits
+    with preview.untracked():
+        # Set global font family via rcParams to catch any text matplotlib creates
+        if overrides:
+            import matplotlib as mpl
 
-        from ..styles._fonts import check_font
+            from ..styles._fonts import check_font
 
-        font_fam = overrides.get("fonts_family", overrides.get("font_family"))
-        if font_fam:
-            mpl.rcParams["font.family"] = "sans-serif"
-            mpl.rcParams["font.sans-serif"] = [check_font(font_fam)]
+            font_fam = overrides.get("fonts_family", overrides.get("font_family"))
+            if font_fam:
+                mpl.rcParams["font.family"] = "sans-serif"
+                mpl.rcParams["font.sans-serif"] = [check_font(font_fam)]
 
-    # Apply overrides directly to existing figure
-    # Skip style overrides for diagram figures — diagrams have their own
-    # layout/styling that would be corrupted by regular figure style settings
-    is_diagram = getattr(fig, "_figrecipe_diagram", None) is not None
-    if not is_diagram:
-        record = fig.record if hasattr(fig, "record") else None
-        if overrides:
-            from ._render_overrides import apply_overrides
+        # Apply overrides directly to existing figure
+        # Skip style overrides for diagram figures — diagrams have their own
+        # layout/styling that would be corrupted by regular figure style settings
+        if not is_diagram:
+            if overrides:
+                from ._render_overrides import apply_overrides
 
-            apply_overrides(fig, overrides, record)
+                apply_overrides(fig, overrides, record)
 
-        # Apply dark/light mode to figure text and spine colors
-        if dark_mode:
-            from ._render_overrides import apply_dark_mode
+            # Apply dark/light mode to figure text and spine colors
+            if dark_mode:
+                from ._render_overrides import apply_dark_mode
 
-            apply_dark_mode(fig)
-        else:
-            _reset_to_light_mode(fig)
+                apply_dark_mode(fig)
+            else:
+                _reset_to_light_mode(fig)
 
     # Validate axes bounds before rendering (prevent infinite/invalid extents)
     for ax in fig.get_axes():
@@ -211,48 +276,44 @@ def render_with_overrides(
             ax.set_xlim(-1, 1)
             ax.set_ylim(-1, 1)
 
-    # Save to PNG using same params as static save
-    # Re-create canvas to ensure clean state (avoids matplotlib renderer issues)
-    # IMPORTANT: Use mpl_fig (not RecordingFigure) for canvas/savefig to avoid
-    # RecordingFigure.axes returning 2D list which breaks _tight_bbox.adjust_bbox
-    original_draw = getattr(mpl_fig, "draw", None)
-    mpl_fig.set_canvas(FigureCanvasAgg(mpl_fig))
+    # Editor preview always renders transparent — the canvas
+    # provides its own background (dark/light grid theme)
+    render_dpi = dpi
+    if is_diagram:
+        fig_w, fig_h = fig.get_size_inches()
+        max_dim = max(fig_w, fig_h)
+        max_pixels = 1500
+        if max_dim * render_dpi > max_pixels:
+            render_dpi = max(30, int(max_pixels / max_dim))
+
+    state_key, axes_keys = _preview_keys(mpl_fig, overrides, record, dark_mode)
 
+    # IMPORTANT: Use mpl_fig (not RecordingFigure) for rendering to avoid
+    # RecordingFigure.axes returning 2D list which breaks matplotlib internals
+    original_draw = getattr(mpl_fig, "draw", None)
     buf = io.BytesIO()
+    bboxes = None
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", "constrained_layout not applied")
         warnings.filterwarnings("ignore", category=UserWarning)
         try:
-            # Editor preview always renders transparent — the canvas
-            # provides its own background (dark/light grid theme)
-            transparent = True
-            render_dpi = 150
-            if is_diagram:
-                fig_w, fig_h = fig.get_size_inches()
-                max_dim = max(fig_w, fig_h)
-                max_pixels = 1500
-                if max_dim * render_dpi > max_pixels:
-                    render_dpi = max(30, int(max_pixels / max_dim))
-            # Make axes backgrounds transparent too (savefig transparent
-            # only affects figure patch, not axes patches)
-            saved_facecolors = []
-            if transparent:
-                for ax in mpl_fig.get_axes():
-                    saved_facecolors.append((ax, ax.get_facecolor()))
-                    ax.set_facecolor("none")
-            save_kwargs = dict(
-                format="png",
-                dpi=render_dpi,
-                transparent=transparent,
+            frame = preview.render(
+                render_dpi,
+                state_key=state_key,
+                axes_keys=axes_keys,
+                force_full=is_diagram,
+                collect=lambda renderer: extract_bboxes(
+                    mpl_fig,
+                    int(renderer.width),
+                    int(renderer.height),
+                    renderer=renderer,
+                ),
             )
-            if is_diagram and not transparent:
-                save_kwargs["facecolor"] = "white"
-            mpl_fig.savefig(buf, **save_kwargs)
-            # Restore axes facecolors
-            for ax, fc in saved_facecolors:
-                ax.set_facecolor(fc)
+            Image.fromarray(frame, "RGBA").save(buf, format="PNG")
+            bboxes = preview.last_collected
         except Exception as e1:
             logger.exception("[render_with_overrides] Primary render failed: %s", e1)
+            preview.invalidate()
             buf = io.BytesIO()
             mpl_fig.set_canvas(FigureCanvasAgg(mpl_fig))
             if original_draw is not None:
@@ -275,38 +336,25 @@ def render_with_overrides(
                 placeholder = PILImage.new("RGB", (400, 300), color=(240, 240, 240))
                 placeholder.save(buf, format="PNG")
                 buf.seek(0)
-        finally:
-            if original_draw is not None and hasattr(mpl_fig, "draw"):
-                try:
-                    mpl_fig.draw = original_draw
-                except AttributeError:
-                    pass
     buf.seek(0)
     png_bytes = buf.read()
-    base64_str = base64.b64encode(png_bytes).decode("utf-8")
 
     # Get image size
     buf.seek(0)
     img = Image.open(buf)
     img_size = img.size
 
-    # Extract bboxes using underlying mpl figure for clean canvas state
-    mpl_fig.set_canvas(FigureCanvasAgg(mpl_fig))
-    original_dpi = mpl_fig.dpi
-    mpl_fig.set_dpi(render_dpi)
-    try:
-        mpl_fig.canvas.draw()
-    except Exception:
-        # Canvas draw failed, likely due to corrupted state - reset and retry
+    if bboxes is None:
+        # Fallback render: extract bboxes with a separate draw
         mpl_fig.set_canvas(FigureCanvasAgg(mpl_fig))
+        original_dpi = mpl_fig.dpi
+        mpl_fig.set_dpi(render_dpi)
         try:
-            mpl_fig.canvas.draw()
-        except Exception:
-            pass  # If still fails, proceed with possibly stale bboxes
-    bboxes = extract_bboxes(mpl_fig, img_size[0], img_size[1])
-    mpl_fig.set_dpi(original_dpi)
+            bboxes = extract_bboxes(mpl_fig, img_size[0], img_size[1])
+        finally:
+            mpl_fig.set_dpi(original_dpi)
 
-    return base64_str, bboxes, img_size
+    return png_bytes, bboxes, img_size
 
 
 def to_json_serializable(obj):
@@ -329,6 +377,7 @@ def to_json_serializable(obj):
 
 __all__ = [
     "get_form_values_from_style",
+    "render_png_with_overrides",
     "render_with_overrides",
     "to_json_serializable",
 ]
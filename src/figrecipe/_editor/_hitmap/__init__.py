@@ -7,7 +7,18 @@ The main entry point is `generate_hitmap`.
 """
 
 # Re-export main functions from _hitmap_main
-from .._hitmap_main import generate_hitmap, hitmap_to_base64
+from .._hitmap_main import generate_hitmap, hitmap_to_base64, hitmap_to_png
+
+# Re-export incremental hitmap cache
+from ._cache import HitmapCache, get_hitmap_cache
+
+# Re-export ID-buffer engine
+from ._idmap import (
+    decode_id_map_rle,
+    encode_id_map_rle,
+    generate_id_map,
+    hitmap_to_id_map,
+)
 
 # Re-export from artist processing
 from ._artists import (
@@ -46,6 +57,14 @@ __all__ = [
     # Main functions
     "generate_hitmap",
     "hitmap_to_base64",
+    "hitmap_to_png",
+    "HitmapCache",
+    "get_hitmap_cache",
+    # ID-buffer engine
+    "generate_id_map",
+    "hitmap_to_id_map",
+    "encode_id_map_rle",
+    "decode_id_map_rle",
     # Color utilities
     "id_to_rgb",
     "rgb_to_id",
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Incremental hitmap cache.
+
+The hitmap frame is kept in a PreviewRenderer of its own, sharing the
+figure's ChangeTracker with the editor preview. Regenerating the hitmap
+still recolors every artist (cheap property changes), but only redraws
+the axes that changed since the last hitmap:
+
+- axes mutated through tracked changes (labels, limits, artists);
+- axes whose call overrides changed in the last preview render;
+- axes whose element colors changed (e.g. an element was added earlier
+  in the figure and shifted the ids of the following ones).
+
+Global override changes, figure-level text and diagrams fall back to a
+full render.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image
+
+
+def get_hitmap_cache(fig) -> "HitmapCache":
+    """Return the hitmap cache attached to a figure, creating it once."""
+    mpl_fig = fig._fig if hasattr(fig, "_fig") else fig
+    cache = getattr(mpl_fig, "_figrecipe_hitmap_cache", None)
+    if cache is None or cache.fig is not fig:
+        cache = HitmapCache(fig)
+        mpl_fig._figrecipe_hitmap_cache = cache
+    return cache
+
+
+class HitmapCache:
+    """Regenerate a figure's hitmap, redrawing only changed axes.
+
+    Parameters
+    ----------
+    fig : RecordingFigure or matplotlib.figure.Figure
+        Figure to generate hitmaps for.
+    """
+
+    def __init__(self, fig):
+        from .._preview import PreviewRenderer
+
+        self.fig = fig
+        self.mpl_fig = fig._fig if hasattr(fig, "_fig") else fig
+        self._renderer = PreviewRenderer(self.mpl_fig, transparent=False)
+
+    @property
+    def last_full(self) -> bool:
+        """Whether the last generate() redrew the whole hitmap."""
+        return self._renderer.last_full
+
+    def invalidate(self) -> None:
+        """Force the next hitmap to be rendered in full."""
+        self._renderer.invalidate()
+
+    def generate(
+        self,
+        dpi: int = 150,
+        include_text: bool = True,
+        target_size: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[Image.Image, Dict[str, Any]]:
+        """Generate the hitmap (same return values as generate_hitmap)."""
+        from .._hitmap_main import (
+            apply_hitmap_colors,
+            fit_hitmap_size,
+            generate_hitmap,
+            get_hitmap_dpi,
+            restore_hitmap_colors,
+        )
+        from .._preview import fingerprint, get_preview_renderer
+
+        fig = self.fig
+        if getattr(fig, "_figrecipe_diagram", None) is not None:
+            # Diagrams are cropped with bbox_inches="tight"
+            self.invalidate()
+            return generate_hitmap(fig, dpi, include_text, target_size)
+
+        # Override fingerprints of the last preview render
+        preview = get_preview_renderer(self.mpl_fig)
+        override_axes_keys = preview.axes_keys
+
+        tracker = self._renderer.tracker
+        with tracker.untracked():
+            axes_list, original_props, color_map = apply_hitmap_colors(
+                fig, include_text
+            )
+            try:
+                per_axes: Dict[int, list] = {}
+                figure_level = []
+                for key, info in sorted(color_map.items()):
+                    ax_index = info.get("ax_index")
+                    if isinstance(ax_index, int) and 0 <= ax_index < len(axes_list):
+                        per_axes.setdefault(ax_index, []).append((key, info))
+                    else:
+                        figure_level.append((key, info))
+
+                state_key = fingerprint(
+                    {
+                        "overrides": preview.state_key,
+                        "figure": figure_level,
+                        "include_text": include_text,
+                    }
+                )
+                axes_keys = {
+                    id(ax): fingerprint(
+                        [per_axes.get(i, []), override_axes_keys.get(id(ax))]
+                    )
+                    for i, ax in enumerate(axes_list)
+                }
+                frame = self._renderer.render(
+                    get_hitmap_dpi(fig, dpi), state_key=state_key, axes_keys=axes_keys
+                )
+                hitmap = Image.fromarray(frame, "RGBA").convert("RGB")
+            finally:
+                restore_hitmap_colors(fig, axes_list, original_props, include_text)
+
+        return fit_hitmap_size(hitmap, target_size), color_map
+
+
+__all__ = ["HitmapCache", "get_hitmap_cache"]
+
+# EOF
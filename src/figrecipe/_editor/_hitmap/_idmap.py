@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""ID-buffer hitmap engine.
+
+Instead of reading element colors back from a rendered image, the figure
+is drawn once with every selectable artist's draw hooked: the artist's
+region of the Agg buffer is cleared before it draws, and the pixels it
+covers afterwards (alpha > 0) are labelled with its element id in a
+numpy ID map. Later artists overwrite earlier ones, so the map follows
+z-order. Coverage includes antialiased edges and semi-transparent fills,
+and picking does not depend on colors surviving antialiasing.
+
+Element ids and metadata are the same as generate_hitmap's color_map.
+The ID map can be exported as run-length encoded JSON.
+"""
+
+import re
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Padding (pixels) around artist extents, plus the artist's linewidth
+_REGION_PAD = 2
+
+# Indexed element keys, e.g. "line3", "scatter0", "arrow_2"
+_INDEXED_KEY = re.compile(r"^([a-z_]+?)(\d+)$")
+
+_COLLECTION_KINDS = {
+    "scatter",
+    "fill",
+    "linecoll",
+    "quadmesh",
+    "contour",
+    "quiver",
+    "barbs",
+}
+_PATCH_KINDS = {"bar", "polygon", "wedge", "stairs", "dbox", "arrow_"}
+
+
+def generate_id_map(
+    fig,
+    dpi: int = 150,
+    include_text: bool = True,
+    target_size: Optional[Tuple[int, int]] = None,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Generate an element ID map in a single draw.
+
+    Parameters
+    ----------
+    fig : RecordingFigure or matplotlib.figure.Figure
+        Figure to generate the ID map for.
+    dpi : int, optional
+        Resolution (default: 150), capped like generate_hitmap.
+    include_text : bool, optional
+        Whether to include text elements like labels (default: True).
+    target_size : tuple of (width, height), optional
+        Resize (nearest neighbour) to match the main render.
+
+    Returns
+    -------
+    id_map : numpy.ndarray
+        ``(height, width)`` uint16 array (uint32 for more than 65535
+        elements) of element ids; 0 is background.
+    color_map : dict
+        Element metadata keyed by element key, as from generate_hitmap.
+    """
+    from matplotlib.backends.backend_agg import RendererAgg
+
+    from .._hitmap_main import (
+        apply_hitmap_colors,
+        get_hitmap_dpi,
+        restore_hitmap_colors,
+    )
+    from .._preview import agg_lock, get_change_tracker
+
+    mpl_fig = fig._fig if hasattr(fig, "_fig") else fig
+    render_dpi = get_hitmap_dpi(fig, dpi)
+
+    with get_change_tracker(mpl_fig).untracked():
+        axes_list, original_props, color_map = apply_hitmap_colors(fig, include_text)
+        original_dpi = mpl_fig.dpi
+        mpl_fig.dpi = render_dpi
+        hooked = []
+        try:
+            width, height = (int(round(v)) for v in mpl_fig.bbox.size)
+            renderer = RendererAgg(width, height, render_dpi)
+            frame = np.asarray(renderer.buffer_rgba())
+            n_ids = max((info["id"] for info in color_map.values()), default=0)
+            dtype = np.uint16 if n_ids < np.iinfo(np.uint16).max else np.uint32
+            id_map = np.zeros((height, width), dtype=dtype)
+
+            for artist, element_id in _element_artists(
+                mpl_fig, axes_list, color_map
+            ).values():
+                hooked.append(_hook_draw(artist, element_id, frame, id_map))
+            with agg_lock():
+                mpl_fig.draw(renderer)
+        finally:
+            for unhook in hooked:
+                unhook()
+            mpl_fig.dpi = original_dpi
+            restore_hitmap_colors(fig, axes_list, original_props, include_text)
+
+    if target_size and (id_map.shape[1], id_map.shape[0]) != tuple(target_size):
+        id_map = _resize_nearest(id_map, target_size)
+    return id_map, color_map
+
+
+def _element_artists(mpl_fig, axes_list, color_map) -> Dict[int, Tuple[Any, int]]:
+    """Map ``id(artist)`` to ``(artist, element_id)`` for every element.
+
+    Keys are resolved structurally, the same way restore_axes_properties
+    finds artists. Keys that do not index their container (boxplot boxes)
+    are matched by their hitmap color instead.
+    """
+    artists: Dict[int, Tuple[Any, int]] = {}
+    unresolved: Dict[Tuple[int, int, int], int] = {}
+    for key, info in color_map.items():
+        artist = _resolve_artist(mpl_fig, axes_list, key)
+        if artist is None:
+            unresolved[tuple(info["rgb"])] = info["id"]
+        else:
+            artists[id(artist)] = (artist, info["id"])
+
+    if unresolved:
+        for ax in axes_list:
+            for artist in [*ax.patches, *ax.collections, *ax.get_lines()]:
+                if id(artist) in artists:
+                    continue
+                element_id = _match_color(artist, unresolved)
+                if element_id:
+                    artists[id(artist)] = (artist, element_id)
+    return artists
+
+
+def _resolve_artist(mpl_fig, axes_list, key: str):
+    """Return the artist an element key refers to, or None."""
+    if key.startswith("fig_sup"):
+        return getattr(mpl_fig, f"_{key[4:]}", None)
+
+    match = re.match(r"^ax(\d+)_(.+)$", key)
+    if not match or int(match.group(1)) >= len(axes_list):
+        return None
+    ax = axes_list[int(match.group(1))]
+    name = match.group(2)
+
+    named = {
+        "title": lambda: ax.title,
+        "xlabel": lambda: ax.xaxis.label,
+        "ylabel": lambda: ax.yaxis.label,
+        "legend": ax.get_legend,
+    }
+    if name in named:
+        return named[name]()
+
+    indexed = _INDEXED_KEY.match(name)
+    if not indexed:
+        return None
+    kind, index = indexed.group(1), int(indexed.group(2))
+    if kind == "line":
+        container = ax.get_lines()
+    elif kind == "image":
+        container = ax.images
+    elif kind == "text":
+        container = ax.texts
+    elif kind in _COLLECTION_KINDS:
+        container = ax.collections
+    elif kind in _PATCH_KINDS:
+        container = ax.patches
+    else:
+        return None
+    return container[index] if index < len(container) else None
+
+
+def _match_color(artist, colors: Dict[Tuple[int, int, int], int]) -> int:
+    """Return the element id whose hitmap color the artist carries, or 0."""
+    from matplotlib.colors import to_rgba_array
+
+    for getter in ("get_facecolor", "get_edgecolor", "get_color"):
+        if not hasattr(artist, getter):
+            continue
+        try:
+            rgba = to_rgba_array(getattr(artist, getter)())
+        except (TypeError, ValueError):
+            continue
+        if len(rgba):
+            rgb = tuple(int(round(c * 255)) for c in rgba[0, :3])
+            if rgb in colors:
+                return colors[rgb]
+    return 0
+
+
+def _hook_draw(artist, element_id: int, frame: np.ndarray, id_map: np.ndarray):
+    """Label the pixels *artist* covers when drawn; return an unhook callable."""
+    had_own = "draw" in vars(artist)
+    own = vars(artist).get("draw")
+    draw = artist.draw
+    height, width = id_map.shape
+
+    def hooked_draw(renderer, *args, **kwargs):
+        r0, r1, c0, c1 = _artist_region(artist, renderer, width, height)
+        if r0 >= r1 or c0 >= c1:
+            return draw(renderer, *args, **kwargs)
+        frame[r0:r1, c0:c1] = 0
+        result = draw(renderer, *args, **kwargs)
+        covered = frame[r0:r1, c0:c1, 3] > 0
+        id_map[r0:r1, c0:c1][covered] = element_id
+        return result
+
+    artist.draw = hooked_draw
+
+    def unhook():
+        if had_own:
+            artist.draw = own
+        else:
+            del artist.draw
+
+    return unhook
+
+
+def _artist_region(artist, renderer, width: int, height: int):
+    """Return clipped (row0, row1, col0, col1) pixels the artist may cover."""
+    try:
+        bbox = artist.get_window_extent(renderer)
+        x0, y0, x1, y1 = bbox.x0, bbox.y0, bbox.x1, bbox.y1
+        if not np.all(np.isfinite([x0, y0, x1, y1])):
+            raise ValueError("non-finite extent")
+    except Exception:
+        return 0, height, 0, width
+
+    linewidth = 0.0
+    if hasattr(artist, "get_linewidth"):
+        lw = np.asarray(artist.get_linewidth(), dtype=float)
+        linewidth = float(lw.max()) if lw.size else 0.0
+    pad = _REGION_PAD + int(np.ceil(linewidth * renderer.dpi / 72))
+
+    c0 = max(0, int(np.floor(x0)) - pad)
+    c1 = min(width, int(np.ceil(x1)) + pad)
+    r0 = max(0, height - int(np.ceil(y1)) - pad)
+    r1 = min(height, height - int(np.floor(y0)) + pad)
+    return r0, r1, c0, c1
+
+
+def _resize_nearest(id_map: np.ndarray, target_size: Tuple[int, int]) -> np.ndarray:
+    """Resize an ID map with nearest-neighbour sampling."""
+    target_w, target_h = target_size
+    height, width = id_map.shape
+    rows = (np.arange(target_h) * height // max(target_h, 1)).clip(0, height - 1)
+    cols = (np.arange(target_w) * width // max(target_w, 1)).clip(0, width - 1)
+    return id_map[rows[:, None], cols[None, :]]
+
+
+def hitmap_to_id_map(hitmap, color_map: Dict[str, Any]) -> np.ndarray:
+    """
+    Convert a color hitmap image to an ID map.
+
+    Parameters
+    ----------
+    hitmap : PIL.Image.Image or numpy.ndarray
+        RGB hitmap from generate_hitmap.
+    color_map : dict
+        Color map returned with the hitmap.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(height, width)`` uint32 array of element ids; 0 where the
+        color matches no element.
+    """
+    rgb = np.asarray(hitmap)[..., :3].astype(np.uint32)
+    packed = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+    entries = sorted(
+        ((info["rgb"][0] << 16) | (info["rgb"][1] << 8) | info["rgb"][2], info["id"])
+        for info in color_map.values()
+    )
+    if not entries:
+        return np.zeros(packed.shape, dtype=np.uint32)
+    keys = np.array([k for k, _ in entries], dtype=np.uint32)
+    ids = np.array([i for _, i in entries], dtype=np.uint32)
+
+    pos = np.searchsorted(keys, packed).clip(0, len(keys) - 1)
+    return np.where(keys[pos] == packed, ids[pos], 0).astype(np.uint32)
+
+
+def encode_id_map_rle(id_map: np.ndarray) -> Dict[str, Any]:
+    """
+    Run-length encode an ID map in row-major order.
+
+    Returns
+    -------
+    dict
+        ``{"width", "height", "dtype", "values", "counts"}`` where
+        ``values[k]`` repeats ``counts[k]`` times.
+    """
+    flat = id_map.ravel()
+    if flat.size == 0:
+        values = counts = np.zeros(0, dtype=np.int64)
+    else:
+        starts = np.flatnonzero(np.r_[True, flat[1:] != flat[:-1]])
+        counts = np.diff(np.r_[starts, flat.size])
+        values = flat[starts]
+    return {
+        "width": int(id_map.shape[1]),
+        "height": int(id_map.shape[0]),
+        "dtype": str(id_map.dtype),
+        "values": values.tolist(),
+        "counts": counts.tolist(),
+    }
+
+
+def decode_id_map_rle(rle: Dict[str, Any]) -> np.ndarray:
+    """Decode the output of encode_id_map_rle back to an ID map."""
+    values = np.asarray(rle["values"], dtype=rle.get("dtype", "uint32"))
+    flat = np.repeat(values, np.asarray(rle["counts"], dtype=np.int64))
+    return flat.reshape(rle["height"], rle["width"])
+
+
+__all__ = [
+    "generate_id_map",
+    "hitmap_to_id_map",
+    "encode_id_map_rle",
+    "decode_id_map_rle",
+]
+
+# EOF
@@ -19,6 +19,9 @@ from typing import Any, Dict, Optional, Tuple
 from matplotlib.figure import Figure
 from PIL import Image
 
+# Cap per dimension to prevent hang on huge figures
+_MAX_HITMAP_PIXELS = 2000
+
 
 def generate_hitmap(
     fig: Figure,
@@ -60,6 +63,90 @@ def generate_hitmap(
             }
         }
     """
+    is_diagram = getattr(fig, "_figrecipe_diagram", None) is not None
+    axes_list, original_props, color_map = apply_hitmap_colors(fig, include_text)
+
+    # Render to buffer
+    # IMPORTANT: Do NOT use bbox_inches="tight" for regular figures - it causes
+    # dimension changes between renders. Must match main render.
+    # Exception: diagram figures NEED bbox_inches="tight" to crop whitespace,
+    # matching how render_with_overrides() renders them.
+    hitmap_dpi = get_hitmap_dpi(fig, dpi)
+    save_kwargs = dict(format="png", dpi=hitmap_dpi, facecolor=fig.get_facecolor())
+    if is_diagram:
+        # Use bbox_inches="tight" to match render_with_overrides() crop.
+        # Color changes don't affect element positions so tight bbox is identical.
+        save_kwargs["bbox_inches"] = "tight"
+    elif bbox_inches is not None:
+        # Caller explicitly requested a specific bbox mode (e.g. "tight" for pie/imshow)
+        save_kwargs["bbox_inches"] = bbox_inches
+        save_kwargs["pad_inches"] = pad_inches
+    buf = io.BytesIO()
+    fig.savefig(buf, **save_kwargs)
+    buf.seek(0)
+
+    # Load as PIL Image
+    hitmap = Image.open(buf).convert("RGB")
+
+    # Guard: if tight bbox expanded the image beyond safe limits (e.g. quiver with
+    # collapsed constrained_layout), resize down to prevent encode hang.
+    if max(hitmap.size) > _MAX_HITMAP_PIXELS * 2:
+        scale = (_MAX_HITMAP_PIXELS * 2) / max(hitmap.size)
+        new_size = (
+            max(1, int(hitmap.width * scale)),
+            max(1, int(hitmap.height * scale)),
+        )
+        hitmap = hitmap.resize(new_size, Image.NEAREST)
+
+    hitmap = fit_hitmap_size(hitmap, target_size)
+
+    restore_hitmap_colors(fig, axes_list, original_props, include_text)
+
+    return hitmap, color_map
+
+
+def fit_hitmap_size(
+    hitmap: Image.Image, target_size: Optional[Tuple[int, int]]
+) -> Image.Image:
+    """Resize a hitmap to the main render size if they differ."""
+    # Force hitmap to match main render dimensions exactly.
+    # bbox_inches="tight" recomputes the crop per render, and color changes
+    # in the hitmap cause a slightly different tight bbox (typically 2-3px).
+    # Use NEAREST resampling to preserve exact color-to-element mapping.
+    if target_size and hitmap.size != target_size:
+        import warnings
+
+        warnings.warn(
+            f"Hitmap size {hitmap.size} differs from main render {target_size}, resizing",
+            UserWarning,
+            stacklevel=3,
+        )
+        hitmap = hitmap.resize(target_size, Image.NEAREST)
+    return hitmap
+
+
+def apply_hitmap_colors(
+    fig: Figure, include_text: bool = True
+) -> Tuple[list, Dict[Any, Any], Dict[str, Any]]:
+    """
+    Recolor every selectable artist with its unique hitmap color.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to recolor.
+    include_text : bool, optional
+        Whether to include text elements like labels (default: True).
+
+    Returns
+    -------
+    axes_list : list
+        Axes of the figure.
+    original_props : dict
+        Saved properties for restore_hitmap_colors.
+    color_map : dict
+        Mapping from element key to metadata (see generate_hitmap).
+    """
     # Import from helper modules (inside function to avoid circular imports)
     from ._hitmap._artists import (
         process_collections,
@@ -76,11 +163,6 @@ def generate_hitmap(
         normalize_color,
     )
     from ._hitmap._detect import detect_plot_types
-    from ._hitmap._restore import (
-        restore_axes_properties,
-        restore_backgrounds,
-        restore_figure_text,
-    )
 
     # Store original properties for restoration
     original_props = {}
@@ -92,9 +174,6 @@ def generate_hitmap(
 
     axes_list = fig.get_axes()
 
-    # Detect diagram figures for special handling
-    is_diagram = getattr(fig, "_figrecipe_diagram", None) is not None
-
     # Process all artists and assign colors
     for ax_idx, ax in enumerate(axes_list):
         ax_info = plot_types.get(ax_idx, {"types": set(), "call_ids": {}})
@@ -141,12 +220,30 @@ def generate_hitmap(
     for ax in axes_list:
         ax.set_facecolor(normalize_color(BACKGROUND_COLOR))
 
-    # Render to buffer
-    # IMPORTANT: Do NOT use bbox_inches="tight" for regular figures - it causes
-    # dimension changes between renders. Must match main render.
-    # Exception: diagram figures NEED bbox_inches="tight" to crop whitespace,
-    # matching how render_with_overrides() renders them.
-    MAX_HITMAP_PIXELS = 2000  # cap per dimension to prevent hang on huge figures
+    return axes_list, original_props, color_map
+
+
+def restore_hitmap_colors(
+    fig: Figure,
+    axes_list: list,
+    original_props: Dict[Any, Any],
+    include_text: bool = True,
+) -> None:
+    """Restore the properties changed by apply_hitmap_colors."""
+    from ._hitmap._restore import (
+        restore_axes_properties,
+        restore_backgrounds,
+        restore_figure_text,
+    )
+
+    restore_axes_properties(axes_list, original_props, include_text)
+    restore_figure_text(fig, original_props, include_text)
+    restore_backgrounds(fig, axes_list)
+
+
+def get_hitmap_dpi(fig: Figure, dpi: int = 150) -> int:
+    """Return the hitmap render DPI, capped to keep the image size safe."""
+    is_diagram = getattr(fig, "_figrecipe_diagram", None) is not None
     hitmap_dpi = dpi
     fig_w, fig_h = fig.get_size_inches()
     max_fig_dim = max(fig_w, fig_h)
@@ -158,54 +255,9 @@ def generate_hitmap(
         # Cap DPI so estimated pixel size stays within safe bounds.
         # Protects against pathologically large images when constrained_layout
         # collapses axes to zero (e.g. quiver), causing tight bbox to expand hugely.
-        if max_fig_dim * hitmap_dpi > MAX_HITMAP_PIXELS:
-            hitmap_dpi = max(30, int(MAX_HITMAP_PIXELS / max_fig_dim))
-    save_kwargs = dict(format="png", dpi=hitmap_dpi, facecolor=fig.get_facecolor())
-    if is_diagram:
-        # Use bbox_inches="tight" to match render_with_overrides() crop.
-        # Color changes don't affect element positions so tight bbox is identical.
-        save_kwargs["bbox_inches"] = "tight"
-    elif bbox_inches is not None:
-        # Caller explicitly requested a specific bbox mode (e.g. "tight" for pie/imshow)
-        save_kwargs["bbox_inches"] = bbox_inches
-        save_kwargs["pad_inches"] = pad_inches
-    buf = io.BytesIO()
-    fig.savefig(buf, **save_kwargs)
-    buf.seek(0)
-
-    # Load as PIL Image
-    hitmap = Image.open(buf).convert("RGB")
-
-    # Guard: if tight bbox expanded the image beyond safe limits (e.g. quiver with
-    # collapsed constrained_layout), resize down to prevent encode hang.
-    if max(hitmap.size) > MAX_HITMAP_PIXELS * 2:
-        scale = (MAX_HITMAP_PIXELS * 2) / max(hitmap.size)
-        new_size = (
-            max(1, int(hitmap.width * scale)),
-            max(1, int(hitmap.height * scale)),
-        )
-        hitmap = hitmap.resize(new_size, Image.NEAREST)
-
-    # Force hitmap to match main render dimensions exactly.
-    # bbox_inches="tight" recomputes the crop per render, and color changes
-    # in the hitmap cause a slightly different tight bbox (typically 2-3px).
-    # Use NEAREST resampling to preserve exact color-to-element mapping.
-    if target_size and hitmap.size != target_size:
-        import warnings
-
-        warnings.warn(
-            f"Hitmap size {hitmap.size} differs from main render {target_size}, resizing",
-            UserWarning,
-            stacklevel=2,
-        )
-        hitmap = hitmap.resize(target_size, Image.NEAREST)
-
-    # Restore original properties
-    restore_axes_properties(axes_list, original_props, include_text)
-    restore_figure_text(fig, original_props, include_text)
-    restore_backgrounds(fig, axes_list)
-
-    return hitmap, color_map
+        if max_fig_dim * hitmap_dpi > _MAX_HITMAP_PIXELS:
+            hitmap_dpi = max(30, int(_MAX_HITMAP_PIXELS / max_fig_dim))
+    return hitmap_dpi
 
 
 def hitmap_to_base64(hitmap: Image.Image) -> str:
@@ -224,15 +276,36 @@ def hitmap_to_base64(hitmap: Image.Image) -> str:
     """
     import base64
 
+    return base64.b64encode(hitmap_to_png(hitmap)).decode("utf-8")
+
+
+def hitmap_to_png(hitmap: Image.Image) -> bytes:
+    """
+    Convert hitmap image to PNG bytes.
+
+    Parameters
+    ----------
+    hitmap : PIL.Image.Image
+        Hitmap image.
+
+    Returns
+    -------
+    bytes
+        PNG-encoded image.
+    """
     buf = io.BytesIO()
     hitmap.save(buf, format="PNG")
-    buf.seek(0)
-    return base64.b64encode(buf.read()).decode("utf-8")
+    return buf.getvalue()
 
 
 __all__ = [
+    "apply_hitmap_colors",
+    "fit_hitmap_size",
     "generate_hitmap",
+    "get_hitmap_dpi",
+    "restore_hitmap_colors",
     "hitmap_to_base64",
+    "hitmap_to_png",
 ]
 
 # EOF
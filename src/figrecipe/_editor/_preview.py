@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Incremental preview renderer for the figure editor.
+
+The preview frame is kept in a private Agg renderer attached to the
+figure. Between renders, mutations are tracked per axes by a ChangeTracker
+hooked into the artists' stale callbacks, and style overrides through
+fingerprints. A
+render then only redraws the regions of axes that changed: the region is
+cleared, every artist overlapping it is redrawn, and pixels outside it are
+restored from the previous frame. Anything that may affect the whole
+figure (global overrides, figure-level artists, size, DPI, the set of
+axes, an active layout engine) falls back to a full draw.
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Padding (pixels) around dirty regions for antialiasing and rounding
+_REGION_PAD = 3
+
+# Redraw everything once dirty regions cover this fraction of the frame
+_FULL_REDRAW_FRACTION = 0.6
+
+
+# Guards Agg draws where matplotlib no longer provides RendererAgg.lock
+_AGG_LOCK = threading.RLock()
+
+# Pixel value of a cleared Agg buffer (set on first use)
+_CLEAR_PIXEL: Optional[np.ndarray] = None
+
+
+def agg_lock():
+    """Return the lock that serializes Agg draws across threads."""
+    from matplotlib.backends.backend_agg import RendererAgg
+
+    return getattr(RendererAgg, "lock", _AGG_LOCK)
+
+
+def fingerprint(value: Any) -> str:
+    """Return a stable string fingerprint of a JSON-like value."""
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def get_change_tracker(mpl_fig) -> "ChangeTracker":
+    """Return the change tracker attached to a figure, creating it once."""
+    tracker = getattr(mpl_fig, "_figrecipe_changes", None)
+    if tracker is None:
+        tracker = ChangeTracker(mpl_fig)
+        mpl_fig._figrecipe_changes = tracker
+    return tracker
+
+
+def get_preview_renderer(mpl_fig) -> "PreviewRenderer":
+    """Return the preview renderer attached to a figure, creating it once."""
+    preview = getattr(mpl_fig, "_figrecipe_preview", None)
+    if preview is None:
+        preview = PreviewRenderer(mpl_fig)
+        mpl_fig._figrecipe_preview = preview
+    return preview
+
+
+class ChangeTracker:
+    """Count changes to a figure and its axes through stale callbacks.
+
+    Every tracked change bumps a global generation counter and records it
+    for the axes (or the figure) that changed. Renderers remember the
+    generation they last drew and ask which axes changed since then, so
+    several renderers can share one tracker.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to track (not a RecordingFigure).
+    """
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.generation = 0
+        self._figure_gen = 0
+        self._axes_gen: Dict[int, int] = {}
+        self._untracked = 0
+        self._in_axes_callback = False
+        self._install_hooks()
+
+    def _install_hooks(self) -> None:
+        """Wrap stale callbacks of the figure and its axes."""
+        fig = self.fig
+        fig_callback = fig.stale_callback
+
+        def on_figure_stale(artist, val):
+            if not self._untracked and not self._in_axes_callback:
+                self.generation += 1
+                self._figure_gen = self.generation
+            if fig_callback is not None:
+                fig_callback(artist, val)
+
+        fig.stale_callback = on_figure_stale
+        self.hook_axes()
+
+    def hook_axes(self) -> None:
+        """Track axes added since the last call."""
+        for ax in self.fig.get_axes():
+            if not getattr(ax, "_figrecipe_preview_hooked", False):
+                self._hook_axes(ax)
+
+    def _hook_axes(self, ax) -> None:
+        """Record a change of *ax* whenever it or one of its children goes stale."""
+        ax_callback = ax.stale_callback
+        ax_id = id(ax)
+
+        def on_axes_stale(artist, val):
+            if not self._untracked:
+                self.generation += 1
+                self._axes_gen[ax_id] = self.generation
+            self._in_axes_callback = True
+            try:
+                if ax_callback is not None:
+                    ax_callback(artist, val)
+            finally:
+                self._in_axes_callback = False
+
+        ax.stale_callback = on_axes_stale
+        ax._figrecipe_preview_hooked = True
+
+    @contextmanager
+    def untracked(self) -> Iterator[None]:
+        """Suspend change tracking for mutations whose effect is keyed.
+
+        Used for override application (covered by the state and axes keys)
+        and for temporary changes that are restored before returning.
+        """
+        self._untracked += 1
+        try:
+            yield
+        finally:
+            self._untracked -= 1
+
+    def figure_changed(self, since: int) -> bool:
+        """Check whether a figure-level change happened after *since*."""
+        return self._figure_gen > since
+
+    def changed_axes(self, since: int) -> set:
+        """Return ids of axes changed after generation *since*."""
+        return {ax_id for ax_id, gen in self._axes_gen.items() if gen > since}
+
+
+class PreviewRenderer:
+    """Render a figure to RGBA, redrawing only axes that changed.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to render (not a RecordingFigure).
+    transparent : bool
+        Render figure and axes backgrounds transparent (default: True).
+    """
+
+    def __init__(self, fig, transparent: bool = True):
+        self.fig = fig
+        self.transparent = transparent
+        self.tracker = get_change_tracker(fig)
+        self._renderer = None
+        self._frame_key: Optional[Tuple[int, int, float]] = None
+        self._state_key: Optional[str] = None
+        self._axes_keys: Dict[int, str] = {}
+        self._axes_ids: Tuple[int, ...] = ()
+        self._extents: Dict[int, Any] = {}
+        self._seen = -1
+        self._force_full = True
+        self.last_full = True
+        self.last_collected: Any = None
+
+    @property
+    def state_key(self) -> Optional[str]:
+        """State key of the last render."""
+        return self._state_key
+
+    @property
+    def axes_keys(self) -> Dict[int, str]:
+        """Axes keys of the last render."""
+        return dict(self._axes_keys)
+
+    def untracked(self):
+        """Suspend change tracking (see ChangeTracker.untracked)."""
+        return self.tracker.untracked()
+
+    def invalidate(self) -> None:
+        """Force the next render to redraw the whole figure."""
+        self._force_full = True
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def _get_renderer(self, width: int, height: int, dpi: float):
+        """Return the private Agg renderer, recreated when the size changes."""
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        key = (width, height, dpi)
+        if self._renderer is None or self._frame_key != key:
+            self._renderer = RendererAgg(width, height, dpi)
+            self._frame_key = key
+            self._force_full = True
+        return self._renderer
+
+    @contextmanager
+    def _transparent(self) -> Iterator[None]:
+        """Temporarily make figure and axes backgrounds transparent."""
+        if not self.transparent:
+            yield
+            return
+        fig = self.fig
+        patches = [fig.patch] + [ax.patch for ax in fig.get_axes()]
+        saved = [(p, p.get_facecolor(), p.get_edgecolor()) for p in patches]
+        for p in patches:
+            p.set_facecolor("none")
+            p.set_edgecolor("none")
+        try:
+            yield
+        finally:
+            for p, fc, ec in saved:
+                p.set_facecolor(fc)
+                p.set_edgecolor(ec)
+
+    def render(
+        self,
+        dpi: float,
+        state_key: str = "",
+        axes_keys: Optional[Dict[int, str]] = None,
+        force_full: bool = False,
+        collect: Optional[Callable[[Any], Any]] = None,
+    ) -> np.ndarray:
+        """Render the figure and return the RGBA frame.
+
+        Parameters
+        ----------
+        dpi : float
+            Render DPI.
+        state_key : str
+            Fingerprint of everything that affects all axes (global style
+            overrides, dark mode). A change triggers a full draw.
+        axes_keys : dict, optional
+            Fingerprint per ``id(ax)`` of overrides that only affect that
+            axes (e.g. call overrides). A change redraws that axes.
+        force_full : bool
+            Always redraw the whole figure.
+        collect : callable, optional
+            Called as ``collect(renderer)`` right after drawing, while the
+            figure is still at *dpi*, to read layout information (e.g.
+            artist bboxes) from the same draw. Its return value is stored
+            in ``last_collected``.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(height, width, 4)`` uint8 view of the frame. It is only
+            valid until the next render; copy it to keep it.
+        """
+        fig = self.fig
+        axes_keys = axes_keys or {}
+
+        with self.untracked():
+            original_dpi = fig.dpi
+            if original_dpi != dpi:
+                fig.dpi = dpi
+            try:
+                width, height = (int(round(v)) for v in fig.bbox.size)
+                renderer = self._get_renderer(width, height, dpi)
+
+                self.tracker.hook_axes()
+                axes_ids = tuple(id(ax) for ax in fig.get_axes())
+                dirty = self.tracker.changed_axes(self._seen)
+                for ax_id in axes_ids:
+                    if axes_keys.get(ax_id) != self._axes_keys.get(ax_id):
+                        dirty.add(ax_id)
+
+                full = (
+                    force_full
+                    or _has_active_layout(fig)
+                    or self._force_full
+                    or self.tracker.figure_changed(self._seen)
+                    or state_key != self._state_key
+                    or axes_ids != self._axes_ids
+                )
+
+                with agg_lock(), self._transparent():
+                    if not full:
+                        full = not self._redraw_regions(renderer, dirty)
+                    if full:
+                        renderer.clear()
+                        fig.draw(renderer)
+                        self._extents = {
+                            id(ax): self._tight_extent(ax, renderer)
+                            for ax in fig.get_axes()
+                        }
+                    frame = np.asarray(renderer.buffer_rgba())
+                    collected = collect(renderer) if collect is not None else None
+            finally:
+                if fig.dpi != original_dpi:
+                    fig.dpi = original_dpi
+
+        self.last_full = full
+        self.last_collected = collected
+        self._state_key = state_key
+        self._axes_keys = dict(axes_keys)
+        self._axes_ids = axes_ids
+        self._seen = self.tracker.generation
+        self._force_full = False
+        # Our temporary changes left the figure stale; nothing is pending
+        fig.stale = False
+        for ax in fig.get_axes():
+            ax.stale = False
+        return frame
+
+    @staticmethod
+    def _tight_extent(artist, renderer):
+        """Return the display-space extent of an artist, or None."""
+        try:
+            if hasattr(artist, "get_tightbbox"):
+                return artist.get_tightbbox(renderer)
+            return artist.get_window_extent(renderer)
+        except Exception:
+            return None
+
+    def _redraw_regions(self, renderer, dirty: set) -> bool:
+        """Redraw the regions of dirty axes in place.
+
+        Returns False if a full draw should be done instead.
+        """
+        fig = self.fig
+        frame = np.asarray(renderer.buffer_rgba())
+        if not frame.flags.writeable:
+            return False
+        if not dirty:
+            return True
+
+        height, width = frame.shape[:2]
+        axes_by_id = {id(ax): ax for ax in fig.get_axes()}
+
+        # Regions cover where each dirty axes was and where it is now
+        regions: List[Tuple[int, int, int, int]] = []
+        for ax_id in dirty:
+            ax = axes_by_id.get(ax_id)
+            if ax is None:
+                return False
+            for extent in (
+                self._extents.get(ax_id),
+                self._tight_extent(ax, renderer),
+            ):
+                if extent is None:
+                    return False
+                regions.append(_to_pixel_rect(extent, width, height))
+
+        mask = np.zeros((height, width), dtype=bool)
+        for r0, r1, c0, c1 in regions:
+            mask[r0:r1, c0:c1] = True
+        if mask.mean() > _FULL_REDRAW_FRACTION:
+            return False
+
+        previous = frame.copy()
+        frame[mask] = _clear_pixel()
+        if not self.transparent:
+            fig.patch.draw(renderer)
+
+        # Redraw every top-level artist overlapping the regions, in z-order
+        children = [
+            a for a in fig.get_children() if a is not fig.patch and a.get_visible()
+        ]
+        children.sort(key=lambda a: a.get_zorder())
+        for artist in children:
+            extent = self._tight_extent(artist, renderer)
+            if extent is not None and not _overlaps(extent, regions, width, height):
+                continue
+            artist.draw(renderer)
+
+        frame[~mask] = previous[~mask]
+
+        for ax_id in dirty:
+            self._extents[ax_id] = self._tight_extent(axes_by_id[ax_id], renderer)
+        return True
+
+
+def _clear_pixel() -> np.ndarray:
+    """Return the RGBA value Agg's ``renderer.clear()`` fills with."""
+    global _CLEAR_PIXEL
+    if _CLEAR_PIXEL is None:
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        renderer = RendererAgg(1, 1, 72)
+        renderer.clear()
+        _CLEAR_PIXEL = np.asarray(renderer.buffer_rgba())[0, 0].copy()
+    return _CLEAR_PIXEL
+
+
+def _has_active_layout(fig) -> bool:
+    """Check whether a layout engine may move axes on the next draw."""
+    from matplotlib.layout_engine import PlaceHolderLayoutEngine
+
+    engine = fig.get_layout_engine()
+    return engine is not None and not isinstance(engine, PlaceHolderLayoutEngine)
+
+
+def _to_pixel_rect(bbox, width: int, height: int) -> Tuple[int, int, int, int]:
+    """Convert a display bbox to clipped (row0, row1, col0, col1) indices."""
+    c0 = max(0, int(np.floor(bbox.x0)) - _REGION_PAD)
+    c1 = min(width, int(np.ceil(bbox.x1)) + _REGION_PAD)
+    r0 = max(0, height - int(np.ceil(bbox.y1)) - _REGION_PAD)
+    r1 = min(height, height - int(np.floor(bbox.y0)) + _REGION_PAD)
+    return r0, max(r0, r1), c0, max(c0, c1)
+
+
+def _overlaps(bbox, regions, width: int, height: int) -> bool:
+    """Check whether a display bbox overlaps any pixel region."""
+    r0, r1, c0, c1 = _to_pixel_rect(bbox, width, height)
+    return any(
+        r0 < b_r1 and b_r0 < r1 and c0 < b_c1 and b_c0 < c1
+        for b_r0, b_r1, b_c0, b_c1 in regions
+    )
+
+
+__all__ = [
+    "ChangeTracker",
+    "PreviewRenderer",
+    "agg_lock",
+    "fingerprint",
+    "get_change_tracker",
+    "get_preview_renderer",
+]
+
+# EOF
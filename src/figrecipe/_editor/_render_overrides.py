@@ -349,6 +349,8 @@ def _apply_colors_to_pie(
         for call in ax_record.calls:
             if call.function == "pie" and "colors" in call.kwargs:
                 custom_colors = call.kwargs["colors"]
+                if hasattr(custom_colors, "tolist"):  # recorded array
+                    custom_colors = custom_colors.tolist()
                 break
 
     # Use custom colors if available, otherwise use palette
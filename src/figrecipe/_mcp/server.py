@@ -93,6 +93,7 @@ def plt_reproduce(
     output_path: Optional[str] = None,
     format: str = "png",
     dpi: int = 300,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """Regenerate a figure bit-for-bit from its saved YAML recipe — the core reproducibility contract of figrecipe. Use whenever the user asks to "reproduce this figure", "regenerate the plot from the recipe", "re-render the YAML", "recreate the figure at higher DPI", "export the recipe to PDF/SVG", or wants to reuse an existing plot spec. Takes a `.yaml` recipe saved by `plt_plot` / `fr.save(fig, ...)` and produces the image again — no original data arrays needed because the recipe embeds them.
 
@@ -111,14 +112,16 @@ def plt_reproduce(
     dpi : int
         DPI for raster output.
 
+    use_cache : bool
+        Reuse a cached render when the recipe, its data, the style and
+        the output settings are unchanged (default: True).
+
     Returns
     -------
     dict
-        Result with 'output_path' and 'success'.
+        Result with 'output_path', 'cached' and 'success'.
     """
-    import matplotlib.pyplot as plt
-
-    import figrecipe as fr
+    from .._render_cache import render_recipe
 
     recipe_path = Path(recipe_path)
 
@@ -127,16 +130,13 @@ def plt_reproduce(
     else:
         output_path = Path(output_path)
 
-    fig, axes = fr.reproduce(recipe_path)
-    fig.savefig(output_path, dpi=dpi, format=format)
-
-    try:
-        plt.close(fig)
-    except TypeError:
-        plt.close("all")
+    output_path, cached = render_recipe(
+        recipe_path, output_path, format, dpi, use_cache=use_cache
+    )
 
     return {
         "output_path": str(output_path),
+        "cached": cached,
         "success": True,
     }
 
@@ -15,6 +15,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import matplotlib
 import numpy as np
 
+from .._signatures import get_defaults, get_signature
+
 
 @dataclass
 class CallRecord:
@@ -263,13 +265,23 @@ class FigureRecord:
 
 
 class Recorder:
-    """Central recorder for tracking matplotlib calls."""
+    """Central recorder for tracking matplotlib calls.
+
+    Parameters
+    ----------
+    snapshot_arrays : bool
+        If False (default), recorded arrays are read-only views of the
+        caller's data and are only serialized when the recipe is saved.
+        If True, arrays are copied at record time, for callers that reuse
+        or mutate their buffers after plotting.
+    """
 
     from .._params import DECORATION_METHODS, PLOTTING_METHODS
 
-    def __init__(self):
+    def __init__(self, snapshot_arrays: bool = False):
         self._figure_record: Optional[FigureRecord] = None
         self._method_counters: Dict[str, int] = {}
+        self.snapshot_arrays = snapshot_arrays
 
     def start_figure(
         self,
@@ -364,7 +376,11 @@ class Recorder:
         from ._utils import process_args
 
         return process_args(
-            args, method_name, self._get_arg_names, self._is_serializable
+            args,
+            method_name,
+            self._get_arg_names,
+            self._is_serializable,
+            snapshot=self.snapshot_arrays,
         )
 
     def _get_arg_names(self, method_name: str, n_args: int) -> List[str]:
@@ -383,8 +399,6 @@ class Recorder:
             List of argument names.
         """
         try:
-            from .._signatures import get_signature
-
             sig = get_signature(method_name)
             names = [arg["name"] for arg in sig["args"][:n_args]]
             # Pad with generic names if needed
@@ -402,7 +416,9 @@ class Recorder:
     ) -> Dict[str, Any]:
         """Process keyword arguments for storage.
 
-        Only stores non-default kwargs to keep recipes minimal.
+        Only stores non-default kwargs to keep recipes minimal. Array
+        values are kept as read-only arrays (views unless snapshot_arrays)
+        and converted to lists when the recipe is saved.
 
         Parameters
         ----------
@@ -419,12 +435,12 @@ class Recorder:
         # Get defaults from signature
         defaults = {}
         try:
-            from .._signatures import get_defaults
-
             defaults = get_defaults(method_name)
         except Exception:
             pass
 
+        from ._utils import keep_array
+
         # Remove internal keys (stats is handled separately as metadata)
         skip_keys = {"id", "track", "_array", "stats"}
         processed = {}
@@ -433,8 +449,8 @@ class Recorder:
             if key in skip_keys:
                 continue
 
-            # Skip if value matches default
-            if key in defaults:
+            # Skip if value matches default (arrays never match a default)
+            if key in defaults and not isinstance(value, np.ndarray):
                 default_val = defaults[key]
                 # Compare values (handle None specially)
                 if default_val is not None and value == default_val:
@@ -446,9 +462,11 @@ class Recorder:
             if self._is_serializable(value):
                 processed[key] = value
             elif isinstance(value, np.ndarray):
-                processed[key] = value.tolist()
-            elif hasattr(value, "values"):
-                processed[key] = np.asarray(value).tolist()
+                processed[key] = keep_array(value, self.snapshot_arrays)
+            elif isinstance(value, dict):
+                processed[key] = value
+            elif hasattr(value, "values"):  # pandas
+                processed[key] = keep_array(np.asarray(value), self.snapshot_arrays)
             else:
                 # Try to convert to string
                 try:
@@ -7,11 +7,25 @@ from typing import Any, Dict, List
 import numpy as np
 
 
+def keep_array(value: np.ndarray, snapshot: bool = False) -> np.ndarray:
+    """Return a read-only array to keep in a call record.
+
+    By default this is a view sharing the caller's buffer, so recording
+    copies nothing; serialization is deferred to save time. With
+    *snapshot*, a private copy is taken so later changes to the caller's
+    buffer are not recorded.
+    """
+    arr = value.copy() if snapshot else value.view()
+    arr.flags.writeable = False
+    return arr
+
+
 def process_args(
     args: tuple,
     method_name: str,
     get_arg_names_func,
     is_serializable_func,
+    snapshot: bool = False,
 ) -> List[Dict[str, Any]]:
     """Process positional arguments for storage.
 
@@ -25,6 +39,8 @@ def process_args(
         Function to get argument names.
     is_serializable_func : callable
         Function to check serializability.
+    snapshot : bool
+        If True, copy arrays instead of keeping views of the caller's data.
 
     Returns
     -------
@@ -38,7 +54,12 @@ def process_args(
 
     for name, value in zip(arg_names, args):
         processed_arg = _process_single_arg(
-            name, value, should_store_inline, to_serializable, is_serializable_func
+            name,
+            value,
+            should_store_inline,
+            to_serializable,
+            is_serializable_func,
+            snapshot,
         )
         processed.append(processed_arg)
 
@@ -51,6 +72,7 @@ def _process_single_arg(
     should_store_inline,
     to_serializable,
     is_serializable_func,
+    snapshot: bool = False,
 ) -> Dict[str, Any]:
     """Process a single argument value."""
     # Handle result references (e.g., ContourSet for clabel)
@@ -58,10 +80,11 @@ def _process_single_arg(
         return {"name": name, "data": {"__ref__": value["__ref__"]}}
 
     if isinstance(value, np.ndarray):
-        return _process_ndarray(name, value, should_store_inline, to_serializable)
+        arr = keep_array(value, snapshot)
+        return _process_ndarray(name, arr, should_store_inline, to_serializable)
 
-    if hasattr(value, "values"):  # pandas
-        arr = np.asarray(value)
+    if hasattr(value, "values"):  # pandas (np.asarray is a view for numeric data)
+        arr = keep_array(np.asarray(value), snapshot)
         return _process_ndarray(name, arr, should_store_inline, to_serializable)
 
     if (
@@ -74,6 +97,7 @@ def _process_single_arg(
 
     if isinstance(value, (list, tuple)) and len(value) > 0:
         # Check if it's a list of numbers that can be converted to array
+        # (a new array, so it is already independent of the caller's list)
         try:
             arr = np.asarray(value)
             if arr.dtype.kind in ("i", "f", "u", "b"):  # numeric types
@@ -169,6 +193,6 @@ def _process_scalar(name: str, value: Any, is_serializable_func) -> Dict[str, An
         return {"name": name, "data": str(value)}
 
 
-__all__ = ["process_args"]
+__all__ = ["keep_array", "process_args"]
 
 # EOF
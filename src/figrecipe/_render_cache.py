@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Content-addressed on-disk cache for recipe renders.
+
+Rendering a recipe to a file (CLI ``reproduce``/``convert``, MCP
+``plt_reproduce``) is keyed by a hash of everything that affects the
+output: the normalized recipe, the digests of its data files and
+override file, the active style, the fonts matplotlib resolves, the
+matplotlib and figrecipe versions, the DPI and the format. Each cache
+entry holds only the rendered image bytes (no recipe, data or hitmap
+sidecars) and is written to the output path on a hit, so with the cache
+enabled only the image is written. With it disabled (``--no-cache``),
+renders write the sidecars as ``fig.savefig`` does. Entries are evicted
+least-recently-used first once the cache exceeds its size limit.
+
+Environment variables
+---------------------
+FIGRECIPE_CACHE_DIR
+    Cache location (default: ``$XDG_CACHE_HOME/figrecipe/renders`` or
+    ``~/.cache/figrecipe/renders``).
+FIGRECIPE_CACHE_MAX_MB
+    Size limit in megabytes (default: 1024).
+FIGRECIPE_NO_CACHE
+    Set to a non-empty value to disable the cache.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ._utils._cache_dir import user_cache_dir
+
+# Default size limit for the render cache
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Per-entry metadata file and rendered image file
+_META_NAME = ".entry.json"
+_IMAGE_NAME = "image"
+
+# Recipe keys that never affect rendering
+_VOLATILE_KEYS = {"created", "timestamp"}
+
+
+def default_cache_dir() -> Path:
+    """Return the render cache directory from the environment."""
+    return user_cache_dir("renders", "FIGRECIPE_CACHE_DIR")
+
+
+def default_max_bytes() -> int:
+    """Return the render cache size limit from the environment."""
+    env_mb = os.environ.get("FIGRECIPE_CACHE_MAX_MB")
+    if env_mb:
+        return int(float(env_mb) * 1024 * 1024)
+    return DEFAULT_MAX_BYTES
+
+
+def cache_enabled() -> bool:
+    """Check whether the render cache is enabled (FIGRECIPE_NO_CACHE unset)."""
+    return not os.environ.get("FIGRECIPE_NO_CACHE")
+
+
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _normalize(obj: Any) -> Any:
+    """Drop keys that do not affect rendering (creation timestamps)."""
+    if isinstance(obj, dict):
+        return {
+            str(k): _normalize(v) for k, v in obj.items() if k not in _VOLATILE_KEYS
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_normalize(v) for v in obj]
+    return obj
+
+
+def _iter_data_files(data: Dict[str, Any]) -> Iterator[str]:
+    """Yield every data file referenced by a raw recipe dict."""
+    from ._serializer._load import _is_data_file_reference
+
+    data_info = data.get("data")
+    if isinstance(data_info, dict) and data_info.get("csv_path"):
+        yield data_info["csv_path"]
+
+    for ax_data in (data.get("axes") or {}).values():
+        for call_list in (ax_data.get("calls", []), ax_data.get("decorations", [])):
+            for call in call_list or []:
+                for arg in call.get("args", []) or []:
+                    if isinstance(arg, dict) and _is_data_file_reference(
+                        arg.get("data")
+                    ):
+                        yield arg["data"]
+
+
+def recipe_digest(path: Union[str, Path]) -> str:
+    """Hash a recipe together with the files it depends on.
+
+    Parameters
+    ----------
+    path : str or Path
+        Recipe source accepted by ``fr.reproduce`` (YAML, image with a
+        sibling YAML, bundle directory or ZIP).
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest. Unchanged when only creation timestamps differ.
+    """
+    from ruamel.yaml import YAML
+
+    from ._utils._bundle import resolve_recipe_path
+
+    path = Path(path)
+
+    # ZIP bundles are self-contained: hash the archive itself
+    if path.is_file() and path.suffix.lower() == ".zip":
+        return _file_digest(path)
+
+    recipe_path, _ = resolve_recipe_path(path)
+    with open(recipe_path) as f:
+        data = YAML(typ="safe").load(f) or {}
+
+    parts: Dict[str, Any] = {
+        "recipe": _normalize(data),
+        "files": {},
+    }
+    for ref in sorted(set(_iter_data_files(data))):
+        file_path = recipe_path.parent / ref
+        parts["files"][ref] = _file_digest(file_path) if file_path.exists() else None
+
+    overrides_path = recipe_path.with_suffix(".overrides.json")
+    if overrides_path.exists():
+        parts["overrides"] = _file_digest(overrides_path)
+
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _style_digest() -> str:
+    """Hash the currently active style."""
+    from .styles._kwargs_converter import to_subplots_kwargs
+
+    payload = json.dumps(to_subplots_kwargs(), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _font_digest() -> str:
+    """Hash the fonts matplotlib knows and the rcParams that pick them."""
+    from matplotlib import font_manager, rcParams
+
+    manager = font_manager.fontManager
+    fonts = sorted(
+        (f.fname, f.name, f.style, str(f.weight), str(f.stretch))
+        for f in manager.ttflist + manager.afmlist
+    )
+    params = {
+        key: rcParams[key]
+        for key in rcParams
+        if key.startswith(("font.", "mathtext.", "text."))
+    }
+    payload = json.dumps([fonts, params], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def render_key(source: Union[str, Path], fmt: str, dpi: int) -> str:
+    """Compute the cache key for rendering *source* to an image.
+
+    Parameters
+    ----------
+    source : str or Path
+        Recipe source.
+    fmt : str
+        Output format ('png', 'pdf', 'svg').
+    dpi : int
+        Output DPI.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest.
+    """
+    import matplotlib
+
+    from . import __version__
+
+    parts = {
+        "recipe": recipe_digest(source),
+        "style": _style_digest(),
+        "fonts": _font_digest(),
+        "matplotlib": matplotlib.__version__,
+        "figrecipe": __version__,
+        "dpi": dpi,
+        "format": fmt,
+    }
+    payload = json.dumps(parts, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """One cached render.
+
+    Attributes
+    ----------
+    key : str
+        Cache key.
+    path : Path
+        Entry directory.
+    size : int
+        Size of the cached image in bytes.
+    last_used : float
+        Time of the last store or hit (seconds since the epoch).
+    meta : dict
+        Source, format and DPI recorded at store time.
+    """
+
+    key: str
+    path: Path
+    size: int
+    last_used: float
+    meta: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "key": self.key,
+            "size": self.size,
+            "last_used": self.last_used,
+            **self.meta,
+        }
+
+
+class RenderCache:
+    """LRU-bounded, content-addressed store of rendered images.
+
+    Parameters
+    ----------
+    root : str or Path, optional
+        Cache directory (default: :func:`default_cache_dir`).
+    max_bytes : int, optional
+        Size limit (default: :func:`default_max_bytes`).
+    """
+
+    def __init__(
+        self,
+        root: Optional[Union[str, Path]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_bytes = max_bytes if max_bytes is not None else default_max_bytes()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def load(self, key: str) -> Optional[bytes]:
+        """Return the cached image bytes for *key*, or None on a miss."""
+        entry_dir = self._entry_dir(key)
+        try:
+            data = (entry_dir / _IMAGE_NAME).read_bytes()
+        except OSError:
+            return None
+
+        # Mark as recently used for LRU eviction
+        os.utime(entry_dir)
+        return data
+
+    def restore(self, key: str, dest: Union[str, Path]) -> Optional[Path]:
+        """Write the cached image for *key* to the file *dest*.
+
+        Returns
+        -------
+        Path or None
+            *dest*, or None on a cache miss.
+        """
+        data = self.load(key)
+        if data is None:
+            return None
+
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(data)
+        return dest
+
+    def store(
+        self,
+        key: str,
+        data: bytes,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """Store rendered image bytes as the entry for *key*."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry_dir = self._entry_dir(key)
+
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.root))
+        try:
+            (staging / _IMAGE_NAME).write_bytes(data)
+            info = {"created": time.time(), **(meta or {})}
+            (staging / _META_NAME).write_text(json.dumps(info, default=str))
+            try:
+                os.replace(staging, entry_dir)
+            except OSError:
+                # Another process stored the same key first
+                pass
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+        return entry_dir
+
+    def entries(self) -> List[CacheEntry]:
+        """List cache entries, least recently used first."""
+        if not self.root.is_dir():
+            return []
+
+        entries = []
+        for entry_dir in self.root.iterdir():
+            if not entry_dir.is_dir() or entry_dir.name.startswith("."):
+                continue
+            size = sum(p.stat().st_size for p in entry_dir.rglob("*") if p.is_file())
+            meta_path = entry_dir / _META_NAME
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                meta = {}
+            entries.append(
+                CacheEntry(
+                    key=entry_dir.name,
+                    path=entry_dir,
+                    size=size,
+                    last_used=entry_dir.stat().st_mtime,
+                    meta=meta,
+                )
+            )
+        entries.sort(key=lambda e: e.last_used)
+        return entries
+
+    def stats(self) -> Dict[str, Any]:
+        """Summarize the cache (location, entry count, size, limit)."""
+        entries = self.entries()
+        return {
+            "path": str(self.root),
+            "entries": len(entries),
+            "size": sum(e.size for e in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def prune(self, max_bytes: Optional[int] = None) -> Tuple[int, int]:
+        """Evict least recently used entries until under the size limit.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Size limit (default: ``self.max_bytes``).
+
+        Returns
+        -------
+        tuple
+            (entries removed, bytes freed)
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(e.size for e in entries)
+
+        removed = 0
+        freed = 0
+        for entry in entries:
+            if total <= limit:
+                break
+            shutil.rmtree(entry.path, ignore_errors=True)
+            total -= entry.size
+            freed += entry.size
+            removed += 1
+        return removed, freed
+
+    def clear(self) -> Tuple[int, int]:
+        """Remove all entries. Returns (entries removed, bytes freed)."""
+        return self.prune(max_bytes=0)
+
+
+def _render(
+    source: Path, output_path: Path, fmt: str, dpi: int, sidecars: bool = False
+) -> Path:
+    """Reproduce *source* and save it to *output_path*; return the image path.
+
+    Same image as ``fig.savefig`` (DPI, crop). Unless *sidecars* is True,
+    no recipe, data files, hitmap or validation render are written.
+    """
+    import matplotlib.pyplot as plt
+
+    from . import reproduce
+
+    fig, _ = reproduce(source)
+    try:
+        if sidecars:
+            image_path, _, _ = fig.savefig(
+                output_path, dpi=dpi, image_format=fmt, verbose=False
+            )
+        else:
+            image_path, _, _ = fig.savefig(
+                output_path,
+                dpi=dpi,
+                image_format=fmt,
+                save_recipe=False,
+                save_hitmap=False,
+                verbose=False,
+            )
+    finally:
+        # Close the figure (handle both regular and Recording figures)
+        try:
+            plt.close(fig)
+        except TypeError:
+            plt.close("all")
+    return Path(image_path)
+
+
+def render_recipe(
+    source: Union[str, Path],
+    output_path: Union[str, Path],
+    fmt: str = "png",
+    dpi: int = 300,
+    use_cache: bool = True,
+    cache: Optional[RenderCache] = None,
+    prune: bool = True,
+) -> Tuple[Path, bool]:
+    """Render a recipe to a file, reusing a cached render when unchanged.
+
+    Parameters
+    ----------
+    source : str or Path
+        Recipe source accepted by ``fr.reproduce``.
+    output_path : str or Path
+        Output path. Without an image suffix, ``.<fmt>`` is appended; an
+        image suffix takes precedence over *fmt*, as in ``fr.save``.
+    fmt : str
+        Output format ('png', 'pdf', 'svg').
+    dpi : int
+        DPI for raster output.
+    use_cache : bool
+        If False (or FIGRECIPE_NO_CACHE is set), always render, and write
+        the recipe and hitmap sidecars as ``fig.savefig`` does.
+    cache : RenderCache, optional
+        Cache to use (default: the environment-configured cache).
+    prune : bool
+        If True (default), enforce the cache size limit after storing a
+        new render. Batch workers pass False and prune once at the end.
+
+    Returns
+    -------
+    tuple
+        (path written, cache_hit)
+    """
+    from ._api._save import resolve_save_paths
+
+    source = Path(source)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not (use_cache and cache_enabled()):
+        return _render(source, output_path, fmt, dpi, sidecars=True), False
+
+    # Key on the format of the file actually written
+    image_path, _, fmt = resolve_save_paths(output_path, fmt)
+    cache = cache if cache is not None else RenderCache()
+    key = render_key(source, fmt, dpi)
+    if cache.restore(key, image_path) is not None:
+        return image_path, True
+
+    written = _render(source, image_path, fmt, dpi)
+    # A renamed output (e.g. "_FAILED" diagrams) is never cached
+    if written == image_path:
+        cache.store(
+            key,
+            image_path.read_bytes(),
+            meta={"source": str(source.resolve()), "format": fmt, "dpi": dpi},
+        )
+        if prune:
+            cache.prune()
+    return written, False
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "CacheEntry",
+    "RenderCache",
+    "cache_enabled",
+    "default_cache_dir",
+    "default_max_bytes",
+    "recipe_digest",
+    "render_key",
+    "render_recipe",
+]
+
+# EOF
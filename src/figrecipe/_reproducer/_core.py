@@ -96,6 +96,7 @@ def reproduce_from_record(
     record: FigureRecord,
     calls: Optional[List[str]] = None,
     skip_decorations: bool = False,
+    use_pyplot: bool = True,
 ):
     """Reproduce a figure from a FigureRecord.
 
@@ -107,6 +108,10 @@ def reproduce_from_record(
         If provided, only reproduce these specific call IDs.
     skip_decorations : bool
         If True, skip decoration calls.
+    use_pyplot : bool
+        If False, build an Agg figure that pyplot does not manage (no
+        global figure state; safe off the main thread). The caller owns
+        it and need not ``plt.close`` it.
 
     Returns
     -------
@@ -131,15 +136,27 @@ def reproduce_from_record(
     ncols = max_col + 1
 
     # Create figure
-    import matplotlib.pyplot as plt
+    if use_pyplot:
+        import matplotlib.pyplot as plt
+
+        fig, mpl_axes = plt.subplots(
+            nrows,
+            ncols,
+            figsize=record.figsize,
+            dpi=record.dpi,
+            constrained_layout=record.constrained_layout,
+        )
+    else:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
 
-    fig, mpl_axes = plt.subplots(
-        nrows,
-        ncols,
-        figsize=record.figsize,
-        dpi=record.dpi,
-        constrained_layout=record.constrained_layout,
-    )
+        fig = Figure(
+            figsize=record.figsize,
+            dpi=record.dpi,
+            constrained_layout=record.constrained_layout,
+        )
+        FigureCanvasAgg(fig)
+        mpl_axes = fig.subplots(nrows, ncols)
 
     # Apply layout if recorded (skip if constrained_layout is used)
     if record.layout is not None and not record.constrained_layout:
@@ -481,7 +498,7 @@ def _replay_colorbars(fig, axes_2d, record, result_cache):
 
 def get_recipe_info(path: Union[str, Path]) -> Dict[str, Any]:
     """Get recipe metadata (id, figsize, dpi, n_axes, calls) without reproducing."""
-    record = load_recipe(path)
+    record = load_recipe(path, lazy=True)
 
     all_calls = []
     for ax_record in record.axes.values():
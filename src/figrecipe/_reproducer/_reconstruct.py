@@ -10,6 +10,8 @@ from typing import Any, Dict, Optional
 
 import numpy as np
 
+from .._utils._lazy_array import resolve_lazy
+
 
 def reconstruct_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """Reconstruct kwargs, converting 2D lists back to numpy arrays.
@@ -71,7 +73,7 @@ def reconstruct_value(
 
     # Check if we have a pre-loaded array (from YAML loading)
     if "_loaded_array" in arg_data:
-        return arg_data["_loaded_array"]
+        return resolve_lazy(arg_data["_loaded_array"])
 
     # Check if we have a raw array (direct from recording, not yet serialized)
     # This handles the __FILE__ placeholder case when reproducing from record
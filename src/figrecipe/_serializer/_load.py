@@ -2,13 +2,16 @@
 # -*- coding: utf-8 -*-
 """Load-side serialization for recipe files (YAML + data files)."""
 
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 import numpy as np
 from ruamel.yaml import YAML
 
 from .._recorder import FigureRecord
+from .._utils._columnar_io import ColumnarReader, is_columnar_file
+from .._utils._lazy_array import LazyArray
 from .._utils._numpy_io import (
     _sanitize_trace_id,
     load_array,
@@ -78,7 +81,7 @@ def _convert_diagram_to_figure_recipe(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def load_recipe(path: Union[str, Path]) -> FigureRecord:
+def load_recipe(path: Union[str, Path], *, lazy: bool = False) -> FigureRecord:
     """Load a figure record from YAML file.
 
     Handles both standard figure recipes and standalone diagram recipes
@@ -90,6 +93,12 @@ def load_recipe(path: Union[str, Path]) -> FigureRecord:
     ----------
     path : str or Path
         Path to .yaml recipe file.
+    lazy : bool
+        If True, do not read data files. Each file-backed arg keeps its
+        file reference string in ``data`` and gets a :class:`LazyArray` in
+        ``_loaded_array`` that loads on first access (``.npy`` files are
+        memory-mapped). Opt-in only, for inspection that never touches the
+        data; code reading ``data`` directly needs the default (False).
 
     Returns
     -------
@@ -107,7 +116,7 @@ def load_recipe(path: Union[str, Path]) -> FigureRecord:
         data = _convert_diagram_to_figure_recipe(data)
 
     # Resolve data file references
-    data = _resolve_data_references(data, path.parent)
+    data = _resolve_data_references(data, path.parent, lazy=lazy)
 
     return FigureRecord.from_dict(data)
 
@@ -115,6 +124,7 @@ def load_recipe(path: Union[str, Path]) -> FigureRecord:
 def _resolve_data_references(
     data: Dict[str, Any],
     base_dir: Path,
+    lazy: bool = False,
 ) -> Dict[str, Any]:
     """Resolve file references to actual array data.
 
@@ -124,6 +134,8 @@ def _resolve_data_references(
         Data dictionary with file references.
     base_dir : Path
         Base directory for resolving relative paths.
+    lazy : bool
+        If True, attach :class:`LazyArray` handles instead of loading.
 
     Returns
     -------
@@ -133,64 +145,121 @@ def _resolve_data_references(
     # Check if this recipe uses single CSV format
     data_info = data.get("data", {})
     if isinstance(data_info, dict) and data_info.get("csv_format") == "single":
-        return _resolve_single_csv_references(data, base_dir, data_info)
+        return _resolve_single_csv_references(data, base_dir, data_info, lazy)
+
+    # Columnar files are opened once and read column by column
+    columnar_readers: Dict[Path, ColumnarReader] = {}
 
     # Original behavior: resolve individual file references
-    for ax_key, ax_data in data.get("axes", {}).items():
-        for call_list in [ax_data.get("calls", []), ax_data.get("decorations", [])]:
-            for call in call_list:
-                for arg in call.get("args", []):
-                    data_ref = arg.get("data")
-
-                    # Check if it's a file reference
-                    if isinstance(data_ref, str) and (
-                        data_ref.endswith(".npy")
-                        or data_ref.endswith(".npz")
-                        or data_ref.endswith(".csv")
-                    ):
-                        file_path = base_dir / data_ref
-                        if file_path.exists():
-                            # Get dtype from YAML to ensure proper type conversion
-                            dtype = arg.get("dtype")
-                            arr = load_array(file_path, dtype=dtype)
-
-                            # Check if this was a list of arrays
-                            if arg.get("_is_array_list"):
-                                # Reconstruct list of arrays from 2D array
-                                n_arrays = arg.get(
-                                    "_n_arrays", arr.shape[1] if arr.ndim > 1 else 1
-                                )
-                                array_lengths = arg.get("_array_lengths")
-
-                                arrays = []
-                                for i in range(n_arrays):
-                                    if arr.ndim > 1:
-                                        col = arr[:, i]
-                                    else:
-                                        col = arr
-
-                                    # Trim to original length (remove NaN padding)
-                                    if array_lengths and i < len(array_lengths):
-                                        col = col[: array_lengths[i]]
-                                        col = col[~np.isnan(col)]
-                                    arrays.append(col)
-
-                                arg["data"] = [a.tolist() for a in arrays]
-                                arg["_loaded_array"] = arrays
-                            else:
-                                arg["data"] = arr.tolist()
-                                arg["_loaded_array"] = arr
-
-                            # Store source file path for symlink support
-                            arg["_source_file"] = str(file_path.resolve())
+    try:
+        for ax_key, ax_data in data.get("axes", {}).items():
+            for call_list in [
+                ax_data.get("calls", []),
+                ax_data.get("decorations", []),
+            ]:
+                for call in call_list:
+                    for arg in call.get("args", []):
+                        _resolve_arg_reference(arg, base_dir, columnar_readers, lazy)
+    finally:
+        for reader in columnar_readers.values():
+            reader.close()
 
     return data
 
 
+def _is_data_file_reference(data_ref: Any) -> bool:
+    """Check whether an arg's data field refers to an array file."""
+    return isinstance(data_ref, str) and (
+        data_ref.endswith(".npy")
+        or data_ref.endswith(".npz")
+        or data_ref.endswith(".csv")
+        or is_columnar_file(data_ref)
+    )
+
+
+def _resolve_arg_reference(
+    arg: Dict[str, Any],
+    base_dir: Path,
+    columnar_readers: Dict[Path, ColumnarReader],
+    lazy: bool = False,
+) -> None:
+    """Load (or attach a lazy handle for) the array referenced by an arg."""
+    data_ref = arg.get("data")
+
+    # Check if it's a file reference
+    if not _is_data_file_reference(data_ref):
+        return
+
+    file_path = base_dir / data_ref
+    if not file_path.exists():
+        return
+
+    if lazy:
+        # Snapshot the metadata now; the arg dict may change before loading
+        loader = partial(_read_arg_array, file_path, dict(arg), None, "r")
+        arg["_loaded_array"] = LazyArray(file_path, loader)
+    else:
+        # Kept as ndarrays (no list copy); columnar reads stay zero-copy
+        loaded = _read_arg_array(file_path, arg, columnar_readers)
+        arg["data"] = loaded
+        arg["_loaded_array"] = loaded
+
+    # Store source file path for symlink support
+    arg["_source_file"] = str(file_path.resolve())
+
+
+def _read_arg_array(
+    file_path: Path,
+    arg: Dict[str, Any],
+    columnar_readers: Optional[Dict[Path, ColumnarReader]] = None,
+    mmap_mode: Optional[str] = None,
+) -> Any:
+    """Read the array for an arg, splitting array lists back into a list."""
+    # Get dtype from YAML to ensure proper type conversion
+    dtype = arg.get("dtype")
+    if is_columnar_file(file_path):
+        column_dtype = dtype if isinstance(dtype, str) else None
+        if columnar_readers is None:
+            with ColumnarReader(file_path) as reader:
+                arr = reader.read(arg.get("column"), dtype=column_dtype)
+        else:
+            if file_path not in columnar_readers:
+                columnar_readers[file_path] = ColumnarReader(file_path)
+            arr = columnar_readers[file_path].read(
+                arg.get("column"), dtype=column_dtype
+            )
+    else:
+        arr = load_array(file_path, dtype=dtype, mmap_mode=mmap_mode)
+
+    # Check if this was a list of arrays
+    if not arg.get("_is_array_list"):
+        return arr
+
+    # Reconstruct list of arrays from 2D array
+    n_arrays = arg.get("_n_arrays", arr.shape[1] if arr.ndim > 1 else 1)
+    array_lengths = arg.get("_array_lengths")
+
+    arrays = []
+    for i in range(n_arrays):
+        if arr.ndim > 1:
+            col = arr[:, i]
+        else:
+            col = arr
+
+        # Trim to original length (remove NaN padding)
+        if array_lengths and i < len(array_lengths):
+            col = col[: array_lengths[i]]
+            col = col[~np.isnan(col)]
+        arrays.append(col)
+
+    return arrays
+
+
 def _resolve_single_csv_references(
     data: Dict[str, Any],
     base_dir: Path,
     data_info: Dict[str, Any],
+    lazy: bool = False,
 ) -> Dict[str, Any]:
     """Resolve references from single CSV format.
 
@@ -202,6 +271,9 @@ def _resolve_single_csv_references(
         Base directory for resolving relative paths.
     data_info : dict
         Data section from recipe with csv_path and csv_format.
+    lazy : bool
+        If True, attach :class:`LazyArray` handles that share one parse
+        of the CSV, performed on first access.
 
     Returns
     -------
@@ -212,6 +284,9 @@ def _resolve_single_csv_references(
     if not csv_path.exists():
         return data
 
+    if lazy:
+        return _attach_lazy_single_csv(data, csv_path)
+
     # Load all arrays from single CSV
     arrays_by_trace = load_single_csv(csv_path)
 
@@ -233,12 +308,40 @@ def _resolve_single_csv_references(
                         dtype = arg.get("dtype")
                         if dtype is not None:
                             arr = arr.astype(dtype)
-                        arg["data"] = arr.tolist()
+                        arg["data"] = arr
                         arg["_loaded_array"] = arr
 
     return data
 
 
+def _attach_lazy_single_csv(data: Dict[str, Any], csv_path: Path) -> Dict[str, Any]:
+    """Attach lazy handles for args stored in a single wide CSV."""
+    load_all = lru_cache(maxsize=None)(partial(load_single_csv, csv_path))
+
+    def _load_column(ax_key, trace_id, var_name, dtype):
+        arr = load_all()[ax_key][trace_id][var_name]
+        return arr.astype(dtype) if dtype is not None else arr
+
+    for ax_key, ax_data in data.get("axes", {}).items():
+        for call_list in [ax_data.get("calls", []), ax_data.get("decorations", [])]:
+            for call in call_list:
+                sanitized_id = _sanitize_trace_id(call.get("id", "unknown"))
+
+                for arg in call.get("args", []):
+                    if arg.get("data") != csv_path.name:
+                        continue
+                    loader = partial(
+                        _load_column,
+                        ax_key,
+                        sanitized_id,
+                        arg.get("name", "").lower(),
+                        arg.get("dtype"),
+                    )
+                    arg["_loaded_array"] = LazyArray(csv_path, loader)
+
+    return data
+
+
 def recipe_to_dict(path: Union[str, Path]) -> Dict[str, Any]:
     """Load recipe as raw dictionary (for inspection).
 
@@ -9,13 +9,14 @@ import numpy as np
 from ruamel.yaml import YAML
 
 from .._recorder import FigureRecord
+from .._utils._columnar_io import COLUMNAR_SUFFIXES, save_arrays_columnar
 from .._utils._numpy_io import (
     CsvFormat,
     DataFormat,
     save_array,
     save_arrays_single_csv,
 )
-from ._utils import _convert_numpy_types, _sanitize_filename
+from ._utils import _convert_numpy_types, _pop_array, _sanitize_filename
 
 
 def save_recipe(
@@ -37,7 +38,9 @@ def save_recipe(
     include_data : bool
         If True, save large arrays to separate files.
     data_format : str
-        Format for data files: 'csv' (default), 'npz', or 'inline'.
+        Format for data files: 'csv' (default), 'npz', 'parquet', 'arrow',
+        or 'inline'. 'parquet' and 'arrow' store every array of the figure
+        as typed columns of one file next to the YAML (requires pyarrow).
     csv_format : str
         CSV file structure: 'separate' (default) or 'single'.
     use_symlinks : bool
@@ -67,6 +70,10 @@ def save_recipe(
             # Save all arrays to single CSV file
             csv_path = path.with_suffix(".csv")
             data = _process_arrays_for_single_csv(data, csv_path)
+        elif data_format in COLUMNAR_SUFFIXES:
+            # Save all arrays as columns of one Parquet/Arrow file
+            columnar_path = path.with_suffix(COLUMNAR_SUFFIXES[data_format])
+            data = _process_arrays_for_columnar(data, columnar_path, data_format)
         elif use_symlinks and source_data_dirs:
             # Use symlinks to source data directories
             data = _process_arrays_with_symlinks(
@@ -107,12 +114,12 @@ def _process_arrays_for_save(
 
                 # Process args
                 for i, arg in enumerate(call.get("args", [])):
-                    if "_array" in arg:
+                    arr = _pop_array(arg)
+                    if arr is not None:
                         if not data_dir_created:
                             data_dir.mkdir(parents=True, exist_ok=True)
                             data_dir_created = True
 
-                        arr = arg.pop("_array")
                         filename = f"{safe_call_id}_{arg.get('name', f'arg{i}')}"
                         file_path = save_array(arr, data_dir / filename, data_format)
                         arg["data"] = str(file_path.relative_to(data_dir.parent))
@@ -172,6 +179,37 @@ def _process_arrays_with_symlinks(
     return data
 
 
+def _process_arrays_for_columnar(
+    data: Dict[str, Any],
+    file_path: Path,
+    data_format: DataFormat,
+) -> Dict[str, Any]:
+    """Process arrays in data dict, saving all as columns of one file."""
+    columns = {}
+
+    for ax_key, ax_data in data.get("axes", {}).items():
+        for call_list in [ax_data.get("calls", []), ax_data.get("decorations", [])]:
+            for call in call_list:
+                call_id = call.get("id", "unknown")
+
+                for i, arg in enumerate(call.get("args", [])):
+                    arr = _pop_array(arg)
+                    if arr is None:
+                        continue
+
+                    column = f"{ax_key}/{call_id}/{arg.get('name', f'arg{i}')}"
+                    if column in columns:
+                        column = f"{column}_{i}"
+                    columns[column] = arr
+                    arg["data"] = file_path.name
+                    arg["column"] = column
+
+    if columns:
+        save_arrays_columnar(columns, file_path, data_format)
+
+    return data
+
+
 def _process_arrays_for_single_csv(
     data: Dict[str, Any],
     csv_path: Path,
@@ -189,13 +227,13 @@ def _process_arrays_for_single_csv(
                 trace_arrays = {}
                 for arg in call.get("args", []):
                     var_name = arg.get("name", "data")
+                    arr = _pop_array(arg)
 
-                    if "_array" in arg:
-                        arr = arg.pop("_array")
+                    if arr is not None:
                         trace_arrays[var_name] = arr
                         arg["data"] = str(csv_path.name)
-                    elif isinstance(arg.get("data"), list):
-                        arr = np.array(arg["data"])
+                    elif isinstance(arg.get("data"), (list, np.ndarray)):
+                        arr = np.asarray(arg["data"])
                         trace_arrays[var_name] = arr
                         arg["data"] = str(csv_path.name)
 
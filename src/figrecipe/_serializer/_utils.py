@@ -2,10 +2,12 @@
 # -*- coding: utf-8 -*-
 """Shared utilities for recipe serialization."""
 
-from typing import Any
+from typing import Any, Dict, Optional
 
 import numpy as np
 
+from .._utils._lazy_array import resolve_lazy
+
 
 def _convert_numpy_types(obj: Any) -> Any:
     """Recursively convert numpy types to Python native types."""
@@ -26,6 +28,23 @@ def _convert_numpy_types(obj: Any) -> Any:
         return obj
 
 
+def _pop_array(arg: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Pop the recorded array of an arg for writing to a data file.
+
+    Loader-only keys are removed from *arg*. Data of a record loaded from
+    a recipe stays inline in ``data`` (a lazy handle is resolved there),
+    as it was before the record was saved again.
+    """
+    arr = arg.pop("_array", None)
+    loaded = arg.pop("_loaded_array", None)
+    arg.pop("_source_file", None)
+
+    if loaded is not None and not isinstance(arg.get("data"), (list, np.ndarray)):
+        arg["data"] = resolve_lazy(loaded)
+        arg.pop("column", None)
+    return arr
+
+
 def _sanitize_filename(name: str) -> str:
     """Sanitize a string for safe use in filenames.
 
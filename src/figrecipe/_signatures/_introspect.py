@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Live introspection of matplotlib Axes method signatures.
+
+This is the slow path behind the precomputed signature table: it inspects
+the bound method on a probe Axes and parses its docstring.
+"""
+
+import inspect
+import json
+from typing import Any, Dict, Optional
+
+from ._kwargs import get_kwargs_mapping
+from ._parsing import extract_args_from_docstring, parse_parameter_types
+
+# Probe axes shared by all lookups (created without pyplot)
+_PROBE_AXES = None
+
+
+def get_probe_axes():
+    """Return a detached Axes used only for introspection."""
+    global _PROBE_AXES
+    if _PROBE_AXES is None:
+        from matplotlib.figure import Figure
+
+        _PROBE_AXES = Figure().add_subplot()
+    return _PROBE_AXES
+
+
+def _get_type_str(annotation) -> Optional[str]:
+    """Convert annotation to string."""
+    if annotation is inspect.Parameter.empty:
+        return None
+    if hasattr(annotation, "__name__"):
+        return annotation.__name__
+    return str(annotation)
+
+
+def _serialize_default(default) -> Any:
+    """Serialize default value."""
+    if default is inspect.Parameter.empty:
+        return None
+    if callable(default):
+        return f"<{type(default).__name__}>"
+    try:
+        json.dumps(default)
+        return default
+    except (TypeError, ValueError):
+        return repr(default)
+
+
+def introspect_signature(
+    method_name: str, expand_kwargs: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Inspect a matplotlib Axes method and its docstring.
+
+    Parameters
+    ----------
+    method_name : str
+        Name of the method (e.g., 'plot', 'scatter').
+    expand_kwargs : bool
+        If True, expand **kwargs to actual parameters.
+
+    Returns
+    -------
+    dict or None
+        Signature information with 'args' and 'kwargs' keys, or None if
+        the method does not exist or cannot be inspected.
+    """
+    method = getattr(get_probe_axes(), method_name, None)
+    if method is None:
+        return None
+
+    try:
+        sig = inspect.signature(method)
+    except (ValueError, TypeError):
+        return None
+
+    # Parse parameter types from docstring
+    param_types = parse_parameter_types(method.__doc__)
+
+    args = []
+    kwargs = {}
+    has_var_positional = False
+    has_var_keyword = False
+
+    for name, param in sig.parameters.items():
+        if name == "self":
+            continue
+
+        if param.kind == inspect.Parameter.VAR_POSITIONAL:
+            has_var_positional = True
+        elif param.kind == inspect.Parameter.VAR_KEYWORD:
+            has_var_keyword = True
+        else:
+            # Try annotation first, then docstring
+            typehint = _get_type_str(param.annotation)
+            if not typehint:
+                typehint = param_types.get(name.lower())
+
+            # Handle POSITIONAL_OR_KEYWORD and POSITIONAL_ONLY parameters
+            if param.kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                args.append(
+                    {
+                        "name": name,
+                        "type": typehint,
+                    }
+                )
+                if param.default is not inspect.Parameter.empty:
+                    kwargs[name] = {
+                        "type": typehint,
+                        "default": _serialize_default(param.default),
+                    }
+            elif param.kind == inspect.Parameter.KEYWORD_ONLY:
+                kwargs[name] = {
+                    "type": typehint,
+                    "default": _serialize_default(param.default)
+                    if param.default is not inspect.Parameter.empty
+                    else None,
+                }
+
+    # Expand *args from docstring
+    if has_var_positional:
+        docstring_args = extract_args_from_docstring(method.__doc__, method_name)
+        if docstring_args:
+            # Get existing arg names to avoid duplicates
+            existing_names = {arg["name"] for arg in args}
+            for i, arg in enumerate(docstring_args):
+                if arg["name"] not in existing_names:
+                    args.insert(i, arg)
+                    existing_names.add(arg["name"])
+        else:
+            args.insert(0, {"name": "*args", "type": "*args"})
+
+    # Expand **kwargs based on function type
+    if has_var_keyword and expand_kwargs:
+        kwargs_mapping = get_kwargs_mapping()
+        if method_name in kwargs_mapping:
+            expanded_kwargs = kwargs_mapping[method_name]
+            existing_names = {p["name"] for p in args} | set(kwargs.keys())
+            for kwarg in expanded_kwargs:
+                if kwarg["name"] not in existing_names:
+                    kwargs[kwarg["name"]] = {
+                        "type": kwarg["type"],
+                        "default": kwarg["default"],
+                    }
+        else:
+            kwargs["**kwargs"] = {"type": "**kwargs"}
+    elif has_var_keyword:
+        kwargs["**kwargs"] = {"type": "**kwargs"}
+
+    return {"args": args, "kwargs": kwargs}
+
+
+__all__ = [
+    "get_probe_axes",
+    "introspect_signature",
+]
+
+# EOF
@@ -8,45 +8,25 @@
 Parses *args/**kwargs from docstrings and expands them to actual parameters.
 """
 
-import inspect
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
-import matplotlib.pyplot as plt
-
-from ._kwargs import get_kwargs_mapping
-from ._parsing import extract_args_from_docstring, parse_parameter_types
+from ._introspect import introspect_signature
+from ._table import lookup_signature
 
 # Cache for signatures
 _SIGNATURE_CACHE: Dict[str, Dict[str, Any]] = {}
 
-
-def _get_type_str(annotation) -> Optional[str]:
-    """Convert annotation to string."""
-    if annotation is inspect.Parameter.empty:
-        return None
-    if hasattr(annotation, "__name__"):
-        return annotation.__name__
-    return str(annotation)
-
-
-def _serialize_default(default) -> Any:
-    """Serialize default value."""
-    if default is inspect.Parameter.empty:
-        return None
-    if callable(default):
-        return f"<{type(default).__name__}>"
-    try:
-        import json
-
-        json.dumps(default)
-        return default
-    except (TypeError, ValueError):
-        return repr(default)
+# Cache for non-default kwargs values per method
+_DEFAULTS_CACHE: Dict[str, Dict[str, Any]] = {}
 
 
 def get_signature(method_name: str, expand_kwargs: bool = True) -> Dict[str, Any]:
     """Get signature for a matplotlib Axes method with deep inspection.
 
+    Expanded signatures of recorded methods come from the signature
+    table (introspected once per matplotlib version); other methods fall
+    back to live introspection.
+
     Parameters
     ----------
     method_name : str
@@ -64,96 +44,15 @@ def get_signature(method_name: str, expand_kwargs: bool = True) -> Dict[str, Any
     if cache_key in _SIGNATURE_CACHE:
         return _SIGNATURE_CACHE[cache_key]
 
-    # Create a temporary axes to introspect
-    fig, ax = plt.subplots()
-    plt.close(fig)
-
-    method = getattr(ax, method_name, None)
-    if method is None:
-        return {"args": [], "kwargs": {}}
-
-    try:
-        sig = inspect.signature(method)
-    except (ValueError, TypeError):
-        return {"args": [], "kwargs": {}}
+    result = None
+    if expand_kwargs:
+        result = lookup_signature(method_name)
 
-    # Parse parameter types from docstring
-    param_types = parse_parameter_types(method.__doc__)
+    if result is None:
+        result = introspect_signature(method_name, expand_kwargs)
+        if result is None:
+            return {"args": [], "kwargs": {}}
 
-    args = []
-    kwargs = {}
-    has_var_positional = False
-    has_var_keyword = False
-
-    for name, param in sig.parameters.items():
-        if name == "self":
-            continue
-
-        if param.kind == inspect.Parameter.VAR_POSITIONAL:
-            has_var_positional = True
-        elif param.kind == inspect.Parameter.VAR_KEYWORD:
-            has_var_keyword = True
-        else:
-            # Try annotation first, then docstring
-            typehint = _get_type_str(param.annotation)
-            if not typehint:
-                typehint = param_types.get(name.lower())
-
-            # Handle POSITIONAL_OR_KEYWORD and POSITIONAL_ONLY parameters
-            if param.kind in (
-                inspect.Parameter.POSITIONAL_ONLY,
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            ):
-                args.append(
-                    {
-                        "name": name,
-                        "type": typehint,
-                    }
-                )
-                if param.default is not inspect.Parameter.empty:
-                    kwargs[name] = {
-                        "type": typehint,
-                        "default": _serialize_default(param.default),
-                    }
-            elif param.kind == inspect.Parameter.KEYWORD_ONLY:
-                kwargs[name] = {
-                    "type": typehint,
-                    "default": _serialize_default(param.default)
-                    if param.default is not inspect.Parameter.empty
-                    else None,
-                }
-
-    # Expand *args from docstring
-    if has_var_positional:
-        docstring_args = extract_args_from_docstring(method.__doc__, method_name)
-        if docstring_args:
-            # Get existing arg names to avoid duplicates
-            existing_names = {arg["name"] for arg in args}
-            for i, arg in enumerate(docstring_args):
-                if arg["name"] not in existing_names:
-                    args.insert(i, arg)
-                    existing_names.add(arg["name"])
-        else:
-            args.insert(0, {"name": "*args", "type": "*args"})
-
-    # Expand **kwargs based on function type
-    if has_var_keyword and expand_kwargs:
-        kwargs_mapping = get_kwargs_mapping()
-        if method_name in kwargs_mapping:
-            expanded_kwargs = kwargs_mapping[method_name]
-            existing_names = {p["name"] for p in args} | set(kwargs.keys())
-            for kwarg in expanded_kwargs:
-                if kwarg["name"] not in existing_names:
-                    kwargs[kwarg["name"]] = {
-                        "type": kwarg["type"],
-                        "default": kwarg["default"],
-                    }
-        else:
-            kwargs["**kwargs"] = {"type": "**kwargs"}
-    elif has_var_keyword:
-        kwargs["**kwargs"] = {"type": "**kwargs"}
-
-    result = {"args": args, "kwargs": kwargs}
     _SIGNATURE_CACHE[cache_key] = result
     return result
 
@@ -171,6 +70,9 @@ def get_defaults(method_name: str) -> Dict[str, Any]:
     dict
         Mapping of kwarg names to default values.
     """
+    if method_name in _DEFAULTS_CACHE:
+        return _DEFAULTS_CACHE[method_name]
+
     sig = get_signature(method_name)
     defaults = {}
 
@@ -178,6 +80,7 @@ def get_defaults(method_name: str) -> Dict[str, Any]:
         if name != "**kwargs" and "default" in info:
             defaults[name] = info["default"]
 
+    _DEFAULTS_CACHE[method_name] = defaults
     return defaults
 
 
@@ -237,10 +140,9 @@ def list_plotting_methods() -> List[str]:
         Names of plotting methods.
     """
     from .._params import PLOTTING_METHODS
+    from ._introspect import get_probe_axes
 
-    fig, ax = plt.subplots()
-    plt.close(fig)
-
+    ax = get_probe_axes()
     return sorted([m for m in PLOTTING_METHODS if hasattr(ax, m)])
 
 
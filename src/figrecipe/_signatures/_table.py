@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Precomputed signature table for matplotlib Axes methods.
+
+Introspecting a method (inspect.signature plus docstring parsing) is slow
+enough to dominate first-plot latency in fresh processes. The table holds
+expanded signatures of recorded methods (PLOTTING_METHODS and
+DECORATION_METHODS) for one matplotlib version, serialized as JSON
+(tuples are tagged so defaults such as ``center=(0, 0)`` load back as
+tuples).
+
+Tables are looked up in order:
+
+1. ``tables/matplotlib-<version>.json`` shipped inside this package;
+2. the on-disk cache (``FIGRECIPE_SIGNATURE_DIR`` or
+   ``$XDG_CACHE_HOME/figrecipe/signatures``).
+
+A method missing from the table is introspected on first use, added, and
+the table is written back to the cache, so a process only pays for the
+methods it records. Build a complete (shipped) table with::
+
+    python -m figrecipe._signatures._table src/figrecipe/_signatures/tables
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .._utils._cache_dir import user_cache_dir
+from ._introspect import introspect_signature
+
+# Bump when the table layout or the kwargs expansion changes
+TABLE_SCHEMA = 2
+
+# JSON tag for tuple values (json would turn them into lists)
+_TUPLE_TAG = "__tuple__"
+
+# Tables shipped with the package
+_SHIPPED_DIR = Path(__file__).parent / "tables"
+
+# Loaded table for the running matplotlib (None: not loaded yet)
+_TABLE: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def default_table_dir() -> Path:
+    """Return the signature table cache directory from the environment."""
+    return user_cache_dir("signatures", "FIGRECIPE_SIGNATURE_DIR")
+
+
+def table_filename(matplotlib_version: Optional[str] = None) -> str:
+    """Return the table file name for a matplotlib version."""
+    if matplotlib_version is None:
+        import matplotlib
+
+        matplotlib_version = matplotlib.__version__
+    return f"matplotlib-{matplotlib_version}.json"
+
+
+def _encode(obj: Any) -> Any:
+    """Tag tuples (recursively) so they survive a JSON round trip."""
+    if isinstance(obj, tuple):
+        return {_TUPLE_TAG: [_encode(v) for v in obj]}
+    if isinstance(obj, list):
+        return [_encode(v) for v in obj]
+    if isinstance(obj, dict):
+        return {k: _encode(v) for k, v in obj.items()}
+    return obj
+
+
+def _decode_hook(obj: Dict[str, Any]) -> Any:
+    """json object_hook turning tagged tuples back into tuples."""
+    if len(obj) == 1 and _TUPLE_TAG in obj:
+        return tuple(obj[_TUPLE_TAG])
+    return obj
+
+
+def _table_dict(signatures: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap signatures with the schema and matplotlib version."""
+    import matplotlib
+
+    return {
+        "schema": TABLE_SCHEMA,
+        "matplotlib": matplotlib.__version__,
+        "signatures": signatures,
+    }
+
+
+def build_signature_table() -> Dict[str, Any]:
+    """Introspect every recorded method of the installed matplotlib.
+
+    Returns
+    -------
+    dict
+        Table with 'schema', 'matplotlib' and 'signatures' keys.
+        'signatures' maps method names to expanded signatures.
+    """
+    from .._params import DECORATION_METHODS, PLOTTING_METHODS
+
+    signatures = {}
+    for name in sorted(PLOTTING_METHODS | DECORATION_METHODS):
+        sig = introspect_signature(name, expand_kwargs=True)
+        if sig is not None:
+            signatures[name] = sig
+
+    return _table_dict(signatures)
+
+
+def write_signature_table(
+    directory: Optional[Union[str, Path]] = None,
+    table: Optional[Dict[str, Any]] = None,
+) -> Path:
+    """Build (if needed) and atomically write a signature table.
+
+    Parameters
+    ----------
+    directory : str or Path, optional
+        Target directory (default: the on-disk cache).
+    table : dict, optional
+        Table to write (default: built from the installed matplotlib).
+
+    Returns
+    -------
+    Path
+        Path of the written table.
+    """
+    if table is None:
+        table = build_signature_table()
+    directory = Path(directory) if directory is not None else default_table_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / table_filename(table["matplotlib"])
+
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(_encode(table), f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _read_table(path: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Read a table file, returning its signatures if it is current."""
+    import matplotlib
+
+    try:
+        with open(path) as f:
+            table = json.load(f, object_hook=_decode_hook)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(table, dict)
+        or table.get("schema") != TABLE_SCHEMA
+        or table.get("matplotlib") != matplotlib.__version__
+    ):
+        return None
+    return table.get("signatures")
+
+
+def load_signature_table() -> Dict[str, Dict[str, Any]]:
+    """Return the signature table for the running matplotlib.
+
+    Loaded once per process from the shipped table or the on-disk cache;
+    empty if neither has a current table. Nothing is introspected here
+    (see :func:`lookup_signature`).
+    """
+    global _TABLE
+    if _TABLE is not None:
+        return _TABLE
+
+    name = table_filename()
+    _TABLE = {}
+    for directory in (_SHIPPED_DIR, default_table_dir()):
+        signatures = _read_table(directory / name)
+        if signatures is not None:
+            _TABLE = signatures
+            break
+    return _TABLE
+
+
+def lookup_signature(method_name: str) -> Optional[Dict[str, Any]]:
+    """Return the expanded signature of a recorded method.
+
+    A method missing from the table is introspected, added to it and the
+    table is written back to the on-disk cache.
+
+    Parameters
+    ----------
+    method_name : str
+        Axes method name.
+
+    Returns
+    -------
+    dict or None
+        Expanded signature, or None for methods that are not recorded
+        (PLOTTING_METHODS / DECORATION_METHODS) or cannot be introspected.
+    """
+    from .._params import DECORATION_METHODS, PLOTTING_METHODS
+
+    table = load_signature_table()
+    if method_name in table:
+        return table[method_name]
+    if method_name not in PLOTTING_METHODS | DECORATION_METHODS:
+        return None
+
+    try:
+        sig = introspect_signature(method_name, expand_kwargs=True)
+    except Exception:
+        return None
+    if sig is None:
+        return None
+
+    table[method_name] = sig
+    try:
+        write_signature_table(table=_table_dict(table))
+    except (OSError, TypeError, ValueError):
+        pass  # Read-only cache location: keep the in-memory table
+    return sig
+
+
+def clear_signature_table() -> None:
+    """Forget the loaded table so the next lookup reloads it."""
+    global _TABLE
+    _TABLE = None
+
+
+__all__ = [
+    "TABLE_SCHEMA",
+    "default_table_dir",
+    "table_filename",
+    "build_signature_table",
+    "write_signature_table",
+    "load_signature_table",
+    "lookup_signature",
+    "clear_signature_table",
+]
+
+
+if __name__ == "__main__":
+    import sys
+
+    print(write_signature_table(sys.argv[1] if len(sys.argv) > 1 else None))
+
+# EOF
@@ -3,6 +3,7 @@
 """Utility modules for figrecipe."""
 
 from ._bundle import is_bundle_path, resolve_recipe_path
+from ._cache_dir import user_cache_dir
 from ._calc_nice_ticks import calc_nice_ticks
 from ._diff import get_non_default_kwargs, is_default_value
 from ._numpy_io import load_array, save_array
@@ -20,6 +21,7 @@ __all__ = [
     "pt_to_mm",
     "resolve_recipe_path",
     "is_bundle_path",
+    "user_cache_dir",
 ]
 
 # Optional: image comparison (requires PIL)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Location of figrecipe's on-disk caches.
+
+Caches live under ``$XDG_CACHE_HOME/figrecipe`` (default:
+``~/.cache/figrecipe``), one subdirectory per cache, and each cache can
+be moved with its own environment variable.
+"""
+
+__all__ = ["user_cache_dir"]
+
+import os
+from pathlib import Path
+from typing import Optional
+
+
+def user_cache_dir(name: str, env_var: Optional[str] = None) -> Path:
+    """Return the directory of the named figrecipe cache.
+
+    Parameters
+    ----------
+    name : str
+        Subdirectory of the figrecipe cache root (e.g. ``"renders"``).
+    env_var : str, optional
+        Environment variable that overrides the directory when set.
+
+    Returns
+    -------
+    Path
+        ``$env_var`` if set, else ``$XDG_CACHE_HOME/figrecipe/<name>``.
+    """
+    env_dir = os.environ.get(env_var) if env_var else None
+    if env_dir:
+        return Path(env_dir).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "figrecipe" / name
+
+
+# EOF
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Columnar (Parquet / Arrow IPC) array storage for figrecipe.
+
+One file holds every array of a figure. Each array is stored as a
+single-row list column, so arrays of different lengths and dtypes live
+side by side; the original shape and dtype are kept in the field
+metadata. Columns can be read one at a time without touching the rest
+of the file (Arrow IPC files are memory-mapped).
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Union
+
+import numpy as np
+
+# Columnar data format type
+ColumnarFormat = Literal["parquet", "arrow"]
+
+# File suffix per columnar format
+COLUMNAR_SUFFIXES = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _import_pyarrow():
+    """Import pyarrow, raising a helpful error if it is missing."""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for data_format='parquet' or 'arrow'. "
+            "Install with: pip install figrecipe[columnar]"
+        ) from e
+    return pa
+
+
+def is_columnar_file(path: Union[str, Path]) -> bool:
+    """Check whether a path refers to a columnar data file."""
+    return Path(path).suffix in COLUMNAR_SUFFIXES.values()
+
+
+def _to_arrow_values(pa, arr: np.ndarray):
+    """Convert a flattened array to an Arrow array."""
+    flat = arr.ravel()
+    try:
+        return pa.array(flat)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed-type object arrays: store their string form
+        return pa.array([str(v) for v in flat.tolist()], type=pa.string())
+
+
+def save_arrays_columnar(
+    columns: Dict[str, np.ndarray],
+    path: Union[str, Path],
+    data_format: ColumnarFormat = "parquet",
+) -> Path:
+    """Save named arrays to a single columnar file.
+
+    Parameters
+    ----------
+    columns : dict
+        Mapping of column name to array. Arrays may differ in length,
+        dtype and number of dimensions.
+    path : str or Path
+        Output file path (extension will be set based on format).
+    data_format : str
+        'parquet' (compressed, compact) or 'arrow' (uncompressed Arrow
+        IPC file, memory-mappable).
+
+    Returns
+    -------
+    Path
+        Path to saved file.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+    pa = _import_pyarrow()
+
+    path = Path(path).with_suffix(COLUMNAR_SUFFIXES[data_format])
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fields = []
+    arrays = []
+    for name, arr in columns.items():
+        arr = np.asarray(arr)
+        values = _to_arrow_values(pa, arr)
+        offsets = pa.array([0, len(values)], type=pa.int64())
+        list_arr = pa.LargeListArray.from_arrays(offsets, values)
+        metadata = {"shape": json.dumps(list(arr.shape)), "dtype": str(arr.dtype)}
+        fields.append(pa.field(name, list_arr.type, metadata=metadata))
+        arrays.append(list_arr)
+
+    table = pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+    if data_format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, path)
+    else:
+        with pa.OSFile(str(path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    return path
+
+
+class ColumnarReader:
+    """Column-wise reader for Parquet / Arrow IPC data files.
+
+    The file is opened once; each :meth:`read` call decodes only the
+    requested column.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to a ``.parquet`` or ``.arrow`` file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        pa = _import_pyarrow()
+
+        self.path = Path(path)
+        if self.path.suffix == COLUMNAR_SUFFIXES["parquet"]:
+            import pyarrow.parquet as pq
+
+            self._parquet = pq.ParquetFile(self.path)
+            self._ipc = None
+            self.schema = self._parquet.schema_arrow
+        else:
+            self._parquet = None
+            self._source = pa.memory_map(str(self.path), "r")
+            self._ipc = pa.ipc.open_file(self._source)
+            self.schema = self._ipc.schema
+
+    @property
+    def columns(self) -> List[str]:
+        """Names of all stored columns."""
+        return list(self.schema.names)
+
+    def read(self, column: Optional[str] = None, dtype=None) -> np.ndarray:
+        """Read one column as a numpy array.
+
+        Parameters
+        ----------
+        column : str, optional
+            Column name. Defaults to the first column.
+        dtype : dtype, optional
+            Target dtype (from YAML recipe). Defaults to the stored dtype.
+
+        Returns
+        -------
+        np.ndarray
+            Array with its original shape.
+        """
+        if column is None:
+            column = self.columns[0]
+
+        if self._parquet is not None:
+            chunked = self._parquet.read(columns=[column]).column(0)
+        else:
+            index = self.schema.get_field_index(column)
+            chunked = [
+                self._ipc.get_batch(i).column(index)
+                for i in range(self._ipc.num_record_batches)
+            ]
+
+        chunks = chunked.chunks if hasattr(chunked, "chunks") else chunked
+        parts = [chunk.flatten().to_numpy(zero_copy_only=False) for chunk in chunks]
+        arr = parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+        metadata = self.schema.field(column).metadata or {}
+        if b"shape" in metadata:
+            arr = arr.reshape(json.loads(metadata[b"shape"]))
+        if dtype is None and b"dtype" in metadata:
+            dtype = metadata[b"dtype"].decode()
+        if dtype is not None:
+            arr = arr.astype(dtype, copy=False)
+        return arr
+
+    def close(self) -> None:
+        """Release the underlying file handle."""
+        if self._ipc is not None:
+            self._source.close()
+
+    def __enter__(self) -> "ColumnarReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_array_columnar(
+    path: Union[str, Path], column: Optional[str] = None, dtype=None
+) -> np.ndarray:
+    """Load a single column from a columnar data file.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to ``.parquet`` or ``.arrow`` file.
+    column : str, optional
+        Column name. Defaults to the first column.
+    dtype : dtype, optional
+        Target dtype. Defaults to the stored dtype.
+
+    Returns
+    -------
+    np.ndarray
+        Loaded array.
+    """
+    with ColumnarReader(path) as reader:
+        return reader.read(column, dtype=dtype)
+
+
+__all__ = [
+    "COLUMNAR_SUFFIXES",
+    "ColumnarFormat",
+    "ColumnarReader",
+    "is_columnar_file",
+    "load_array_columnar",
+    "save_arrays_columnar",
+]
+
+# EOF
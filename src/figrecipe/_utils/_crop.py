@@ -6,7 +6,13 @@ This utility automatically detects the content area of saved figures
 and crops them, removing excess whitespace while preserving a specified margin.
 """
 
-__all__ = ["crop", "crop_svg", "find_content_area", "mm_to_pixels"]
+__all__ = [
+    "crop",
+    "crop_svg",
+    "find_content_area",
+    "mm_to_pixels",
+    "save_cropped_png",
+]
 
 from pathlib import Path
 from typing import Optional, Tuple, Union
@@ -35,8 +41,25 @@ def find_content_area(image_path: Union[str, Path]) -> Tuple[int, int, int, int]
     from PIL import Image
 
     img = Image.open(image_path)
-    img_array = np.array(img)
+    return find_content_box(np.array(img))
 
+
+def find_content_box(img_array: np.ndarray) -> Tuple[int, int, int, int]:
+    """Find the bounding box of the content area in an image array.
+
+    Array counterpart of :func:`find_content_area` for images that are
+    already in memory (e.g. an Agg RGBA buffer).
+
+    Parameters
+    ----------
+    img_array : np.ndarray
+        Grayscale (H, W), RGB (H, W, 3) or RGBA (H, W, 4) image.
+
+    Returns
+    -------
+    tuple
+        (left, upper, right, lower) bounding box coordinates
+    """
     # Check if image has alpha channel (RGBA) with actual transparency
     if len(img_array.shape) == 3 and img_array.shape[2] == 4:
         alpha = img_array[:, :, 3]
@@ -88,7 +111,7 @@ def find_content_area(image_path: Union[str, Path]) -> Tuple[int, int, int, int]
         x_min, x_max = np.where(cols)[0][[0, -1]]
         return x_min, y_min, x_max + 1, y_max + 1
     else:
-        return 0, 0, img.width, img.height
+        return 0, 0, img_array.shape[1], img_array.shape[0]
 
 
 def mm_to_pixels(mm: float, dpi: int = 300) -> int:
@@ -366,6 +389,122 @@ def crop(
     return output_path
 
 
+def _png_roundtrip_dpi(dpi: float) -> int:
+    """DPI that :func:`crop` reads back from a PNG saved at *dpi*.
+
+    PNG stores resolution as integer pixels per metre, so e.g. 300 DPI is
+    read back as 299.9994 and truncated to 299. Used so that in-memory
+    cropping picks exactly the same pixel margins as file-based cropping.
+    """
+    return int(int(dpi / 0.0254 + 0.5) * 0.0254)
+
+
+def _crop_array(
+    img_array: np.ndarray, left: int, upper: int, right: int, lower: int
+) -> np.ndarray:
+    """Crop an image array, extending with the corner background if needed."""
+    h, w = img_array.shape[:2]
+    if left >= 0 and upper >= 0 and right <= w and lower <= h:
+        return img_array[upper:lower, left:right]
+
+    corners = [
+        img_array[0, 0],
+        img_array[0, w - 1],
+        img_array[h - 1, 0],
+        img_array[h - 1, w - 1],
+    ]
+    bg_color = np.median(corners, axis=0).astype(img_array.dtype)
+    canvas = np.empty(
+        (lower - upper, right - left) + img_array.shape[2:], img_array.dtype
+    )
+    canvas[...] = bg_color
+
+    src = img_array[max(upper, 0) : min(lower, h), max(left, 0) : min(right, w)]
+    paste_x = max(-left, 0)
+    paste_y = max(-upper, 0)
+    canvas[paste_y : paste_y + src.shape[0], paste_x : paste_x + src.shape[1]] = src
+    return canvas
+
+
+def save_cropped_png(
+    rgba: np.ndarray,
+    output_path: Union[str, Path],
+    dpi: float,
+    margin_mm: float = 1.0,
+    margin_left_mm: Optional[float] = None,
+    margin_right_mm: Optional[float] = None,
+    margin_top_mm: Optional[float] = None,
+    margin_bottom_mm: Optional[float] = None,
+    metadata: Optional[dict] = None,
+) -> dict:
+    """Crop an in-memory RGBA render to its content and write it as PNG.
+
+    Produces the same file as saving the render with ``savefig`` and then
+    calling :func:`crop` on it, without the intermediate PNG encode/decode.
+
+    Parameters
+    ----------
+    rgba : np.ndarray
+        (H, W, 4) uint8 render, e.g. from ``savefig(format="raw")``.
+    output_path : str or Path
+        Output PNG path.
+    dpi : float
+        Render DPI (stored in the PNG and used for mm margins).
+    margin_mm : float
+        Uniform margin in mm, overridden by per-side margins.
+    margin_left_mm, margin_right_mm, margin_top_mm, margin_bottom_mm : float
+        Per-side margins in mm.
+    metadata : dict, optional
+        PNG text chunks (e.g. ``{"Software": ...}``).
+
+    Returns
+    -------
+    dict
+        Crop offset, same keys as ``crop(..., return_offset=True)``.
+    """
+    from PIL import Image, PngImagePlugin
+
+    original_height, original_width = rgba.shape[:2]
+    margin_dpi = _png_roundtrip_dpi(dpi)
+
+    ml = margin_left_mm if margin_left_mm is not None else margin_mm
+    mr = margin_right_mm if margin_right_mm is not None else margin_mm
+    mt = margin_top_mm if margin_top_mm is not None else margin_mm
+    mb = margin_bottom_mm if margin_bottom_mm is not None else margin_mm
+
+    content_left, content_upper, content_right, content_lower = find_content_box(rgba)
+    left = int(content_left) - mm_to_pixels(ml, margin_dpi)
+    upper = int(content_upper) - mm_to_pixels(mt, margin_dpi)
+    right = int(content_right) + mm_to_pixels(mr, margin_dpi)
+    lower = int(content_lower) + mm_to_pixels(mb, margin_dpi)
+
+    cropped = _crop_array(rgba, left, upper, right, lower)
+
+    pnginfo = PngImagePlugin.PngInfo()
+    for key, value in (metadata or {}).items():
+        pnginfo.add_text(key, value)
+
+    Image.fromarray(cropped, "RGBA").save(
+        output_path,
+        format="PNG",
+        dpi=(dpi, dpi),
+        compress_level=6,
+        optimize=True,
+        pnginfo=pnginfo,
+    )
+
+    return {
+        "left": left,
+        "upper": upper,
+        "right": right,
+        "lower": lower,
+        "original_width": original_width,
+        "original_height": original_height,
+        "new_width": cropped.shape[1],
+        "new_height": cropped.shape[0],
+    }
+
+
 def crop_svg(
     svg_path: Union[str, Path],
     fig,
@@ -3,7 +3,7 @@
 """Image comparison utilities for roundtrip testing."""
 
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import numpy as np
 
@@ -80,6 +80,90 @@ def compute_diff(
     return mse, diff_img
 
 
+def compare_arrays(
+    img1: np.ndarray,
+    img2: np.ndarray,
+    mse_threshold: Optional[float] = None,
+    size_tolerance: int = 2,
+    band_rows: int = 64,
+) -> dict:
+    """Compare two uint8 images with integer arithmetic, band by band.
+
+    Rows are diffed in bands of ``band_rows`` using int16 differences and
+    int64 sums, so no float copy of the images is ever made. When
+    ``mse_threshold`` is given, comparison stops as soon as the running
+    sum of squared errors guarantees the threshold is exceeded.
+
+    Parameters
+    ----------
+    img1 : np.ndarray
+        First image (H, W, C), uint8.
+    img2 : np.ndarray
+        Second image (H, W, C), uint8.
+    mse_threshold : float, optional
+        Stop early once the MSE is known to exceed this value.
+    size_tolerance : int
+        Allow this many pixels of size difference (default: 2); the
+        overlapping region is compared.
+    band_rows : int
+        Number of rows diffed per step (default: 64).
+
+    Returns
+    -------
+    dict
+        Same keys as :func:`compare_images` (file sizes are 0), plus
+        ``early_exit`` (bool). After an early exit, ``mse`` and
+        ``max_diff`` cover only the rows compared so far (lower bounds).
+    """
+    same_size = img1.shape == img2.shape
+    h_diff = abs(img1.shape[0] - img2.shape[0])
+    w_diff = abs(img1.shape[1] - img2.shape[1])
+
+    result = {
+        "identical": False,
+        "mse": float("nan"),
+        "psnr": float("nan"),
+        "max_diff": float("nan"),
+        "size1": (img1.shape[0], img1.shape[1]),
+        "size2": (img2.shape[0], img2.shape[1]),
+        "same_size": same_size,
+        "file_size1": 0,
+        "file_size2": 0,
+        "early_exit": False,
+    }
+    if not same_size and (h_diff > size_tolerance or w_diff > size_tolerance):
+        return result
+
+    min_h = min(img1.shape[0], img2.shape[0])
+    min_w = min(img1.shape[1], img2.shape[1])
+    img1 = img1[:min_h, :min_w]
+    img2 = img2[:min_h, :min_w]
+
+    n_values = img1.size
+    sse_limit = None if mse_threshold is None else mse_threshold * n_values
+
+    sse = 0
+    max_diff = 0
+    for start in range(0, min_h, band_rows):
+        band1 = img1[start : start + band_rows]
+        band2 = img2[start : start + band_rows]
+        if np.array_equal(band1, band2):
+            continue
+        diff = np.subtract(band1, band2, dtype=np.int16)
+        sse += int(np.square(diff, dtype=np.int32).sum(dtype=np.int64))
+        max_diff = max(max_diff, int(np.abs(diff).max()))
+        if sse_limit is not None and sse > sse_limit:
+            result["early_exit"] = True
+            break
+
+    mse = sse / n_values if n_values else 0.0
+    result["identical"] = sse == 0
+    result["mse"] = float(mse)
+    result["psnr"] = float("inf") if mse == 0 else float(10 * np.log10(255**2 / mse))
+    result["max_diff"] = float(max_diff)
+    return result
+
+
 def compare_images(
     path1: Union[str, Path],
     path2: Union[str, Path],
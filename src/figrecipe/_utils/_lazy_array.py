@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Lazily loaded array handles for recipe data files."""
+
+from pathlib import Path
+from typing import Any, Callable, Union
+
+import numpy as np
+
+
+class LazyArray:
+    """Handle to recipe array data that is read on first access.
+
+    Stored in ``CallRecord.args[i]["_loaded_array"]`` when a recipe is
+    loaded with ``lazy=True``. Nothing is read from disk until
+    :meth:`load` is called (directly, via ``np.asarray`` or via
+    :func:`resolve_lazy`); the result is cached on the handle.
+
+    Parameters
+    ----------
+    path : str or Path
+        Data file the array comes from (for display and symlinking).
+    loader : callable
+        Zero-argument callable returning the array (or list of arrays).
+    """
+
+    __slots__ = ("path", "_loader", "_value")
+
+    def __init__(self, path: Union[str, Path], loader: Callable[[], Any]):
+        self.path = Path(path)
+        self._loader = loader
+        self._value = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the data has been read from disk."""
+        return self._loader is None
+
+    def load(self) -> Any:
+        """Read the data (once) and return it."""
+        if self._loader is not None:
+            self._value = self._loader()
+            self._loader = None
+        return self._value
+
+    def __array__(self, dtype=None, copy=None):
+        arr = np.asarray(self.load(), dtype=dtype)
+        return arr.copy() if copy else arr
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"LazyArray('{self.path}', {state})"
+
+
+def resolve_lazy(value: Any) -> Any:
+    """Return the loaded data if *value* is a :class:`LazyArray`."""
+    if isinstance(value, LazyArray):
+        return value.load()
+    return value
+
+
+__all__ = ["LazyArray", "resolve_lazy"]
+
+# EOF
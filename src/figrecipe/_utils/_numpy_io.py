@@ -3,21 +3,31 @@
 """NumPy array I/O utilities for figrecipe."""
 
 import csv
+import warnings
 from pathlib import Path
-from typing import Literal, Union
+from typing import Literal, Optional, Union
 
 import numpy as np
 
+from ._columnar_io import (
+    COLUMNAR_SUFFIXES,
+    load_array_columnar,
+    save_arrays_columnar,
+)
+
 # Threshold for inline vs file storage (in elements)
 # Set to 0 for consistent CSV storage (all data in CSV, YAML contains only structure)
 INLINE_THRESHOLD = 0
 
 # Data format type
-DataFormat = Literal["csv", "npz", "inline"]
+DataFormat = Literal["csv", "npz", "inline", "parquet", "arrow"]
 
 # CSV format type: single file with all columns vs separate files per variable
 CsvFormat = Literal["single", "separate"]
 
+# Line terminator used by csv.writer's default dialect
+_CSV_LINE_TERMINATOR = "\r\n"
+
 
 def should_store_inline(data: np.ndarray) -> bool:
     """Determine if array should be stored inline or as file.
@@ -49,7 +59,8 @@ def save_array(
     path : str or Path
         Output file path (extension will be set based on format).
     data_format : str
-        Format to use: 'csv' (default), 'npz', or 'inline'.
+        Format to use: 'csv' (default), 'npz', 'parquet', 'arrow', or
+        'inline'. Columnar formats write a one-column file.
         Note: 3D+ arrays (e.g., RGBA images) automatically use 'npz'
         since CSV cannot properly represent multi-dimensional data.
 
@@ -71,6 +82,8 @@ def save_array(
     elif data_format == "npz":
         path = path.with_suffix(".npz")
         np.savez_compressed(path, data=data)
+    elif data_format in COLUMNAR_SUFFIXES:
+        path = save_arrays_columnar({"data": data}, path, data_format)
     else:
         path = path.with_suffix(".npy")
         np.save(path, data)
@@ -97,21 +110,58 @@ def save_array_csv(data: np.ndarray, path: Union[str, Path]) -> Path:
     -----
     Dtype is stored in the YAML recipe file, not in CSV.
     CSV contains only the raw data values for clean import into other tools.
+
+    Numeric and boolean arrays are formatted in bulk with a single
+    ``%``-template pass; the output is byte-identical to writing each row
+    with ``csv.writer`` (``str()`` of every element, ``\\r\\n`` line
+    endings). String and object arrays, which may need CSV quoting, go
+    through ``csv.writer`` directly.
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    text = _format_csv_text(data)
+    if text is None:
+        _save_array_csv_rows(data, path)
+        return path
+
+    with open(path, "w", newline="") as f:
+        f.write(text)
+
+    return path
+
+
+def _format_csv_text(data: np.ndarray) -> Optional[str]:
+    """Format a 1D/2D numeric array as CSV text, or None if unsupported."""
+    data = np.asarray(data)
+    if data.ndim not in (1, 2) or data.size == 0:
+        return None
+
+    kind = data.dtype.kind
+    if kind in "iub" or data.dtype == np.float64:
+        # Python ints/floats/bools format exactly like their numpy scalars
+        values = data.ravel().tolist()
+    elif kind in "fc":
+        # float32/float16/complex: shortest repr differs from Python float's
+        values = list(map(str, data.ravel()))
+    else:
+        return None
+
+    n_cols = 1 if data.ndim == 1 else data.shape[1]
+    n_rows = data.shape[0]
+    line = ",".join(["%s"] * n_cols) + _CSV_LINE_TERMINATOR
+    return (line * n_rows) % tuple(values)
+
+
+def _save_array_csv_rows(data: np.ndarray, path: Path) -> None:
+    """Write array row by row with csv.writer (handles quoting)."""
     with open(path, "w", newline="") as f:
         writer = csv.writer(f)
         # Write data only (dtype stored in YAML)
         if data.ndim == 1:
-            for val in data:
-                writer.writerow([val])
+            writer.writerows([val] for val in data)
         else:
-            for row in data:
-                writer.writerow(row if hasattr(row, "__iter__") else [row])
-
-    return path
+            writer.writerows(row if hasattr(row, "__iter__") else [row] for row in data)
 
 
 def load_array_csv(path: Union[str, Path], dtype=None) -> np.ndarray:
@@ -132,8 +182,45 @@ def load_array_csv(path: Union[str, Path], dtype=None) -> np.ndarray:
     Notes
     -----
     Supports both new format (pure data) and legacy format (with dtype header).
+    Numeric data is parsed by ``np.loadtxt`` directly into the target dtype;
+    non-numeric or irregular files fall back to row-wise parsing.
     """
     path = Path(path)
+
+    with open(path, "r", newline="") as f:
+        first_line = f.readline()
+
+    if not first_line:
+        return np.array([], dtype=dtype)
+
+    # Legacy dtype header takes effect only when the YAML gives no dtype
+    if first_line.startswith("# dtype:") and dtype is None:
+        dtype = np.dtype(first_line.replace("# dtype:", "").strip())
+
+    target = np.dtype(dtype) if dtype is not None else np.dtype(np.float64)
+    if target.kind in "iufc":
+        try:
+            with warnings.catch_warnings():
+                # Empty-after-header files warn; the fallback handles them
+                warnings.simplefilter("error", UserWarning)
+                arr = np.loadtxt(
+                    path,
+                    delimiter=",",
+                    dtype=target,
+                    comments="# dtype:",
+                    ndmin=2,
+                    encoding="utf-8",
+                )
+        except (ValueError, UserWarning):
+            pass
+        else:
+            return arr.reshape(-1) if arr.shape[1] == 1 else arr
+
+    return _load_array_csv_rows(path, dtype)
+
+
+def _load_array_csv_rows(path: Path, dtype=None) -> np.ndarray:
+    """Row-wise CSV parser for non-numeric or irregular data."""
     data_rows = []
 
     with open(path, "r", newline="") as f:
@@ -170,15 +257,23 @@ def load_array_csv(path: Union[str, Path], dtype=None) -> np.ndarray:
     return np.array(data, dtype=dtype)
 
 
-def load_array(path: Union[str, Path], dtype=None) -> np.ndarray:
+def load_array(
+    path: Union[str, Path],
+    dtype=None,
+    mmap_mode: Optional[str] = None,
+) -> np.ndarray:
     """Load numpy array from file.
 
     Parameters
     ----------
     path : str or Path
-        Path to .npy, .npz, or .csv file.
+        Path to .npy, .npz, .csv, .parquet, or .arrow file. Columnar
+        files return their first column.
     dtype : dtype, optional
         Expected dtype for the array. If None, infers from data.
+    mmap_mode : str, optional
+        Memory-map .npy files with this mode (e.g. 'r') instead of reading
+        them. The map is kept when *dtype* already matches the file.
 
     Returns
     -------
@@ -195,9 +290,11 @@ def load_array(path: Union[str, Path], dtype=None) -> np.ndarray:
             return arr
     elif path.suffix == ".csv":
         return load_array_csv(path, dtype=dtype)
+    elif path.suffix in COLUMNAR_SUFFIXES.values():
+        return load_array_columnar(path, dtype=dtype)
     else:
-        arr = np.load(path)
-        if dtype is not None:
+        arr = np.load(path, mmap_mode=mmap_mode)
+        if dtype is not None and arr.dtype != np.dtype(dtype):
             arr = arr.astype(dtype)
         return arr
 
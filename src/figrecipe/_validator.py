@@ -2,13 +2,24 @@
 # -*- coding: utf-8 -*-
 """Reproducibility validation for figrecipe recipes."""
 
+import dataclasses
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 import numpy as np
 
+# Validation modes accepted by validate_on_save() / fr.save()
+VALIDATION_MODES = ("full", "fast", "async")
+
+# Reduced DPI used for in-memory (fast/async) validation renders
+FAST_VALIDATION_DPI = 72
+
+# Single background worker shared by async validations (created lazily)
+_executor: Optional[ThreadPoolExecutor] = None
+
 
 @dataclass
 class ValidationResult:
@@ -133,41 +144,234 @@ def validate_recipe(
         # Compare images
         diff = compare_images(original_path, reproduced_path)
 
-        # Determine validity
-        mse = diff["mse"]
-        if np.isnan(mse):
-            # Different sizes - invalid
-            valid = False
-            message = f"Image dimensions differ: {diff['size1']} vs {diff['size2']}"
-        elif mse > mse_threshold:
-            valid = False
-            message = f"MSE ({mse:.2f}) exceeds threshold ({mse_threshold})"
-        else:
-            valid = True
-            message = "Reproduction matches original within threshold"
-
-        return ValidationResult(
-            valid=valid,
-            mse=mse if not np.isnan(mse) else float("inf"),
-            psnr=diff["psnr"],
-            max_diff=diff["max_diff"]
-            if not np.isnan(diff["max_diff"])
-            else float("inf"),
-            size_original=diff["size1"],
-            size_reproduced=diff["size2"],
-            same_size=diff["same_size"],
-            file_size_diff=diff["file_size2"] - diff["file_size1"],
-            message=message,
+        return _result_from_diff(diff, mse_threshold)
+
+
+def _result_from_diff(diff: dict, mse_threshold: float) -> ValidationResult:
+    """Build a ValidationResult from an image comparison dict."""
+    # Determine validity
+    mse = diff["mse"]
+    if np.isnan(mse):
+        # Different sizes - invalid
+        valid = False
+        message = f"Image dimensions differ: {diff['size1']} vs {diff['size2']}"
+    elif mse > mse_threshold:
+        valid = False
+        message = f"MSE ({mse:.2f}) exceeds threshold ({mse_threshold})"
+        if diff.get("early_exit"):
+            message += " (comparison stopped early; MSE is a lower bound)"
+    else:
+        valid = True
+        message = "Reproduction matches original within threshold"
+
+    return ValidationResult(
+        valid=valid,
+        mse=mse if not np.isnan(mse) else float("inf"),
+        psnr=diff["psnr"],
+        max_diff=diff["max_diff"] if not np.isnan(diff["max_diff"]) else float("inf"),
+        size_original=diff["size1"],
+        size_reproduced=diff["size2"],
+        same_size=diff["same_size"],
+        file_size_diff=diff["file_size2"] - diff["file_size1"],
+        message=message,
+    )
+
+
+def snapshot_record(record):
+    """Copy a FigureRecord so saving the original cannot alter the copy.
+
+    Saving a recipe replaces each arg's in-memory array with a file
+    reference. The snapshot gets its own arg dicts (the arrays themselves
+    are shared, not copied), so it can still be replayed afterwards.
+
+    Parameters
+    ----------
+    record : FigureRecord
+        Record to copy.
+
+    Returns
+    -------
+    FigureRecord
+        Independent copy suitable for :func:`validate_record`.
+    """
+
+    def _copy_call(call):
+        return dataclasses.replace(call, args=[dict(arg) for arg in call.args])
+
+    axes = {
+        key: dataclasses.replace(
+            ax,
+            calls=[_copy_call(c) for c in ax.calls],
+            decorations=[_copy_call(d) for d in ax.decorations],
+        )
+        for key, ax in record.axes.items()
+    }
+    return dataclasses.replace(record, axes=axes)
+
+
+def render_for_validation(fig, dpi: int = FAST_VALIDATION_DPI) -> np.ndarray:
+    """Render a figure to an RGB uint8 array for in-memory comparison.
+
+    Parameters
+    ----------
+    fig : RecordingFigure or matplotlib.figure.Figure
+        Figure to render (uncropped, full canvas).
+    dpi : int
+        Render resolution.
+
+    Returns
+    -------
+    np.ndarray
+        (H, W, 3) uint8 image.
+    """
+    from ._api._save import get_save_transparency
+    from ._api._save_helpers import _render_rgba
+
+    mpl_fig = fig.fig if hasattr(fig, "fig") else fig
+    rgba = _render_rgba(mpl_fig, dpi, transparent=get_save_transparency())
+    return rgba[..., :3]
+
+
+def _replay_and_compare(
+    original: np.ndarray,
+    record,
+    mse_threshold: float,
+    dpi: int,
+) -> ValidationResult:
+    """Replay *record*, render it and compare against *original* pixels.
+
+    The replay is an Agg figure outside pyplot, so this is safe to run
+    in a worker thread.
+    """
+    from ._reproducer import reproduce_from_record
+    from ._utils._image_diff import compare_arrays
+    from .styles._kwargs_converter import to_subplots_kwargs
+    from .styles._style_applier import finalize_special_plots, finalize_ticks
+
+    reproduced_fig, _ = reproduce_from_record(record, use_pyplot=False)
+    mpl_fig = reproduced_fig.fig if hasattr(reproduced_fig, "fig") else reproduced_fig
+
+    # Same finalization save_figure() applied to the original
+    style_dict = to_subplots_kwargs()
+    for ax in mpl_fig.get_axes():
+        finalize_ticks(ax)
+        finalize_special_plots(ax, style_dict)
+    # Layout engines (constrained_layout) refine positions on every
+    # draw; the original was already drawn when saved, so settle the
+    # replay with one extra cheap draw before comparing
+    if mpl_fig.get_layout_engine() is not None:
+        render_for_validation(mpl_fig, dpi)
+    reproduced = render_for_validation(mpl_fig, dpi)
+
+    diff = compare_arrays(original, reproduced, mse_threshold=mse_threshold)
+    return _result_from_diff(diff, mse_threshold)
+
+
+def validate_record(
+    fig,
+    record=None,
+    mse_threshold: float = 100.0,
+    dpi: int = FAST_VALIDATION_DPI,
+    original: Optional[np.ndarray] = None,
+) -> ValidationResult:
+    """Validate reproducibility by replaying the in-memory record.
+
+    Faster than :func:`validate_recipe`: the recipe is not re-read from
+    disk, figures are rendered straight to pixel buffers (the original
+    not at all when its save render is passed as *original*), and the
+    integer diff stops as soon as the MSE threshold is exceeded.
+    YAML/data-file round-tripping is not exercised.
+
+    Parameters
+    ----------
+    fig : RecordingFigure
+        The original figure.
+    record : FigureRecord, optional
+        Record to replay (default: a snapshot of ``fig.record``).
+    mse_threshold : float
+        Maximum acceptable MSE for validation to pass (default: 100).
+    dpi : int
+        DPI for comparison renders (default: 72).
+    original : np.ndarray, optional
+        (H, W, 3) uint8 uncropped render of *fig* at *dpi*, e.g. the
+        pixels already rendered for saving. Rendered here if omitted.
+
+    Returns
+    -------
+    ValidationResult
+        Comparison results (``file_size_diff`` is always 0).
+    """
+    if record is None:
+        record = snapshot_record(fig.record)
+    if original is None:
+        original = render_for_validation(fig, dpi)
+    return _replay_and_compare(original, record, mse_threshold, dpi)
+
+
+def validate_record_async(
+    fig,
+    record=None,
+    mse_threshold: float = 100.0,
+    dpi: int = FAST_VALIDATION_DPI,
+    callback: Optional[Callable[[ValidationResult], ValidationResult]] = None,
+    original: Optional[np.ndarray] = None,
+) -> "Future[ValidationResult]":
+    """Run :func:`validate_record` in a background worker.
+
+    The original figure is rendered (unless *original* is given) before
+    returning, so it may be modified or closed right away. Replay and
+    comparison happen in the worker on an Agg figure that pyplot does
+    not manage, whatever the active backend.
+
+    Parameters
+    ----------
+    fig : RecordingFigure
+        The original figure.
+    record : FigureRecord, optional
+        Record to replay (default: a snapshot of ``fig.record``).
+    mse_threshold : float
+        Maximum acceptable MSE for validation to pass (default: 100).
+    dpi : int
+        DPI for comparison renders (default: 72).
+    callback : callable, optional
+        Applied to the ValidationResult in the worker; its return value
+        (or exception) becomes the future's outcome.
+    original : np.ndarray, optional
+        Uncropped render of *fig* at *dpi* (see :func:`validate_record`).
+
+    Returns
+    -------
+    concurrent.futures.Future
+        Resolves to the ValidationResult.
+    """
+    global _executor
+
+    if record is None:
+        record = snapshot_record(fig.record)
+    if original is None:
+        original = render_for_validation(fig, dpi)
+
+    def _job() -> ValidationResult:
+        result = _replay_and_compare(original, record, mse_threshold, dpi)
+        return callback(result) if callback is not None else result
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="figrecipe-validate"
         )
+    return _executor.submit(_job)
 
 
 def validate_on_save(
     fig,
     recipe_path: Union[str, Path],
     mse_threshold: float = 100.0,
-    dpi: int = 150,
+    dpi: Optional[int] = None,
     raise_on_failure: bool = False,
-) -> Optional[ValidationResult]:
+    mode: str = "full",
+    record=None,
+    original: Optional[np.ndarray] = None,
+) -> Union[ValidationResult, "Future[ValidationResult]"]:
     """Validate recipe immediately after saving.
 
     Parameters
@@ -178,24 +382,57 @@ def validate_on_save(
         Path where recipe was saved.
     mse_threshold : float
         Maximum acceptable MSE.
-    dpi : int
-        DPI for comparison.
+    dpi : int, optional
+        DPI for comparison (default: 150 for 'full', 72 otherwise).
     raise_on_failure : bool
-        If True, raise ValueError when validation fails.
+        If True, raise ValueError when validation fails (for 'async',
+        the future raises it instead).
+    mode : str
+        'full' (default): reload the recipe from disk, reproduce and
+        compare saved images. 'fast': replay the in-memory record and
+        compare pixel buffers (see :func:`validate_record`). 'async':
+        like 'fast' but in a background worker; returns a Future.
+    record : FigureRecord, optional
+        Record to replay for 'fast'/'async', taken before the recipe was
+        saved (see :func:`snapshot_record`).
+    original : np.ndarray, optional
+        Uncropped save render of *fig* at *dpi* for 'fast'/'async', so the
+        original is not rendered again.
 
     Returns
     -------
-    ValidationResult
-        Validation results.
+    ValidationResult or concurrent.futures.Future
+        Validation results (a Future of them for mode='async').
 
     Raises
     ------
     ValueError
-        If raise_on_failure=True and validation fails.
+        If raise_on_failure=True and validation fails, or mode is unknown.
     """
-    result = validate_recipe(fig, recipe_path, mse_threshold, dpi)
+    if mode not in VALIDATION_MODES:
+        raise ValueError(
+            f"Unknown validation mode: {mode!r}. Expected one of {VALIDATION_MODES}"
+        )
+
+    def _check(result: ValidationResult) -> ValidationResult:
+        if raise_on_failure and not result.valid:
+            raise ValueError(f"Recipe validation failed: {result.message}")
+        return result
 
-    if raise_on_failure and not result.valid:
-        raise ValueError(f"Recipe validation failed: {result.message}")
+    if mode == "async":
+        return validate_record_async(
+            fig,
+            record,
+            mse_threshold,
+            dpi or FAST_VALIDATION_DPI,
+            callback=_check,
+            original=original,
+        )
+    if mode == "fast":
+        result = validate_record(
+            fig, record, mse_threshold, dpi or FAST_VALIDATION_DPI, original
+        )
+    else:
+        result = validate_recipe(fig, recipe_path, mse_threshold, dpi or 150)
 
-    return result
+    return _check(result)
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 import numpy as np
 from matplotlib.axes import Axes
 
+from .._params import DECORATION_METHODS, PLOTTING_METHODS
 from ._axes_diagram import DiagramMixin
 from ._axes_methods import RecordingAxesMethods
 from ._axes_scitex import SciTexMixin
@@ -15,6 +16,16 @@ from ._axes_style_mixin import AxesStyleMixin
 if TYPE_CHECKING:
     from .._recorder import Recorder
 
+# Methods recorded through the generic recording wrapper
+_RECORDED_METHODS = frozenset(PLOTTING_METHODS | DECORATION_METHODS)
+
+# Methods routed to a dedicated wrapper factory instead
+_CUSTOM_WRAPPERS = {
+    "bar": "_create_bar_wrapper",
+    "legend": "_create_legend_wrapper",
+    "stem": "_create_stem_wrapper",
+}
+
 
 class RecordingAxes(RecordingAxesMethods, AxesStyleMixin, SciTexMixin, DiagramMixin):
     """Wrapper around matplotlib Axes that records all calls.
@@ -68,33 +79,29 @@ class RecordingAxes(RecordingAxesMethods, AxesStyleMixin, SciTexMixin, DiagramMi
         return self._position
 
     def __getattr__(self, name: str) -> Any:
-        """Intercept attribute access to wrap methods."""
+        """Intercept attribute access to wrap methods.
+
+        Wrappers are built once per axes and stored in the instance
+        ``__dict__``, so later accesses bypass ``__getattr__`` entirely.
+        """
         attr = getattr(self._ax, name)
+        if not callable(attr):
+            return attr
 
         # Use custom wrappers for methods with special styling
-        if callable(attr) and name == "bar":
-            return self._create_bar_wrapper()
-
-        # Route boxplot to wrapper that sets patch_artist=True
-        if callable(attr) and name == "boxplot":
-            return self._create_boxplot_wrapper()
-
-        # Route legend to wrapper that applies frame styling
-        if callable(attr) and name == "legend":
-            return self._create_legend_wrapper()
-
-        # Route stem to wrapper that handles color kwarg
-        if callable(attr) and name == "stem":
-            return self._create_stem_wrapper()
-
+        # (bar, legend, stem)
+        factory = _CUSTOM_WRAPPERS.get(name)
+        if factory is not None:
+            wrapper = getattr(self, factory)()
         # If it's a plotting or decoration method, wrap it
-        if callable(attr) and name in (
-            self._recorder.PLOTTING_METHODS | self._recorder.DECORATION_METHODS
-        ):
-            return self._create_recording_wrapper(name, attr)
+        elif name in _RECORDED_METHODS:
+            wrapper = self._create_recording_wrapper(name, attr)
+        else:
+            # For other methods, return as-is
+            return attr
 
-        # For other methods/attributes, return as-is
-        return attr
+        self.__dict__[name] = wrapper
+        return wrapper
 
     def __dir__(self):
         """Return list of attributes for tab completion.
@@ -106,15 +113,14 @@ class RecordingAxes(RecordingAxesMethods, AxesStyleMixin, SciTexMixin, DiagramMi
         base_attrs = [a for a in super().__dir__() if not a.startswith("_")]
 
         # Add all matplotlib plotting methods
-        from .._params import DECORATION_METHODS, PLOTTING_METHODS
-
-        matplotlib_methods = sorted(PLOTTING_METHODS | DECORATION_METHODS)
+        matplotlib_methods = sorted(_RECORDED_METHODS)
 
         # Combine and deduplicate
         return sorted(set(base_attrs + matplotlib_methods))
 
     def _create_recording_wrapper(self, method_name: str, method: callable):
         """Create a wrapper function that records the call."""
+        from ..styles._internal import resolve_colors_in_kwargs
         from ._axes_helpers import (
             inject_clip_on_from_style,
             inject_method_defaults,
@@ -128,8 +134,6 @@ class RecordingAxes(RecordingAxesMethods, AxesStyleMixin, SciTexMixin, DiagramMi
             stats: Optional[Dict[str, Any]] = None,
             **kwargs,
         ):
-            from ..styles._internal import resolve_colors_in_kwargs
-
             kwargs = resolve_colors_in_kwargs(kwargs)
             kwargs = inject_clip_on_from_style(kwargs, method_name)
             kwargs = inject_method_defaults(kwargs, method_name)
@@ -181,33 +185,6 @@ class RecordingAxes(RecordingAxesMethods, AxesStyleMixin, SciTexMixin, DiagramMi
 
         return wrapper
 
-    def _create_boxplot_wrapper(self):
-        """Create wrapper for boxplot() with patch_artist=True default."""
-        from ._boxplot import boxplot_plot
-
-        def wrapper(
-            *args,
-            id: Optional[str] = None,
-            track: bool = True,
-            **kwargs,
-        ):
-            # Handle positional x argument
-            x = args[0] if args else kwargs.pop("x", None)
-            if x is None:
-                raise ValueError("boxplot requires data argument")
-
-            return boxplot_plot(
-                self._ax,
-                x,
-                self._recorder,
-                self._position,
-                track=self._track and track,
-                call_id=id,
-                **kwargs,
-            )
-
-        return wrapper
-
     def _create_stem_wrapper(self):
         """Create wrapper for stem() that accepts color kwarg."""
         original_stem = self._ax.stem
@@ -4,6 +4,8 @@
 
 from typing import Any, Dict, Optional
 
+from ..styles import _style_loader
+
 # Methods that support clip_on parameter (plotting methods, not decoration methods)
 CLIP_ON_SUPPORTED_METHODS = {
     "plot",
@@ -67,14 +69,13 @@ def inject_clip_on_from_style(kwargs: dict, method_name: str = None) -> dict:
     dict
         Updated kwargs with clip_on=False if applicable.
     """
-    from ..styles._style_loader import _STYLE_CACHE
-
     # Only inject for methods that support clip_on
     if method_name is not None and method_name not in CLIP_ON_SUPPORTED_METHODS:
         return kwargs
 
-    if "clip_on" not in kwargs and _STYLE_CACHE is not None:
-        behavior = _STYLE_CACHE.get("behavior", {})
+    style_cache = _style_loader._STYLE_CACHE
+    if "clip_on" not in kwargs and style_cache is not None:
+        behavior = style_cache.get("behavior", {})
         if behavior.get("clip_on") is False:
             kwargs["clip_on"] = False
     return kwargs
@@ -95,13 +96,12 @@ def inject_method_defaults(kwargs: dict, method_name: str) -> dict:
     dict
         Updated kwargs with style defaults applied.
     """
-    from ..styles._style_loader import _STYLE_CACHE
-
-    if _STYLE_CACHE is None:
+    style_cache = _style_loader._STYLE_CACHE
+    if style_cache is None:
         return kwargs
 
     if method_name == "fill_between" or method_name == "fill_betweenx":
-        fb_style = _STYLE_CACHE.get("fill_between", {})
+        fb_style = style_cache.get("fill_between", {})
         if "edgecolor" not in kwargs:
             edgecolor = fb_style.get("edgecolor", "none")
             kwargs["edgecolor"] = edgecolor
@@ -111,7 +111,7 @@ def inject_method_defaults(kwargs: dict, method_name: str) -> dict:
                 kwargs["alpha"] = alpha
 
     elif method_name == "eventplot":
-        ep_style = _STYLE_CACHE.get("eventplot", {})
+        ep_style = style_cache.get("eventplot", {})
         from .._utils._units import mm_to_pt
 
         if "linewidths" not in kwargs:
@@ -407,11 +407,12 @@ class RecordingFigure:
         fname,
         save_recipe: bool = True,
         include_data: bool = True,
-        data_format: Literal["csv", "npz", "inline"] = "csv",
+        data_format: Literal["csv", "npz", "inline", "parquet", "arrow"] = "csv",
         csv_format: Literal["single", "separate"] = "separate",
         validate: bool = True,
         validate_mse_threshold: float = 100.0,
         validate_error_level: str = "error",
+        validate_mode: Literal["full", "fast", "async"] = "full",
         verbose: bool = True,
         dpi: Optional[int] = None,
         image_format: Optional[str] = None,
@@ -446,6 +447,7 @@ class RecordingFigure:
             validate=validate,
             validate_mse_threshold=validate_mse_threshold,
             validate_error_level=validate_error_level,
+            validate_mode=validate_mode,
             verbose=verbose,
             dpi=dpi,
             image_format=image_format,
@@ -516,7 +518,7 @@ class RecordingFigure:
         self,
         path: Union[str, Path],
         include_data: bool = True,
-        data_format: Literal["csv", "npz", "inline"] = "csv",
+        data_format: Literal["csv", "npz", "inline", "parquet", "arrow"] = "csv",
         csv_format: Literal["single", "separate"] = "separate",
     ) -> Path:
         """Save the recording recipe to YAML.
@@ -528,7 +530,8 @@ class RecordingFigure:
         include_data : bool
             If True, save array data alongside recipe.
         data_format : str
-            Format for data files: 'csv' (default), 'npz', or 'inline'.
+            Format for data files: 'csv' (default), 'npz', 'parquet', 'arrow',
+            or 'inline'.
         csv_format : str
             CSV structure: 'separate' (default) or 'single' (scitex-compatible).
         """
@@ -19,6 +19,7 @@ def create_recording_subplots(
     ncols: int = 1,
     recorder: Optional["Recorder"] = None,
     panel_labels: bool = False,
+    snapshot_arrays: bool = False,
     **kwargs,
 ) -> Tuple[RecordingFigure, Union[RecordingAxes, NDArray]]:
     """Create a figure with recording-enabled axes.
@@ -34,6 +35,9 @@ def create_recording_subplots(
     panel_labels : bool
         If True and figure has multiple panels, automatically add
         panel labels (A, B, C, D, ...). Default is False.
+    snapshot_arrays : bool
+        If True, copy array arguments when they are recorded instead of
+        keeping read-only views. Ignored if *recorder* is given.
     **kwargs
         Passed to plt.subplots().
 
@@ -51,7 +55,7 @@ def create_recording_subplots(
     from .._recorder import Recorder
 
     if recorder is None:
-        recorder = Recorder()
+        recorder = Recorder(snapshot_arrays=snapshot_arrays)
 
     # Create matplotlib figure
     import matplotlib.pyplot as plt
@@ -36,6 +36,7 @@ from ._integrations import (
 from ._recorder import CallRecord, FigureRecord
 from ._reproducer import get_recipe_info
 from ._serializer import load_recipe
+from ._utils._lazy_array import LazyArray
 from ._utils._numpy_io import CsvFormat, DataFormat, load_array, save_array
 from ._utils._units import (
     inch_to_mm,
@@ -63,6 +64,7 @@ __all__ = [
     # Data I/O
     "CsvFormat",
     "DataFormat",
+    "LazyArray",
     "load_array",
     "save_array",
     # Record types
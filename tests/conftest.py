@@ -1,6 +1,7 @@
 """Root conftest for figrecipe tests."""
 
 import gc
+import os
 
 import matplotlib
 import matplotlib.pyplot as plt
@@ -9,6 +10,32 @@ import pytest
 matplotlib.use("Agg")
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_render_cache(tmp_path_factory):
+    """Keep the render cache used by CLI/MCP tests out of the user's home."""
+    old = os.environ.get("FIGRECIPE_CACHE_DIR")
+    os.environ["FIGRECIPE_CACHE_DIR"] = str(tmp_path_factory.mktemp("render_cache"))
+    yield
+    if old is None:
+        os.environ.pop("FIGRECIPE_CACHE_DIR", None)
+    else:
+        os.environ["FIGRECIPE_CACHE_DIR"] = old
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_signature_table(tmp_path_factory):
+    """Keep the generated signature table out of the user's home."""
+    old = os.environ.get("FIGRECIPE_SIGNATURE_DIR")
+    os.environ["FIGRECIPE_SIGNATURE_DIR"] = str(
+        tmp_path_factory.mktemp("signature_table")
+    )
+    yield
+    if old is None:
+        os.environ.pop("FIGRECIPE_SIGNATURE_DIR", None)
+    else:
+        os.environ["FIGRECIPE_SIGNATURE_DIR"] = old
+
+
 @pytest.fixture(autouse=True)
 def _close_figures():
     """Close all matplotlib figures after each test to prevent memory leaks."""
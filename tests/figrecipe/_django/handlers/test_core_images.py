@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for binary image endpoints of the editor."""
+
+import base64
+import json
+
+import matplotlib
+import pytest
+
+matplotlib.use("Agg")
+
+django = pytest.importorskip("django")
+pytest.importorskip("scitex_app")
+
+from django.conf import settings  # noqa: E402
+
+if not settings.configured:
+    settings.configure(DEFAULT_CHARSET="utf-8", ALLOWED_HOSTS=["*"])
+    django.setup()
+
+from django.test import RequestFactory  # noqa: E402
+
+import figrecipe as fr  # noqa: E402
+from figrecipe._django.handlers.core import (  # noqa: E402
+    handle_hitmap,
+    handle_image,
+    handle_preview,
+    handle_update,
+)
+from figrecipe._django.services import EditorState  # noqa: E402
+
+
+@pytest.fixture
+def editor():
+    fig, ax = fr.subplots()
+    ax.plot([0, 1, 2], [0, 1, 4], id="line")
+    return EditorState(fig=fig)
+
+
+@pytest.fixture
+def rf():
+    return RequestFactory()
+
+
+class TestImageMetadata:
+    """JSON responses reference images by URL."""
+
+    def test_url_mode_omits_base64(self, rf, editor):
+        response = handle_preview(rf.get("/preview", {"image": "url"}), editor)
+        data = json.loads(response.content)
+        assert "image" not in data
+        assert data["image_url"] == f"image/preview/{data['image_etag']}"
+        assert "bboxes" in data
+
+    def test_default_mode_keeps_base64(self, rf, editor):
+        data = json.loads(handle_preview(rf.get("/preview"), editor).content)
+        etag, png_bytes = editor._images["preview"]
+        assert base64.b64decode(data["image"]) == png_bytes
+        assert data["image_etag"] == etag
+
+    def test_update_url_mode_from_body(self, rf, editor):
+        request = rf.post(
+            "/update",
+            data=json.dumps({"overrides": {}, "image": "url"}),
+            content_type="application/json",
+        )
+        data = json.loads(handle_update(request, editor).content)
+        assert "image" not in data
+        assert data["image_etag"] == editor._images["preview"][0]
+
+    def test_recipe_carried_in_url(self, rf, editor):
+        request = rf.get("/hitmap", {"image": "url", "recipe": "a b.yaml"})
+        data = json.loads(handle_hitmap(request, editor).content)
+        assert data["image_url"].endswith("?recipe=a%20b.yaml")
+        assert "color_map" in data
+
+
+class TestImageEndpoint:
+    """Raw PNG bytes with ETag revalidation."""
+
+    def test_serves_png_bytes(self, rf, editor):
+        handle_preview(rf.get("/preview"), editor)
+        etag, png_bytes = editor._images["preview"]
+        response = handle_image(rf.get("/"), editor, "preview", etag)
+        assert response.status_code == 200
+        assert response["Content-Type"] == "image/png"
+        assert response.content == png_bytes
+        assert response["ETag"] == f'"{etag}"'
+        assert "immutable" in response["Cache-Control"]
+
+    def test_not_modified(self, rf, editor):
+        handle_preview(rf.get("/preview"), editor)
+        etag, _ = editor._images["preview"]
+        request = rf.get("/", HTTP_IF_NONE_MATCH=f'"{etag}"')
+        response = handle_image(request, editor, "preview")
+        assert response.status_code == 304
+        assert response["Cache-Control"] == "no-cache"
+
+    def test_stale_version(self, rf, editor):
+        handle_preview(rf.get("/preview"), editor)
+        response = handle_image(rf.get("/"), editor, "preview", "0" * 16)
+        assert response.status_code == 404
+
+    def test_hitmap_generated_on_demand(self, rf, editor):
+        response = handle_image(rf.get("/"), editor, "hitmap")
+        assert response.status_code == 200
+        assert response.content.startswith(b"\x89PNG")
+
+    def test_unknown_kind(self, rf, editor):
+        assert handle_image(rf.get("/"), editor, "other").status_code == 404
+
+
+class TestDraftRender:
+    """Draft renders do not change the hitmap size."""
+
+    def test_hitmap_keeps_full_size(self, rf, editor):
+        from figrecipe._django._coalesce import get_coalescer
+
+        full = json.loads(handle_preview(rf.get("/preview"), editor).content)
+        request = rf.post(
+            "/update",
+            data=json.dumps({"overrides": {}, "draft": True}),
+            content_type="application/json",
+        )
+        draft = json.loads(handle_update(request, editor).content)
+        get_coalescer(editor).cancel()
+
+        assert draft["draft"]
+        assert draft["img_size"]["width"] < full["img_size"]["width"]
+        width, height = editor._main_img_size
+        assert {"width": width, "height": height} == full["img_size"]
+
+
+# EOF
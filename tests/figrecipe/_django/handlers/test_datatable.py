@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the editor's datatable endpoints."""
+
+import json
+
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use("Agg")
+
+django = pytest.importorskip("django")
+
+from django.conf import settings  # noqa: E402
+
+if not settings.configured:
+    settings.configure(DEFAULT_CHARSET="utf-8", ALLOWED_HOSTS=["*"])
+    django.setup()
+
+from django.test import RequestFactory  # noqa: E402
+
+import figrecipe as fr  # noqa: E402
+from figrecipe._django.handlers.datatable import (  # noqa: E402
+    _editor_columns,
+    handle_datatable_data,
+)
+from figrecipe._django.services import EditorState  # noqa: E402
+from figrecipe._editor import _datatable_columns  # noqa: E402
+
+
+class TestDatatableData:
+    """GET /datatable/data builds rows from the recorded calls."""
+
+    def test_array_kwargs(self):
+        fig, ax = fr.subplots()
+        x = np.array([0.0, 1.0, 2.0])
+        ax.scatter(x=x, y=x * 2, id="s")
+        editor = EditorState(fig=fig)
+        request = RequestFactory().get("/datatable/data")
+
+        payload = json.loads(handle_datatable_data(request, editor).content)
+        assert payload["columns"] == ["s_x", "s_y"]
+        assert payload["data"][2] == {"s_x": 2.0, "s_y": 4.0}
+
+
+class TestEditorColumnCache:
+    """Columns are rebuilt only when the recorded data changes."""
+
+    def test_cached_per_editor(self, monkeypatch):
+        fig, ax = fr.subplots()
+        ax.plot([0, 1, 2], [1, 2, 3], id="line")
+        editor = EditorState(fig=fig)
+        calls = []
+        build = _datatable_columns.record_columns
+        monkeypatch.setattr(
+            _datatable_columns,
+            "record_columns",
+            lambda record: calls.append(1) or build(record),
+        )
+
+        first = _editor_columns(editor, fig.record)
+        assert _editor_columns(editor, fig.record) is first
+        assert len(calls) == 1
+        ax.plot([0, 1], [3, 4], id="more")
+        assert len(_editor_columns(editor, fig.record)) > len(first)
+        assert len(calls) == 2
+
+
+# EOF
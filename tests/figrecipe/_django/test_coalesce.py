@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for coalescing of editor update renders."""
+
+import threading
+import time
+
+import pytest
+
+from figrecipe._django._coalesce import RenderCoalescer
+from figrecipe._django.services import _EditorLock
+
+
+class _Editor:
+    """Counts renders and the state each one saw."""
+
+    def __init__(self, block=False):
+        self.value = 0
+        self.rendered = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def render(self, draft):
+        self.started.set()
+        self.release.wait(5)
+        self.rendered.append((self.value, draft))
+        return (self.value, draft)
+
+
+def _coalescer(settle_delay=60.0):
+    return RenderCoalescer(_EditorLock(), settle_delay=settle_delay)
+
+
+class TestCoalescing:
+    """Renders are shared by requests that arrive while one runs."""
+
+    def test_sequential_requests_each_render(self):
+        editor, queue = _Editor(), _coalescer()
+        for i in range(3):
+            frame = queue.submit(
+                lambda i=i: setattr(editor, "value", i), editor.render
+            )
+            assert frame == (i, False)
+        assert queue.renders == 3
+
+    def test_burst_served_by_one_render(self):
+        editor, queue = _Editor(block=True), _coalescer()
+        results = {}
+
+        def request(i):
+            results[i] = queue.submit(
+                lambda: setattr(editor, "value", i), editor.render
+            )
+
+        first = threading.Thread(target=request, args=(0,))
+        first.start()
+        assert editor.started.wait(5)
+        burst = [threading.Thread(target=request, args=(i,)) for i in range(1, 6)]
+        for t in burst:
+            t.start()
+        time.sleep(0.1)
+        editor.release.set()
+        for t in [first, *burst]:
+            t.join(5)
+
+        assert queue.renders == 2
+        latest = editor.rendered[-1]
+        assert all(results[i] == latest for i in range(1, 6))
+        assert queue.coalesced == 4
+
+    def test_apply_runs_under_lock(self):
+        editor, queue = _Editor(), _coalescer()
+        held = []
+        queue.submit(
+            lambda: held.append(queue.lock.held_by_current_thread()), editor.render
+        )
+        assert held == [True]
+
+    def test_burst_applied_by_next_render(self):
+        editor, queue = _Editor(block=True), _coalescer()
+        applied = []
+
+        def request(i):
+            queue.submit(lambda: applied.append(i), editor.render)
+
+        first = threading.Thread(target=request, args=(0,))
+        first.start()
+        assert editor.started.wait(5)
+        burst = [threading.Thread(target=request, args=(i,)) for i in range(1, 4)]
+        for t in burst:
+            t.start()
+            time.sleep(0.02)
+        # Queued while the figure is being rendered
+        assert applied == [0]
+        editor.release.set()
+        for t in [first, *burst]:
+            t.join(5)
+        assert applied == [0, 1, 2, 3]
+
+    def test_apply_error_raised_in_its_request(self):
+        editor, queue = _Editor(), _coalescer()
+
+        def fail():
+            raise ValueError("bad override")
+
+        with pytest.raises(ValueError, match="bad override"):
+            queue.submit(fail, editor.render)
+        assert queue.submit(None, editor.render) == (0, False)
+
+    def test_full_render_serves_drafts(self):
+        editor, queue = _Editor(), _coalescer()
+        queue.submit(None, editor.render)
+        assert queue._result_for(1, draft=True) == (True, (0, False))
+
+
+class TestDraftSettle:
+    """Drafts are followed by one full-DPI render."""
+
+    def test_settle_after_drafts(self):
+        editor, queue = _Editor(), _coalescer(settle_delay=0.05)
+        for i in range(3):
+            frame = queue.submit(
+                lambda i=i: setattr(editor, "value", i), editor.render, draft=True
+            )
+            assert frame == (i, True)
+        time.sleep(0.3)
+        assert editor.rendered[-1] == (2, False)
+        assert [d for _, d in editor.rendered].count(False) == 1
+
+    def test_no_settle_when_already_full(self):
+        editor, queue = _Editor(), _coalescer(settle_delay=0.05)
+        queue.submit(None, editor.render, draft=True)
+        queue.submit(None, editor.render)
+        time.sleep(0.3)
+        assert [d for _, d in editor.rendered] == [True, False]
+
+    def test_cancel(self):
+        editor, queue = _Editor(), _coalescer(settle_delay=0.05)
+        queue.submit(None, editor.render, draft=True)
+        queue.cancel()
+        time.sleep(0.2)
+        assert [d for _, d in editor.rendered] == [True]
+
+
+# EOF
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the memory-bounded editor cache."""
+
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use("Agg")
+
+pytest.importorskip("django")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+import figrecipe as fr  # noqa: E402
+from figrecipe._django import services  # noqa: E402
+from figrecipe._django.services import EditorState  # noqa: E402
+
+
+def _editor(n_points=10):
+    fig, ax = fr.subplots()
+    ax.plot(np.arange(n_points), np.arange(n_points), id="line")
+    return EditorState(fig=fig)
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    """Start from an empty cache; editors are created without recipes."""
+    services.evict_all_editors(persist=False)
+    stats = dict.fromkeys(services._cache_stats, 0)
+    monkeypatch.setattr(services, "_cache_stats", stats)
+    monkeypatch.setattr(services, "_create_editor", lambda *args: _editor())
+    yield
+    services.evict_all_editors(persist=False)
+    plt.close("all")
+
+
+def _budget(monkeypatch, n_editors):
+    size = services.estimate_editor_bytes(_editor())
+    monkeypatch.setattr(services, "_CACHE_MAX_BYTES", int(size * (n_editors + 0.5)))
+
+
+class TestEstimate:
+    """Estimated bytes follow data and stored images."""
+
+    def test_grows_with_data(self):
+        small = services.estimate_editor_bytes(_editor(10))
+        large = services.estimate_editor_bytes(_editor(100_000))
+        assert large - small >= 100_000 * 16
+
+    def test_counts_images(self):
+        editor = _editor()
+        before = services.estimate_editor_bytes(editor)
+        editor._images["preview"] = ("etag", b"x" * 50_000)
+        assert services.estimate_editor_bytes(editor) == before + 50_000
+
+
+class TestEviction:
+    """Least recently used editors are evicted beyond the budget."""
+
+    def test_lru_order(self, monkeypatch):
+        _budget(monkeypatch, 2)
+        a = services.get_or_create_editor("a", "a.yaml")
+        services.get_or_create_editor("b", "b.yaml")
+        services.get_or_create_editor("a", "a.yaml")
+        services.get_or_create_editor("c", "c.yaml")
+        assert list(services._editor_cache) == ["a", "c"]
+        assert services.get_or_create_editor("a", "a.yaml") is a
+
+    def test_figure_closed(self, monkeypatch):
+        _budget(monkeypatch, 1)
+        a = services.get_or_create_editor("a", "a.yaml")
+        services.get_or_create_editor("b", "b.yaml")
+        assert "a" not in services._editor_cache
+        assert not plt.fignum_exists(a.fig.fig.number)
+
+    def test_current_editor_kept(self, monkeypatch):
+        monkeypatch.setattr(services, "_CACHE_MAX_BYTES", 1)
+        services.get_or_create_editor("a", "a.yaml")
+        assert list(services._editor_cache) == ["a"]
+
+    def test_busy_editor_skipped(self, monkeypatch):
+        import threading
+
+        _budget(monkeypatch, 2)
+        a = services.get_or_create_editor("a", "a.yaml")
+        services.get_or_create_editor("b", "b.yaml")
+        held, release = threading.Event(), threading.Event()
+
+        def handler():
+            with a._lock:
+                held.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=handler)
+        thread.start()
+        held.wait(5)
+        try:
+            services.get_or_create_editor("c", "c.yaml")
+            assert list(services._editor_cache) == ["a", "c"]
+            assert plt.fignum_exists(a.fig.fig.number)
+        finally:
+            release.set()
+            thread.join()
+
+    def test_editor_held_by_caller_skipped(self, monkeypatch):
+        _budget(monkeypatch, 1)
+        a = services.get_or_create_editor("a", "a.yaml")
+        with a._lock:
+            services.get_or_create_editor("b", "b.yaml")
+        assert "a" in services._editor_cache
+
+    def test_concurrent_create_keeps_one(self, monkeypatch):
+        import threading
+
+        barrier = threading.Barrier(2)
+        created = []
+
+        def create(*args):
+            editor = _editor()
+            created.append(editor)
+            barrier.wait(5)
+            return editor
+
+        monkeypatch.setattr(services, "_create_editor", create)
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    services.get_or_create_editor("a", "a.yaml")
+                )
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert results[0] is results[1] is services._editor_cache["a"][0]
+        loser = next(e for e in created if e is not results[0])
+        assert not plt.fignum_exists(loser.fig.fig.number)
+        assert plt.fignum_exists(results[0].fig.fig.number)
+
+    def test_evict_waits_for_handler(self):
+        import threading
+
+        a = services.get_or_create_editor("a", "a.yaml")
+        events = []
+        with a._lock:
+            thread = threading.Thread(target=services.evict_editor, args=("a",))
+            thread.start()
+            thread.join(0.2)
+            events.append(plt.fignum_exists(a.fig.fig.number))
+        thread.join()
+        assert events == [True]
+        assert not plt.fignum_exists(a.fig.fig.number)
+
+
+class TestStats:
+    """Stats report size, budget and hit rate."""
+
+    def test_hit_rate(self):
+        services.get_or_create_editor("a", "a.yaml")
+        services.get_or_create_editor("a", "a.yaml")
+        services.get_or_create_editor("a", "a.yaml")
+        services.get_or_create_editor("b", "b.yaml")
+        stats = services.get_cache_stats()
+        assert stats["entries"] == 2
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == pytest.approx(0.5)
+        assert stats["bytes"] == sum(e["bytes"] for e in stats["editors"])
+        assert stats["max_bytes"] == services._CACHE_MAX_BYTES
+
+
+# EOF
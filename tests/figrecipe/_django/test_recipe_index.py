@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the persistent recipe file index."""
+
+import os
+
+import pytest
+
+from figrecipe._django._recipe_index import RecipeIndex
+
+RECIPE = """figrecipe: '1.0'
+id: fig_1234abcd
+figure:
+  figsize: [4, 3]
+axes:
+  ax_0_0:
+    calls: []
+  ax_0_1:
+    calls: []
+metadata:
+  ax_9_9: not an axes
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "project"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.yaml").write_text(RECIPE)
+    (root / "a.png").write_bytes(b"png")
+    (root / "sub" / "b.yaml").write_text(RECIPE)
+    (root / "config.yaml").write_text("name: not a recipe\n")
+    (root / "a.overrides.yaml").write_text(RECIPE)
+    (root / ".hidden").mkdir()
+    (root / ".hidden" / "c.yaml").write_text(RECIPE)
+    return root
+
+
+def _index(root, tmp_path):
+    return RecipeIndex(root, index_path=tmp_path / "index.json")
+
+
+class TestRecipeIndex:
+    """Entries are built once and refreshed only for changed files."""
+
+    def test_entries(self, tree, tmp_path):
+        entries = _index(tree, tmp_path).scan()
+        assert set(entries) == {"a.yaml", "sub/b.yaml", "config.yaml"}
+        a = entries["a.yaml"]
+        assert a["is_recipe"] and a["image"] == "a.png"
+        assert a["figure_id"] == "fig_1234abcd"
+        assert a["n_axes"] == 2
+        assert entries["sub/b.yaml"]["image"] is None
+        assert not entries["config.yaml"]["is_recipe"]
+
+    def test_unchanged_not_reread(self, tree, tmp_path, monkeypatch):
+        index = _index(tree, tmp_path)
+        index.scan()
+
+        from figrecipe._django import _recipe_index
+
+        monkeypatch.setattr(_recipe_index, "_read_recipe_info", pytest.fail)
+        index.scan()
+        assert index.last_changed == 0
+
+    def test_modified_added_deleted(self, tree, tmp_path):
+        index = _index(tree, tmp_path)
+        index.scan()
+        (tree / "config.yaml").write_text(RECIPE)
+        st = (tree / "config.yaml").stat()
+        os.utime(tree / "config.yaml", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        (tree / "sub" / "b.png").write_bytes(b"png")
+        (tree / "a.yaml").unlink()
+
+        entries = index.scan()
+        assert index.last_changed == 3
+        assert entries["config.yaml"]["is_recipe"]
+        assert entries["sub/b.yaml"]["image"] == "sub/b.png"
+        assert "a.yaml" not in entries
+
+    def test_persisted(self, tree, tmp_path):
+        _index(tree, tmp_path).scan()
+        reloaded = _index(tree, tmp_path)
+        assert reloaded.get("a.yaml")["figure_id"] == "fig_1234abcd"
+        reloaded.scan()
+        assert reloaded.last_changed == 0
+
+
+class TestBoundedScan:
+    """The walk and the file reads stay bounded on large trees."""
+
+    def test_skipped_dirs(self, tree, tmp_path):
+        for name in ("venv", "build", "site-packages"):
+            (tree / name).mkdir()
+            (tree / name / "x.yaml").write_text(RECIPE)
+        entries = _index(tree, tmp_path).scan()
+        assert set(entries) == {"a.yaml", "sub/b.yaml", "config.yaml"}
+
+    def test_max_depth(self, tmp_path, monkeypatch):
+        from figrecipe._django import _recipe_index
+
+        monkeypatch.setattr(_recipe_index, "_MAX_DEPTH", 3)
+        root = tmp_path / "project"
+        (root / "a" / "b" / "c").mkdir(parents=True)
+        for rel in ("r.yaml", "a/r.yaml", "a/b/r.yaml", "a/b/c/r.yaml"):
+            (root / rel).write_text(RECIPE)
+        entries = _index(root, tmp_path).scan()
+        assert set(entries) == {"r.yaml", "a/r.yaml", "a/b/r.yaml"}
+
+    def test_home_top_level_only(self, tree, tmp_path, monkeypatch):
+        from pathlib import Path
+
+        monkeypatch.setattr(Path, "home", classmethod(lambda cls: tree))
+        entries = _index(tree, tmp_path).scan()
+        assert set(entries) == {"a.yaml", "config.yaml"}
+
+    def test_stops_after_axes(self, tmp_path):
+        from figrecipe._django._recipe_index import _read_through_axes
+
+        path = tmp_path / "big.yaml"
+        path.write_text(RECIPE + "data:\n" + "  - 1.0\n" * 100000)
+        with open(path) as f:
+            text = _read_through_axes(f)
+            assert f.tell() < 4096
+        assert text == RECIPE[: RECIPE.index("metadata:")]
+
+    def test_axes_past_header(self, tmp_path):
+        from figrecipe._django._recipe_index import _read_recipe_info
+
+        path = tmp_path / "long.yaml"
+        calls = "".join(f"  ax_0_{i}:\n    calls: []\n" for i in range(300))
+        path.write_text("id: fig_1\nfigure: {}\naxes:\n" + calls + "data: []\n")
+        info = _read_recipe_info(str(path))
+        assert info == {"is_recipe": True, "figure_id": "fig_1", "n_axes": 300}
+
+
+class TestIndexTree:
+    """api/files builds its tree from the index scan."""
+
+    def test_tree(self, tree, tmp_path):
+        django = pytest.importorskip("django")
+        from types import SimpleNamespace
+
+        from django.conf import settings
+
+        if not settings.configured:
+            settings.configure(DEFAULT_CHARSET="utf-8", ALLOWED_HOSTS=["*"])
+            django.setup()
+
+        from figrecipe._django.handlers.files import _index_tree
+
+        index = _index(tree, tmp_path)
+        index.scan()
+        editor = SimpleNamespace(recipe_path=tree / "sub" / "b.yaml")
+        items = _index_tree(index, editor)
+        assert [(x["name"], x["type"]) for x in items] == [
+            ("sub", "directory"),
+            ("a.yaml", "file"),
+        ]
+        a = items[1]
+        assert a["path"] == "a.yaml"
+        assert a["has_image"] and not a["is_current"]
+        assert a["figure_id"] == "fig_1234abcd"
+        (b,) = items[0]["children"]
+        assert b["path"] == "sub/b.yaml"
+        assert b["is_current"] and not b["has_image"]
+
+
+class TestCacheDirs:
+    """All on-disk caches share the XDG cache root."""
+
+    def test_defaults(self, tmp_path, monkeypatch):
+        from figrecipe._django._recipe_index import default_index_dir
+        from figrecipe._render_cache import default_cache_dir
+        from figrecipe._signatures._table import default_table_dir
+
+        for var in ("INDEX", "CACHE", "SIGNATURE"):
+            monkeypatch.delenv(f"FIGRECIPE_{var}_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_index_dir() == tmp_path / "figrecipe" / "index"
+        assert default_cache_dir() == tmp_path / "figrecipe" / "renders"
+        assert default_table_dir() == tmp_path / "figrecipe" / "signatures"
+
+    def test_env_override(self, tmp_path, monkeypatch):
+        from figrecipe._utils._cache_dir import user_cache_dir
+
+        monkeypatch.setenv("FIGRECIPE_TEST_DIR", str(tmp_path / "x"))
+        assert user_cache_dir("index", "FIGRECIPE_TEST_DIR") == tmp_path / "x"
+
+
+# EOF
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the editor worker pool."""
+
+import json
+
+import matplotlib
+import pytest
+
+matplotlib.use("Agg")
+
+django = pytest.importorskip("django")
+
+from django.conf import settings  # noqa: E402
+
+if not settings.configured:
+    settings.configure(DEFAULT_CHARSET="utf-8", ALLOWED_HOSTS=["*"])
+    django.setup()
+
+from django.http import HttpResponse  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+import figrecipe as fr  # noqa: E402
+from figrecipe._django import services  # noqa: E402
+from figrecipe._django._workers import (  # noqa: E402
+    EditorWorkerPool,
+    WorkerError,
+    _build_request,
+    _build_response,
+    _merge_cache_stats,
+    _serialize_request,
+    _serialize_response,
+    _Worker,
+)
+
+
+class TestTransport:
+    """Requests and responses survive the trip to a worker."""
+
+    def test_request_roundtrip(self):
+        body = json.dumps({"recipe_path": "a.yaml", "overrides": {"x": 1}})
+        request = RequestFactory().post(
+            "/api/update?image=url", data=body, content_type="application/json"
+        )
+        rebuilt = _build_request(_serialize_request(request))
+        assert rebuilt.method == "POST"
+        assert rebuilt.GET.get("image") == "url"
+        assert json.loads(rebuilt.body) == json.loads(body)
+        assert rebuilt.headers["Content-Type"] == "application/json"
+
+    def test_response_roundtrip(self):
+        response = HttpResponse(b"\x89PNG", content_type="image/png", status=200)
+        response["ETag"] = '"abc"'
+        rebuilt = _build_response(_serialize_response(response))
+        assert rebuilt.status_code == 200
+        assert rebuilt.content == b"\x89PNG"
+        assert rebuilt["Content-Type"] == "image/png"
+        assert rebuilt["ETag"] == '"abc"'
+
+
+class TestAssignment:
+    """Sessions stick to one worker and are evicted in LRU order."""
+
+    def test_affinity_and_balancing(self):
+        pool = EditorWorkerPool(2, max_sessions=4)
+        a, _ = pool._assign("a")
+        b, _ = pool._assign("b")
+        assert a != b
+        assert pool._assign("a") == (a, [])
+
+    def test_lru_eviction(self):
+        pool = EditorWorkerPool(2, max_sessions=2)
+        pool._assign("a")
+        pool._assign("b")
+        pool._assign("a")
+        index, evicted = pool._assign("c")
+        assert [key for key, _ in evicted] == ["b"]
+        assert list(pool.sessions()) == ["a", "c"]
+        assert index == dict(evicted)["b"]
+
+
+class _StuckWorker(_Worker):
+    """Worker whose process never replies."""
+
+    starts = 0
+
+    def _start(self):
+        import multiprocessing
+        from unittest import mock
+
+        self.conn, self._peer = multiprocessing.Pipe()
+        self.process = mock.Mock()
+        self.starts += 1
+
+
+class TestTimeout:
+    """A worker that stops replying is restarted instead of hanging."""
+
+    def test_stuck_worker_is_restarted(self):
+        worker = _StuckWorker(None, timeout=0.1)
+        stuck = worker.process
+        with pytest.raises(WorkerError, match="timed out"):
+            worker.call("dispatch", "preview", {})
+        stuck.kill.assert_called_once()
+        assert worker.starts == 2
+        assert worker.process is not stuck
+
+
+class TestCacheStats:
+    """cache/stats covers the caches of all workers."""
+
+    def test_merge(self):
+        def stats(worker, hits, misses, editors):
+            return {
+                "worker": worker,
+                "entries": len(editors),
+                "bytes": sum(e["bytes"] for e in editors),
+                "max_bytes": 100,
+                "hits": hits,
+                "misses": misses,
+                "evictions": 0,
+                "hit_rate": 0.0,
+                "editors": editors,
+            }
+
+        merged = _merge_cache_stats(
+            [
+                stats(0, 3, 1, [{"session_key": "a", "bytes": 10, "last_access": 2}]),
+                stats(1, 1, 3, [{"session_key": "b", "bytes": 5, "last_access": 1}]),
+            ]
+        )
+        assert merged["entries"] == 2
+        assert merged["bytes"] == 15
+        assert merged["max_bytes"] == 200
+        assert merged["hit_rate"] == 0.5
+        assert [(e["session_key"], e["worker"]) for e in merged["editors"]] == [
+            ("b", 1),
+            ("a", 0),
+        ]
+        assert [w["worker"] for w in merged["workers"]] == [0, 1]
+
+    def test_no_workers_started(self):
+        merged = EditorWorkerPool(2, max_sessions=4).cache_stats()
+        assert merged["entries"] == 0
+        assert merged["editors"] == []
+
+
+class TestEvictEditor:
+    """Evicted editors persist overrides and close their figure."""
+
+    def test_persist_and_restore(self, tmp_path):
+        import matplotlib.pyplot as plt
+
+        fig, ax = fr.subplots()
+        ax.plot([0, 1], [0, 1], id="line")
+        fr.save(fig, tmp_path / "fig.png", validate=False, verbose=False)
+        recipe = tmp_path / "fig.yaml"
+        plt.close("all")
+
+        editor = services.get_or_create_editor("k", str(recipe))
+        editor.overrides.update_manual_overrides({"fonts_axis_label_pt": 11})
+        services.evict_editor("k")
+        assert "k" not in services._editor_cache
+        assert not plt.fignum_exists(editor.fig.fig.number)
+        assert recipe.with_suffix(".overrides.json").exists()
+
+        restored = services.get_or_create_editor("k", str(recipe))
+        assert restored.overrides.manual_overrides == {"fonts_axis_label_pt": 11}
+        services.evict_editor("k", persist=False)
+
+
+# EOF
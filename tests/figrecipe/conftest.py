@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Shared fixtures for figrecipe tests."""
+
+import numpy as np
+import pytest
+
+import figrecipe as fr
+
+
+@pytest.fixture
+def three_panels():
+    """A 1x3 figure with one labelled line per axes and no layout engine.
+
+    Returns ``(fig, axes)``; used by the incremental hitmap and preview
+    tests, which redraw single axes of it.
+    """
+    fig, axes = fr.subplots(1, 3, figsize=(9, 3))
+    for i, ax in enumerate(axes.flat):
+        ax.plot(np.arange(10), np.arange(10) * (i + 1), id=f"line{i}")
+        ax.set_xlabel("x")
+    fig.fig.set_layout_engine("none")
+    return fig, axes
+
+
+# EOF
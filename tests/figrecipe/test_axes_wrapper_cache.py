@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for cached recording wrappers on RecordingAxes."""
+
+import numpy as np
+
+import figrecipe as fr
+
+
+class TestWrapperCache:
+    """Wrappers are built once per axes and reused."""
+
+    def test_same_wrapper_returned(self):
+        fig, ax = fr.subplots()
+        assert ax.plot is ax.plot
+        assert ax.set_xlabel is ax.set_xlabel
+
+    def test_custom_wrappers_cached(self):
+        fig, ax = fr.subplots()
+        for name in ("bar", "legend", "stem"):
+            assert getattr(ax, name) is getattr(ax, name)
+
+    def test_unrecorded_methods_not_cached(self):
+        fig, ax = fr.subplots()
+        ax.get_xticks()
+        assert "get_xticks" not in vars(ax)
+
+    def test_wrappers_are_per_axes(self):
+        fig, axes = fr.subplots(1, 2)
+        axes[1].plot([0, 1], [0, 1])
+        assert axes[0].plot is not axes[1].plot
+        assert len(fig.record.get_or_create_axes(0, 0).calls) == 0
+        assert len(fig.record.get_or_create_axes(0, 1).calls) == 1
+
+
+class TestCachedWrapperRecording:
+    """Cached wrappers still record every call and honour tracking."""
+
+    def test_every_call_recorded(self):
+        fig, ax = fr.subplots()
+        plot = ax.plot
+        for i in range(5):
+            plot(np.arange(3), np.arange(3) * i)
+        assert len(fig.record.axes["ax_0_0"].calls) == 5
+
+    def test_no_record_context(self):
+        fig, ax = fr.subplots()
+        ax.plot([0, 1], [0, 1])
+        with ax._no_record():
+            ax.plot([0, 1], [1, 0])
+        ax.plot([0, 1], [0.5, 0.5])
+        assert len(fig.record.axes["ax_0_0"].calls) == 2
+
+
+# EOF
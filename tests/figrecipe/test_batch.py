@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for parallel batch reproduce/convert."""
+
+import json
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from figrecipe._cli import main
+
+
+@pytest.fixture
+def recipe_dir(tmp_path):
+    """Directory with two recipes, a nested one and non-recipe YAML."""
+    import figrecipe as fr
+
+    root = tmp_path / "figs"
+    (root / "sub").mkdir(parents=True)
+    for i, path in enumerate([root / "a.png", root / "b.png", root / "sub" / "c.png"]):
+        fig, ax = fr.subplots()
+        ax.plot(np.arange(5), np.arange(5) * (i + 1))
+        fr.save(fig, path, validate=False, verbose=False)
+    (root / "style.yaml").write_text("fonts:\n  family: Arial\n")
+    (root / "a.reproduced.yaml").write_text((root / "a.yaml").read_text())
+    return root
+
+
+class TestDiscovery:
+    def test_finds_recipes_only(self, recipe_dir):
+        from figrecipe._batch import discover_recipes
+
+        found = [
+            p.relative_to(recipe_dir).as_posix() for p in discover_recipes(recipe_dir)
+        ]
+        assert found == ["a.yaml", "b.yaml", "sub/c.yaml"]
+
+    def test_non_recursive(self, recipe_dir):
+        from figrecipe._batch import discover_recipes
+
+        found = discover_recipes(recipe_dir, recursive=False)
+        assert [p.name for p in found] == ["a.yaml", "b.yaml"]
+
+    def test_output_paths(self, tmp_path):
+        from figrecipe._batch import output_path_for
+
+        src = tmp_path / "figs" / "sub" / "c.yaml"
+        assert output_path_for(src, "png") == src.with_name("c.reproduced.png")
+        out = output_path_for(src, "pdf", tmp_path / "figs", tmp_path / "out", tag="")
+        assert out == tmp_path / "out" / "sub" / "c.pdf"
+
+
+class TestRunBatch:
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_renders_all(self, recipe_dir, tmp_path, n_jobs):
+        from figrecipe._batch import BatchJob, discover_recipes, run_batch
+
+        jobs = [
+            BatchJob(str(src), str(tmp_path / "out" / f"{src.stem}.png"), dpi=50)
+            for src in discover_recipes(recipe_dir)
+        ]
+        results = list(run_batch(jobs, n_jobs))
+        assert sorted(r["status"] for r in results) == ["ok"] * 3
+        assert all((tmp_path / "out" / f"{n}.png").exists() for n in "abc")
+
+    def test_errors_are_reported(self, tmp_path):
+        from figrecipe._batch import BatchJob, run_batch
+
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("figrecipe: '1.0'\nfigure: [\n")
+        (result,) = run_batch([BatchJob(str(bad), str(tmp_path / "bad.png"))], 1)
+        assert result["status"] == "error"
+        assert result["error"]
+
+
+class TestBatchCLI:
+    def test_reproduce_batch_streams_json(self, recipe_dir, tmp_path):
+        out = tmp_path / "out"
+        result = CliRunner().invoke(
+            main,
+            [
+                "reproduce",
+                "--batch",
+                str(recipe_dir),
+                "-j",
+                "2",
+                "-o",
+                str(out),
+                "--dpi",
+                "50",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        files = [line for line in lines if line["event"] == "file"]
+        assert len(files) == 3
+        assert all("seconds" in line for line in files)
+        assert lines[-1]["event"] == "done"
+        assert lines[-1]["total"] == 3
+        assert (out / "sub" / "c.png").exists()
+
+    def test_source_or_batch_required(self, recipe_dir):
+        runner = CliRunner()
+        assert runner.invoke(main, ["reproduce"]).exit_code != 0
+        result = runner.invoke(
+            main, ["reproduce", str(recipe_dir / "a.yaml"), "--batch", str(recipe_dir)]
+        )
+        assert result.exit_code != 0
+
+    def test_convert_batch_keeps_sources(self, recipe_dir):
+        sources = {
+            p: p.read_bytes()
+            for p in recipe_dir.rglob("*")
+            if p.is_file() and p.suffix in (".yaml", ".png")
+        }
+        result = CliRunner().invoke(
+            main, ["convert", "--batch", str(recipe_dir), "-f", "png", "--dpi", "50"]
+        )
+        assert result.exit_code == 0, result.output
+        for path, content in sources.items():
+            assert path.read_bytes() == content, path
+        assert (recipe_dir / "a.reproduced.png").exists()
+        assert (recipe_dir / "sub" / "c.reproduced.png").exists()
+
+    def test_convert_batch_rejects_yaml(self, recipe_dir):
+        result = CliRunner().invoke(
+            main, ["convert", "--batch", str(recipe_dir), "-f", "yaml"]
+        )
+        assert result.exit_code != 0
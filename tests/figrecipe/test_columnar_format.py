@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for columnar data formats (parquet / arrow)."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+# Add src to path for development
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import figrecipe as fr
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def tmpdir():
+    """Temporary directory for test outputs."""
+    with tempfile.TemporaryDirectory() as d:
+        yield Path(d)
+
+
+class TestColumnarIO:
+    """Tests for save_arrays_columnar / ColumnarReader."""
+
+    @pytest.mark.parametrize("data_format", ["parquet", "arrow"])
+    def test_roundtrip_mixed_columns(self, tmpdir, data_format):
+        """Test that columns keep their dtype and shape independently."""
+        from figrecipe._utils._columnar_io import (
+            ColumnarReader,
+            save_arrays_columnar,
+        )
+
+        columns = {
+            "a": np.linspace(0, 1, 100),
+            "b": np.arange(7, dtype=np.int32),
+            "c": np.arange(12, dtype=np.float32).reshape(4, 3),
+            "d": np.array(["x", "y"], dtype=object),
+        }
+        path = save_arrays_columnar(columns, tmpdir / "fig", data_format)
+        assert path.suffix == f".{data_format}"
+
+        with ColumnarReader(path) as reader:
+            assert reader.columns == list(columns)
+            for name, expected in columns.items():
+                loaded = reader.read(name)
+                assert loaded.shape == expected.shape
+                assert loaded.dtype == expected.dtype
+                np.testing.assert_array_equal(loaded, expected)
+
+    def test_dtype_override(self, tmpdir):
+        """Test that the YAML dtype takes precedence over the stored dtype."""
+        from figrecipe._utils._columnar_io import (
+            load_array_columnar,
+            save_arrays_columnar,
+        )
+
+        path = save_arrays_columnar({"v": np.arange(3)}, tmpdir / "fig")
+        loaded = load_array_columnar(path, "v", dtype="float32")
+        assert loaded.dtype == np.float32
+
+    def test_save_array_single_column(self, tmpdir):
+        """Test that save_array/load_array support columnar formats."""
+        from figrecipe._utils._numpy_io import load_array, save_array
+
+        data = np.random.default_rng(0).normal(size=(5, 2))
+        path = save_array(data, tmpdir / "arr", "arrow")
+        assert path.suffix == ".arrow"
+        np.testing.assert_array_equal(load_array(path), data)
+
+
+class TestColumnarRecipe:
+    """Tests for data_format='parquet'/'arrow' on recipes."""
+
+    @pytest.fixture(autouse=True)
+    def reset_matplotlib(self):
+        """Reset matplotlib state before and after each test."""
+        plt.close("all")
+        matplotlib.rcdefaults()
+        yield
+        plt.close("all")
+
+    @pytest.mark.parametrize("data_format", ["parquet", "arrow"])
+    def test_single_file_per_figure(self, tmpdir, data_format):
+        """Test that all arrays go to one columnar file next to the YAML."""
+        import yaml
+
+        fig, axes = fr.subplots(1, 2)
+        x = np.linspace(0, 1, 50)
+        axes[0].plot(x, np.sin(x), id="sine")
+        axes[1].scatter(x, np.cos(x), id="points")
+
+        yaml_path = tmpdir / "fig.yaml"
+        fig.save_recipe(yaml_path, data_format=data_format)
+
+        assert (tmpdir / f"fig.{data_format}").exists()
+        assert not (tmpdir / "fig_data").exists()
+
+        with open(yaml_path) as f:
+            recipe = yaml.safe_load(f)
+        args = recipe["axes"]["ax_0_0"]["calls"][0]["args"]
+        assert args[0]["data"] == f"fig.{data_format}"
+        assert args[0]["column"] == "ax_0_0/sine/x"
+
+    @pytest.mark.parametrize("data_format", ["parquet", "arrow"])
+    def test_roundtrip_reproduce(self, tmpdir, data_format):
+        """Test that reproduce loads data back from the columnar file."""
+        from figrecipe._serializer import load_recipe
+
+        fig, ax = fr.subplots()
+        x = np.linspace(0, 10, 200)
+        y = np.sin(x).astype(np.float32)
+        ax.plot(x, y, id="wave")
+        ax.boxplot([np.arange(5.0), np.arange(8.0)], id="box")
+
+        yaml_path = tmpdir / "fig.yaml"
+        fig.save_recipe(yaml_path, data_format=data_format)
+
+        record = load_recipe(yaml_path)
+        wave = record.axes["ax_0_0"].calls[0]
+        np.testing.assert_array_equal(wave.args[0]["_loaded_array"], x)
+        # data is the loaded array itself, not a list copy
+        assert wave.args[1]["data"] is wave.args[1]["_loaded_array"]
+        assert wave.args[1]["_loaded_array"].dtype == np.float32
+        box = record.axes["ax_0_0"].calls[1]
+        assert [len(a) for a in box.args[0]["_loaded_array"]] == [5, 8]
+
+        fig2, ax2 = fr.reproduce(yaml_path)
+        np.testing.assert_array_almost_equal(ax2.get_lines()[0].get_ydata(), y)
@@ -159,6 +159,24 @@ class TestCsvFormat:
         np.testing.assert_array_almost_equal(x_loaded, x_orig)
         np.testing.assert_array_almost_equal(y_loaded, y_orig)
 
+    @pytest.mark.parametrize("csv_format", ["separate", "single"])
+    def test_loaded_data_is_ndarray(self, tmpdir, csv_format):
+        """Test that loaded args hold the arrays themselves, not list copies."""
+        from figrecipe._serializer import load_recipe
+
+        fig, ax = fr.subplots()
+        ax.plot(np.arange(5.0), np.arange(5.0) ** 2, id="squares")
+        output_path = tmpdir / "loaded.yaml"
+        fig.save_recipe(output_path, csv_format=csv_format)
+        plt.close("all")
+
+        record = load_recipe(output_path)
+        for arg in record.axes["ax_0_0"].calls[0].args:
+            assert isinstance(arg["data"], np.ndarray)
+        np.testing.assert_array_equal(
+            record.axes["ax_0_0"].calls[0].args[1]["data"], np.arange(5.0) ** 2
+        )
+
     def test_single_csv_multi_trace(self, tmpdir):
         """Test single CSV format with multiple traces."""
         fig, ax = fr.subplots()
@@ -263,3 +281,88 @@ class TestCsvFormatLoadSingleCsv:
         assert "trace1" in result["ax_0_0"]
         np.testing.assert_array_equal(result["ax_0_0"]["trace1"]["x"], [1, 2, 3])
         np.testing.assert_array_equal(result["ax_0_0"]["trace1"]["y"], [4, 5, 6])
+
+
+class TestArrayCsvEngine:
+    """Tests for the bulk save_array_csv/load_array_csv engine."""
+
+    @pytest.fixture
+    def tmpdir(self):
+        """Temporary directory for test outputs."""
+        with tempfile.TemporaryDirectory() as d:
+            yield Path(d)
+
+    @staticmethod
+    def _write_with_csv_writer(data, path):
+        import csv
+
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            if data.ndim == 1:
+                for val in data:
+                    writer.writerow([val])
+            else:
+                for row in data:
+                    writer.writerow(row)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            np.array([0.1, -0.0, 1e16, 1e-5, np.nan, np.inf]),
+            np.arange(12, dtype=np.float64).reshape(4, 3) / 7,
+            np.array([0.1, 2.5, -3.25], dtype=np.float32),
+            np.arange(-5, 5, dtype=np.int64),
+            np.array([True, False, True]),
+            np.array(["a", "b,c", 'say "hi"'], dtype=object),
+        ],
+    )
+    def test_output_matches_csv_writer(self, tmpdir, data):
+        """Test that bulk formatting is byte-identical to csv.writer output."""
+        from figrecipe._utils._numpy_io import save_array_csv
+
+        expected = tmpdir / "expected.csv"
+        actual = tmpdir / "actual.csv"
+        self._write_with_csv_writer(data, expected)
+        save_array_csv(data, actual)
+
+        assert actual.read_bytes() == expected.read_bytes()
+
+    @pytest.mark.parametrize("dtype", ["float64", "float32", "int32"])
+    def test_roundtrip_preserves_dtype_and_shape(self, tmpdir, dtype):
+        """Test that numeric arrays load back with the YAML dtype."""
+        from figrecipe._utils._numpy_io import load_array_csv, save_array_csv
+
+        rng = np.random.default_rng(0)
+        for data in (rng.normal(size=50) * 100, rng.normal(size=(1, 4)) * 100):
+            data = data.astype(dtype)
+            path = save_array_csv(data, tmpdir / "data.csv")
+            loaded = load_array_csv(path, dtype=dtype)
+
+            assert loaded.dtype == np.dtype(dtype)
+            assert loaded.shape == data.shape
+            np.testing.assert_array_equal(loaded, data)
+
+    def test_legacy_dtype_header(self, tmpdir):
+        """Test that the legacy '# dtype:' header is honoured and skipped."""
+        from figrecipe._utils._numpy_io import load_array_csv
+
+        path = tmpdir / "legacy.csv"
+        path.write_text("# dtype: int32\n1\n2\n3\n")
+
+        loaded = load_array_csv(path)
+        assert loaded.dtype == np.int32
+        np.testing.assert_array_equal(loaded, [1, 2, 3])
+
+        path.write_text("# dtype: int32\n")
+        assert load_array_csv(path).size == 0
+
+    def test_non_numeric_falls_back_to_object(self, tmpdir):
+        """Test that categorical CSV data loads as an object array."""
+        from figrecipe._utils._numpy_io import load_array_csv
+
+        path = tmpdir / "labels.csv"
+        path.write_text("a\nb\nc\n")
+
+        loaded = load_array_csv(path)
+        assert loaded.dtype == object
+        assert loaded.tolist() == ["a", "b", "c"]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for columnar datatable access."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import figrecipe as fr
+from figrecipe._editor._datatable_columns import (
+    column_window,
+    record_columns,
+    record_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    """Clean up matplotlib figures after each test."""
+    yield
+    plt.close("all")
+
+
+def _columns():
+    fig, axes = fr.subplots(1, 2)
+    x = np.linspace(0, 1, 50_000)
+    axes[0].plot(x, np.sin(x), id="trace")
+    axes[1].bar(["a", "b", "c"], [1, 2, 3], id="bars")
+    return record_columns(fig.record), x
+
+
+class TestRecordColumns:
+    """Columns reference the recorded arrays."""
+
+    def test_names_and_types(self):
+        columns, _ = _columns()
+        info = {c.name: c.info() for c in columns}
+        assert info["trace_x"]["dtype"] == "float"
+        assert info["trace_x"]["length"] == 50_000
+        assert info["trace_x"]["ax_key"] == "ax_0_0"
+        assert info["bars_x"]["dtype"] == "string"
+        assert info["bars_height"]["length"] == 3
+
+    def test_no_copy(self):
+        columns, x = _columns()
+        trace_x = next(c for c in columns if c.name == "trace_x")
+        np.testing.assert_array_equal(trace_x.values, x)
+
+
+class TestColumnWindow:
+    """Only the requested rows are converted."""
+
+    def test_window(self):
+        columns, x = _columns()
+        window = column_window(columns, offset=10, limit=5)
+        assert (window["start"], window["stop"], window["step"]) == (10, 15, 1)
+        assert window["n_rows"] == 50_000
+        assert window["data"]["trace_x"] == x[10:15].tolist()
+        assert window["data"]["bars_x"] == []
+
+    def test_downsample(self):
+        columns, x = _columns()
+        window = column_window(columns, offset=0, limit=50_000, max_points=1000)
+        assert window["step"] == 50
+        assert len(window["data"]["trace_x"]) == 1000
+        assert window["data"]["trace_x"][1] == x[50]
+
+    def test_nan_becomes_none(self):
+        fig, ax = fr.subplots()
+        ax.plot([0, 1, 2], [1.0, np.nan, np.inf], id="gaps")
+        window = column_window(record_columns(fig.record))
+        assert window["data"]["gaps_y"] == [1.0, None, None]
+
+    def test_offset_past_end(self):
+        columns, _ = _columns()
+        window = column_window(columns, offset=10**9, limit=10)
+        assert window["start"] == window["stop"] == 50_000
+        assert window["data"]["trace_x"] == []
+
+
+class TestEditorColumnCache:
+    """Columns are rebuilt only when the recorded data changes."""
+
+    def test_record_key(self):
+        fig, ax = fr.subplots()
+        ax.plot([0, 1, 2], [1, 2, 3], id="line")
+        key = record_key(fig.record)
+        assert record_key(fig.record) == key
+        ax.plot([0, 1], [3, 4], id="more")
+        assert record_key(fig.record) != key
+
+
+# EOF
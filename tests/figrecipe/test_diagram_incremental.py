@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for incremental diagram layout and drawing."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pytest
+
+import figrecipe as fr
+from figrecipe._diagram._diagram._render import draw_all_elements
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    """Clean up matplotlib figures after each test."""
+    yield
+    plt.close("all")
+
+
+def _chain_diagram():
+    s = fr.Diagram(width_mm=180, height_mm=120, title="Pipeline")
+    for bid in "abcde":
+        s.add_box(bid, title=bid.upper())
+    for src, tgt in [("a", "b"), ("a", "c"), ("b", "d"), ("c", "e")]:
+        s.add_arrow(src, tgt, label=f"{src}{tgt}")
+    s.auto_layout("lr")
+    return s
+
+
+def _snapshot(ax):
+    """Geometry of the axes' artists, in draw order."""
+    out = []
+    for a in ax._children:
+        if hasattr(a, "_posA_posB"):
+            out.append(("arrow", repr(a._posA_posB)))
+        elif hasattr(a, "get_text"):
+            out.append(("text", a.get_text(), tuple(a.get_position())))
+        else:
+            out.append((type(a).__name__, repr(a.get_path().vertices.tolist())))
+    return out
+
+
+class TestIncrementalDraw:
+    """Only changed elements are redrawn, with the full-draw result."""
+
+    def test_matches_full_redraw(self):
+        s = _chain_diagram()
+        fig, ax = s.render()
+        s._positions["b"].y_mm -= 6
+        s._boxes["d"].title = "Renamed"
+        s.render(ax=ax, incremental=True)
+
+        _, ax_full = plt.subplots(figsize=fig.get_size_inches())
+        draw_all_elements(s, ax_full)
+        assert _snapshot(ax) == _snapshot(ax_full)
+
+    def test_redraws_moved_box_and_its_arrows(self):
+        s = _chain_diagram()
+        _, ax = s.render()
+        assert draw_all_elements(s, ax, incremental=True) == 0
+        s._positions["d"].x_mm += 5
+        # the box, its arrow and the centred title
+        assert draw_all_elements(s, ax, incremental=True) == 3
+
+    def test_cleared_axes_redraws_everything(self):
+        s = _chain_diagram()
+        _, ax = s.render()
+        ax.clear()
+        n = draw_all_elements(s, ax, incremental=True)
+        assert n == len(s._boxes) + len(s._arrows) + 1
+        assert len(ax.patches) > 0
+
+
+class TestFlexResize:
+    """Flex containers follow their children across renders."""
+
+    def test_container_grows_with_new_child(self):
+        s = fr.Diagram(width_mm=170, gap_mm=10)
+        s.add_box("a", title="A")
+        s.add_box("b", title="B")
+        s.add_container("g", title="G", children=["a", "b"])
+        s.render()
+        width = s._positions["g"].width_mm
+        s.add_box("c", title="C")
+        s._containers["g"]["children"].append("c")
+        s.render()
+        assert s._positions["g"].width_mm > width
+
+    def test_explicit_size_is_kept(self):
+        s = fr.Diagram(width_mm=170, gap_mm=10)
+        s.add_box("a", title="A")
+        s.add_container("g", title="G", children=["a"], width_mm=150)
+        s.render()
+        s.add_box("b", title="B")
+        s._containers["g"]["children"].append("b")
+        s.render()
+        assert s._positions["g"].width_mm == 150
+
+
+class TestIncrementalLayout:
+    """auto_layout(incremental=True) keeps the boxes already placed."""
+
+    def test_new_box_joins_its_layer(self):
+        s = fr.Diagram(width_mm=180, height_mm=120)
+        for bid in "abcd":
+            s.add_box(bid, title=bid)
+        for src, tgt in [("a", "b"), ("a", "c"), ("b", "d")]:
+            s.add_arrow(src, tgt)
+        s.auto_layout("lr", incremental=True)
+        before = {k: (p.x_mm, p.y_mm) for k, p in s._positions.items()}
+
+        s.add_box("e", title="e")
+        s.add_arrow("c", "e")
+        s.auto_layout("lr", incremental=True)
+        p = s._positions
+        assert {k: (p[k].x_mm, p[k].y_mm) for k in before} == before
+        assert p["e"].x_mm == p["d"].x_mm
+        assert abs(p["e"].y_mm - p["d"].y_mm) >= p["e"].height_mm
+
+    def test_layer_change_relayouts(self):
+        s = fr.Diagram(width_mm=180, height_mm=120)
+        for bid in "abc":
+            s.add_box(bid, title=bid)
+        s.add_arrow("a", "b")
+        s.auto_layout("lr", incremental=True)
+        s.add_arrow("b", "c")  # c moves from layer 0 to layer 2
+        s.auto_layout("lr", incremental=True)
+        p = s._positions
+        assert p["a"].x_mm < p["b"].x_mm < p["c"].x_mm
+
+
+# EOF
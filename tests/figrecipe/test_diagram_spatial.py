@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the diagram spatial index and its users."""
+
+import random
+from itertools import combinations
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from figrecipe._diagram._diagram._geom import (
+    box_rect,
+    rects_overlap,
+    seg_rect_clip_len,
+    seg_rects_clip_len,
+)
+from figrecipe._diagram._diagram._overlap import resolve_overlaps
+from figrecipe._diagram._diagram._spatial import GridIndex
+from figrecipe._diagram._diagram._specs import PositionSpec
+
+
+def _random_rects(n, seed=0, extent=500.0):
+    rng = random.Random(seed)
+    rects = {}
+    for i in range(n):
+        x, y = rng.uniform(0, extent), rng.uniform(0, extent)
+        w, h = rng.uniform(5, 60), rng.uniform(5, 40)
+        rects[f"b{i}"] = (x, y, x + w, y + h)
+    return rects
+
+
+class TestGridIndex:
+    """Index results match brute force."""
+
+    def test_pairs_match_combinations(self):
+        rects = _random_rects(300)
+        index = GridIndex.from_rects(rects)
+        expected = [
+            (a, b)
+            for a, b in combinations(rects, 2)
+            if rects_overlap(rects[a], rects[b])
+        ]
+        assert expected
+        assert index.overlapping_pairs() == expected
+
+    def test_query_in_insertion_order(self):
+        rects = _random_rects(200, seed=1)
+        index = GridIndex.from_rects(rects)
+        left, bottom, right, top = 100.0, 100.0, 180.0, 150.0
+        expected = [
+            k
+            for k, r in rects.items()
+            if r[0] <= right and left <= r[2] and r[1] <= top and bottom <= r[3]
+        ]
+        assert index.query((left, bottom, right, top)) == expected
+        assert index.query_point(0.0, 0.0) == [
+            k for k, r in rects.items() if r[0] <= 0 <= r[2] and r[1] <= 0 <= r[3]
+        ]
+
+    def test_update_and_remove(self):
+        index = GridIndex(cell_mm=10.0)
+        index.insert("a", (0, 0, 5, 5))
+        index.insert("b", (100, 100, 105, 105))
+        assert index.overlapping_pairs() == []
+        index.update("b", (2, 2, 8, 8))
+        assert index.overlapping_pairs() == [("a", "b")]
+        index.remove("a")
+        assert index.query((0, 0, 10, 10)) == ["b"]
+        assert "a" not in index and len(index) == 1
+
+    def test_huge_rect(self):
+        index = GridIndex(cell_mm=1.0)
+        index.insert("canvas", (-1e6, -1e6, 1e6, 1e6))
+        index.insert("box", (10, 10, 20, 20))
+        assert index.overlapping_pairs() == [("canvas", "box")]
+        assert index.query_point(15, 15) == ["canvas", "box"]
+
+
+class TestResolveOverlaps:
+    """Overlap resolution still separates every pair."""
+
+    @pytest.mark.parametrize("n", [10, 120])
+    def test_no_overlaps_left(self, n):
+        rng = random.Random(n)
+        positions = {
+            f"b{i}": PositionSpec(
+                x_mm=rng.uniform(40, 160),
+                y_mm=rng.uniform(40, 160),
+                width_mm=20.0,
+                height_mm=10.0,
+            )
+            for i in range(n)
+        }
+        diagram = SimpleNamespace(_positions=positions, _boxes={})
+        resolve_overlaps(
+            diagram,
+            gap=2.0,
+            x_min=-1e4,
+            x_max=1e4,
+            y_min=-1e4,
+            y_max=1e4,
+            max_iterations=500,
+        )
+        rects = [box_rect(p) for p in positions.values()]
+        assert not any(rects_overlap(a, b) for a, b in combinations(rects, 2))
+
+
+class TestClipLength:
+    """The vectorized clip kernel matches the scalar Liang-Barsky."""
+
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        segs = rng.uniform(0, 100, size=(200, 4))
+        segs[:20, 2:] = segs[:20, :2]  # degenerate segments
+        segs[20:40, 3] = segs[20:40, 1]  # horizontal segments
+        corners = rng.uniform(0, 100, size=(50, 2))
+        rects = np.hstack([corners, corners + rng.uniform(1, 40, size=(50, 2))])
+        clip = seg_rects_clip_len(
+            *(segs[:, None, i] for i in range(4)),
+            *(rects[None, :, j] for j in range(4)),
+        )
+        expected = [[seg_rect_clip_len(*s, *r) for r in rects] for s in segs]
+        np.testing.assert_allclose(clip, expected, atol=1e-9)
+
+
+# EOF
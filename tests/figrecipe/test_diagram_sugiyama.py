@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the layered (Sugiyama) layout engine."""
+
+import random
+import time
+from itertools import combinations
+
+import figrecipe as fr
+from figrecipe._diagram import GraphDiagram
+from figrecipe._diagram._shared._layout import compute_layout, optimize_edge_crossings
+from figrecipe._diagram._shared._sugiyama import count_crossings, layered_layout
+
+
+def _brute_crossings(order, edges):
+    where = {n: (r, i) for r, layer in enumerate(order) for i, n in enumerate(layer)}
+    segs = []
+    for a, b in edges:
+        (ra, ia), (rb, ib) = sorted((where[a], where[b]))
+        if rb == ra + 1:
+            segs.append((ra, ia, ib))
+    return sum(
+        1
+        for (r1, a1, b1), (r2, a2, b2) in combinations(segs, 2)
+        if r1 == r2 and (a1 - a2) * (b1 - b2) < 0
+    )
+
+
+def _random_flow(n, seed, width=8):
+    rng = random.Random(seed)
+    ids = [f"n{i}" for i in range(n)]
+    layers = {nid: i // width for i, nid in enumerate(ids)}
+    edges = []
+    for i in range(width, n):
+        lo = max(0, (layers[ids[i]] - 2) * width)
+        edges.append((ids[rng.randrange(lo, layers[ids[i]] * width)], ids[i]))
+    rng.shuffle(ids)
+    return {nid: layers[nid] for nid in ids}, edges
+
+
+class TestCrossings:
+    """Accumulator-tree counting matches brute force."""
+
+    def test_count_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            order = [[f"{r}.{i}" for i in range(rng.randint(1, 6))] for r in range(4)]
+            nodes = [n for layer in order for n in layer]
+            edges = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(25)]
+            assert count_crossings(order, edges) == _brute_crossings(order, edges)
+
+    def test_removes_avoidable_crossing(self):
+        layers = {"a": 0, "b": 0, "c": 1, "d": 1}
+        edges = [("a", "d"), ("b", "c")]
+        assert count_crossings([["a", "b"], ["c", "d"]], edges) == 1
+        result = layered_layout(layers, edges)
+        assert result.crossings == 0
+        assert count_crossings(list(result.order.values()), edges) == 0
+
+
+class TestLayeredLayout:
+    """Ordering and Brandes-Koepf coordinates."""
+
+    def test_deterministic_and_separated(self):
+        layers, edges = _random_flow(300, seed=1)
+        sizes = {nid: 25.0 for nid in layers}
+        result = layered_layout(layers, edges, sizes=sizes, gap=10.0)
+        assert result == layered_layout(layers, edges, sizes=sizes, gap=10.0)
+        assert sorted(n for m in result.order.values() for n in m) == sorted(layers)
+        for members in result.order.values():
+            for a, b in zip(members, members[1:]):
+                assert result.cross[b] - result.cross[a] >= 35.0 - 1e-9
+
+    def test_reduces_crossings(self):
+        layers, edges = _random_flow(200, seed=2)
+        initial = {}
+        for nid, layer in layers.items():
+            initial.setdefault(layer, []).append(nid)
+        before = count_crossings([initial[k] for k in sorted(initial)], edges)
+        assert layered_layout(layers, edges).crossings < before / 2
+
+    def test_chain_is_straight(self):
+        layers = {"a": 0, "b": 1, "c": 2, "x": 1}
+        result = layered_layout(layers, [("a", "b"), ("b", "c"), ("a", "x")])
+        assert result.cross["b"] == result.cross["c"]
+        # the fork sits between its two targets
+        lo, hi = sorted((result.cross["b"], result.cross["x"]))
+        assert lo < result.cross["a"] < hi
+
+    def test_long_edges_and_cycles(self):
+        layers = {"a": 0, "b": 1, "c": 2, "d": 3}
+        edges = [("a", "d"), ("d", "a"), ("a", "b"), ("b", "b"), ("c", "c")]
+        result = layered_layout(layers, edges)
+        assert set(result.cross) == set(layers)
+        assert [m for m in result.order.values()] == [["a"], ["b"], ["c"], ["d"]]
+
+
+class TestLongEdges:
+    """Dummy nodes of long edges do not blow up the ordering time."""
+
+    def test_random_long_edges_timing(self):
+        rng = random.Random(0)
+        layers = {f"n{i}": rng.randrange(30) for i in range(1000)}
+        ids = list(layers)
+        edges = [(rng.choice(ids), rng.choice(ids)) for _ in range(2000)]
+
+        start = time.perf_counter()
+        result = layered_layout(layers, edges)
+        elapsed = time.perf_counter() - start
+
+        # About 19,000 dummy nodes; uncapped ordering took 15-30 s, the
+        # capped layout takes about 0.5 s
+        assert elapsed < 2.0
+        assert sorted(n for m in result.order.values() for n in m) == sorted(ids)
+        unordered = layered_layout(layers, edges, max_sweeps=0)
+        assert result.crossings < unordered.crossings
+
+
+class TestCallers:
+    """Diagram layouts use the engine."""
+
+    def test_auto_layout_uncrosses_arrows(self):
+        s = fr.Diagram(width_mm=180, height_mm=120)
+        for bid in "abcd":
+            s.add_box(bid, title=bid.upper())
+        s.add_arrow("a", "d")
+        s.add_arrow("b", "c")
+        s.auto_layout("lr")
+        p = s._positions
+        assert p["c"].x_mm > p["a"].x_mm
+        assert (p["a"].y_mm > p["b"].y_mm) == (p["d"].y_mm > p["c"].y_mm)
+
+    def test_layered_spec_layout_without_crossings(self):
+        d = GraphDiagram(type="workflow")
+        for nid in ["s", "a", "b", "x", "y"]:
+            d.add_node(nid, nid)
+        for src, tgt in [("s", "a"), ("s", "b"), ("a", "y"), ("b", "x")]:
+            d.add_edge(src, tgt)
+        pos = compute_layout(d.spec, algorithm="layered", direction="LR")
+        # a above b implies y above x
+        assert (pos["a"][1] < pos["b"][1]) == (pos["y"][1] < pos["x"][1])
+
+    def test_optimize_edge_crossings_keeps_slots(self):
+        d = GraphDiagram(type="workflow")
+        for nid in ["a", "b", "c", "e"]:
+            d.add_node(nid, nid)
+        d.add_edge("a", "e")
+        d.add_edge("b", "c")
+        positions = {
+            "a": (0.1, 0.2),
+            "b": (0.1, 0.8),
+            "c": (0.9, 0.2),
+            "e": (0.9, 0.8),
+        }
+        new = optimize_edge_crossings(positions, d.spec)
+        assert sorted(y for _, y in new.values()) == [0.2, 0.2, 0.8, 0.8]
+        assert (new["a"][1] < new["b"][1]) == (new["e"][1] < new["c"][1])
+
+
+# EOF
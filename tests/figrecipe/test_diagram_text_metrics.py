@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for render-free diagram text metrics."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import figrecipe as fr
+from figrecipe._diagram._diagram._text_metrics import text_extents, text_window_extent
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    """Clean up matplotlib figures after each test."""
+    yield
+    plt.close("all")
+
+
+class TestTextExtent:
+    """Cached extents match matplotlib's drawn extents."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(ha="center", va="center", fontsize=11, fontweight="bold"),
+            dict(ha="left", va="top", fontsize=8, fontfamily="monospace"),
+            dict(ha="right", va="baseline", fontsize=9, fontstyle="italic"),
+            dict(ha="center", va="bottom", fontsize=10, rotation=30),
+        ],
+    )
+    def test_matches_window_extent(self, kwargs):
+        fig, ax = plt.subplots(figsize=(4, 3))
+        ax.set_xlim(0, 100)
+        ax.set_ylim(0, 75)
+        ax.set_aspect("equal")
+        texts = [ax.text(20, 30, "Encoder\nblock", **kwargs), ax.text(60, 50, "x")]
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        for t in texts:
+            np.testing.assert_allclose(
+                text_window_extent(t).extents,
+                t.get_window_extent(renderer).extents,
+                atol=1e-6,
+            )
+
+    def test_data_coordinates_without_draw(self):
+        fig, ax = plt.subplots(figsize=(4, 3))
+        ax.set_xlim(0, 100)
+        ax.set_ylim(0, 75)
+        ax.set_aspect("equal")
+        t = ax.text(50, 40, "Label", ha="center", va="center")
+        [(_, bb_cached)] = text_extents(ax)
+        fig.canvas.draw()
+        drawn = t.get_window_extent().transformed(ax.transData.inverted())
+        np.testing.assert_allclose(bb_cached.extents, drawn.extents, atol=1e-6)
+
+    def test_font_family_rc_change(self):
+        def measure():
+            fig, ax = plt.subplots(figsize=(4, 3))
+            t = ax.text(10, 10, "Encoder", fontfamily="sans-serif")
+            fig.canvas.draw()
+            drawn = t.get_window_extent(fig.canvas.get_renderer()).extents
+            np.testing.assert_allclose(text_window_extent(t).extents, drawn, atol=1e-6)
+            return drawn
+
+        before = measure()
+        with plt.rc_context({"font.sans-serif": ["DejaVu Sans Mono"]}):
+            after = measure()
+        assert not np.allclose(before, after)
+
+
+class TestRenderDraws:
+    """Auto-fix and validation draw the figure once."""
+
+    def test_single_draw(self, monkeypatch):
+        s = fr.Diagram(width_mm=180, height_mm=100)
+        s.add_box("a", title="A", x_mm=40, y_mm=50, width_mm=40, height_mm=25)
+        s.add_box("b", title="B", x_mm=140, y_mm=50, width_mm=40, height_mm=25)
+        s.add_arrow("a", "b", label="data")
+
+        draws = []
+        original = FigureCanvasAgg.draw
+
+        def counting_draw(canvas, *args, **kwargs):
+            draws.append(canvas)
+            return original(canvas, *args, **kwargs)
+
+        monkeypatch.setattr(FigureCanvasAgg, "draw", counting_draw)
+        s.render(auto_fix=True)
+        assert len(draws) == 1
+
+
+# EOF
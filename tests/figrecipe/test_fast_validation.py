@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for in-memory (fast/async) reproducibility validation."""
+
+from concurrent.futures import Future
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    """Clean up matplotlib figures after each test."""
+    yield
+    plt.close("all")
+
+
+def _make_figure(nrows=1, ncols=1):
+    import figrecipe as fr
+
+    fig, axes = fr.subplots(nrows, ncols)
+    for i, ax in enumerate(np.atleast_1d(axes).flat):
+        x = np.linspace(0, 10, 500)
+        ax.plot(x, np.sin(x * (i + 1)), id=f"line{i}")
+        ax.scatter(x[::50], x[::50], id=f"pts{i}")
+        ax.set_title(f"Panel {i}")
+    return fig
+
+
+def _corrupt(fig):
+    """Make the recorded data disagree with what was drawn."""
+    arg = fig.record.axes["ax_0_0"].calls[0].args[1]
+    arg["_array"] = np.full_like(arg["_array"], 5.0)
+
+
+class TestCompareArrays:
+    """Integer, band-wise image comparison."""
+
+    def test_identical(self):
+        from figrecipe._utils._image_diff import compare_arrays
+
+        img = np.random.default_rng(0).integers(0, 256, (100, 80, 3), np.uint8)
+        diff = compare_arrays(img, img.copy())
+        assert diff["identical"]
+        assert diff["mse"] == 0.0
+        assert diff["psnr"] == float("inf")
+
+    def test_matches_float_computation(self):
+        from figrecipe._utils._image_diff import compare_arrays, compute_diff
+
+        rng = np.random.default_rng(1)
+        img1 = rng.integers(0, 256, (130, 70, 3), np.uint8)
+        img2 = rng.integers(0, 256, (130, 70, 3), np.uint8)
+        diff = compare_arrays(img1, img2, band_rows=16)
+        mse, _ = compute_diff(img1, img2)
+        assert diff["mse"] == pytest.approx(mse)
+        assert diff["max_diff"] == np.abs(img1.astype(int) - img2.astype(int)).max()
+        assert not diff["early_exit"]
+
+    def test_early_exit(self):
+        from figrecipe._utils._image_diff import compare_arrays
+
+        img1 = np.zeros((256, 16, 3), np.uint8)
+        img2 = np.full((256, 16, 3), 255, np.uint8)
+        diff = compare_arrays(img1, img2, mse_threshold=100.0, band_rows=8)
+        assert diff["early_exit"]
+        assert diff["mse"] > 100.0
+
+    def test_size_tolerance(self):
+        from figrecipe._utils._image_diff import compare_arrays
+
+        img = np.zeros((50, 50, 3), np.uint8)
+        assert compare_arrays(img, img[:49, :48])["mse"] == 0.0
+        assert np.isnan(compare_arrays(img, img[:40])["mse"])
+
+
+class TestSnapshotRecord:
+    """Snapshots survive saving the original record."""
+
+    def test_snapshot_keeps_arrays(self, tmp_path):
+        import figrecipe as fr
+        from figrecipe._validator import snapshot_record
+
+        fig = _make_figure()
+        snapshot = snapshot_record(fig.record)
+        fr.save(fig, tmp_path / "fig.png", validate=False, verbose=False)
+
+        arg = snapshot.axes["ax_0_0"].calls[0].args[0]
+        original = fig.record.axes["ax_0_0"].calls[0].args[0]
+        assert "_array" in arg
+        assert arg is not original
+
+
+class TestFastValidation:
+    """validate_mode='fast' and 'async' in fr.save()."""
+
+    @pytest.mark.parametrize("shape", [(1, 1), (2, 2)])
+    def test_fast_passes(self, tmp_path, shape):
+        import figrecipe as fr
+        from figrecipe._validator import ValidationResult
+
+        fig = _make_figure(*shape)
+        _, _, result = fr.save(
+            fig, tmp_path / "fig.png", validate_mode="fast", verbose=False
+        )
+        assert isinstance(result, ValidationResult)
+        assert result.valid, result.message
+
+    def test_fast_detects_mismatch(self, tmp_path):
+        import figrecipe as fr
+
+        fig = _make_figure()
+        _corrupt(fig)
+        with pytest.raises(ValueError, match="Reproducibility validation failed"):
+            fr.save(fig, tmp_path / "fig.png", validate_mode="fast", verbose=False)
+
+    def test_async_returns_future(self, tmp_path):
+        import figrecipe as fr
+
+        fig = _make_figure()
+        image_path, yaml_path, future = fr.save(
+            fig, tmp_path / "fig.png", validate_mode="async", verbose=False
+        )
+        assert image_path.exists() and yaml_path.exists()
+        assert isinstance(future, Future)
+        assert future.result(timeout=60).valid
+
+    def test_async_failure_raises_from_result(self, tmp_path):
+        import figrecipe as fr
+
+        fig = _make_figure()
+        _corrupt(fig)
+        _, _, future = fr.save(
+            fig, tmp_path / "fig.png", validate_mode="async", verbose=False
+        )
+        with pytest.raises(ValueError, match="Reproducibility validation failed"):
+            future.result(timeout=60)
+
+    @pytest.mark.parametrize("mode", ["fast", "async"])
+    def test_replay_bypasses_pyplot(self, tmp_path, monkeypatch, mode):
+        import figrecipe as fr
+
+        fig = _make_figure()
+        before = plt.get_fignums()
+        monkeypatch.setattr(plt, "subplots", None)
+        monkeypatch.setattr(plt, "close", None)
+        _, _, result = fr.save(
+            fig, tmp_path / "fig.png", validate_mode=mode, verbose=False
+        )
+        if mode == "async":
+            result = result.result(timeout=60)
+        assert result.valid, result.message
+        assert plt.get_fignums() == before
+
+    @pytest.mark.parametrize("mode", ["fast", "async"])
+    def test_reuses_save_render(self, tmp_path, monkeypatch, mode):
+        import figrecipe as fr
+        from figrecipe import _validator
+
+        fig, ax = fr.subplots(
+            axes_width_mm=40, axes_height_mm=28, constrained_layout=False
+        )
+        ax.plot([1, 2, 3], [1, 4, 9], id="line")
+        rendered = []
+        render = _validator.render_for_validation
+
+        def _spy(target, dpi=_validator.FAST_VALIDATION_DPI):
+            rendered.append((target, dpi))
+            return render(target, dpi)
+
+        monkeypatch.setattr(_validator, "render_for_validation", _spy)
+        _, _, result = fr.save(
+            fig, tmp_path / "fig.png", dpi=100, validate_mode=mode, verbose=False
+        )
+        if mode == "async":
+            result = result.result(timeout=60)
+        assert result.valid, result.message
+        assert [dpi for _, dpi in rendered] == [100]
+        assert rendered[0][0] is not fig.fig
+
+    def test_unknown_mode(self, tmp_path):
+        import figrecipe as fr
+
+        fig = _make_figure()
+        with pytest.raises(ValueError, match="Unknown validation mode"):
+            fr.save(fig, tmp_path / "fig.png", validate_mode="slow", verbose=False)
+
+
+# EOF
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the incremental hitmap cache."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from figrecipe._editor._hitmap import generate_hitmap, get_hitmap_cache
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    """Clean up matplotlib figures after each test."""
+    yield
+    plt.close("all")
+
+
+def _assert_matches_full(fig, hitmap, color_map):
+    expected, expected_map = generate_hitmap(fig)
+    assert color_map == expected_map
+    diff = np.abs(np.asarray(hitmap, int) - np.asarray(expected, int))
+    assert diff.max() <= 1
+
+
+class TestHitmapCache:
+    """Only changed axes are redrawn into the cached hitmap."""
+
+    def test_first_generate_matches_generate_hitmap(self, three_panels):
+        fig, _ = three_panels
+        hitmap, color_map = get_hitmap_cache(fig).generate()
+        _assert_matches_full(fig, hitmap, color_map)
+
+    def test_cache_reused_per_figure(self, three_panels):
+        fig, _ = three_panels
+        assert get_hitmap_cache(fig) is get_hitmap_cache(fig)
+
+    def test_unchanged_is_incremental(self, three_panels):
+        fig, _ = three_panels
+        cache = get_hitmap_cache(fig)
+        first, _ = cache.generate()
+        second, _ = cache.generate()
+        assert not cache.last_full
+        np.testing.assert_array_equal(np.asarray(first), np.asarray(second))
+
+    def test_label_change_redraws_one_axes(self, three_panels):
+        fig, axes = three_panels
+        cache = get_hitmap_cache(fig)
+        cache.generate()
+        axes.flat[1].set_xlabel("a much longer x label")
+        hitmap, color_map = cache.generate()
+        assert not cache.last_full
+        _assert_matches_full(fig, hitmap, color_map)
+
+    def test_shifted_element_ids(self, three_panels):
+        fig, axes = three_panels
+        cache = get_hitmap_cache(fig)
+        cache.generate()
+        axes.flat[0].plot([0, 9], [9, 0], id="extra")
+        hitmap, color_map = cache.generate()
+        _assert_matches_full(fig, hitmap, color_map)
+
+    def test_colors_restored(self, three_panels):
+        fig, axes = three_panels
+        line = axes.flat[0].get_lines()[0]
+        color = line.get_color()
+        get_hitmap_cache(fig).generate()
+        assert line.get_color() == color
+
+
+# EOF
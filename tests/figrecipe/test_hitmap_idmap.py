@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the ID-buffer hitmap engine."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import figrecipe as fr
+from figrecipe._editor._hitmap import (
+    decode_id_map_rle,
+    encode_id_map_rle,
+    generate_hitmap,
+    generate_id_map,
+    hitmap_to_id_map,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    """Clean up matplotlib figures after each test."""
+    yield
+    plt.close("all")
+
+
+def _figure():
+    fig, ax = fr.subplots(figsize=(4, 3))
+    ax.bar(["A", "B"], [1, 2], id="bars")
+    ax.plot([-0.5, 1.5], [1.5, 1.5], id="line")
+    ax.set_xlabel("Group")
+    ax.set_title("Title")
+    return fig, ax
+
+
+class TestGenerateIdMap:
+    """Per-artist coverage recorded during one draw."""
+
+    def test_shape_and_dtype(self):
+        fig, _ = _figure()
+        id_map, color_map = generate_id_map(fig)
+        hitmap, _ = generate_hitmap(fig)
+        assert id_map.shape == (hitmap.height, hitmap.width)
+        assert id_map.dtype == np.uint16
+        assert color_map
+
+    def test_every_visible_element_labelled(self):
+        fig, _ = _figure()
+        id_map, color_map = generate_id_map(fig)
+        present = set(np.unique(id_map)) - {0}
+        by_type = {info["type"]: info["id"] for info in color_map.values()}
+        assert by_type["line"] in present
+        assert by_type["bar"] in present
+
+    def test_topmost_element_wins(self):
+        fig, ax = _figure()
+        id_map, color_map = generate_id_map(fig)
+        line_id = next(i["id"] for i in color_map.values() if i["type"] == "line")
+
+        # Point where the line crosses the second bar
+        mpl_fig = fig.fig
+        x, y = ax.transData.transform((1.0, 1.5))
+        scale = id_map.shape[1] / mpl_fig.bbox.width
+        row = int(round(id_map.shape[0] - y * scale))
+        col = int(round(x * scale))
+        assert id_map[row, col] == line_id
+
+    def test_colors_restored(self):
+        fig, ax = _figure()
+        line = ax.get_lines()[0]
+        color = line.get_color()
+        draw = line.draw
+        generate_id_map(fig)
+        assert line.get_color() == color
+        assert "draw" not in vars(line)
+        assert line.draw == draw
+
+    def test_target_size(self):
+        fig, _ = _figure()
+        id_map, _ = generate_id_map(fig, target_size=(200, 100))
+        assert id_map.shape == (100, 200)
+
+
+class TestConversions:
+    """RLE export and color hitmap conversion."""
+
+    def test_rle_roundtrip(self):
+        fig, _ = _figure()
+        id_map, _ = generate_id_map(fig)
+        rle = encode_id_map_rle(id_map)
+        assert sum(rle["counts"]) == id_map.size
+        assert len(rle["values"]) < id_map.size
+        np.testing.assert_array_equal(decode_id_map_rle(rle), id_map)
+
+    def test_rle_empty(self):
+        rle = encode_id_map_rle(np.zeros((0, 0), dtype=np.uint16))
+        assert decode_id_map_rle(rle).shape == (0, 0)
+
+    def test_hitmap_to_id_map(self):
+        color_map = {
+            "a": {"id": 1, "rgb": [255, 0, 0]},
+            "b": {"id": 2, "rgb": [0, 200, 0]},
+        }
+        image = np.zeros((2, 2, 3), dtype=np.uint8)
+        image[0, 0] = (255, 0, 0)
+        image[1, 1] = (0, 200, 0)
+        image[0, 1] = (1, 2, 3)
+        id_map = hitmap_to_id_map(image, color_map)
+        np.testing.assert_array_equal(id_map, [[1, 0], [0, 2]])
+
+
+# EOF
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for incremental editor preview rendering."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from figrecipe._editor._preview import PreviewRenderer, get_preview_renderer
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    """Clean up matplotlib figures after each test."""
+    yield
+    plt.close("all")
+
+
+def _full_frame(mpl_fig, dpi=100):
+    """Render the figure from scratch with a fresh renderer."""
+    return PreviewRenderer(mpl_fig).render(dpi).copy()
+
+
+class TestIncrementalPreview:
+    """Only axes that changed are redrawn."""
+
+    def test_first_render_is_full(self, three_panels):
+        fig, _ = three_panels
+        preview = get_preview_renderer(fig.fig)
+        frame = preview.render(100)
+        assert preview.last_full
+        assert frame.shape[2] == 4
+
+    def test_unchanged_render_is_incremental(self, three_panels):
+        fig, _ = three_panels
+        preview = get_preview_renderer(fig.fig)
+        first = preview.render(100).copy()
+        second = preview.render(100)
+        assert not preview.last_full
+        np.testing.assert_array_equal(first, second)
+
+    def test_single_axes_change_matches_full_render(self, three_panels):
+        fig, axes = three_panels
+        preview = get_preview_renderer(fig.fig)
+        preview.render(100)
+
+        axes.flat[1].set_xlabel("a much longer x label")
+        incremental = preview.render(100).copy()
+        assert not preview.last_full
+
+        full = _full_frame(fig.fig)
+        diff = np.abs(incremental.astype(int) - full.astype(int))
+        assert diff.max() <= 1
+
+    def test_state_key_change_forces_full(self, three_panels):
+        fig, _ = three_panels
+        preview = get_preview_renderer(fig.fig)
+        preview.render(100, state_key="a")
+        preview.render(100, state_key="b")
+        assert preview.last_full
+
+    def test_figure_level_change_forces_full(self, three_panels):
+        fig, _ = three_panels
+        preview = get_preview_renderer(fig.fig)
+        preview.render(100)
+        fig.fig.suptitle("Title")
+        preview.render(100)
+        assert preview.last_full
+
+    def test_dpi_restored(self, three_panels):
+        fig, _ = three_panels
+        dpi = fig.fig.dpi
+        get_preview_renderer(fig.fig).render(150)
+        assert fig.fig.dpi == dpi
+
+
+class TestRenderWithOverrides:
+    """render_with_overrides uses the incremental preview."""
+
+    def test_repeat_render_is_incremental(self, three_panels):
+        from figrecipe._editor._helpers import render_with_overrides
+
+        fig, _ = three_panels
+        first = render_with_overrides(fig, {})
+        second = render_with_overrides(fig, {})
+        assert get_preview_renderer(fig.fig).last_full is False
+        assert first[0] == second[0]
+        assert first[2] == second[2]
+
+    def test_global_override_forces_full(self, three_panels):
+        from figrecipe._editor._helpers import render_with_overrides
+
+        fig, _ = three_panels
+        render_with_overrides(fig, {})
+        render_with_overrides(fig, {"fonts_axis_label_pt": 10})
+        assert get_preview_renderer(fig.fig).last_full
+
+
+class TestBboxesFromPreviewDraw:
+    """Bboxes are collected during the preview draw."""
+
+    def test_no_extra_canvas_draw(self, three_panels, monkeypatch):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        from figrecipe._editor._helpers import render_with_overrides
+
+        fig, _ = three_panels
+        calls = []
+        original = FigureCanvasAgg.draw
+        monkeypatch.setattr(
+            FigureCanvasAgg,
+            "draw",
+            lambda self, *a, **k: calls.append(1) or original(self, *a, **k),
+        )
+        _, bboxes, img_size = render_with_overrides(fig, {})
+        assert calls == []
+        assert "ax0_axes" in bboxes
+        assert bboxes["_meta"]["img_width"] == img_size[0]
+
+    def test_matches_separate_extraction(self, three_panels):
+        from figrecipe._editor._bbox import extract_bboxes
+        from figrecipe._editor._helpers import render_with_overrides
+
+        fig, _ = three_panels
+        _, bboxes, img_size = render_with_overrides(fig, {})
+
+        mpl_fig = fig.fig
+        original_dpi = mpl_fig.dpi
+        mpl_fig.set_dpi(150)
+        expected = extract_bboxes(mpl_fig, img_size[0], img_size[1])
+        mpl_fig.set_dpi(original_dpi)
+
+        assert bboxes.keys() == expected.keys()
+        for key in ("ax0_axes", "ax1_axes", "ax2_axes"):
+            for coord in ("x", "y", "width", "height"):
+                assert bboxes[key][coord] == pytest.approx(
+                    expected[key][coord], abs=1
+                )
+
+
+# EOF
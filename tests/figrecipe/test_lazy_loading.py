@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for lazy (on-first-access) loading of recipe arrays."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+# Add src to path for development
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import figrecipe as fr
+from figrecipe._serializer import load_recipe
+from figrecipe._utils._lazy_array import LazyArray
+
+
+@pytest.fixture
+def tmpdir():
+    """Temporary directory for test outputs."""
+    with tempfile.TemporaryDirectory() as d:
+        yield Path(d)
+
+
+@pytest.fixture(autouse=True)
+def reset_matplotlib():
+    """Reset matplotlib state before and after each test."""
+    plt.close("all")
+    yield
+    plt.close("all")
+
+
+def _save_sample(path, **save_kwargs):
+    fig, ax = fr.subplots()
+    ax.plot(np.arange(5.0), np.arange(5.0) ** 2, id="line")
+    ax.boxplot([np.arange(3.0), np.arange(6.0)], id="box")
+    fig.save_recipe(path, **save_kwargs)
+    return path
+
+
+class TestLazyLoadRecipe:
+    """Tests for load_recipe(..., lazy=True)."""
+
+    @pytest.mark.parametrize("data_format", ["csv", "npz"])
+    def test_data_not_read_until_accessed(self, tmpdir, data_format):
+        """Test that lazy handles keep the file reference and defer reading."""
+        path = _save_sample(tmpdir / "fig.yaml", data_format=data_format)
+
+        record = load_recipe(path, lazy=True)
+        arg = record.axes["ax_0_0"].calls[0].args[1]
+
+        assert isinstance(arg["data"], str)
+        handle = arg["_loaded_array"]
+        assert isinstance(handle, LazyArray)
+        assert not handle.loaded
+
+        np.testing.assert_array_equal(np.asarray(handle), np.arange(5.0) ** 2)
+        assert handle.loaded
+
+    def test_array_list_resolves_to_list(self, tmpdir):
+        """Test that array-list args resolve to their original lengths."""
+        path = _save_sample(tmpdir / "fig.yaml")
+
+        record = load_recipe(path, lazy=True)
+        arrays = record.axes["ax_0_0"].calls[1].args[0]["_loaded_array"].load()
+        assert [len(a) for a in arrays] == [3, 6]
+
+    def test_npy_is_memory_mapped(self, tmpdir):
+        """Test that .npy data files are memory-mapped on access."""
+        from figrecipe._utils._numpy_io import load_array, save_array
+
+        path = save_array(np.arange(10.0), tmpdir / "arr", "inline")
+        assert isinstance(load_array(path, "float64", mmap_mode="r"), np.memmap)
+
+    def test_single_csv_lazy(self, tmpdir):
+        """Test lazy handles for the single wide CSV layout."""
+        path = _save_sample(tmpdir / "fig.yaml", csv_format="single")
+
+        record = load_recipe(path, lazy=True)
+        handle = record.axes["ax_0_0"].calls[0].args[0]["_loaded_array"]
+        np.testing.assert_array_equal(handle.load(), np.arange(5.0))
+
+    def test_reproduce_from_lazy_record(self, tmpdir):
+        """Test that a lazily loaded record reproduces the figure."""
+        from figrecipe._reproducer import reproduce_from_record
+
+        path = _save_sample(tmpdir / "fig.yaml")
+
+        fig, ax = reproduce_from_record(load_recipe(path, lazy=True))
+        np.testing.assert_array_equal(
+            ax.get_lines()[0].get_ydata(), np.arange(5.0) ** 2
+        )
+
+    def test_info_uses_lazy_load(self, tmpdir):
+        """Test that fr.info works without the data files being readable."""
+        path = _save_sample(tmpdir / "fig.yaml")
+        for csv_file in (tmpdir / "fig_data").glob("*.csv"):
+            csv_file.write_text("not,a\nnumber")
+
+        info = fr.info(path)
+        assert [c["id"] for c in info["calls"]] == ["line", "box"]
+
+
+class TestResaveLoadedRecord:
+    """Tests for saving records that were loaded from a recipe."""
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_loaded_arrays_stay_inline(self, tmpdir, lazy):
+        """Test that re-saving keeps loaded data inline, as before loading."""
+        import yaml
+
+        from figrecipe._serializer import save_recipe
+
+        path = _save_sample(tmpdir / "fig.yaml")
+        record = load_recipe(path, lazy=lazy)
+        out = save_recipe(record, tmpdir / "copy.yaml")
+
+        with open(out) as f:
+            recipe = yaml.safe_load(f)
+        args = recipe["axes"]["ax_0_0"]["calls"][0]["args"]
+        assert args[1]["data"] == (np.arange(5.0) ** 2).tolist()
+        assert "_loaded_array" not in args[1]
+        assert "_source_file" not in args[1]
+        assert not (tmpdir / "copy_data").exists()
+
+        fig, ax = fr.reproduce(out)
+        np.testing.assert_array_equal(
+            ax.get_lines()[0].get_ydata(), np.arange(5.0) ** 2
+        )
+
+    def test_lazy_is_keyword_only(self, tmpdir):
+        """Test that lazy loading must be requested explicitly."""
+        path = _save_sample(tmpdir / "fig.yaml")
+        with pytest.raises(TypeError):
+            load_recipe(path, True)
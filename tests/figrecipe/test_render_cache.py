@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the content-addressed render cache."""
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from figrecipe._cli import main
+
+
+@pytest.fixture
+def recipe(tmp_path):
+    """Save a small recipe with a separate data file."""
+    import figrecipe as fr
+
+    fig, ax = fr.subplots()
+    x = np.linspace(0, 10, 200)
+    ax.plot(x, np.sin(x), id="wave")
+    ax.set_xlabel("X")
+    fr.save(fig, tmp_path / "fig.png", validate=False, verbose=False)
+    return tmp_path / "fig.yaml"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from figrecipe._render_cache import RenderCache
+
+    return RenderCache(tmp_path / "cache")
+
+
+class TestRecipeDigest:
+    """The key changes exactly when rendering inputs change."""
+
+    def test_stable(self, recipe):
+        from figrecipe._render_cache import recipe_digest
+
+        assert recipe_digest(recipe) == recipe_digest(recipe)
+
+    def test_ignores_timestamps(self, recipe):
+        from figrecipe._render_cache import recipe_digest
+
+        before = recipe_digest(recipe)
+        text = recipe.read_text()
+        recipe.write_text(text.replace("created: '", "created: '1999-01-01"))
+        assert recipe_digest(recipe) == before
+
+    def test_data_file_change(self, recipe):
+        from figrecipe._render_cache import recipe_digest
+
+        before = recipe_digest(recipe)
+        data_file = next((recipe.parent / "fig_data").glob("*.csv"))
+        data_file.write_text(data_file.read_text() + "0.0\r\n")
+        assert recipe_digest(recipe) != before
+
+    def test_render_settings(self, recipe):
+        from figrecipe._render_cache import render_key
+
+        base = render_key(recipe, "png", 300)
+        assert render_key(recipe, "png", 150) != base
+        assert render_key(recipe, "pdf", 300) != base
+
+    def test_font_state(self, recipe, monkeypatch):
+        import matplotlib
+
+        from figrecipe._render_cache import render_key
+
+        base = render_key(recipe, "png", 300)
+        monkeypatch.setitem(matplotlib.rcParams, "font.family", ["monospace"])
+        assert render_key(recipe, "png", 300) != base
+        monkeypatch.undo()
+        assert render_key(recipe, "png", 300) == base
+
+        manager = matplotlib.font_manager.fontManager
+        monkeypatch.setattr(manager, "ttflist", manager.ttflist[1:])
+        assert render_key(recipe, "png", 300) != base
+
+
+class TestRenderRecipe:
+    """render_recipe() serves unchanged recipes from the cache."""
+
+    def test_hit_restores_image(self, recipe, cache, tmp_path):
+        from figrecipe._render_cache import render_recipe
+
+        out = tmp_path / "out" / "fig.reproduced.png"
+        _, cached = render_recipe(recipe, out, "png", 100, cache=cache)
+        assert not cached
+        first = out.read_bytes()
+        # Only the image is written: no recipe, data or hitmap sidecars
+        assert [p.name for p in out.parent.iterdir()] == [out.name]
+
+        out.unlink()
+        _, cached = render_recipe(recipe, out, "png", 100, cache=cache)
+        assert cached
+        assert out.read_bytes() == first
+        assert [p.name for p in out.parent.iterdir()] == [out.name]
+
+    def test_output_name_shares_entry(self, recipe, cache, tmp_path):
+        from figrecipe._render_cache import render_recipe
+
+        render_recipe(recipe, tmp_path / "a.png", "png", 100, cache=cache)
+        _, cached = render_recipe(recipe, tmp_path / "b.png", "png", 100, cache=cache)
+        assert cached
+        assert len(cache.entries()) == 1
+
+    def test_format_without_suffix(self, recipe, cache, tmp_path):
+        from figrecipe._render_cache import render_recipe
+
+        base = tmp_path / "o" / "out"
+        out, _ = render_recipe(recipe, base, "svg", 100, cache=cache)
+        assert out == tmp_path / "o" / "out.svg"
+        assert b"<svg" in out.read_bytes()
+        out.unlink()
+        out, cached = render_recipe(recipe, base, "svg", 100, cache=cache)
+        assert cached
+        assert b"<svg" in out.read_bytes()
+
+    def test_suffix_wins_over_format(self, recipe, cache, tmp_path):
+        from figrecipe._render_cache import render_recipe
+
+        out, _ = render_recipe(recipe, tmp_path / "out.png", "pdf", 100, cache=cache)
+        assert out.read_bytes().startswith(b"\x89PNG")
+        assert [e.meta["format"] for e in cache.entries()] == ["png"]
+
+    def test_disabled(self, recipe, cache, tmp_path):
+        from figrecipe._render_cache import render_recipe
+
+        out = tmp_path / "fig.out.png"
+        render_recipe(recipe, out, "png", 100, cache=cache)
+        _, cached = render_recipe(recipe, out, "png", 100, use_cache=False)
+        assert not cached
+        # Without the cache, sidecars are written as by fig.savefig
+        assert (tmp_path / "fig.out.yaml").exists()
+
+    def test_env_disable(self, recipe, cache, tmp_path, monkeypatch):
+        from figrecipe._render_cache import render_recipe
+
+        monkeypatch.setenv("FIGRECIPE_NO_CACHE", "1")
+        out = tmp_path / "fig.out.png"
+        render_recipe(recipe, out, "png", 100, cache=cache)
+        assert cache.entries() == []
+
+
+class TestRenderCache:
+    """LRU size cap and maintenance."""
+
+    def _store(self, cache, tmp_path, key, size):
+        return cache.store(key, b"x" * size)
+
+    def test_prune_evicts_least_recently_used(self, cache, tmp_path):
+        import os
+
+        for i, key in enumerate(["a", "b", "c"]):
+            entry = self._store(cache, tmp_path, key, 1000)
+            os.utime(entry, (1000 + i, 1000 + i))
+        # Touch "a" so that "b" becomes the oldest
+        cache.restore("a", tmp_path / "restored.png")
+
+        entry_size = cache.entries()[0].size
+        removed, freed = cache.prune(max_bytes=2 * entry_size + entry_size // 2)
+        assert (removed, freed) == (1, entry_size)
+        assert sorted(e.key for e in cache.entries()) == ["a", "c"]
+
+    def test_clear(self, cache, tmp_path):
+        self._store(cache, tmp_path, "a", 10)
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+
+    def test_miss(self, cache, tmp_path):
+        assert cache.restore("missing", tmp_path / "missing.png") is None
+        assert not (tmp_path / "missing.png").exists()
+
+
+class TestCacheCommand:
+    """figrecipe cache / reproduce --no-cache."""
+
+    def test_reproduce_uses_cache(self, recipe, tmp_path, monkeypatch):
+        monkeypatch.setenv("FIGRECIPE_CACHE_DIR", str(tmp_path / "cli_cache"))
+        runner = CliRunner()
+        out = tmp_path / "cli.png"
+        args = ["reproduce", str(recipe), "-o", str(out), "--dpi", "100"]
+
+        result = runner.invoke(main, args)
+        assert result.exit_code == 0, result.output
+        assert "(cached)" not in result.output
+
+        result = runner.invoke(main, args)
+        assert result.exit_code == 0, result.output
+        assert "(cached)" in result.output
+
+        result = runner.invoke(main, args + ["--no-cache"])
+        assert "(cached)" not in result.output
+
+        result = runner.invoke(main, ["cache", "info", "--json"])
+        assert '"entries": 1' in result.output
+
+        result = runner.invoke(main, ["cache", "clear", "-y"])
+        assert result.exit_code == 0
+        assert "Removed 1 entries" in result.output
+
+    def test_cache_help(self):
+        result = CliRunner().invoke(main, ["cache", "--help"])
+        assert result.exit_code == 0
+        assert "prune" in result.output
+
+
+# EOF
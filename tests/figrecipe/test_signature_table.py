@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the precomputed matplotlib signature table."""
+
+import json
+
+import pytest
+
+from figrecipe._signatures import _loader, _table
+from figrecipe._signatures._introspect import introspect_signature
+
+
+@pytest.fixture
+def table_dir(tmp_path, monkeypatch):
+    """Point the table cache at a fresh directory and reset loaded state."""
+    monkeypatch.setenv("FIGRECIPE_SIGNATURE_DIR", str(tmp_path))
+    _table.clear_signature_table()
+    _loader._SIGNATURE_CACHE.clear()
+    _loader._DEFAULTS_CACHE.clear()
+    yield tmp_path
+    _table.clear_signature_table()
+    _loader._SIGNATURE_CACHE.clear()
+    _loader._DEFAULTS_CACHE.clear()
+
+
+class TestSignatureTable:
+    """Building, caching and loading the table."""
+
+    def test_built_per_method_on_first_lookup(self, table_dir, monkeypatch):
+        introspected = []
+
+        def _spy(name, expand_kwargs=True):
+            introspected.append(name)
+            return introspect_signature(name, expand_kwargs)
+
+        monkeypatch.setattr(_table, "introspect_signature", _spy)
+        sig = _loader.get_signature("plot")
+        assert introspected == ["plot"]
+        path = table_dir / _table.table_filename()
+        assert path.exists()
+
+        data = json.loads(path.read_text())
+        assert data["schema"] == _table.TABLE_SCHEMA
+        assert list(data["signatures"]) == ["plot"]
+
+        _table.clear_signature_table()
+        assert _table.lookup_signature("plot") == sig
+        _loader.get_signature("set_xlabel")
+        assert introspected == ["plot", "set_xlabel"]
+        data = json.loads(path.read_text())
+        assert sorted(data["signatures"]) == ["plot", "set_xlabel"]
+
+    def test_matches_introspection(self, table_dir):
+        _table.write_signature_table()
+        _table.clear_signature_table()
+        table = _table.load_signature_table()
+        assert table["scatter"] == introspect_signature("scatter")
+
+    def test_tuple_defaults_survive_round_trip(self, table_dir):
+        live = _table.lookup_signature("pie")["kwargs"]["center"]["default"]
+        assert live == (0, 0)
+
+        _table.clear_signature_table()
+        loaded = _table.lookup_signature("pie")["kwargs"]["center"]["default"]
+        assert isinstance(loaded, tuple)
+        assert loaded == (0, 0)
+
+    def test_loaded_from_disk_without_introspection(self, table_dir, monkeypatch):
+        _table.write_signature_table()
+        _table.clear_signature_table()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("introspection should not run")
+
+        monkeypatch.setattr(_table, "build_signature_table", fail)
+        monkeypatch.setattr(_table, "introspect_signature", fail)
+        monkeypatch.setattr(_loader, "introspect_signature", fail)
+        assert _loader.get_signature("bar")["args"]
+
+    def test_stale_version_is_rebuilt(self, table_dir):
+        path = table_dir / _table.table_filename()
+        path.write_text(
+            json.dumps(
+                {"schema": _table.TABLE_SCHEMA, "matplotlib": "0.0", "signatures": {}}
+            )
+        )
+        assert _table.load_signature_table() == {}
+        assert _table.lookup_signature("plot") is not None
+        data = json.loads(path.read_text())
+        assert data["matplotlib"] != "0.0"
+
+    def test_unknown_method_falls_back(self, table_dir):
+        sig = _loader.get_signature("get_xlim")
+        assert sig == introspect_signature("get_xlim")
+        assert _loader.get_signature("no_such_method") == {"args": [], "kwargs": {}}
+
+
+class TestDefaults:
+    """get_defaults is served from the table and memoized."""
+
+    def test_defaults_cached(self, table_dir):
+        first = _loader.get_defaults("plot")
+        assert "linestyle" in first
+        assert _loader.get_defaults("plot") is first
+
+    def test_tuple_default_filtered_after_reload(self, table_dir):
+        import matplotlib.pyplot as plt
+
+        import figrecipe as fr
+
+        _loader.get_signature("pie")
+        _table.clear_signature_table()
+        _loader._SIGNATURE_CACHE.clear()
+        _loader._DEFAULTS_CACHE.clear()
+
+        fig, ax = fr.subplots()
+        ax.pie([1, 2, 3], center=(0, 0), id="pie")
+        kwargs = fig.record.axes["ax_0_0"].calls[0].kwargs
+        plt.close(fig.fig)
+        assert "center" not in kwargs
+
+
+# EOF
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the single-render PNG save path (render once, crop in memory)."""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+
+@pytest.fixture
+def fig_ax():
+    """Create a simple recorded figure."""
+    import matplotlib.pyplot as plt
+
+    import figrecipe as fr
+
+    fig, ax = fr.subplots()
+    ax.plot([1, 2, 3], [1, 4, 9], id="line")
+    ax.set_xlabel("X axis")
+    ax.set_title("Title")
+    yield fig, ax
+    plt.close(fig.fig)
+
+
+class TestSaveCroppedPng:
+    """save_cropped_png() must match crop() on the same render."""
+
+    def test_matches_file_crop(self, fig_ax, tmp_path):
+        from figrecipe._api._save_helpers import _render_rgba
+        from figrecipe._utils._crop import crop, save_cropped_png
+
+        fig, _ = fig_ax
+        dpi = 300
+
+        file_path = tmp_path / "file.png"
+        fig.fig.savefig(file_path, dpi=dpi)
+        _, file_offset = crop(
+            file_path, margin_mm=1.0, overwrite=True, return_offset=True
+        )
+
+        mem_path = tmp_path / "mem.png"
+        rgba = _render_rgba(fig.fig, dpi)
+        mem_offset = save_cropped_png(rgba, mem_path, dpi, margin_mm=1.0)
+
+        assert mem_offset == file_offset
+        with Image.open(file_path) as a, Image.open(mem_path) as b:
+            assert a.size == b.size
+            np.testing.assert_array_equal(np.asarray(a), np.asarray(b))
+            assert b.info["dpi"] == pytest.approx(a.info["dpi"], abs=0.01)
+
+    def test_per_side_margins(self, fig_ax, tmp_path):
+        from figrecipe._api._save_helpers import _render_rgba
+        from figrecipe._utils._crop import save_cropped_png
+
+        fig, _ = fig_ax
+        rgba = _render_rgba(fig.fig, 100)
+        narrow = save_cropped_png(rgba, tmp_path / "a.png", 100, margin_mm=0.0)
+        wide = save_cropped_png(
+            rgba, tmp_path / "b.png", 100, margin_mm=0.0, margin_left_mm=5.0
+        )
+        assert wide["new_width"] > narrow["new_width"]
+        assert wide["new_height"] == narrow["new_height"]
+
+
+class TestRenderRgba:
+    """_render_rgba() takes its raster size from the canvas."""
+
+    @pytest.mark.parametrize("dpi", [72, 96, 137, 300])
+    def test_shape_matches_png(self, tmp_path, dpi):
+        import matplotlib.pyplot as plt
+
+        from figrecipe._api._save_helpers import _render_rgba
+
+        fig = plt.figure(figsize=(3.33, 2.07), dpi=100)
+        fig.add_subplot().plot([0, 1], [1, 0])
+        fig.savefig(tmp_path / "ref.png", dpi=dpi)
+        rgba = _render_rgba(fig, dpi)
+        plt.close(fig)
+
+        with Image.open(tmp_path / "ref.png") as ref:
+            assert rgba.shape == (ref.height, ref.width, 4)
+            np.testing.assert_array_equal(rgba, np.asarray(ref.convert("RGBA")))
+        assert fig.dpi == 100
+
+
+class TestSinglePassSave:
+    """fr.save() of a PNG writes a cropped image in one render."""
+
+    def test_save_is_cropped(self, fig_ax, tmp_path):
+        import figrecipe as fr
+
+        fig, _ = fig_ax
+        img_path, _, _ = fr.save(fig, tmp_path / "out.png", verbose=False)
+        full_w = int(fig.fig.get_size_inches()[0] * fig.fig.dpi)
+        with Image.open(img_path) as img:
+            assert img.width <= full_w
+            assert img.mode == "RGBA"
+
+    def test_hitmap_matches_generate_hitmap(self, tmp_path):
+        import matplotlib.pyplot as plt
+
+        import figrecipe as fr
+        from figrecipe._editor._hitmap import generate_hitmap
+
+        fig, ax = fr.subplots(
+            axes_width_mm=40, axes_height_mm=28, constrained_layout=False
+        )
+        ax.plot([1, 2, 3], [1, 4, 9], id="line")
+        assert not fig.fig.get_constrained_layout()
+        fr.save(fig, tmp_path / "out.png", verbose=False, save_hitmap=True)
+        expected, _ = generate_hitmap(fig, dpi=150)
+        plt.close(fig.fig)
+
+        with Image.open(tmp_path / "out_hitmap.png") as hitmap:
+            assert hitmap.mode == "RGB"
+            np.testing.assert_array_equal(np.asarray(hitmap), np.asarray(expected))
+
+
+# EOF
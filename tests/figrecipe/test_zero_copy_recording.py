@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for zero-copy recording of array arguments."""
+
+import numpy as np
+
+from figrecipe._recorder import Recorder
+
+
+def _record_scatter(recorder, x, y, c):
+    recorder.start_figure()
+    return recorder.record_call((0, 0), "scatter", (x, y), {"c": c})
+
+
+class TestZeroCopy:
+    """Arrays are recorded as read-only views of the caller's buffers."""
+
+    def test_args_share_memory(self):
+        x = np.arange(1000.0)
+        call = _record_scatter(Recorder(), x, x, x)
+        arr = call.args[0]["_array"]
+        assert np.shares_memory(arr, x)
+        assert not arr.flags.writeable
+        assert x.flags.writeable
+
+    def test_kwargs_kept_as_arrays(self):
+        c = np.linspace(0, 1, 1000)
+        call = _record_scatter(Recorder(), c, c, c)
+        assert isinstance(call.kwargs["c"], np.ndarray)
+        assert np.shares_memory(call.kwargs["c"], c)
+
+    def test_pandas_kwargs(self):
+        import pandas as pd
+
+        s = pd.Series(np.arange(10.0))
+        call = _record_scatter(Recorder(), s, s, s)
+        assert isinstance(call.kwargs["c"], np.ndarray)
+        np.testing.assert_array_equal(call.kwargs["c"], s.values)
+
+    def test_view_sees_later_mutation(self):
+        c = np.zeros(5)
+        call = _record_scatter(Recorder(), c, c, c)
+        c[0] = 7.0
+        assert call.kwargs["c"][0] == 7.0
+
+
+class TestSnapshot:
+    """snapshot_arrays copies arrays at record time."""
+
+    def test_snapshot_isolated_from_mutation(self):
+        c = np.zeros(5)
+        call = _record_scatter(Recorder(snapshot_arrays=True), c, c, c)
+        c[0] = 7.0
+        assert call.kwargs["c"][0] == 0.0
+        assert call.args[0]["_array"][0] == 0.0
+        assert not np.shares_memory(call.kwargs["c"], c)
+
+    def test_subplots_option(self):
+        import figrecipe as fr
+
+        fig, ax = fr.subplots(snapshot_arrays=True)
+        assert fig.record is not None
+        c = np.zeros(5)
+        ax.scatter(c, c, c=c)
+        c[:] = 1.0
+        call = fig.record.axes["ax_0_0"].calls[0]
+        np.testing.assert_array_equal(call.kwargs["c"], np.zeros(5))
+
+
+class TestDeferredSerialization:
+    """Array kwargs are converted to lists only when saving."""
+
+    def test_saved_recipe_roundtrip(self, tmp_path):
+        from figrecipe._serializer import load_recipe, save_recipe
+
+        recorder = Recorder()
+        c = np.linspace(0, 1, 20)
+        _record_scatter(recorder, c, c, c)
+        path = save_recipe(recorder.figure_record, tmp_path / "fig.yaml")
+
+        loaded = load_recipe(path)
+        call = loaded.axes["ax_0_0"].calls[0]
+        np.testing.assert_allclose(call.kwargs["c"], c)
+
+
+# EOF